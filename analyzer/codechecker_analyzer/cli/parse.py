@@ -12,6 +12,7 @@ human-readable format.
 
 
 import argparse
+import contextlib
 import os
 import sys
 from typing import Dict, Optional, Set, List, Any
@@ -616,79 +617,104 @@ def main(args):
             context.path_plist_to_html_dist,
             context.checker_labels)
 
-    for dir_path, file_paths in report_file.analyzer_result_files(args.input):
-        review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
-        if os.path.lexists(review_status_cfg):
-            try:
-                review_status_handler.set_review_status_config(
-                    review_status_cfg)
-            except ValueError as err:
-                LOG.error(err)
-                sys.exit(1)
-
-        metadata = get_metadata(dir_path)
-
-        if metadata and 'files' in args:
-            # Mapping plists when files are specified to speed up parsing
-            # The specifed_file_paths variable would be an empty list
-            # if metadata.json did not contain the specified file or
-            # metadata did not contain mapping between source files and plists.
-            specifed_file_paths = [
-                key for key, val in
-                metadata['tools'][0]['result_source_files'].items()
-                if any(fnmatch.fnmatch(val, f) for f in args.files)
-            ] if 'tools' in metadata \
-                and len(metadata['tools']) > 0 \
-                and 'result_source_files' in metadata['tools'][0] \
-                else []
-            file_paths = specifed_file_paths or file_paths
-
-        for file_path in file_paths:
-            reports = report_file.get_reports(
-                file_path, context.checker_labels, file_cache)
-
-            for report in reports:
+    # JSON based exports are written continuously, so the reports don't have
+    # to be kept in memory.
+    report_writer = None
+    if export == 'json':
+        report_writer = report_to_json.ReportWriter(
+            get_output_file_path("reports.json"))
+    elif export == 'sarif':
+        report_writer = sarif.ReportWriter(
+            get_output_file_path("reports.json"))
+
+    # The partially written output file is removed if the parsing fails.
+    with report_writer or contextlib.nullcontext():
+        for dir_path, file_paths in \
+                report_file.analyzer_result_files(args.input):
+            review_status_cfg = os.path.join(dir_path, 'review_status.yaml')
+            if os.path.lexists(review_status_cfg):
                 try:
-                    # TODO: skip_handler is used later in reports_helper.skip()
-                    # too. However, skipped reports shouldn't check source code
-                    # comments because they potentially raise an exception.
-                    # Skipped files shouldn't raise an exception, also, "skip"
-                    # shouldn't be checked twice.
-                    if not report.skip(skip_handlers):
-                        report.review_status = \
-                            review_status_handler.get_review_status(report)
+                    review_status_handler.set_review_status_config(
+                        review_status_cfg)
                 except ValueError as err:
                     LOG.error(err)
                     sys.exit(1)
 
-            reports = reports_helper.skip(
-                reports, processed_path_hashes, skip_handlers, suppr_handler,
-                src_comment_status_filter)
-
-            statistics.num_of_analyzer_result_files += 1
-            for report in reports:
-                if report.changed_files:
-                    changed_files.update(report.changed_files)
-
-                statistics.add_report(report)
-
-                if trim_path_prefixes:
-                    report.trim_path_prefixes(trim_path_prefixes)
-
-            all_reports.extend(reports)
-
-            # Print reports continously.
-            if not export:
-                file_report_map = plaintext.get_file_report_map(
-                    reports, file_path, metadata)
-                plaintext.convert(
-                    review_status_handler,
-                    file_report_map, processed_file_paths, print_steps)
-            elif export == 'html':
-                print(f"Parsing input file '{file_path}'.")
-                report_to_html.convert(
-                    file_path, reports, output_dir_path,
-                    html_builder)
+            metadata = get_metadata(dir_path)
+
+            if metadata and 'files' in args:
+                # Mapping plists when files are specified to speed up parsing
+                # The specifed_file_paths variable would be an empty list
+                # if metadata.json did not contain the specified file or
+                # metadata did not contain mapping between source files and
+                # plists.
+                specifed_file_paths = [
+                    key for key, val in
+                    metadata['tools'][0]['result_source_files'].items()
+                    if any(fnmatch.fnmatch(val, f) for f in args.files)
+                ] if 'tools' in metadata \
+                    and len(metadata['tools']) > 0 \
+                    and 'result_source_files' in metadata['tools'][0] \
+                    else []
+                file_paths = specifed_file_paths or file_paths
+
+            for file_path in file_paths:
+                # Don't parse report files which contain only skipped reports.
+                if report_file.is_skipped(file_path, skip_handlers, metadata):
+                    LOG.debug("Skipping report file: %s", file_path)
+                    reports = []
+                else:
+                    reports = report_file.get_reports(
+                        file_path, context.checker_labels, file_cache)
+
+                for report in reports:
+                    try:
+                        # TODO: skip_handler is used later in
+                        # reports_helper.skip() too. However, skipped reports
+                        # shouldn't check source code comments because they
+                        # potentially raise an exception. Skipped files
+                        # shouldn't raise an exception, also, "skip" shouldn't
+                        # be checked twice.
+                        if not report.skip(skip_handlers):
+                            report.review_status = \
+                                review_status_handler.get_review_status(report)
+                    except ValueError as err:
+                        LOG.error(err)
+                        sys.exit(1)
+
+                reports = reports_helper.skip(
+                    reports, processed_path_hashes, skip_handlers,
+                    suppr_handler, src_comment_status_filter)
+
+                statistics.num_of_analyzer_result_files += 1
+                for report in reports:
+                    if report.changed_files:
+                        changed_files.update(report.changed_files)
+
+                    statistics.add_report(report)
+
+                    if trim_path_prefixes:
+                        report.trim_path_prefixes(trim_path_prefixes)
+
+                if report_writer:
+                    report_writer.add_reports(reports)
+                else:
+                    all_reports.extend(reports)
+
+                # Print reports continously.
+                if not export:
+                    file_report_map = plaintext.get_file_report_map(
+                        reports, file_path, metadata)
+                    plaintext.convert(
+                        review_status_handler,
+                        file_report_map, processed_file_paths, print_steps)
+                elif export == 'html':
+                    print(f"Parsing input file '{file_path}'.")
+                    report_to_html.convert(
+                        file_path, reports, output_dir_path,
+                        html_builder)
+
+    review_status_handler.log_rule_match_statistics()
 
     for warning in review_status_handler.source_comment_warnings():
         LOG.warning(warning)
@@ -697,18 +723,12 @@ def main(args):
         statistics.write()
     elif export == 'html':
         html_builder.finish(output_dir_path, statistics)
-    elif export == 'json':
-        data = report_to_json.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'codeclimate':
         data = codeclimate.convert(all_reports)
         dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'gerrit':
         data = gerrit.convert(all_reports)
         dump_json_output(data, get_output_file_path("reports.json"))
-    elif export == 'sarif':
-        data = sarif.convert(all_reports)
-        dump_json_output(data, get_output_file_path("reports.json"))
     elif export == 'baseline':
         data = baseline.convert(all_reports)
         output_path = get_output_file_path("reports.baseline")
@@ -7,9 +7,14 @@
 # -------------------------------------------------------------------------
 
 
+import fnmatch
 import os
+import random
 import unittest
 
+import yaml
+
+from codechecker_report_converter.report import File, Report
 from codechecker_common.review_status_handler import ReviewStatusHandler
 from libtest import env
 
@@ -274,3 +279,68 @@ rules:
         rscfg_file = self.__put_in_review_status_cfg_file(cfg)
         with self.assertRaisesRegex(ValueError, "TODO"):
             self.rshandler.set_review_status_config(rscfg_file)
+
+    def test_indexed_rule_matching(self):
+        """
+        The indexed rule matching gives the same result as checking the
+        rules one by one.
+        """
+        def rule_matches(report, rule):
+            filters = rule['filters']
+            return (
+                'filepath' not in filters or fnmatch.fnmatch(
+                    report.file.original_path, filters['filepath'])) and (
+                'checker_name' not in filters or
+                report.checker_name == filters['checker_name']) and (
+                'report_hash' not in filters or not report.report_hash or
+                report.report_hash.startswith(filters['report_hash']))
+
+        rnd = random.Random(42)
+        hashes = ['abc123', 'abd456', 'bcd789', 'a1b2c3']
+        checkers = ['core.DivideZero', 'core.NullDereference']
+        paths = ['/src/a.cpp', '/src/b.h', '/test/a.cpp', '/test/c.c']
+        globs = ['/src/*', '*.cpp', '/test/?.c', '*']
+
+        for _ in range(20):
+            rules = []
+            for _ in range(rnd.randint(1, 30)):
+                filters = {}
+                if rnd.random() < 0.5:
+                    filters['report_hash'] = \
+                        rnd.choice(hashes)[:rnd.randint(1, 6)]
+                if rnd.random() < 0.4:
+                    filters['checker_name'] = rnd.choice(checkers)
+                if rnd.random() < 0.4 or not filters:
+                    filters['filepath'] = rnd.choice(globs)
+
+                actions = {
+                    'review_status': rnd.choice(
+                        ReviewStatusHandler.REVIEW_STATUS_OPTIONS),
+                    'reason': str(len(rules))}
+
+                rules.append({'filters': filters, 'actions': actions})
+
+            rscfg_file = self.__put_in_review_status_cfg_file(
+                yaml.dump({'$version': 1, 'rules': rules}))
+            self.rshandler.set_review_status_config(rscfg_file)
+
+            for _ in range(30):
+                report = Report(
+                    File(rnd.choice(paths)), 1, 1, 'message',
+                    rnd.choice(checkers),
+                    report_hash=rnd.choice(hashes + [None]))
+
+                matching = [rule for rule in rules
+                            if rule_matches(report, rule)]
+
+                self.assertFalse(self.rshandler.should_ignore(report))
+
+                review_status = \
+                    self.rshandler.get_review_status_from_config(report)
+
+                if matching:
+                    self.assertEqual(
+                        review_status.message,
+                        matching[0]['actions']['reason'].encode())
+                else:
+                    self.assertIsNone(review_status)
@@ -0,0 +1,110 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the skip list handler. """
+
+
+import fnmatch
+import os
+import random
+import unittest
+
+from codechecker_common.skiplist_handler import SkipListHandler
+
+
+def sequential_should_skip(skip_lines, path):
+    """ Reference implementation which tries the skip rules one by one. """
+    for line in skip_lines:
+        glob = os.path.normpath(line[1:].strip())
+        if fnmatch.fnmatchcase(path, glob) or \
+                fnmatch.fnmatchcase(path, glob + '/*'):
+            return line[0] == '-'
+
+    return False
+
+
+class SkipListHandlerTest(unittest.TestCase):
+    """ Test the skip list handler. """
+
+    def test_first_match_wins(self):
+        """ The first matching rule decides. """
+        handler = SkipListHandler("""
+        +/dir/check.this.file
+        -/dir/*
+        -/skip/all/source/in/directory*
+        # Comment
+        +*/lib/*.cpp
+        -*/lib/*
+        """)
+
+        self.assertFalse(handler.should_skip('/dir/check.this.file'))
+        self.assertTrue(handler.should_skip('/dir/other.file'))
+        self.assertTrue(handler.should_skip('/dir/sub/check.this.file'))
+        self.assertFalse(handler.should_skip('/dirx/other.file'))
+        self.assertTrue(handler.should_skip('/skip/all/source/in/directory'))
+        self.assertTrue(handler.should_skip(
+            '/skip/all/source/in/directory_2/a.cpp'))
+        self.assertFalse(handler.should_skip('/skip/all/source/in/dir'))
+        self.assertFalse(handler.should_skip('/project/lib/a.cpp'))
+        self.assertTrue(handler.should_skip('/project/lib/a.h'))
+        self.assertFalse(handler.should_skip('/project/src/a.h'))
+
+        # Memoized decisions give the same result.
+        self.assertFalse(handler.should_skip('/dir/check.this.file'))
+        self.assertTrue(handler.should_skip('/dir/other.file'))
+
+    def test_directory_rule(self):
+        """ Rules without wildcards match the files of the directory. """
+        handler = SkipListHandler("-/project/third_party/")
+
+        self.assertTrue(handler.should_skip('/project/third_party'))
+        self.assertTrue(handler.should_skip('/project/third_party/a/b.c'))
+        self.assertFalse(handler.should_skip('/project/third_party_2/a.c'))
+        self.assertFalse(handler.should_skip('/project/a.c'))
+
+    def test_overwrite_skip_content(self):
+        """ Memoized decisions are dropped when the rules change. """
+        handler = SkipListHandler("-/project/*")
+        self.assertTrue(handler.should_skip('/project/a.c'))
+
+        handler.overwrite_skip_content(["+/project/a.c", "-/project/*"])
+        self.assertFalse(handler.should_skip('/project/a.c'))
+        self.assertTrue(handler.should_skip('/project/b.c'))
+
+        handler.overwrite_skip_content([])
+        self.assertFalse(handler.should_skip('/project/b.c'))
+
+    def test_same_as_sequential_matching(self):
+        """
+        The decisions are the same as trying the skip rules one by one.
+        """
+        rnd = random.Random(42)
+        names = ['src', 'lib', 'lib1', 'a', 'ab', 'b.cpp', 'a.h']
+
+        def random_path():
+            return '/' + '/'.join(
+                rnd.choice(names) for _ in range(rnd.randint(1, 4)))
+
+        def random_pattern():
+            components = [rnd.choice(names + ['*', 'a*', '*.cpp', 'l?b'])
+                          for _ in range(rnd.randint(1, 4))]
+            prefix = rnd.choice(['/', '*/', ''])
+            suffix = rnd.choice(['', '/', '*'])
+            return prefix + '/'.join(components) + suffix
+
+        for _ in range(50):
+            skip_lines = [rnd.choice('+-') + random_pattern()
+                          for _ in range(rnd.randint(1, 20))]
+            handler = SkipListHandler('\n'.join(skip_lines))
+
+            for _ in range(50):
+                path = random_path()
+                self.assertEqual(
+                    handler.should_skip(path),
+                    sequential_should_skip(skip_lines, path),
+                    f"{path} with rules {skip_lines}")
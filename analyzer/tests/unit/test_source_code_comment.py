@@ -12,10 +12,13 @@
 
 
 import os
+import shutil
+import tempfile
 import unittest
 
 from codechecker_common.source_code_comment_handler import \
-    SourceCodeComment, SourceCodeCommentHandler
+    SourceCodeComment, SourceCodeCommentHandler, SpellException, \
+    get_source_code_comment_index
 
 
 class SourceCodeCommentTestCase(unittest.TestCase):
@@ -770,3 +773,114 @@ class SourceCodeCommentTestCase(unittest.TestCase):
         current_line_comments = sc_handler.filter_source_line_comments(
             self.__tmp_srcfile_3, bug_line, 'my.dummy')
         self.assertEqual(len(current_line_comments), 0)
+
+    def test_source_code_comment_index(self):
+        """
+        The index returns the same comments as the source code comment
+        handler and it is shared between files with the same content.
+        """
+        sc_handler = SourceCodeCommentHandler()
+
+        for src_file in [self.__tmp_srcfile_1, self.__tmp_srcfile_2,
+                         self.__tmp_srcfile_3]:
+            index = get_source_code_comment_index(src_file.name)
+            self.assertIs(index, get_source_code_comment_index(src_file.name))
+
+            src_file.seek(0)
+            lines = src_file.readlines()
+            for bug_line in range(1, len(lines) + 2):
+                try:
+                    expected = sc_handler.get_source_line_comments_from_lines(
+                        lines, bug_line)
+                except SpellException as ex:
+                    with self.assertRaises(SpellException) as cm:
+                        index.get_source_line_comments(bug_line)
+                    self.assertEqual(str(cm.exception), str(ex))
+                    continue
+
+                self.assertEqual(
+                    index.get_source_line_comments(bug_line), expected)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_file_path = os.path.join(tmp_dir, 'test_file_1')
+            shutil.copy(self.__tmp_srcfile_1.name, src_file_path)
+            self.assertIs(
+                get_source_code_comment_index(src_file_path),
+                get_source_code_comment_index(self.__tmp_srcfile_1.name))
+
+    def test_source_code_comment_index_blocks(self):
+        """
+        The index keeps the lines of the C style comment blocks which don't
+        look like comments.
+        """
+        lines = [
+            "int a;\n",
+            "/* codechecker_suppress [all] block\n",
+            "   comment without markers\n",
+            "*/\n",
+            "int b;\n",
+            "int c; /* codechecker_confirmed [my.checker] inline */\n",
+            "int d;\n",
+            "// other comment\n",
+            "/* codechecker_intentional [all]\n",
+            "   long\n",
+            "   comment */\n",
+            "// codechecker_false_positive [all] comment\n",
+            "int e;\n",
+            "x */\n",
+            "int f;\n",
+            "/* codechecker_suppress [all] */ int g; /* */\n",
+            "int h;\n"]
+
+        sc_handler = SourceCodeCommentHandler()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_file_path = os.path.join(tmp_dir, 'blocks.cpp')
+            with open(src_file_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+
+            index = get_source_code_comment_index(src_file_path)
+            for bug_line in range(1, len(lines) + 2):
+                try:
+                    expected = sc_handler.get_source_line_comments_from_lines(
+                        lines, bug_line)
+                except SpellException as ex:
+                    with self.assertRaises(SpellException) as cm:
+                        index.get_source_line_comments(bug_line)
+                    self.assertEqual(str(cm.exception), str(ex))
+                    continue
+
+                self.assertEqual(
+                    index.get_source_line_comments(bug_line), expected,
+                    bug_line)
+
+            # The modified file is indexed again.
+            with open(src_file_path, 'a', encoding='utf-8') as f:
+                f.write("// codechecker_suppress [all] new\nint i;\n")
+            os.utime(src_file_path, ns=(0, 0))
+
+            new_index = get_source_code_comment_index(src_file_path)
+            self.assertIsNot(new_index, index)
+            self.assertEqual(
+                len(new_index.get_source_line_comments(len(lines) + 2)), 1)
+
+    def test_source_code_comment_index_misspelled(self):
+        """ Misspelled comments are reported at each lookup. """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_file_path = os.path.join(tmp_dir, 'main.cpp')
+            with open(src_file_path, 'w', encoding='utf-8') as f:
+                f.write("int x;\n"
+                        "// codechecker_suppresssss [all] comment\n"
+                        "int y = 1 / 0;\n")
+
+            index = get_source_code_comment_index(src_file_path)
+            self.assertTrue(index.has_codechecker_comment())
+            self.assertEqual(index.get_source_line_comments(2), [])
+
+            for _ in range(2):
+                with self.assertRaises(SpellException):
+                    index.get_source_line_comments(3)
+
+            comments, misspelled_comments = \
+                index.scan_source_line_comments([1, 3])
+            self.assertEqual(comments, [(1, [])])
+            self.assertEqual(len(misspelled_comments), 1)
@@ -9,19 +9,123 @@
 
 import fnmatch
 import os
-from typing import List, Optional
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 import yaml
 
 from codechecker_report_converter.report import Report, SourceReviewStatus
 from codechecker_common.logger import get_logger
 from codechecker_common.source_code_comment_handler import \
-    SourceCodeCommentHandler, SpellException, contains_codechecker_comment, \
-    SourceCodeComment, SourceCodeComments
+    SpellException, SourceCodeComment, SourceCodeComments, \
+    get_source_code_comment_index
 from codechecker_common.util import path_for_fake_root
 
 
 LOG = get_logger('system')
 
+# Number of file path patterns combined into one regular expression.
+GLOB_CHUNK_SIZE = 100
+
+
+class ReviewStatusRuleIndex:
+    """
+    Index of review status rules to find the first rule matching a report
+    without checking every rule.
+
+    Each rule is indexed by one of its filters: by the report hash prefix in
+    a prefix map, by the checker name in a checker name map or by the file
+    path pattern in a combined regular expression. Rules found by the report
+    hash or checker name are checked against their other filters too.
+    """
+
+    def __init__(self, rules: List[Tuple[int, dict]]):
+        self.__rules = dict(rules)
+
+        self.__hash_prefix_rules: Dict[str, List[int]] = {}
+        self.__checker_rules: Dict[str, List[int]] = {}
+        self.__match_all_rules: List[int] = []
+
+        globs: List[Tuple[int, str]] = []
+        for idx, rule in rules:
+            filters = rule['filters']
+            if 'report_hash' in filters:
+                self.__hash_prefix_rules.setdefault(
+                    str(filters['report_hash']), []).append(idx)
+            elif 'checker_name' in filters:
+                self.__checker_rules.setdefault(
+                    filters['checker_name'], []).append(idx)
+            elif 'filepath' in filters:
+                globs.append((idx, filters['filepath']))
+            else:
+                self.__match_all_rules.append(idx)
+
+        self.__hash_prefix_lengths = sorted(
+            {len(prefix) for prefix in self.__hash_prefix_rules})
+
+        # The alternatives of a regular expression are tried in order, so the
+        # first matching group belongs to the first matching rule.
+        self.__glob_patterns: List[re.Pattern] = []
+        for i in range(0, len(globs), GLOB_CHUNK_SIZE):
+            self.__glob_patterns.append(re.compile('|'.join(
+                f"(?P<rule{idx}>"
+                f"{fnmatch.translate(os.path.normcase(glob))})"
+                for idx, glob in globs[i:i + GLOB_CHUNK_SIZE])))
+
+    def __get_candidates(self, report: Report) -> List[int]:
+        """
+        Rules which may match the given report based on the report hash and
+        the checker name.
+        """
+        candidates = list(self.__match_all_rules)
+
+        # The report hash filter matches reports without report hash.
+        if report.report_hash:
+            for length in self.__hash_prefix_lengths:
+                candidates.extend(self.__hash_prefix_rules.get(
+                    report.report_hash[:length], []))
+        else:
+            for idxs in self.__hash_prefix_rules.values():
+                candidates.extend(idxs)
+
+        candidates.extend(self.__checker_rules.get(report.checker_name, []))
+
+        return candidates
+
+    def __get_first_glob_match(self, file_path: str) -> Optional[int]:
+        """
+        First rule which has only a file path filter and matches the given
+        file path.
+        """
+        file_path = os.path.normcase(file_path)
+        for pattern in self.__glob_patterns:
+            match = pattern.match(file_path)
+            if match and match.lastgroup:
+                return int(match.lastgroup[len('rule'):])
+
+        return None
+
+    def match(
+        self,
+        report: Report,
+        matches_rule: Callable[[Report, dict], bool]
+    ) -> Optional[dict]:
+        """
+        Returns the first rule which matches the given report or None if no
+        rule matches it. Candidate rules are checked by matches_rule.
+        """
+        first_idx = self.__get_first_glob_match(report.file.original_path)
+
+        for idx in sorted(self.__get_candidates(report)):
+            if first_idx is not None and idx > first_idx:
+                break
+
+            if matches_rule(report, self.__rules[idx]):
+                first_idx = idx
+                break
+
+        return self.__rules[first_idx] if first_idx is not None else None
+
 
 class ReviewStatusHandler:
     """
@@ -65,6 +169,10 @@ class ReviewStatusHandler:
         self.__source_comment_warnings = []
         self.__source_commets = {}
         self.__data = None
+        self.__status_rule_index: Optional[ReviewStatusRuleIndex] = None
+        self.__ignore_rule_index: Optional[ReviewStatusRuleIndex] = None
+        self.__rule_match_count = 0
+        self.__rule_match_time = 0.0
 
     def __parse_codechecker_review_comment(
         self,
@@ -76,15 +184,17 @@ class ReviewStatusHandler:
         position.  Returns an empty list if there are no comments.
         """
         src_comment_data = []
-        with open(source_file_name, encoding='utf-8', errors='ignore') as f:
-            if contains_codechecker_comment(f):
-                sc_handler = SourceCodeCommentHandler()
-                try:
-                    src_comment_data = sc_handler.filter_source_line_comments(
-                        f, report_line, checker_name)
-                except SpellException as ex:
-                    self.__source_comment_warnings.append(
-                        f"{source_file_name} contains {ex}")
+
+        # The source files are indexed only once, because a lot of reports
+        # can belong to the same source file.
+        index = get_source_code_comment_index(source_file_name)
+
+        try:
+            src_comment_data = index.filter_source_line_comments(
+                report_line, checker_name)
+        except SpellException as ex:
+            self.__source_comment_warnings.append(
+                f"{source_file_name} contains {ex}")
 
         return src_comment_data
 
@@ -241,6 +351,52 @@ class ReviewStatusHandler:
                     f"{err}")
 
         self.__validate_review_status_yaml_data()
+        self.__index_rules()
+
+    def __index_rules(self):
+        """
+        Build the indices of the rules in the review status config file.
+        """
+        before = time.time()
+
+        rules = list(enumerate(self.__data.get('rules', [])))
+
+        # Rules without filters don't set review status.
+        self.__status_rule_index = ReviewStatusRuleIndex([
+            (idx, rule) for idx, rule in rules
+            if not rule['actions'].get('ignore') and
+            any(filt in rule['filters']
+                for filt in ReviewStatusHandler.ALLOWED_FILTERS)])
+        self.__ignore_rule_index = ReviewStatusRuleIndex([
+            (idx, rule) for idx, rule in rules
+            if rule['actions'].get('ignore')])
+
+        LOG.debug("Indexed %d review status rules of %s in %.3f seconds.",
+                  len(rules), self.__review_status_yaml, time.time() - before)
+
+    def __match_rule(
+        self,
+        index: ReviewStatusRuleIndex,
+        report: Report
+    ) -> Optional[dict]:
+        """ Returns the first rule in the index which matches the report. """
+        before = time.time()
+        rule = index.match(report, self.__report_matches_rule)
+
+        self.__rule_match_count += 1
+        self.__rule_match_time += time.time() - before
+
+        return rule
+
+    def log_rule_match_statistics(self):
+        """
+        Log the number of reports matched against the review status rules and
+        the time it took.
+        """
+        if self.__rule_match_count:
+            LOG.debug("Matched %d reports against review status rules in "
+                      "%.3f seconds.", self.__rule_match_count,
+                      self.__rule_match_time)
 
     def should_ignore(self, report: Report) -> bool:
         """
@@ -253,15 +409,10 @@ class ReviewStatusHandler:
             another name for this class, because it handles not only review
             statuses.
         """
-        if self.__data is None:
+        if self.__ignore_rule_index is None:
             return False
 
-        for rule in self.__data['rules']:
-            if self.__report_matches_rule(report, rule) and \
-                    rule['actions'].get('ignore'):
-                return True
-
-        return False
+        return self.__match_rule(self.__ignore_rule_index, report) is not None
 
     def get_review_status_from_config(
         self,
@@ -276,21 +427,18 @@ class ReviewStatusHandler:
             "Review status config file has to be set with " \
             "set_review_status_config()."
 
-        # TODO: Document "in_source".
-        for rule in self.__data['rules']:
-            if not self.__report_matches_rule(report, rule) or \
-                    rule['actions'].get('ignore'):
-                continue
+        assert self.__status_rule_index is not None
 
-            if any(filt in rule['filters'] for filt in
-                   ['filepath', 'checker_name', 'report_hash']):
-                return SourceReviewStatus(
-                    status=rule['actions']['review_status'],
-                    message=rule['actions']['reason']
-                    .encode(encoding='utf-8', errors='ignore')
-                    if 'reason' in rule['actions'] else b'',
-                    bug_hash=report.report_hash or "",
-                    in_source=True)
+        # TODO: Document "in_source".
+        rule = self.__match_rule(self.__status_rule_index, report)
+        if rule:
+            return SourceReviewStatus(
+                status=rule['actions']['review_status'],
+                message=rule['actions']['reason']
+                .encode(encoding='utf-8', errors='ignore')
+                if 'reason' in rule['actions'] else b'',
+                bug_hash=report.report_hash or "",
+                in_source=True)
 
         return None
 
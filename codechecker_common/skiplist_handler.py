@@ -11,10 +11,82 @@ import fnmatch
 import re
 import os
 
+from typing import Dict, List, Optional, Tuple
+
 from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# Maximum number of skip decisions memoized by a skip list handler.
+DECISION_CACHE_SIZE = 1 << 16
+
+# Characters which have special meaning in the skip file patterns.
+WILDCARD_CHARS = '*?['
+
+
+class _TrieNode:
+    """
+    Node of the skip rule trie. The nodes are labeled by path components.
+    """
+    __slots__ = ('children', 'rules')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+
+        # (Beginning of the next path component, rule index) pairs of the
+        # rules which continue with a partial component or a wildcard.
+        self.rules: List[Tuple[str, int]] = []
+
+
+class SkipRuleMatcher:
+    """
+    Match paths against skip rules where the first matching rule wins.
+
+    The literal prefixes of the rules (the part before the first wildcard
+    character) are organized into a trie of path components. Only those rules
+    are tried for a path whose literal prefix is a prefix of the path, in the
+    order of the rules.
+    """
+
+    def __init__(self, rules: List[Tuple[str, re.Pattern]]):
+        self.__rules = rules
+        self.__root = _TrieNode()
+
+        for idx, (line, _) in enumerate(rules):
+            norm_skip_path = os.path.normpath(line[1:].strip())
+            literal_prefix = re.split(
+                f"[{re.escape(WILDCARD_CHARS)}]", norm_skip_path, 1)[0]
+
+            *components, partial = literal_prefix.split(os.path.sep)
+
+            node = self.__root
+            for component in components:
+                node = node.children.setdefault(component, _TrieNode())
+            node.rules.append((partial, idx))
+
+    def match(self, path: str) -> int:
+        """
+        Returns the index of the first rule which matches the given path or
+        -1 if there is no such rule.
+        """
+        candidates: List[int] = []
+
+        node: Optional[_TrieNode] = self.__root
+        for component in path.split(os.path.sep):
+            if node is None:
+                break
+
+            candidates.extend(idx for partial, idx in node.rules
+                              if component.startswith(partial))
+
+            node = node.children.get(component)
+
+        for idx in sorted(candidates):
+            if self.__rules[idx][1].match(path):
+                return idx
+
+        return -1
+
 
 class SkipListHandler:
     """
@@ -30,7 +102,9 @@ class SkipListHandler:
         """
         Process the lines of the skip file.
         """
-        self.__skip = []
+        self.__skip: List[Tuple[str, re.Pattern]] = []
+        self.__matcher = SkipRuleMatcher(self.__skip)
+        self.__decisions: Dict[str, bool] = {}
         if not skip_file_content:
             skip_file_content = ""
 
@@ -66,6 +140,9 @@ class SkipListHandler:
                 translated_glob + fr"(?:\{os.path.sep}.*)?$")
             self.__skip.append((skip_line, rexpr))
 
+        self.__matcher = SkipRuleMatcher(self.__skip)
+        self.__decisions = {}
+
     def __check_line_format(self, skip_lines):
         """
         Check if the skip line is given in a valid format.
@@ -105,11 +182,18 @@ class SkipListHandler:
         if not self.__skip:
             return False
 
-        for line, rexpr in self.__skip:
-            if rexpr.match(source):
-                sign = line[0]
-                return sign == '-'
-        return False
+        decision = self.__decisions.get(source)
+        if decision is not None:
+            return decision
+
+        idx = self.__matcher.match(source)
+        decision = idx != -1 and self.__skip[idx][0][0] == '-'
+
+        if len(self.__decisions) >= DECISION_CACHE_SIZE:
+            self.__decisions.clear()
+        self.__decisions[source] = decision
+
+        return decision
 
 
 class SkipListHandlers(list):
@@ -9,14 +9,17 @@
 Source code comment handling.
 """
 
+import hashlib
+import io
 import json
 import logging
+import os
 import re
+import threading
 
+from collections import OrderedDict
 from typing import Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
-from . import util
-
 
 LOG = logging.getLogger('report-converter')
 
@@ -24,6 +27,9 @@ LOG = logging.getLogger('report-converter')
 REVIEW_STATUS_VALUES = ["confirmed", "false_positive", "intentional",
                         "suppress", "unreviewed"]
 
+# Maximum number of source code comment indices kept in the memory.
+INDEX_CACHE_SIZE = 1024
+
 
 def contains_codechecker_comment(fp):
     """Returns true if the file content contains any
@@ -207,18 +213,8 @@ class SourceCodeCommentHandler:
         returns a list of (line_num, comments) tuples where comments
         were found.
         """
-        comments: List[Tuple[int, SourceCodeComments]] = []
-        misspelled_comments: List[str] = []
-        if not contains_codechecker_comment(fp):
-            return comments, misspelled_comments
-
-        line_numbers = sorted(line_numbers)
-        for num in line_numbers:
-            try:
-                comments.append((num, self.get_source_line_comments(fp, num)))
-            except SpellException as ex:
-                misspelled_comments.append(str(ex))
-        return comments, misspelled_comments
+        return SourceCodeCommentIndex(fp).scan_source_line_comments(
+            line_numbers)
 
     def get_source_line_comments(
         self,
@@ -227,6 +223,34 @@ class SourceCodeCommentHandler:
     ) -> SourceCodeComments:
         """ Returns the preprocessed source code comments for a bug line.
 
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        return SourceCodeCommentIndex(fp).get_source_line_comments(bug_line)
+
+    def get_source_line_comments_from_lines(
+        self,
+        source_lines: List[str],
+        bug_line: int
+    ) -> SourceCodeComments:
+        """ Returns the preprocessed source code comments for a bug line from
+        the given lines of the source file.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        return self.get_source_line_comments_from_line_map(
+            dict(enumerate(source_lines, 1)), bug_line)
+
+    def get_source_line_comments_from_line_map(
+        self,
+        source_lines: Dict[int, str],
+        bug_line: int
+    ) -> SourceCodeComments:
+        """ Returns the preprocessed source code comments for a bug line from
+        the given lines of the source file by line numbers. Missing lines are
+        handled as empty lines.
+
         raise: SpellException in case there is a spell error in the
                codechecker review comment keyword
         """
@@ -244,7 +268,7 @@ class SourceCodeCommentHandler:
         cstyle_end_found = False
 
         while True:
-            source_line = util.get_linef(fp, previous_line_num)
+            source_line = source_lines.get(previous_line_num, '')
 
             # cpp style comment
             is_comment = \
@@ -343,7 +367,140 @@ class SourceCodeCommentHandler:
                  comment1 */
 
         """
-        source_line_comments = self.get_source_line_comments(fp, bug_line)
+        return SourceCodeCommentIndex(fp).filter_source_line_comments(
+            bug_line, checker_name)
+
+
+class SourceCodeCommentIndex:
+    """
+    Review comments of a source file indexed by line numbers.
+
+    The source file is read only once and only its comment lines are kept.
+    The review comments belonging to a line are collected at the first lookup
+    of the line and they are kept for the further lookups, so the comments
+    above lines with multiple reports are not parsed again.
+    """
+
+    def __init__(self, fp: TextIO):
+        fp.seek(0)
+        lines = fp.readlines()
+        self.__line_count = len(lines)
+
+        # Review comments can't belong to the lines before the first comment
+        # marker.
+        self.__first_marker_line = next(
+            (idx + 1 for idx, line in enumerate(lines)
+             if "codechecker_" in line), None)
+
+        # Review comments are collected from the comment lines and from the
+        # lines of C style comment blocks above a report. Any other line
+        # ends the collection like an empty line, so it is not kept.
+        self.__lines: Dict[int, str] = {}
+        if self.__first_marker_line is not None:
+            in_cstyle_comment = False
+            for idx in range(len(lines) - 1, self.__first_marker_line - 2,
+                             -1):
+                line = lines[idx]
+                src_line = line.strip()
+                cstyle_start = '/*' in src_line
+                cstyle_end = '*/' in src_line
+
+                if in_cstyle_comment or cstyle_start or cstyle_end or \
+                        src_line.startswith('//'):
+                    self.__lines[idx + 1] = line
+
+                if cstyle_start:
+                    in_cstyle_comment = False
+                elif cstyle_end:
+                    in_cstyle_comment = True
+
+        self.__comments: Dict[int, SourceCodeComments] = {}
+        self.__spell_errors: Dict[int, str] = {}
+
+    def has_codechecker_comment(self) -> bool:
+        """ True if the source file contains any codechecker comment. """
+        return self.__first_marker_line is not None
+
+    def get_source_line_comments(
+        self,
+        bug_line: int
+    ) -> SourceCodeComments:
+        """ Returns the preprocessed source code comments for a bug line.
+
+        raise: SpellException in case there is a spell error in the
+               codechecker review comment keyword
+        """
+        if self.__first_marker_line is None or \
+                bug_line <= self.__first_marker_line:
+            return []
+
+        if bug_line in self.__spell_errors:
+            raise SpellException(self.__spell_errors[bug_line])
+
+        if bug_line not in self.__comments:
+            try:
+                self.__comments[bug_line] = SourceCodeCommentHandler() \
+                    .get_source_line_comments_from_line_map(
+                        self.__lines, bug_line)
+            except SpellException as ex:
+                self.__spell_errors[bug_line] = str(ex)
+                raise
+
+        return list(self.__comments[bug_line])
+
+    def scan_source_line_comments(
+        self,
+        line_numbers: Iterable[int]
+    ) -> Tuple[List[Tuple[int, SourceCodeComments]], List[str]]:
+        """collect all the source line review comments if exists
+        in a source file at the given line numbers.
+
+        returns a list of (line_num, comments) tuples where comments
+        were found.
+        """
+        comments: List[Tuple[int, SourceCodeComments]] = []
+        misspelled_comments: List[str] = []
+        if not self.has_codechecker_comment():
+            return comments, misspelled_comments
+
+        line_numbers = sorted(line_numbers)
+        for num in line_numbers:
+            try:
+                comments.append((num, self.get_source_line_comments(num)))
+            except SpellException as ex:
+                misspelled_comments.append(str(ex))
+        return comments, misspelled_comments
+
+    def get_commented_lines(self) -> Tuple[List[int], Dict[int, str]]:
+        """
+        Returns the numbers of the lines which have review comments and the
+        misspelled review comments by line numbers.
+        """
+        commented_lines: List[int] = []
+        misspelled_comments: Dict[int, str] = {}
+        if self.__first_marker_line is None:
+            return commented_lines, misspelled_comments
+
+        for num in range(self.__first_marker_line + 1, self.__line_count + 2):
+            try:
+                if self.get_source_line_comments(num):
+                    commented_lines.append(num)
+            except SpellException as ex:
+                misspelled_comments[num] = str(ex)
+
+        return commented_lines, misspelled_comments
+
+    def filter_source_line_comments(
+        self,
+        bug_line: int,
+        checker_name: str
+    ) -> SourceCodeComments:
+        """
+        Returns the source code comments of the bug line which belong to the
+        given checker. See SourceCodeCommentHandler.filter_source_line_comments
+        for the details.
+        """
+        source_line_comments = self.get_source_line_comments(bug_line)
 
         if not source_line_comments:
             return []
@@ -367,3 +524,54 @@ class SourceCodeCommentHandler:
                       "checker '%s': %s", checker_name,
                       checker_name_comments[0])
         return checker_name_comments
+
+
+__index_cache: "OrderedDict[str, SourceCodeCommentIndex]" = OrderedDict()
+__content_hash_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+__index_cache_lock = threading.Lock()
+
+
+def get_source_code_comment_index(file_path: str) -> SourceCodeCommentIndex:
+    """
+    Returns the review comment index of the given source file.
+
+    The indices are cached by the content hash of the source files, so
+    source files with the same content are indexed only once. The content
+    hashes are cached by the path, size and modification time of the files,
+    so the files are not read again while they are not modified.
+    """
+    stat = os.stat(file_path)
+    file_key = (file_path, stat.st_size, stat.st_mtime_ns)
+
+    with __index_cache_lock:
+        content_hash = __content_hash_cache.get(file_key)
+        index = __index_cache.get(content_hash) if content_hash else None
+        if index is not None:
+            __content_hash_cache.move_to_end(file_key)
+            __index_cache.move_to_end(content_hash)
+            return index
+
+    with open(file_path, 'rb') as f:
+        content = f.read()
+
+    content_hash = hashlib.sha256(content).hexdigest()
+
+    with __index_cache_lock:
+        __content_hash_cache[file_key] = content_hash
+        if len(__content_hash_cache) > INDEX_CACHE_SIZE:
+            __content_hash_cache.popitem(last=False)
+
+        index = __index_cache.get(content_hash)
+        if index is not None:
+            __index_cache.move_to_end(content_hash)
+            return index
+
+    index = SourceCodeCommentIndex(io.TextIOWrapper(
+        io.BytesIO(content), encoding='utf-8', errors='ignore'))
+
+    with __index_cache_lock:
+        __index_cache[content_hash] = index
+        if len(__index_cache) > INDEX_CACHE_SIZE:
+            __index_cache.popitem(last=False)
+
+    return index
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Performance tester for the SARIF parser of the report-converter.
+
+It generates a synthetic SARIF file and compares the peak memory usage and
+throughput of loading it by the sarif-tools loader and of reading it by the
+incremental SARIF reader.
+"""
+
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+REPO_ROOT = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..'))
+
+sys.path.append(os.path.join(REPO_ROOT, 'tools', 'report-converter'))
+
+
+MODES = ['loader', 'stream', 'reports']
+
+
+def generate_sarif(file_path: str, source_file_path: str, result_count: int):
+    """ Generate a SARIF file with the given number of results. """
+    with open(source_file_path, 'w', encoding='utf-8') as f:
+        f.writelines(f"int x{i} = {i};\n" for i in range(100))
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write('{"version": "2.1.0", "runs": [{"results": [')
+        for i in range(result_count):
+            if i:
+                f.write(',')
+
+            line = i % 100 + 1
+            json.dump({
+                "ruleId": f"checker-{i % 50}",
+                "message": {"text": f"Synthetic message {i}"},
+                "locations": [{
+                    "physicalLocation": {
+                        "artifactLocation": {
+                            "uri": f"file://{source_file_path}"},
+                        "region": {"startLine": line, "startColumn": 1}}}],
+                "codeFlows": [{"threadFlows": [{"locations": [{
+                    "location": {
+                        "message": {"text": "Event message"},
+                        "physicalLocation": {
+                            "artifactLocation": {
+                                "uri": f"file://{source_file_path}"},
+                            "region": {
+                                "startLine": line, "startColumn": 1}}}}]}]}]
+            }, f)
+        f.write('], "tool": {"driver": {"name": "synthetic", "rules": [')
+        f.write(','.join(json.dumps({"id": f"checker-{i}"})
+                         for i in range(50)))
+        f.write(']}}}]}')
+
+
+def measure(mode: str, file_path: str):
+    """ Process the given SARIF file and print the measured values. """
+    # pylint: disable=import-outside-toplevel
+    before = time.time()
+    count = 0
+    if mode == 'loader':
+        from sarif import loader  # type: ignore
+        data = loader.load_sarif_file(file_path)
+        for run in data.runs:
+            count += len(run.get_results())
+    elif mode == 'stream':
+        from codechecker_report_converter.report.parser.sarif import \
+            SarifReader
+        sarif_reader = SarifReader(file_path)
+        sarif_reader.get_runs()
+        for _ in sarif_reader.iter_results():
+            count += 1
+    else:
+        from codechecker_report_converter.report.parser.sarif import Parser
+        for _ in Parser().iter_reports(file_path):
+            count += 1
+
+    duration = time.time() - before
+
+    # On Linux the maximum resident set size is given in kilobytes.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(json.dumps({
+        "mode": mode,
+        "count": count,
+        "duration": duration,
+        "peak_rss_mb": peak_rss}))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Performance tester for the SARIF parser.')
+
+    parser.add_argument('-n', '--results',
+                        type=int,
+                        dest='results',
+                        default=1000000,
+                        help='Number of results in the generated SARIF file.')
+
+    parser.add_argument('--mode',
+                        dest='mode',
+                        choices=MODES,
+                        help=argparse.SUPPRESS)
+
+    parser.add_argument('--file',
+                        dest='file',
+                        help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    # Each measurement runs in a separate process so the peak memory usage
+    # of the modes doesn't affect each other.
+    if args.mode:
+        measure(args.mode, args.file)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sarif_file = os.path.join(tmp_dir, 'synthetic.sarif')
+        generate_sarif(sarif_file, os.path.join(tmp_dir, 'main.c'),
+                       args.results)
+
+        size_mb = os.path.getsize(sarif_file) / 1024 / 1024
+        print(f"Generated {args.results} results ({size_mb:.1f} MB).")
+        print(f"{'mode':<10}{'results':>10}{'time (s)':>12}"
+              f"{'results/s':>12}{'peak RSS (MB)':>16}")
+
+        for mode in MODES:
+            out = subprocess.check_output(
+                [sys.executable, __file__, '--mode', mode,
+                 '--file', sarif_file],
+                encoding='utf-8')
+            res = json.loads(out.splitlines()[-1])
+            print(f"{mode:<10}{res['count']:>10}{res['duration']:>12.2f}"
+                  f"{res['count'] / res['duration']:>12.0f}"
+                  f"{res['peak_rss_mb']:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,14 @@
 # -------------------------------------------------------------------------
 """
 Performance tester for the server.
+
+With the --insert-rows option it measures the throughput of inserting report
+rows into a database with the ORM, with the bulk inserter of the storage and
+with the compact bug path layout instead, and the size of the stored data.
+
+With the --diff-hashes option it measures the duration of comparing a run to
+the given numbers of report hashes of a client by passing the hashes as bound
+parameters and by joining them from a temporary table.
 """
 
 
@@ -34,6 +42,9 @@ handler.setFormatter(formatter)
 LOG.setLevel(logging.INFO)
 LOG.addHandler(handler)
 
+REPO_ROOT = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..'))
+
 
 VERBOSE = False
 FINISH = False
@@ -84,7 +95,7 @@ def parse_arguments():
     parser.add_argument('input',
                         type=str,
                         metavar='file/folder',
-                        nargs='+',
+                        nargs='*',
                         default='~/.codechecker/reports',
                         help="The analysis result files and/or folders.")
     parser.add_argument('--url',
@@ -97,7 +108,6 @@ def parse_arguments():
                              "for, in the format of host:port/ProductName.")
     parser.add_argument('-o', '--output',
                         type=str,
-                        required=True,
                         help="Output file name for printing statistics.")
     parser.add_argument('-u', '--users',
                         type=int,
@@ -124,8 +134,37 @@ def parse_arguments():
     parser.add_argument('-v', '--verbose',
                         action='store_true',
                         help="Print the output of CodeChecker commands.")
+    parser.add_argument('--insert-rows',
+                        type=int,
+                        dest='insert_rows',
+                        default=0,
+                        help="Instead of simulating users, insert this many "
+                             "reports with bug path events into the database "
+                             "given by --database-url with the different "
+                             "storage methods and print the inserted rows "
+                             "per second and the size of the stored data.")
+    parser.add_argument('--database-url',
+                        type=str,
+                        dest='database_url',
+                        default='sqlite://',
+                        help="SQLAlchemy URL of an empty database for "
+                             "--insert-rows and --diff-hashes.")
+    parser.add_argument('--diff-hashes',
+                        type=int,
+                        nargs='+',
+                        dest='diff_hashes',
+                        help="Instead of simulating users, store a run with "
+                             "this many reports into the database given by "
+                             "--database-url and compare it to the same "
+                             "number of report hashes, half of which are "
+                             "new, for every given number. For example: "
+                             "--diff-hashes 10000 100000 1000000")
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not args.insert_rows and not args.diff_hashes and not args.output:
+        parser.error("the following arguments are required: -o/--output")
+
+    return args
 
 
 class StatManager:
@@ -397,11 +436,257 @@ def simulate_user(report_dirs, server_url, stat, beta, rounds):
         user.play()
 
 
+def get_database_size(session, tables):
+    """
+    Returns the size of the given tables in bytes or None if it can't be
+    measured on the used database.
+    """
+    # pylint: disable=import-outside-toplevel
+    import sqlalchemy
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        page_size, page_count, freelist_count = [
+            session.execute(sqlalchemy.text(f"PRAGMA {pragma}")).scalar()
+            for pragma in ['page_size', 'page_count', 'freelist_count']]
+        return page_size * (page_count - freelist_count)
+
+    if dialect == 'postgresql':
+        return sum(session.execute(
+            sqlalchemy.text("SELECT pg_total_relation_size(:table)"),
+            {'table': table}).scalar() for table in tables)
+
+    return None
+
+
+def benchmark_insert(report_count, database_url):
+    """
+    Insert reports with bug paths into the database with the ORM, with the
+    bulk inserter of the storage and with the compact bug path layout. Prints
+    the inserted rows per second and the size of the stored data.
+    """
+    for path in ['web/server', 'web', '', 'tools/report-converter']:
+        sys.path.append(os.path.join(REPO_ROOT, path))
+
+    # pylint: disable=import-outside-toplevel
+    import sqlalchemy
+    from sqlalchemy.orm import sessionmaker
+
+    from codechecker_report_converter.report import \
+        BugPathEvent as ReportBugPathEvent, File as ReportFile, Report as \
+        ConvertedReport
+    from codechecker_server.database.bulk_insert import BulkInserter, \
+        insert_rows_returning_ids
+    from codechecker_server.database.report_path import encode_report_path
+    from codechecker_server.database.run_db_model import Base, \
+        BugPathEvent, Checker, Report, ReportPath, ReportPathFile
+
+    engine = sqlalchemy.create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    now = datetime.datetime.now()
+    file_path_to_id = {f'/src/file{i}.cpp': i for i in range(1, 11)}
+    reports = [ConvertedReport(
+        ReportFile('/src/file1.cpp'), i, 1, 'Division by zero',
+        'core.DivideZero', report_hash=f'hash{i}',
+        bug_path_events=[ReportBugPathEvent(
+            f'Assuming that the value is {idx}',
+            ReportFile(f'/src/file{idx % 3 + 1}.cpp'), idx, 1)
+            for idx in range(10)]) for i in range(report_count)]
+
+    tables = ['reports', 'bug_path_events', 'report_paths',
+              'report_path_files']
+
+    def report_row(report, checker):
+        return {'file_id': 1, 'run_id': 1, 'bug_id': report.report_hash,
+                'checker_id': checker.id, 'line': report.line,
+                'column': report.column,
+                'path_length': len(report.bug_path_events),
+                'checker_message': report.message,
+                'detection_status': 'new', 'review_status': 'unreviewed',
+                'review_status_is_in_source': False, 'detected_at': now}
+
+    def orm_insert(checker):
+        db_reports = [Report(1, 1, report.report_hash, checker, report.line,
+                             report.column, len(report.bug_path_events),
+                             report.message, 'new', 'unreviewed', None, None,
+                             None, False, now, None)
+                      for report in reports]
+        session.add_all(db_reports)
+        session.flush()
+
+        for db_report, report in zip(db_reports, reports):
+            for idx, event in enumerate(report.bug_path_events):
+                session.add(BugPathEvent(
+                    event.line, event.column, event.line, event.column, idx,
+                    event.message, file_path_to_id[event.file.path],
+                    db_report.id))
+        session.flush()
+
+        return len(reports) + sum(len(r.bug_path_events) for r in reports)
+
+    def bulk_insert(checker):
+        report_ids = insert_rows_returning_ids(
+            session, Report.__table__,
+            [report_row(report, checker) for report in reports])
+
+        inserter = BulkInserter(session)
+        for report_id, report in zip(report_ids, reports):
+            for idx, event in enumerate(report.bug_path_events):
+                inserter.add(BugPathEvent.__table__, {
+                    'line_begin': event.line, 'col_begin': event.column,
+                    'line_end': event.line, 'col_end': event.column,
+                    'order': idx, 'msg': event.message,
+                    'file_id': file_path_to_id[event.file.path],
+                    'report_id': report_id})
+        inserter.flush()
+
+        return len(report_ids) + inserter.row_count
+
+    def compact_insert(checker):
+        report_ids = insert_rows_returning_ids(
+            session, Report.__table__,
+            [report_row(report, checker) for report in reports])
+
+        inserter = BulkInserter(session)
+        for report_id, report in zip(report_ids, reports):
+            data, file_ids = encode_report_path(report, file_path_to_id)
+            inserter.add(ReportPath.__table__,
+                         {'report_id': report_id, 'data': data})
+            for file_id in file_ids:
+                inserter.add(ReportPathFile.__table__,
+                             {'report_id': report_id, 'file_id': file_id})
+        inserter.flush()
+
+        return len(report_ids) + inserter.row_count
+
+    for name, insert in [('ORM', orm_insert), ('bulk', bulk_insert),
+                         ('compact', compact_insert)]:
+        checker = Checker('clangsa', 'core.DivideZero', 0)
+        session.add(checker)
+        session.flush()
+
+        size_before = get_database_size(session, tables)
+        before = time.time()
+        row_count = insert(checker)
+        duration = time.time() - before
+        size_after = get_database_size(session, tables)
+
+        session.rollback()
+        session.expunge_all()
+
+        size = f", {(size_after - size_before) / 1024 ** 2:.1f} MiB" \
+            if size_before is not None else ""
+        LOG.info("%s: %d reports, %d rows in %.2f s, %.0f reports/s, "
+                 "%.0f rows/s%s", name, len(reports), row_count, duration,
+                 len(reports) / duration, row_count / duration, size)
+
+    session.close()
+    engine.dispose()
+
+
+def benchmark_diff(hash_counts, database_url):
+    """
+    Compare a run to report hashes of a client by passing the hashes as bound
+    parameters of an IN expression and by joining them from a temporary
+    table. Prints the duration of the queries of the new, resolved and
+    unresolved reports.
+    """
+    for path in ['web/server', 'web', '', 'tools/report-converter']:
+        sys.path.append(os.path.join(REPO_ROOT, path))
+
+    # pylint: disable=import-outside-toplevel
+    import sqlalchemy
+    from sqlalchemy.orm import sessionmaker
+
+    from codechecker_server.api.report_server import REPORT_HASHES_TABLE
+    from codechecker_server.database.bulk_insert import BulkInserter, \
+        temporary_table
+    from codechecker_server.database.run_db_model import Base, Checker, \
+        Report
+
+    engine = sqlalchemy.create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    now = datetime.datetime.now()
+
+    def in_list_diff(client_hashes):
+        base_hashes = set(bug_id for bug_id, in session.query(Report.bug_id)
+                          .filter(Report.bug_id.in_(client_hashes))
+                          .distinct())
+        new = set(client_hashes) - base_hashes
+        resolved = session.query(Report.bug_id) \
+            .filter(Report.bug_id.notin_(client_hashes)).distinct().all()
+        unresolved = session.query(Report.bug_id) \
+            .filter(Report.bug_id.in_(client_hashes)).distinct().all()
+        return len(new), len(resolved), len(unresolved)
+
+    def temporary_table_diff(client_hashes):
+        with temporary_table(session, REPORT_HASHES_TABLE,
+                             [{'bug_id': h} for h in client_hashes]) as t:
+            base_hashes = sqlalchemy.select(Report.bug_id)
+            new = session.execute(
+                sqlalchemy.select(t.c.bug_id).except_(base_hashes)).all()
+            resolved = session.query(Report.bug_id) \
+                .filter(~sqlalchemy.exists().where(
+                    t.c.bug_id == Report.bug_id)).distinct().all()
+            unresolved = session.query(Report.bug_id) \
+                .join(t, t.c.bug_id == Report.bug_id).distinct().all()
+            return len(new), len(resolved), len(unresolved)
+
+    for hash_count in hash_counts:
+        checker = Checker('clangsa', 'core.DivideZero', 0)
+        session.add(checker)
+        session.flush()
+
+        inserter = BulkInserter(session)
+        for i in range(hash_count):
+            inserter.add(Report.__table__, {
+                'run_id': 1, 'bug_id': f'hash{i}', 'checker_id': checker.id,
+                'line': i, 'detection_status': 'new',
+                'review_status': 'unreviewed', 'detected_at': now})
+        inserter.flush()
+
+        client_hashes = [f'hash{i}' for i in range(
+            hash_count // 2, hash_count + hash_count // 2)]
+
+        for name, diff in [('IN list', in_list_diff),
+                           ('temporary table', temporary_table_diff)]:
+            before = time.time()
+            try:
+                new, resolved, unresolved = diff(client_hashes)
+            except sqlalchemy.exc.DBAPIError as ex:
+                session.rollback()
+                LOG.info("%s: %d hashes failed: %s", name, hash_count,
+                         ex.orig)
+                continue
+
+            LOG.info("%s: %d hashes in %.2f s (%d new, %d resolved, "
+                     "%d unresolved)", name, hash_count, time.time() - before,
+                     new, resolved, unresolved)
+
+        session.rollback()
+        session.expunge_all()
+
+    session.close()
+    engine.dispose()
+
+
 def main():
     global VERBOSE
 
     args = parse_arguments()
 
+    if args.insert_rows:
+        benchmark_insert(args.insert_rows, args.database_url)
+        return
+
+    if args.diff_hashes:
+        benchmark_diff(args.diff_hashes, args.database_url)
+        return
+
     VERBOSE = args.verbose
 
     stat = StatManager()
@@ -0,0 +1,149 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Performance tester for the skip list handler.
+
+It generates a skip file similar to the ones generated from code ownership
+data and measures the throughput of the skip list handler on generated
+paths. The decisions are compared to the sequential matching of the rules
+on a sample of the paths.
+"""
+
+
+import argparse
+import fnmatch
+import os
+import random
+import re
+import sys
+import time
+
+
+REPO_ROOT = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..'))
+
+sys.path.append(REPO_ROOT)
+
+# pylint: disable=wrong-import-position
+from codechecker_common.skiplist_handler import SkipListHandler  # noqa
+
+
+def generate_skip_lines(rule_count: int, rnd: random.Random):
+    """ Generate skip file lines. """
+    skip_lines = ['-*/generated/*', '+*/test/*.cpp']
+    for i in range(rule_count - len(skip_lines)):
+        sign = rnd.choice('+-')
+        pattern = rnd.choice([
+            f"/repo/team{i % 100}/component{i}/*",
+            f"/repo/team{i % 100}/component{i}/src/*.cpp",
+            f"/repo/team{i % 100}/component{i}/include/"])
+        skip_lines.append(f"{sign}{pattern}")
+
+    skip_lines.append('-/repo/*')
+
+    return skip_lines
+
+
+def generate_paths(path_count: int, rule_count: int, rnd: random.Random):
+    """ Generate source file paths. """
+    for i in range(path_count):
+        directory = rnd.choice(['src', 'include', 'test', 'generated'])
+        extension = rnd.choice(['cpp', 'h'])
+        yield f"/repo/team{rnd.randrange(100)}/" \
+            f"component{rnd.randrange(rule_count)}/{directory}/file{i}." \
+            f"{extension}"
+
+
+def sequential_should_skip(rules, path: str) -> bool:
+    """ Try the skip rules one by one. """
+    for line, rexpr in rules:
+        if rexpr.match(path):
+            return line[0] == '-'
+
+    return False
+
+
+def compile_rules(skip_lines):
+    """ Compile the skip lines to regular expressions one by one. """
+    rules = []
+    for line in skip_lines:
+        glob = fnmatch.translate(os.path.normpath(line[1:]))[:-2]
+        rules.append((line, re.compile(glob + r"(?:/.*)?$")))
+
+    return rules
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Performance tester for the skip list handler.')
+
+    parser.add_argument('-n', '--paths',
+                        type=int,
+                        dest='paths',
+                        default=1000000,
+                        help='Number of generated paths.')
+
+    parser.add_argument('-r', '--rules',
+                        type=int,
+                        dest='rules',
+                        default=5000,
+                        help='Number of generated skip rules.')
+
+    parser.add_argument('-d', '--distinct',
+                        type=int,
+                        dest='distinct',
+                        default=10000,
+                        help='Number of distinct paths in the run with '
+                             'repeated paths.')
+
+    parser.add_argument('-s', '--sample',
+                        type=int,
+                        dest='sample',
+                        default=1000,
+                        help='Number of paths which are also matched by '
+                             'trying the skip rules one by one.')
+
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    skip_lines = generate_skip_lines(args.rules, rnd)
+    paths = list(generate_paths(args.paths, args.rules, rnd))
+
+    before = time.time()
+    handler = SkipListHandler('\n'.join(skip_lines))
+    print(f"Compiled {len(skip_lines)} rules in "
+          f"{time.time() - before:.2f} s.")
+
+    # Reports of the same source file look up the same path multiple times.
+    repeated_paths = [paths[i % args.distinct] for i in range(len(paths))]
+
+    for name, lookups in [('distinct paths', paths),
+                          ('repeated paths', repeated_paths)]:
+        before = time.time()
+        skipped = sum(handler.should_skip(path) for path in lookups)
+        duration = time.time() - before
+        print(f"{name}: {len(lookups)} paths ({skipped} skipped) in "
+              f"{duration:.2f} s, {len(lookups) / duration:.0f} paths/s")
+
+    sample = paths[:args.sample]
+    rules = compile_rules(skip_lines)
+
+    before = time.time()
+    decisions = [sequential_should_skip(rules, path) for path in sample]
+    duration = time.time() - before
+    print(f"sequential: {len(sample)} paths in {duration:.2f} s, "
+          f"{len(sample) / duration:.0f} paths/s")
+
+    if decisions != [handler.should_skip(path) for path in sample]:
+        print("Decisions of the skip list handler differ from the "
+              "sequential matching!")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
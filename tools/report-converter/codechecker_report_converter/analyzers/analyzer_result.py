@@ -12,8 +12,10 @@ import os
 
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import hashlib
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
 from codechecker_report_converter.report import Report, report_file
 from codechecker_report_converter.report.hash import get_report_hash, HashType
@@ -23,6 +25,31 @@ from codechecker_report_converter.report.parser.base import AnalyzerInfo
 LOG = logging.getLogger('report-converter')
 
 
+def _get_reports_job(
+    analyzer_result_cls: Type["AnalyzerResultBase"],
+    file_path: str
+) -> List[Report]:
+    """ Parse and post process the given analyzer result file.
+
+    A new analyzer result object is created for each file because some of the
+    converters keep state about the currently parsed file.
+    """
+    return analyzer_result_cls()._get_processed_reports(file_path)
+
+
+def _write_job(
+    export_type: str,
+    analyzer_info: AnalyzerInfo,
+    job: Tuple[str, List[Report]]
+):
+    """ Write the given reports to the given output file. """
+    out_file_path, reports = job
+
+    parser = report_file.get_parser(f".{export_type}")
+    data = parser.convert(reports, analyzer_info)
+    parser.write(data, out_file_path)
+
+
 class AnalyzerResultBase(metaclass=ABCMeta):
     """ Base class to transform analyzer result. """
 
@@ -41,11 +68,16 @@ class AnalyzerResultBase(metaclass=ABCMeta):
         output_dir_path: str,
         export_type: str,
         file_name: str = "{source_file}_{analyzer}_{file_hash}",
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        jobs: int = 1
     ) -> bool:
         """
         Converts the given analyzer result to the output directory in the given
         output type.
+
+        If jobs is greater than 1, the analyzer result files are parsed and
+        the output files are written by a pool of worker processes. The
+        analyzer result directories are split to result files beforehand.
         """
         parser = report_file.get_parser(f".{export_type}")
         if not parser:
@@ -53,27 +85,31 @@ class AnalyzerResultBase(metaclass=ABCMeta):
                       export_type)
             return False
 
-        all_reports = []
-
-        for file_path in analyzer_result_file_paths:
-            file_path = os.path.abspath(file_path)
-            reports = self.get_reports(file_path)
-            if not reports:
-                LOG.info("No '%s' results can be found in '%s'.",
-                         self.TOOL_NAME, file_path)
-
-            self._post_process_result(reports)
-
-            for report in reports:
-                report.analyzer_result_file_path = file_path
-
-                if not report.checker_name:
-                    report.checker_name = self.TOOL_NAME
-
-            all_reports.extend(reports)
+        # Directory inputs are sharded by the result files in them, so they
+        # can be parsed in parallel too.
+        analyzer_result_file_paths = [
+            result_file_path
+            for file_path in analyzer_result_file_paths
+            for result_file_path in self._get_analyzer_result_files(
+                os.path.abspath(file_path))]
+
+        # Spawning worker processes is not worth it for a single input file.
+        parse_jobs = max(1, min(jobs, len(analyzer_result_file_paths)))
+
+        all_reports: List[Report] = []
+        if parse_jobs == 1:
+            for file_path in analyzer_result_file_paths:
+                all_reports.extend(self._get_processed_reports(file_path))
+        else:
+            with ProcessPoolExecutor(max_workers=parse_jobs) as executor:
+                for reports in executor.map(
+                        functools.partial(_get_reports_job, self.__class__),
+                        analyzer_result_file_paths):
+                    all_reports.extend(reports)
 
         self._write(
-            all_reports, output_dir_path, parser, export_type, file_name)
+            all_reports, output_dir_path, parser, export_type, file_name,
+            jobs)
 
         if metadata:
             self._save_metadata(metadata, output_dir_path)
@@ -90,6 +126,32 @@ class AnalyzerResultBase(metaclass=ABCMeta):
         """ Get reports from the given analyzer result. """
         raise NotImplementedError("Subclasses should implement this!")
 
+    def _get_analyzer_result_files(self, file_path: str) -> List[str]:
+        """
+        Get the analyzer result files which can be parsed independently of
+        each other from the given analyzer result path.
+
+        By default the given path is parsed as a whole.
+        """
+        return [file_path]
+
+    def _get_processed_reports(self, file_path: str) -> List[Report]:
+        """ Get post processed reports from the given analyzer result. """
+        reports = self.get_reports(file_path)
+        if not reports:
+            LOG.info("No '%s' results can be found in '%s'.",
+                     self.TOOL_NAME, file_path)
+
+        self._post_process_result(reports)
+
+        for report in reports:
+            report.analyzer_result_file_path = file_path
+
+            if not report.checker_name:
+                report.checker_name = self.TOOL_NAME
+
+        return reports
+
     def _save_metadata(self, metadata, output_dir):
         """ Save metadata.json file to the output directory which will be used
         by CodeChecker.
@@ -138,11 +200,13 @@ class AnalyzerResultBase(metaclass=ABCMeta):
         output_dir_path: str,
         parser,
         export_type: str,
-        file_name: str
+        file_name: str,
+        jobs: int = 1
     ):
         """ Creates plist files from the parse result to the given output.
 
-        It will generate a context free hash for each diagnostics.
+        It will generate a context free hash for each diagnostics. Output
+        files are written in parallel if jobs is greater than 1.
         """
         output_dir = os.path.abspath(output_dir_path)
 
@@ -152,6 +216,7 @@ class AnalyzerResultBase(metaclass=ABCMeta):
             file_to_report[file_path].append(report)
 
         analyzer_info = AnalyzerInfo(name=self.TOOL_NAME)
+        write_jobs: List[Tuple[str, List[Report]]] = []
         for file_path, file_reports in file_to_report.items():
             source_file = os.path.basename(file_path)
             file_hash = hashlib.md5(file_path.encode(errors='ignore')) \
@@ -168,5 +233,16 @@ class AnalyzerResultBase(metaclass=ABCMeta):
                      export_type, out_file_path)
             LOG.debug(file_reports)
 
-            data = parser.convert(file_reports, analyzer_info)
-            parser.write(data, out_file_path)
+            write_jobs.append((out_file_path, file_reports))
+
+        if jobs == 1 or len(write_jobs) <= 1:
+            for out_file_path, file_reports in write_jobs:
+                data = parser.convert(file_reports, analyzer_info)
+                parser.write(data, out_file_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Consume the iterator to propagate exceptions of the workers.
+            list(executor.map(
+                functools.partial(_write_job, export_type, analyzer_info),
+                write_jobs))
@@ -29,13 +29,20 @@ class AnalyzerResult(AnalyzerResultBase):
     NAME = 'Cppcheck'
     URL = 'http://cppcheck.sourceforge.net'
 
+    def _get_analyzer_result_files(self, file_path: str) -> List[str]:
+        """ Get the plist files of the given Cppcheck result directory. """
+        if os.path.isdir(file_path):
+            return sorted(glob.glob(os.path.join(file_path, "*.plist")))
+
+        return [file_path]
+
     def get_reports(self, file_path: str) -> List[Report]:
         """ Get reports from the given analyzer result. """
         reports: List[Report] = []
 
         plist_files = []
         if os.path.isdir(file_path):
-            plist_files = glob.glob(os.path.join(file_path, "*.plist"))
+            plist_files = self._get_analyzer_result_files(file_path)
         elif os.path.isfile(file_path) and file_path.endswith(".plist"):
             plist_files = [file_path]
         else:
@@ -83,7 +83,8 @@ def transform_output(
     file_name: str,
     export_type: str,
     clean: bool = False,
-    metadata: Optional[Dict[str, str]] = None
+    metadata: Optional[Dict[str, str]] = None,
+    jobs: int = 1
 ):
     """ Creates .plist files from the given output to the given output dir. """
     if clean and os.path.isdir(output_dir):
@@ -96,7 +97,7 @@ def transform_output(
 
     parser = supported_converters[parser_type]()
     parser.transform(
-        analyzer_results, output_dir, export_type, file_name, metadata)
+        analyzer_results, output_dir, export_type, file_name, metadata, jobs)
 
 
 def process_metadata(metadata) -> Tuple[Dict[str, str], Dict[str, str]]:
@@ -236,6 +237,16 @@ def __add_arguments_to_parser(parser):
                              "the absolute file path where the bug was "
                              "found. ")
 
+    parser.add_argument('-j', '--jobs',
+                        type=int,
+                        dest="jobs",
+                        required=False,
+                        default=1,
+                        help="Number of parallel jobs which parse the given "
+                             "analyzer output files and write the converted "
+                             "report files. Choosing value 1 doesn't use "
+                             "sub-processes.")
+
     parser.add_argument('-c', '--clean',
                         dest="clean",
                         required=False,
@@ -280,9 +291,13 @@ Supported analyzers:
                   ', '.join(supported_metadata_keys))
         sys.exit(1)
 
+    if args.jobs < 1:
+        LOG.error("The number of jobs should be a positive integer.")
+        sys.exit(1)
+
     return transform_output(
         args.input, args.type, args.output_dir, args.filename, args.export,
-        args.clean, valid_metadata_values)
+        args.clean, valid_metadata_values, args.jobs)
 
 
 if __name__ == "__main__":
@@ -13,9 +13,10 @@ import itertools
 import json
 import logging
 import os
+import sys
 
 from typing import Callable, Dict, List, Optional, Protocol, Set, Tuple, \
-        Union, Any
+        TypeVar, Union, Any
 
 from .. import util
 
@@ -39,14 +40,32 @@ InvalidFileContentMsg: str = \
     "your project to update the reports."
 
 
+OptionalStr = TypeVar('OptionalStr', str, Optional[str])
+
+
+def intern_str(value: OptionalStr) -> OptionalStr:
+    """
+    Intern the given string. File paths, checker names, analyzer names and
+    bug path messages are repeated a lot among reports, so interned copies
+    are shared instead of having a separate copy for each report.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# The classes below use __slots__ because there can be millions of instances
+# of them in memory when large result directories are processed.
 class File:
+    __slots__ = ('__id', '__path', '__original_path', '__content', '__name')
+
     def __init__(
         self,
         file_path: str,
         file_id: Optional[str] = None,
         content: Optional[str] = None
     ):
-        self.__id = file_path if file_id is None else file_id
+        file_path = sys.intern(file_path)
+
+        self.__id = file_path if file_id is None else sys.intern(file_id)
         self.__path = file_path
         self.__original_path = file_path
         self.__content = content
@@ -107,8 +126,8 @@ class File:
 
     def trim(self, path_prefixes: Optional[List[str]] = None) -> str:
         """ Removes the longest matching leading path from the file paths. """
-        self.__path = util.trim_path_prefixes(
-            self.__path, path_prefixes)
+        self.__path = sys.intern(util.trim_path_prefixes(
+            self.__path, path_prefixes))
         return self.__path
 
     def to_json(self) -> Dict:
@@ -147,6 +166,8 @@ def get_or_create_file(
 
 
 class Range:
+    __slots__ = ('start_line', 'start_col', 'end_line', 'end_col')
+
     def __init__(
         self,
         start_line: int,
@@ -182,6 +203,8 @@ class Range:
 
 
 class BugPathPosition:
+    __slots__ = ('file', 'range')
+
     def __init__(
         self,
         file: File,
@@ -211,6 +234,8 @@ class BugPathPosition:
 
 
 class BugPathEvent(BugPathPosition):
+    __slots__ = ('line', 'column', 'message')
+
     def __init__(
         self,
         message: str,
@@ -226,7 +251,7 @@ class BugPathEvent(BugPathPosition):
         self.line = line
         self.column = column
 
-        self.message = message
+        self.message = intern_str(message)
 
     def to_json(self) -> Dict:
         """ Creates a JSON dictionary. """
@@ -255,6 +280,8 @@ class BugPathEvent(BugPathPosition):
 
 
 class MacroExpansion(BugPathEvent):
+    __slots__ = ('name',)
+
     def __init__(
         self,
         message: str,  # Expanded message.
@@ -265,7 +292,7 @@ class MacroExpansion(BugPathEvent):
         file_range: Optional[Range] = None
     ):
         super().__init__(message, file, line, column, file_range)
-        self.name = name
+        self.name = intern_str(name)
 
     def to_json(self) -> Dict:
         """ Creates a JSON dictionary. """
@@ -301,6 +328,13 @@ class SourceReviewStatus:
 class Report:
     """ Represents a report object. """
 
+    __slots__ = ('analyzer_result_file_path', 'file', 'line', 'column',
+                 'message', 'checker_name', 'severity', 'report_hash',
+                 'analyzer_name', 'category', 'type', 'annotations',
+                 'static_message', 'bug_path_events', 'bug_path_positions',
+                 'notes', 'macro_expansions', 'review_status',
+                 '__source_line', '__files', '__changed_files')
+
     def __init__(
         self,
         file: File,
@@ -335,21 +369,22 @@ class Report:
             provide a more stable message which is used only for hash
             generation.
         """
-        self.analyzer_result_file_path = analyzer_result_file_path
+        self.analyzer_result_file_path = \
+            intern_str(analyzer_result_file_path)
         self.file = file
         self.line = line
         self.column = column
-        self.message = message
-        self.checker_name = checker_name
-        self.severity = severity
+        self.message = intern_str(message)
+        self.checker_name = intern_str(checker_name)
+        self.severity = intern_str(severity)
         self.report_hash = report_hash
-        self.analyzer_name = analyzer_name
+        self.analyzer_name = intern_str(analyzer_name)
         self.category = category  # TODO: Remove this. DEPRECATED.
         self.type = type  # TODO: Remove this. DEPRECATED.
         self.annotations = annotations
 
         self.static_message = \
-            message if static_message is None else static_message
+            self.message if static_message is None else static_message
 
         self.bug_path_events = bug_path_events \
             if bug_path_events is not None else \
@@ -7,17 +7,115 @@
 # -------------------------------------------------------------------------
 """ JSON output helpers. """
 
-from typing import Dict, List
+import json
+import logging
+import os
+import sys
+
+from typing import Dict, Iterable, List, Optional, TextIO
 
 from codechecker_report_converter.report import Report
 
 
+LOG = logging.getLogger('report-converter')
+
+VERSION = 1
+
+
 def convert(reports: List[Report]) -> Dict:
     """ Convert the given reports to JSON format. """
-    version = 1
-
     json_reports = []
     for report in reports:
         json_reports.append(report.to_json())
 
-    return {"version": version, "reports": json_reports}
+    return {"version": VERSION, "reports": json_reports}
+
+
+class ReportWriter:
+    """
+    Writes reports incrementally to a JSON document.
+
+    Reports are serialized as soon as they are added, so the memory usage
+    does not depend on the number of reports. The written output is the same
+    as the one written by 'dump_json_output' from the result of 'convert'.
+
+    If no output file path is given, the document is written to the 'out'
+    stream. If an exception occurs while the writer is used as a context
+    manager, the partially written output file is removed.
+    """
+
+    def __init__(
+        self,
+        output_file_path: Optional[str] = None,
+        out: TextIO = sys.stdout
+    ):
+        self._output_file_path = output_file_path
+        self._out = out
+        self._file: Optional[TextIO] = None
+        self._has_reports = False
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+
+        # The output stream is not closed, because it is not owned by the
+        # writer.
+        if self._file and self._output_file_path:
+            self._file.close()
+            os.remove(self._output_file_path)
+
+        self._file = None
+
+    def open(self):
+        """ Open the output and write the header of the document. """
+        if self._output_file_path:
+            self._file = open(self._output_file_path, mode='w',
+                              encoding='utf-8', errors="ignore")
+        else:
+            self._file = self._out
+
+        self._file.write(self._header())
+
+    def add_reports(self, reports: Iterable[Report]):
+        """ Serialize the given reports to the output. """
+        assert self._file, "The writer is not opened!"
+
+        for report in reports:
+            if self._has_reports:
+                self._file.write(", ")
+
+            self._file.write(json.dumps(self._convert_report(report)))
+            self._has_reports = True
+
+    def close(self):
+        """ Write the end of the document and close the output. """
+        if not self._file:
+            return
+
+        self._file.write(self._footer())
+
+        if self._output_file_path:
+            self._file.close()
+            LOG.info('JSON report file was created: %s',
+                     self._output_file_path)
+        else:
+            self._file.write("\n")
+
+        self._file = None
+
+    def _header(self) -> str:
+        """ Beginning of the document up to the first report. """
+        return f'{{"version": {VERSION}, "reports": ['
+
+    def _footer(self) -> str:
+        """ End of the document after the last report. """
+        return "]}"
+
+    def _convert_report(self, report: Report) -> Dict:
+        """ Convert the given report to a JSON serializable object. """
+        return report.to_json()
@@ -16,34 +16,12 @@ from collections import defaultdict
 from typing import Dict, List, Optional, Set
 
 from codechecker_report_converter.report import BugPathEvent, \
-    InvalidFileContentMsg, MacroExpansion, Report
+    InvalidFileContentMsg, MacroExpansion, Report, report_file
 
 
 LOG = logging.getLogger('report-converter')
 
 
-def __get_source_file_for_analyzer_result_file(
-    analyzer_result_file_path: str,
-    metadata: Optional[Dict]
-) -> Optional[str]:
-    """ Get source file for the given analyzer result file. """
-    if not metadata:
-        return None
-
-    result_source_files = {}
-    if 'result_source_files' in metadata:
-        result_source_files = metadata['result_source_files']
-    else:
-        for tool in metadata.get('tools', {}):
-            result_src_files = tool.get('result_source_files', {})
-            result_source_files.update(result_src_files.items())
-
-    if analyzer_result_file_path in result_source_files:
-        return result_source_files[analyzer_result_file_path]
-
-    return None
-
-
 def format_main_report(report: Report) -> str:
     """ Format bug path event. """
     line = report.source_line
@@ -134,7 +112,7 @@ def get_file_report_map(
         file_report_map[report.file.path].append(report)
 
     if input_file_path:
-        source_file = __get_source_file_for_analyzer_result_file(
+        source_file = report_file.get_result_source_file(
             input_file_path, metadata)
 
         # Add source file to the map if it doesn't exist.
@@ -1,9 +1,54 @@
+import json
+
 from typing import Dict, List
 
 from codechecker_report_converter.report import Report
+from codechecker_report_converter.report.output.json import \
+    ReportWriter as JsonReportWriter
 from codechecker_report_converter.report.parser import sarif
+from codechecker_report_converter.report.parser.base import get_tool_info
 
 
 def convert(reports: List[Report]) -> Dict:
     sarif_parser = sarif.Parser()
     return sarif_parser.convert(reports)
+
+
+class ReportWriter(JsonReportWriter):
+    """
+    Writes reports incrementally to a SARIF document.
+
+    Results are written as soon as the reports are added. The rule table of
+    the tool is written after the results, so only the unique rules are kept
+    in memory.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__parser = sarif.Parser()
+        self.__rules: Dict[str, Dict] = {}
+
+    def _header(self) -> str:
+        return '{"version": "2.1.0", ' \
+            '"$schema": "https://raw.githubusercontent.com/oasis-tcs/' \
+            'sarif-spec/master/Schemata/sarif-schema-2.1.0.json", ' \
+            '"runs": [{"results": ['
+
+    def _footer(self) -> str:
+        tool_name, tool_version = get_tool_info()
+        tool = {
+            "driver": {
+                "name": tool_name,
+                "version": tool_version,
+                "rules": list(self.__rules.values())
+            }
+        }
+
+        return f'], "tool": {json.dumps(tool)}}}]}}'
+
+    def _convert_report(self, report: Report) -> Dict:
+        if report.checker_name not in self.__rules:
+            self.__rules[report.checker_name] = \
+                self.__parser.create_rule(report)
+
+        return self.__parser.create_result(report)
@@ -0,0 +1,189 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Incremental reader for large JSON documents.
+
+Only the values which are explicitly read are materialized, so containers
+with a lot of elements (e.g. SARIF results) can be iterated one element at a
+time with memory usage proportional to the size of a single element.
+"""
+
+import json
+
+from typing import Any, Iterator, TextIO
+
+
+# Number of characters read from the file at once.
+CHUNK_SIZE = 1 << 16
+
+WHITESPACE = ' \t\n\r'
+
+# Characters which can continue a number. The decoder stops a number before
+# these characters if the rest of the number is in the next chunk.
+NUMBER_CHARS = '0123456789+-.eE'
+
+# Decoding errors which are at least this many characters before the end of
+# the buffer can't be fixed by reading more of the document. The longest
+# token which can be cut in half by the end of the buffer, apart from
+# strings, is a '\uXXXX' escape sequence.
+MAX_TRUNCATED_TOKEN_LENGTH = 6
+
+
+class JsonStreamReader:
+    """
+    Pull based JSON reader.
+
+    The containers which should be walked incrementally can be iterated by
+    the 'iter_object' and 'iter_array' functions. After each key or element
+    yielded by these functions the caller has to consume exactly one value
+    by calling 'read_value', 'skip_value' or by iterating the nested
+    container.
+    """
+
+    def __init__(self, file_obj: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.__file = file_obj
+        self.__chunk_size = chunk_size
+        self.__buf = ''
+        self.__pos = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+    def __fill(self) -> bool:
+        """
+        Read the next chunk from the file. Already consumed characters are
+        dropped from the buffer. Returns False if the end of the file is
+        reached.
+        """
+        if self.__eof:
+            return False
+
+        self.__buf = self.__buf[self.__pos:]
+        self.__pos = 0
+
+        # Grow geometrically so decoding a large value needs only a
+        # logarithmic number of retries.
+        chunk = self.__file.read(max(self.__chunk_size, len(self.__buf)))
+        if not chunk:
+            self.__eof = True
+            return False
+
+        self.__buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespaces and return the next character without consuming it.
+        Returns an empty string at the end of the document.
+        """
+        while True:
+            while self.__pos < len(self.__buf) and \
+                    self.__buf[self.__pos] in WHITESPACE:
+                self.__pos += 1
+
+            if self.__pos < len(self.__buf):
+                return self.__buf[self.__pos]
+
+            if not self.__fill():
+                return ''
+
+    def __expect(self, chars: str) -> str:
+        """ Consume the next character which should be one of chars. """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expected one of '{chars}' but got '{char}' in the JSON "
+                "document.")
+
+        self.__pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """ Read and decode the next value. """
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buf, self.__pos)
+            except json.JSONDecodeError as err:
+                if self.__is_invalid(err) or not self.__fill():
+                    raise
+                continue
+
+            # A number at the end of the buffer may continue in the next
+            # chunk.
+            if isinstance(value, (int, float)) and \
+                    not isinstance(value, bool) and \
+                    all(c in NUMBER_CHARS for c in self.__buf[end:]) and \
+                    self.__fill():
+                continue
+
+            self.__pos = end
+            return value
+
+    def __is_invalid(self, err: json.JSONDecodeError) -> bool:
+        """
+        Returns True if the given decoding error is caused by an invalid
+        document and not by a value which continues in the next chunk.
+        """
+        # Strings can be arbitrary long, so the error position of an
+        # unterminated string (its beginning) can be anywhere in the buffer.
+        if err.msg.startswith('Unterminated string'):
+            return False
+
+        return err.pos + MAX_TRUNCATED_TOKEN_LENGTH < len(self.__buf)
+
+    def skip_value(self):
+        """
+        Consume the next value without keeping it. The members of containers
+        are decoded one by one, so the whole container is never kept in
+        memory.
+        """
+        char = self.peek()
+        if char == '{':
+            for _ in self.iter_object():
+                self.read_value()
+        elif char == '[':
+            for _ in self.iter_array():
+                self.read_value()
+        else:
+            self.read_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """ Iterate over the keys of the next object. """
+        self.__expect('{')
+        if self.peek() == '}':
+            self.__pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError(
+                    f"Expected an object key in the JSON document but got "
+                    f"'{key}'.")
+
+            self.__expect(':')
+            yield key
+
+            if self.__expect(',}') == '}':
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """ Iterate over the indices of the elements of the next array. """
+        self.__expect('[')
+        if self.peek() == ']':
+            self.__pos += 1
+            return
+
+        idx = 0
+        while True:
+            yield idx
+            idx += 1
+
+            if self.__expect(',]') == ']':
+                return
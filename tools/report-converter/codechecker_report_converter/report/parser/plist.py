@@ -9,10 +9,13 @@
 Parse the plist output of an analyzer
 """
 
+import html
 import importlib
 import logging
+import mmap
 import os
 import plistlib
+import re
 import traceback
 import sys
 
@@ -45,6 +48,16 @@ EXTENSION = 'plist'
 
 PlistItem = Any
 
+FILES_KEY = b'<key>files</key>'
+
+FILES_ARRAY_PATTERN = re.compile(
+    rb'\s*(?:<array>(.*?)</array>|<array\s*/>)', re.DOTALL)
+
+STRING_PATTERN = re.compile(rb'<string>(.*?)</string>', re.DOTALL)
+
+# Opening, closing and empty container elements of the plist.
+CONTAINER_PATTERN = re.compile(rb'<(/?)(?:dict|array)\s*(/?)>')
+
 
 class _LXMLPlistEventHandler:
     """
@@ -187,6 +200,73 @@ def get_file_index_map(
     return file_index_map
 
 
+def __find_top_level_key(data, key: bytes) -> int:
+    """
+    Returns the position of the given key of the root dictionary in the raw
+    plist content or -1 if it is not found. Keys of the nested dictionaries
+    are skipped.
+    """
+    # Clang writes the 'files' array before the diagnostics, but plistlib
+    # sorts the keys, so it can be at the end of the file too.
+    depth = 0
+    scanned = 0
+    pos = data.find(key)
+    while pos != -1:
+        for match in CONTAINER_PATTERN.finditer(data, scanned, pos):
+            if match.group(1):
+                depth -= 1
+            elif not match.group(2):
+                depth += 1
+        scanned = pos
+
+        if depth == 1:
+            return pos
+
+        pos = data.find(key, pos + len(key))
+
+    return -1
+
+
+def get_file_paths(
+    analyzer_result_file_path: str,
+    source_dir_path: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Get the source file paths referenced by the given plist file without
+    parsing the whole XML document. Only the top level 'files' array is
+    looked up in the raw content of the file, which is much cheaper than
+    building the plist object of the diagnostics.
+
+    Returns None if the file paths can not be determined this way (e.g. for
+    binary plist files).
+    """
+    if not source_dir_path:
+        source_dir_path = os.path.dirname(analyzer_result_file_path)
+
+    try:
+        with open(analyzer_result_file_path, 'rb') as fp, \
+                mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:6] == b'bplist':
+                return None
+
+            pos = __find_top_level_key(data, FILES_KEY)
+            if pos == -1:
+                return None
+
+            match = FILES_ARRAY_PATTERN.match(data, pos + len(FILES_KEY))
+            if not match:
+                return None
+
+            return [
+                os.path.normpath(os.path.join(
+                    source_dir_path, html.unescape(file_path.decode())))
+                for file_path in STRING_PATTERN.findall(match.group(1) or b'')]
+    except (OSError, ValueError) as err:
+        LOG.debug("Failed to read file paths from %s: %s",
+                  analyzer_result_file_path, err)
+        return None
+
+
 class Parser(BaseParser):
     def get_reports(
         self,
@@ -10,9 +10,7 @@ import json
 import logging
 import os
 
-from sarif import loader  # type: ignore
-
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from urllib.parse import urlparse
 
@@ -20,7 +18,9 @@ from codechecker_report_converter.report import BugPathEvent, \
     BugPathPosition, File, MacroExpansion, get_or_create_file, Range, Report
 from codechecker_report_converter.report.hash import get_report_hash, HashType
 from codechecker_report_converter.report.parser.base import AnalyzerInfo, \
-    BaseParser, load_json, get_tool_info
+    BaseParser, get_tool_info
+from codechecker_report_converter.report.parser.json_stream import \
+    JsonStreamReader
 
 
 EXTENSION = 'sarif'
@@ -38,6 +38,71 @@ class ThreadFlowInfo:
         self.macro_expansions: List[MacroExpansion] = []
 
 
+class SarifReader:
+    """
+    Incremental reader of SARIF files.
+
+    The results of the runs are read one by one, so the whole document is
+    never loaded into the memory. The file is read twice: the first pass
+    collects the run level data (tool, rules, originalUriBaseIds, etc.)
+    which is required to process the results, because these may come after
+    the results in the document.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def __open(self):
+        # JSON data shall be encoded in utf-8, but a BOM may be present.
+        return open(self.file_path, 'r', encoding='utf-8-sig',
+                    errors='ignore')
+
+    def __iter_runs(self, reader: JsonStreamReader) -> Iterator[int]:
+        """ Iterate over the indices of the runs (§3.13.4). """
+        for key in reader.iter_object():
+            if key != "runs" or reader.peek() != '[':
+                reader.skip_value()
+                continue
+
+            yield from reader.iter_array()
+
+    def get_runs(self) -> List[Dict]:
+        """
+        Get run objects (§3.14) without the results. The 'results' key is
+        kept with a None value if the run has results.
+        """
+        runs: List[Dict] = []
+        with self.__open() as f:
+            reader = JsonStreamReader(f)
+            for _ in self.__iter_runs(reader):
+                run: Dict = {}
+                for key in reader.iter_object():
+                    if key == "results":
+                        reader.skip_value()
+                        run[key] = None
+                    else:
+                        run[key] = reader.read_value()
+                runs.append(run)
+
+        return runs
+
+    def iter_results(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        Iterate over the results (§3.27) of all runs. It yields a tuple of the
+        run index and the result object.
+        """
+        with self.__open() as f:
+            reader = JsonStreamReader(f)
+            for run_idx in self.__iter_runs(reader):
+                for key in reader.iter_object():
+                    if key != "results" or reader.peek() != '[':
+                        reader.skip_value()
+                        continue
+
+                    for _ in reader.iter_array():
+                        yield run_idx, reader.read_value()
+
+
 # Parse to/from sarif formats.
 # Sarif has an extensive documentation, and supports a grand number of fields
 # that CodeChecker has no use for as of writing this comment (e.g. §3.39 graph,
@@ -51,73 +116,92 @@ class Parser(BaseParser):
         _: Optional[str] = None
     ) -> List[Report]:
         """ Get reports from the given analyzer result file. """
+        reports = list(self.iter_reports(analyzer_result_file_path))
 
-        if not self.has_any_runs(analyzer_result_file_path):
+        # If a file path can not be resolved the entire sarif file is
+        # considered to be invalid.
+        if self.had_error:
             return []
 
-        reports: List[Report] = []
-        self.result_file_path = analyzer_result_file_path
-        self.had_error = False
-
-        data = loader.load_sarif_file(analyzer_result_file_path)
-
-        for run in data.runs:
-            rules = self._get_rules(run.run_data)
-            analyzer_name = self._get_analyzer_name(run.run_data)
-            # $3.14.14
-            self.original_uri_base_ids = None
-            if "originalUriBaseIds" in run.run_data:
-                self.original_uri_base_ids = run.run_data["originalUriBaseIds"]
-
-            if "results" not in run.run_data:
-                continue
-
-            for result in run.get_results():
-                rule_id = result["ruleId"]
-                severity = self.get_severity(rule_id)
-                message = self._process_message(
-                    result["message"], rule_id, rules)  # §3.11
-
-                thread_flow_info = self._process_code_flows(
-                    result, rule_id, rules)
-                for location in result.get("locations", []):
-                    # TODO: We don't really support non-local analyses, so we
-                    # only parse physical locations here.
-                    file, rng = self._process_location(location)
-                    if not (file and rng):
-                        continue
-                    if self.had_error:
-                        return []
-
-                    bug_path_events = thread_flow_info.bug_path_events or None
-
-                    report = Report(
-                        file, rng.start_line, rng.start_col,
-                        message, rule_id,
-                        severity=severity,
-                        analyzer_name=analyzer_name,
-                        analyzer_result_file_path=analyzer_result_file_path,
-                        bug_path_events=bug_path_events,
-                        bug_path_positions=thread_flow_info.bug_path_positions,
-                        notes=thread_flow_info.notes,
-                        macro_expansions=thread_flow_info.macro_expansions)
-
-                    if report.report_hash is None:
-                        report.report_hash = get_report_hash(
-                            report, HashType.PATH_SENSITIVE)
-
-                    reports.append(report)
-
         return reports
 
-    def has_any_runs(self, result_file_path: str) -> bool:
+    def iter_reports(
+        self,
+        analyzer_result_file_path: str
+    ) -> Iterator[Report]:
         """
-        The package that contains the sarif import, sarif-tools currently
-        crashes when a sarif file contains no runs, so we need to manually
-        check it.
+        Iterate over the reports of the given analyzer result file.
+
+        The results are read incrementally from the file, so the memory usage
+        doesn't depend on the number of results. The iteration stops if the
+        file is found invalid, in which case 'had_error' is set to True.
         """
-        ret = load_json(result_file_path)
-        return bool(ret and ret["runs"])
+        self.result_file_path = analyzer_result_file_path
+        self.had_error = False
+
+        sarif_reader = SarifReader(analyzer_result_file_path)
+        try:
+            runs = sarif_reader.get_runs()
+        except OSError as ex:
+            LOG.warning("Failed to open sarif file: %s",
+                        analyzer_result_file_path)
+            LOG.warning(ex)
+            return
+        except ValueError as ex:
+            LOG.warning("%s is not a valid sarif file.",
+                        analyzer_result_file_path)
+            LOG.warning(ex)
+            return
+
+        run_infos = []
+        for run in runs:
+            # $3.14.14
+            run_infos.append((
+                self._get_rules(run),
+                self._get_analyzer_name(run),
+                run.get("originalUriBaseIds")))
+
+        if not any("results" in run for run in runs):
+            return
+
+        for run_idx, result in sarif_reader.iter_results():
+            rules, analyzer_name, self.original_uri_base_ids = \
+                run_infos[run_idx]
+
+            rule_id = result["ruleId"]
+            severity = self.get_severity(rule_id)
+            message = self._process_message(
+                result["message"], rule_id, rules)  # §3.11
+
+            thread_flow_info = self._process_code_flows(
+                result, rule_id, rules)
+            for location in result.get("locations", []):
+                # TODO: We don't really support non-local analyses, so we
+                # only parse physical locations here.
+                file, rng = self._process_location(location)
+                if not (file and rng):
+                    continue
+                if self.had_error:
+                    return
+
+                bug_path_events = thread_flow_info.bug_path_events or None
+
+                report = Report(
+                    file, rng.start_line, rng.start_col,
+                    message, rule_id,
+                    severity=severity,
+                    analyzer_name=analyzer_name,
+                    analyzer_result_file_path=analyzer_result_file_path,
+                    bug_path_events=bug_path_events,
+                    bug_path_positions=thread_flow_info.bug_path_positions,
+                    notes=thread_flow_info.notes,
+                    macro_expansions=thread_flow_info.macro_expansions)
+
+                if report.report_hash is None:
+                    report.report_hash = get_report_hash(
+                        report, HashType.PATH_SENSITIVE)
+
+                yield report
 
     def _get_rules(self, data: Dict) -> Dict[str, Dict]:
         """
@@ -314,14 +398,9 @@ class Parser(BaseParser):
         results = []
         for report in reports:
             if report.checker_name not in rules:
-                rules[report.checker_name] = {
-                    "id": report.checker_name,
-                    "fullDescription": {
-                        "text": report.message
-                    }
-                }
+                rules[report.checker_name] = self.create_rule(report)
 
-            results.append(self._create_result(report))
+            results.append(self.create_result(report))
 
         return {
             "version": "2.1.0",
@@ -339,7 +418,16 @@ class Parser(BaseParser):
             }]
         }
 
-    def _create_result(self, report: Report) -> Dict:
+    def create_rule(self, report: Report) -> Dict:
+        """ Create rule dictionary (§3.49) from the given report. """
+        return {
+            "id": report.checker_name,
+            "fullDescription": {
+                "text": report.message
+            }
+        }
+
+    def create_result(self, report: Report) -> Dict:
         """ Create result dictionary from the given report. """
         result = {
             "ruleId": report.checker_name,
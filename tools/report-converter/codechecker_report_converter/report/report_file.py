@@ -9,9 +9,10 @@
 import logging
 import os
 
-from typing import Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from codechecker_report_converter.report import File, Report
+from codechecker_report_converter.report import File, Report, \
+    SkipListHandlers
 from codechecker_report_converter.report.checker_labels import CheckerLabels
 from codechecker_report_converter.report.hash import HashType
 from codechecker_report_converter.report.parser import plist, sarif
@@ -70,6 +71,73 @@ def get_reports(
     return []
 
 
+def get_file_paths(
+    analyzer_result_file_path: str,
+    source_dir_path: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Get the source file paths referenced by the given report file without
+    parsing the reports. Returns None if this is not supported for the given
+    report file.
+    """
+    if analyzer_result_file_path.endswith(plist.EXTENSION):
+        return plist.get_file_paths(analyzer_result_file_path, source_dir_path)
+
+    return None
+
+
+def get_result_source_file(
+    analyzer_result_file_path: str,
+    metadata: Optional[Dict]
+) -> Optional[str]:
+    """
+    Get the analyzed source file of the given analyzer result file from the
+    metadata.
+    """
+    if not metadata:
+        return None
+
+    result_source_files = {}
+    if 'result_source_files' in metadata:
+        result_source_files = metadata['result_source_files']
+    else:
+        for tool in metadata.get('tools', {}):
+            result_src_files = tool.get('result_source_files', {})
+            result_source_files.update(result_src_files.items())
+
+    if analyzer_result_file_path in result_source_files:
+        return result_source_files[analyzer_result_file_path]
+
+    return None
+
+
+def is_skipped(
+    analyzer_result_file_path: str,
+    skip_handlers: Optional[Union[SkipListHandlers, Any]],
+    metadata: Optional[Dict] = None
+) -> bool:
+    """
+    True if every report of the given report file would be skipped by the
+    given skip handlers, so the report file doesn't have to be parsed.
+
+    Reports can be found in any of the files referenced by the report file
+    (e.g. in headers), so the analyzed source file in the metadata is used
+    only to rule out skipping cheaply.
+    """
+    if not skip_handlers:
+        return False
+
+    source_file = get_result_source_file(analyzer_result_file_path, metadata)
+    if source_file and not skip_handlers.should_skip(source_file):
+        return False
+
+    file_paths = get_file_paths(analyzer_result_file_path)
+    if not file_paths:
+        return False
+
+    return all(skip_handlers.should_skip(f) for f in file_paths)
+
+
 def create(
     output_file_path: str,
     reports: List[Report],
@@ -57,6 +57,11 @@ class ClangTidyAnalyzerResultTestCase(unittest.TestCase):
             [analyzer_result], self.cc_result_dir, plist.EXTENSION,
             file_name="{source_file}_{analyzer}")
 
+        self.__check_plist(analyzer_result_plist, source_files, expected_plist)
+
+    def __check_plist(self, analyzer_result_plist, source_files,
+                      expected_plist):
+        """ Compare the given output plist with the expected plist. """
         plist_file = os.path.join(self.cc_result_dir, analyzer_result_plist)
         with open(plist_file, mode='rb') as pfile:
             res = plistlib.load(pfile)
@@ -113,3 +118,17 @@ class ClangTidyAnalyzerResultTestCase(unittest.TestCase):
         """ Test for the tidy7.plist file. """
         self.__check_analyzer_result('tidy7.out', 'test7.cpp_clang-tidy.plist',
                                      ['files/test7.cpp'], 'tidy7.plist')
+
+    def test_parallel_transform(self):
+        """ Test transforming multiple files by multiple processes. """
+        ret = self.analyzer_result.transform(
+            ['tidy1.out', 'tidy2.out', 'tidy7.out'], self.cc_result_dir,
+            plist.EXTENSION, file_name="{source_file}_{analyzer}", jobs=3)
+        self.assertTrue(ret)
+
+        self.__check_plist('test.cpp_clang-tidy.plist',
+                           ['files/test.cpp'], 'tidy1.plist')
+        self.__check_plist('test2.cpp_clang-tidy.plist',
+                           ['files/test2.cpp'], 'tidy2.plist')
+        self.__check_plist('test7.cpp_clang-tidy.plist',
+                           ['files/test7.cpp'], 'tidy7.plist')
@@ -122,3 +122,38 @@ class CppcheckAnalyzerResultTestCase(unittest.TestCase):
             exp = plistlib.load(pfile)
 
         self.assertEqual(res, exp)
+
+    def test_parallel_transform_directory(self):
+        """ Test transforming a directory of plist files by processes. """
+        analyzer_result_dir = os.path.join(self.cc_result_dir, 'out')
+        os.makedirs(analyzer_result_dir)
+        for file_name in ['divide_zero_1.plist', 'divide_zero_2.plist']:
+            shutil.copy(
+                os.path.join(self.test_files, 'out', 'divide_zero.plist'),
+                os.path.join(analyzer_result_dir, file_name))
+
+        self.assertEqual(
+            self.analyzer_result._get_analyzer_result_files(
+                analyzer_result_dir),
+            [os.path.join(analyzer_result_dir, 'divide_zero_1.plist'),
+             os.path.join(analyzer_result_dir, 'divide_zero_2.plist')])
+
+        serial_result_dir = os.path.join(self.cc_result_dir, 'serial')
+        parallel_result_dir = os.path.join(self.cc_result_dir, 'parallel')
+        for result_dir, jobs in [(serial_result_dir, 1),
+                                 (parallel_result_dir, 2)]:
+            os.makedirs(result_dir)
+            ret = self.analyzer_result.transform(
+                [analyzer_result_dir], result_dir, plist.EXTENSION,
+                file_name="{source_file}_{analyzer}", jobs=jobs)
+            self.assertTrue(ret)
+
+        results = []
+        for result_dir in [serial_result_dir, parallel_result_dir]:
+            plist_file = os.path.join(result_dir,
+                                      'divide_zero.cpp_cppcheck.plist')
+            with open(plist_file, mode='rb') as pfile:
+                results.append(plistlib.load(pfile))
+
+        self.assertEqual(len(results[0]['diagnostics']), 2)
+        self.assertEqual(results[0], results[1])
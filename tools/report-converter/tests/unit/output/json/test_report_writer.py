@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Tests for the incremental JSON and SARIF report writers. """
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+from codechecker_report_converter.report.output import \
+    json as report_to_json, sarif
+from codechecker_report_converter.util import dump_json_output
+
+
+class TestReportWriter(unittest.TestCase):
+    @classmethod
+    def setup_class(cls):
+        src_dir = os.path.join(
+            os.path.dirname(__file__), os.pardir, 'gerrit', 'test_files')
+
+        main_file = File(os.path.join(src_dir, 'main.cpp'))
+        lib_file = File(os.path.join(src_dir, 'lib.cpp'))
+
+        cls._reports = [
+            Report(main_file, 3, 3, 'some description', 'my_checker',
+                   report_hash='hash1', severity='LOW'),
+            Report(lib_file, 1, 2, 'other description', 'other_checker',
+                   report_hash='hash2', severity='HIGH',
+                   bug_path_events=[
+                       BugPathEvent('event', lib_file, 1, 2)]),
+            Report(main_file, 2, 1, 'third description', 'my_checker',
+                   report_hash='hash3', severity='LOW')]
+
+    def setUp(self):
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_json_writer_same_as_convert(self):
+        """ Written document is the same as the converted one. """
+        expected = dump_json_output(
+            report_to_json.convert(self._reports), out=None)
+
+        out = io.StringIO()
+        with report_to_json.ReportWriter(out=out) as writer:
+            writer.add_reports(self._reports[:1])
+            writer.add_reports(self._reports[1:])
+
+        self.assertEqual(out.getvalue(), f"{expected}\n")
+
+    def test_json_writer_no_reports(self):
+        """ Valid document is written if there are no reports. """
+        output_file_path = os.path.join(self._tmp_dir, 'reports.json')
+        with report_to_json.ReportWriter(output_file_path):
+            pass
+
+        with open(output_file_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), report_to_json.convert([]))
+
+    def test_json_writer_remove_on_error(self):
+        """ Partially written output file is removed on error. """
+        output_file_path = os.path.join(self._tmp_dir, 'reports.json')
+        with self.assertRaises(RuntimeError):
+            with report_to_json.ReportWriter(output_file_path) as writer:
+                writer.add_reports(self._reports)
+                raise RuntimeError()
+
+        self.assertFalse(os.path.exists(output_file_path))
+
+    def test_json_writer_keep_stream_on_error(self):
+        """ Output stream is not closed on error. """
+        out = io.StringIO()
+        with self.assertRaises(RuntimeError):
+            with report_to_json.ReportWriter(out=out) as writer:
+                writer.add_reports(self._reports)
+                raise RuntimeError()
+
+        self.assertFalse(out.closed)
+
+    def test_sarif_writer_same_as_convert(self):
+        """ Written document has the same content as the converted one. """
+        output_file_path = os.path.join(self._tmp_dir, 'reports.sarif')
+        with sarif.ReportWriter(output_file_path) as writer:
+            for report in self._reports:
+                writer.add_reports([report])
+
+        with open(output_file_path, encoding='utf-8') as f:
+            res = json.load(f)
+
+        self.assertEqual(res, sarif.convert(self._reports))
+        self.assertEqual(
+            [r["id"] for r in res["runs"][0]["tool"]["driver"]["rules"]],
+            ["my_checker", "other_checker"])
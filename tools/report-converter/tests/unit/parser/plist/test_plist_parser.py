@@ -27,12 +27,15 @@ With the newer clang releases more information is available in the plist files.
 
 
 import os
+import plistlib
+import tempfile
 import unittest
 
 from copy import deepcopy
 
 from codechecker_report_converter.report import BugPathEvent, \
     BugPathPosition, File, Range, Report, report_file
+from codechecker_report_converter.report.parser import plist
 from codechecker_report_converter.report.reports import \
     get_mentioned_original_files
 
@@ -276,3 +279,72 @@ class PlistParserTestCase(unittest.TestCase):
                     report.bug_path_events, skel.bug_path_events)
                 self.assertEqual(
                     report.bug_path_positions, skel.bug_path_positions)
+
+    def test_file_paths(self):
+        """ Get the referenced file paths without parsing the reports. """
+        clang37_plist = os.path.join(
+            self.__plist_test_files, 'clang-3.7.plist')
+        self.assertEqual(
+            plist.get_file_paths(clang37_plist),
+            [f.original_path for f in SRC_FILES])
+
+        empty_plist = os.path.join(self.__plist_test_files, 'empty_file.plist')
+        self.assertIsNone(plist.get_file_paths(empty_plist))
+
+        no_bug_plist = os.path.join(
+            self.__plist_test_files, 'clang-3.7-noerror.plist')
+        self.assertEqual(plist.get_file_paths(no_bug_plist), [])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The 'files' array is written after the diagnostics.
+            plist_file = os.path.join(tmp_dir, 'test.plist')
+            report_file.create(
+                plist_file, report_file.get_reports(clang37_plist))
+            self.assertEqual(
+                plist.get_file_paths(plist_file),
+                [f.original_path for f in SRC_FILES])
+
+            binary_plist_file = os.path.join(tmp_dir, 'binary.plist')
+            with open(binary_plist_file, 'wb') as f:
+                plistlib.dump({'files': ['a.cpp']}, f,
+                              fmt=plistlib.FMT_BINARY)
+            self.assertIsNone(plist.get_file_paths(binary_plist_file))
+
+            # The 'files' keys of the nested dictionaries are skipped.
+            nested_plist_file = os.path.join(tmp_dir, 'nested.plist')
+            with open(nested_plist_file, 'wb') as f:
+                plistlib.dump({
+                    'diagnostics': [{'files': ['nested.cpp']}, {}],
+                    'files': ['a.cpp']}, f)
+            self.assertEqual(plist.get_file_paths(nested_plist_file),
+                             [os.path.join(tmp_dir, 'a.cpp')])
+
+            with open(nested_plist_file, 'wb') as f:
+                plistlib.dump({
+                    'diagnostics': [{'files': ['nested.cpp']}]}, f)
+            self.assertIsNone(plist.get_file_paths(nested_plist_file))
+
+    def test_is_skipped(self):
+        """ Skip report files if all of the referenced files are skipped. """
+        class SkipHandlers:
+            def __init__(self, skipped):
+                self.skipped = skipped
+
+            def should_skip(self, file_path):
+                return file_path in self.skipped
+
+        clang37_plist = os.path.join(
+            self.__plist_test_files, 'clang-3.7.plist')
+        src_file, header_file = [f.original_path for f in SRC_FILES]
+
+        self.assertFalse(report_file.is_skipped(clang37_plist, None))
+        self.assertFalse(report_file.is_skipped(
+            clang37_plist, SkipHandlers({src_file})))
+        self.assertTrue(report_file.is_skipped(
+            clang37_plist, SkipHandlers({src_file, header_file})))
+
+        # The analyzed source file in the metadata is not skipped.
+        metadata = {'tools': [
+            {'result_source_files': {clang37_plist: '/not/skipped.cpp'}}]}
+        self.assertFalse(report_file.is_skipped(
+            clang37_plist, SkipHandlers({src_file, header_file}), metadata))
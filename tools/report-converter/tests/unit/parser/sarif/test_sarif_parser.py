@@ -11,10 +11,15 @@ Test the parsing of the sarif files.
 """
 
 
+import io
+import json
 import os
 import unittest
 
 from codechecker_report_converter.report import report_file
+from codechecker_report_converter.report.parser import sarif
+from codechecker_report_converter.report.parser.json_stream import \
+    JsonStreamReader
 
 
 gen_sarif_dir_path = os.path.join(
@@ -41,3 +46,97 @@ class SarifParserTestCase(unittest.TestCase):
                 abs_filename = os.path.join(root, filename)
                 # We test for no crashes.
                 report_file.get_reports(abs_filename)
+
+    def __sarif_files(self):
+        """ Iterate over the sarif test files. """
+        for root, _, files in os.walk(self.__sarif_test_files):
+            for filename in files:
+                if filename.endswith(".sarif"):
+                    yield os.path.join(root, filename)
+
+    def test_json_stream_reader(self):
+        """
+        Incrementally read values are the same as the ones loaded at once,
+        even if the values span over multiple chunks.
+        """
+        for file_path in self.__sarif_files():
+            with open(file_path, encoding='utf-8-sig') as f:
+                expected = json.load(f)
+
+            with open(file_path, encoding='utf-8-sig') as f:
+                reader = JsonStreamReader(f, chunk_size=7)
+                data = {}
+                for key in reader.iter_object():
+                    if key != "runs" or reader.peek() != '[':
+                        data[key] = reader.read_value()
+                        continue
+
+                    data[key] = []
+                    for _ in reader.iter_array():
+                        data[key].append(reader.read_value())
+
+            self.assertEqual(data, expected, file_path)
+
+    def test_json_stream_reader_chunk_boundaries(self):
+        """ Values are read correctly at every chunk boundary. """
+        docs = [
+            '[1.5, 2]',
+            '[12.5e3, 2]',
+            '{"a": 1.25}',
+            '{"a": [-0.5e-10, 1E+2, 3], "b": 12.5e3, "c": -7}',
+            '[true, false, null, "\\u00e9\\ud83d\\ude00", 100]',
+            '12.5e-3']
+
+        for doc in docs:
+            expected = json.loads(doc)
+            for chunk_size in range(1, len(doc) + 1):
+                reader = JsonStreamReader(io.StringIO(doc), chunk_size)
+                self.assertEqual(reader.read_value(), expected,
+                                 (doc, chunk_size))
+
+                reader = JsonStreamReader(io.StringIO(doc), chunk_size)
+                if isinstance(expected, list):
+                    values = [reader.read_value()
+                              for _ in reader.iter_array()]
+                elif isinstance(expected, dict):
+                    values = {key: reader.read_value()
+                              for key in reader.iter_object()}
+                else:
+                    values = reader.read_value()
+                self.assertEqual(values, expected, (doc, chunk_size))
+
+    def test_json_stream_reader_invalid(self):
+        """ Invalid documents are rejected without reading them to the end. """
+        doc = '[1, 2 3, ' + '4, ' * 10000 + '5]'
+        f = io.StringIO(doc)
+
+        reader = JsonStreamReader(f, chunk_size=16)
+        with self.assertRaises(ValueError):
+            reader.read_value()
+
+        self.assertLess(f.tell(), 100)
+
+    def test_sarif_reader(self):
+        """ Runs and results are read separately from the sarif file. """
+        for file_path in self.__sarif_files():
+            with open(file_path, encoding='utf-8-sig') as f:
+                expected = json.load(f)
+
+            expected_runs = expected.get("runs") or []
+
+            sarif_reader = sarif.SarifReader(file_path)
+            runs = sarif_reader.get_runs()
+            self.assertEqual(len(runs), len(expected_runs), file_path)
+
+            results = [[] for _ in runs]
+            for run_idx, result in sarif_reader.iter_results():
+                results[run_idx].append(result)
+
+            for run, expected_run, run_results in \
+                    zip(runs, expected_runs, results):
+                expected_results = expected_run.get("results") or []
+                self.assertEqual(run_results, expected_results, file_path)
+
+                expected_run.pop("results", None)
+                run.pop("results", None)
+                self.assertEqual(run, expected_run, file_path)
@@ -0,0 +1,146 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the memory footprint of the report objects. """
+
+
+import tracemalloc
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, File, \
+    get_or_create_file, MacroExpansion, Range, Report
+
+
+# Number of reports created by the memory benchmark.
+REPORT_COUNT = 20000
+
+
+class DictObject:
+    """
+    Object which keeps its attributes in a per-instance dictionary like the
+    report objects did before they used slots.
+    """
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def create_reports(count):
+    """
+    Create reports where all strings are built dynamically like in the case
+    of the parsers, so equal strings are different objects.
+    """
+    file_cache = {}
+    reports = []
+    for i in range(count):
+        file = get_or_create_file(f"/src/dir/file_{i % 100}.cpp", file_cache)
+
+        bug_path_events = [
+            BugPathEvent(f"Assuming '{'x' * (j + 1)}' is null", file, i, j,
+                         Range(i, j, i, j + 5))
+            for j in range(3)]
+
+        reports.append(Report(
+            file, i, 1, f"Division by zero {i % 10}",
+            f"core.{'DivideZero'}", severity=f"{'HIGH'}",
+            report_hash=f"{i:032x}", analyzer_name=f"{'clangsa'}",
+            analyzer_result_file_path=f"/reports/{i % 100}.plist",
+            bug_path_events=bug_path_events))
+
+    return reports
+
+
+def create_dict_reports(count):
+    """
+    Create the same reports as 'create_reports' with objects which have
+    per-instance dictionaries and don't intern their strings.
+    """
+    file_cache = {}
+    reports = []
+    for i in range(count):
+        file_path = f"/src/dir/file_{i % 100}.cpp"
+        file = file_cache.get(file_path)
+        if file is None:
+            file = DictObject(path=file_path, original_path=file_path,
+                              id=file_path, content=None,
+                              name=f"file_{i % 100}.cpp")
+            file_cache[file_path] = file
+
+        bug_path_events = [
+            DictObject(message=f"Assuming '{'x' * (j + 1)}' is null",
+                       file=file, line=i, column=j,
+                       range=DictObject(start_line=i, start_col=j,
+                                        end_line=i, end_col=j + 5))
+            for j in range(3)]
+
+        reports.append(DictObject(
+            file=file, line=i, column=1,
+            message=f"Division by zero {i % 10}",
+            checker_name=f"core.{'DivideZero'}", severity=f"{'HIGH'}",
+            report_hash=f"{i:032x}", analyzer_name=f"{'clangsa'}",
+            analyzer_result_file_path=f"/reports/{i % 100}.plist",
+            category=None, type=None, source_line=None, review_status=None,
+            bug_path_events=bug_path_events, bug_path_positions=[],
+            notes=[], macro_expansions=[], annotations=None,
+            static_message=None, files=None, changed_files=None))
+
+    return reports
+
+
+def get_memory_usage(create, count):
+    """ Returns the memory allocated by creating the given objects. """
+    tracemalloc.start()
+    try:
+        # The created objects are kept alive until the memory is measured.
+        objects = create(count)
+        used, _ = tracemalloc.get_traced_memory()
+        assert objects
+    finally:
+        tracemalloc.stop()
+
+    return used
+
+
+class ReportMemoryTestCase(unittest.TestCase):
+    """ Test the memory footprint of the report objects. """
+
+    def test_no_instance_dict(self):
+        """ Report objects don't have per-instance dictionaries. """
+        file = File("/src/main.cpp")
+        rng = Range(1, 1, 1, 2)
+        event = BugPathEvent("msg", file, 1, 1, rng)
+        macro = MacroExpansion("msg", "MACRO", file, 1, 1, rng)
+        report = Report(file, 1, 1, "msg", "checker")
+
+        for obj in (file, rng, event, macro, report):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj))
+
+    def test_interned_strings(self):
+        """ Equal strings of different reports are shared. """
+        reports = create_reports(20)
+
+        self.assertIs(reports[0].checker_name, reports[1].checker_name)
+        self.assertIs(reports[0].analyzer_name, reports[1].analyzer_name)
+        self.assertIs(reports[0].severity, reports[1].severity)
+        self.assertIs(reports[0].message, reports[10].message)
+        self.assertIs(reports[0].bug_path_events[0].message,
+                      reports[1].bug_path_events[0].message)
+
+        file1 = File(f"/src/{'main'}.cpp")
+        file2 = File(f"/src/{'main'}.cpp")
+        self.assertIs(file1.path, file2.path)
+
+    def test_memory_usage(self):
+        """
+        Reports use much less memory than objects with per-instance
+        dictionaries and without string interning which hold the same data.
+        """
+        used = get_memory_usage(create_reports, REPORT_COUNT)
+        dict_used = get_memory_usage(create_dict_reports, REPORT_COUNT)
+
+        self.assertLess(used, dict_used * 3 / 4)
@@ -213,6 +213,13 @@ struct SubmittedRunOptions {
   6: optional string       description,
 }
 
+struct MissingContentHashes {
+  1: list<string> contentHashes,    // Hashes of the files which are not
+                                    // stored yet.
+  2: list<string> blameInfoHashes,  // Hashes of the files to which no blame
+                                    // info is stored yet.
+}
+
 struct RunHistoryData {
   1: i64                     runId,              // Unique id of the run.
   2: string                  runName,            // Name of the run.
@@ -1058,6 +1065,27 @@ service codeCheckerDBAccess {
   list<string> getMissingContentHashesForBlameInfo(1: list<string> fileHashes)
                                                    throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // The client can ask the server in a single request which of the given
+  // files and which of their blame infos are not stored yet. The result is the
+  // same as the results of getMissingContentHashes() and
+  // getMissingContentHashesForBlameInfo() together.
+  //
+  // PERMISSION: PRODUCT_STORE
+  MissingContentHashes getMissingContentHashesForStore(1: list<string> fileHashes)
+                                                       throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // The client can ask the server for the fingerprints of the reports which
+  // are stored in the given run. A report which is found again with the same
+  // fingerprint doesn't have to be sent in the ZIP file, only its fingerprint
+  // (see the "kept_report_fingerprints.json" files of the report directories).
+  // The fingerprint is a hash of the report path hash, the content hashes of
+  // the files of the report and the trimmed path prefixes. If the run doesn't
+  // exist, an empty list is returned.
+  //
+  // PERMISSION: PRODUCT_STORE
+  list<string> getRunReportFingerprints(1: string runName)
+                                        throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // This function stores an entire run encapsulated and sent in a ZIP file.
   // The ZIP file has to be compressed by ZLib and the compressed buffer
   // sent as a Base64-encoded string. The ZIP file must contain a "reports" and
@@ -1117,6 +1145,57 @@ service codeCheckerDBAccess {
       2: SubmittedRunOptions storeOpts)
       throws (1: codechecker_api_shared.RequestFailed requestError),
 
+  // The following functions upload the ZIP file of an analysis run in chunks
+  // instead of a single massStoreRunAsynchronous() call, so the size of the
+  // stored results is not limited by the size of one request, and an
+  // interrupted upload can be resumed.
+  //
+  // The uploaded ZIP file must be compressed by ZLib the same way as for
+  // massStoreRunAsynchronous(), but the chunks are Base64-encoded separately.
+  //
+  // This function starts the upload of a compressed ZIP file of the given size
+  // in bytes and returns the token which identifies the upload in the
+  // subsequent calls.
+  //
+  // PERMISSION: PRODUCT_STORE
+  string beginStoreUpload(1: i64 zipfileSize)
+                          throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Returns the number of bytes of the upload received by the server so far.
+  // An interrupted upload can be resumed by sending the chunks from this
+  // offset.
+  //
+  // PERMISSION: PRODUCT_STORE
+  i64 getStoreUploadOffset(1: string uploadToken)
+                           throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Writes a Base64-encoded chunk of the upload at the given offset and returns
+  // the number of bytes received by the server so far. The offset can't be
+  // greater than the number of received bytes. The received bytes from the
+  // offset are overwritten, so a chunk can be sent again if the result of the
+  // previous call was lost.
+  //
+  // The checksum is the SHA-256 hash of the decoded chunk as a hexadecimal
+  // string. The chunk is rejected if its checksum doesn't match.
+  //
+  // PERMISSION: PRODUCT_STORE
+  i64 appendStoreUploadChunk(1: string uploadToken,
+                             2: i64    offset,
+                             3: string chunk,      // Base64-encoded string.
+                             4: string checksum)
+                             throws (1: codechecker_api_shared.RequestFailed requestError),
+
+  // Finishes the upload after every byte of the ZIP file was received and
+  // stores its content the same way as massStoreRunAsynchronous() does.
+  //
+  // Returns a TaskToken, see massStoreRunAsynchronous() for details.
+  //
+  // PERMISSION: PRODUCT_STORE
+  codechecker_api_shared.TaskToken commitStoreUpload(
+      1: string              uploadToken,
+      2: SubmittedRunOptions storeOpts)
+      throws (1: codechecker_api_shared.RequestFailed requestError),
+
   // Returns true if analysis statistics information can be sent to the server,
   // otherwise it returns false.
   // PERMISSION: PRODUCT_STORE
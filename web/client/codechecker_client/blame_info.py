@@ -1,19 +1,35 @@
+import hashlib
 import json
 import os
+import tempfile
 import zipfile
 
 from git import Repo
 from git.exc import InvalidGitRepositoryError, GitCommandError
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from codechecker_common.compatibility.multiprocessing import Pool
 from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# Maximum number of files of a repository which are blamed by one job. The
+# repository is opened once for every batch.
+BLAME_BATCH_SIZE = 32
+
+# Maximum number of blame information in the cache directory.
+BLAME_CACHE_SIZE = 100000
+
+# Fields of the blame information which depend on the state of the
+# repository instead of the blamed file, so they are not cached.
+REPOSITORY_FIELDS = ('tracking_branch', 'remote_url')
+
 
 FileBlameInfo = Dict[str, Optional[Dict]]
 
+# Repository root, cache directory and the blamed files with their content
+# hashes.
+BlameBatch = Tuple[str, Optional[str], List[Tuple[str, Optional[str]]]]
+
 
 def __get_tracking_branch(repo: Repo) -> Optional[str]:
     """
@@ -36,33 +52,92 @@ def __get_tracking_branch(repo: Repo) -> Optional[str]:
     return None
 
 
-def __get_blame_info(file_path: str):
-    """ Get blame info for the given file. """
+def __get_repository_root(
+    dir_path: str,
+    repository_roots: Dict[str, Optional[str]]
+) -> Optional[str]:
+    """
+    Get the root directory of the git repository which contains the given
+    directory. The results are memoized for every visited directory in the
+    given dictionary.
+    """
+    visited = []
+    root = None
+    while dir_path not in repository_roots:
+        visited.append(dir_path)
+        if os.path.exists(os.path.join(dir_path, '.git')):
+            root = dir_path
+            break
+
+        parent = os.path.dirname(dir_path)
+        if parent == dir_path:
+            break
+        dir_path = parent
+    else:
+        root = repository_roots[dir_path]
+
+    for path in visited:
+        repository_roots[path] = root
+
+    return root
+
+
+def __get_cache_file_path(
+    cache_dir: str,
+    head: str,
+    real_path: str,
+    content_hash: str
+) -> str:
+    """ Get the cache file of the blame information of the given file. """
+    key = hashlib.sha256(
+        json.dumps([head, real_path, content_hash]).encode('utf-8'))
+    return os.path.join(cache_dir, f"{key.hexdigest()}.json")
+
+
+def __load_cached_blame_info(cache_file_path: str) -> Optional[Dict]:
+    """ Load the cached blame information if it exists. """
     try:
-        real_path = os.path.realpath(file_path)
-        repo = Repo(real_path, search_parent_directories=True)
-        if repo.ignored(real_path):
-            LOG.debug("File %s is an ignored file", file_path)
-            return None
-    except InvalidGitRepositoryError:
-        return None
-    except GitCommandError as ex:
-        LOG.debug("Failed to get blame information for %s: %s", file_path, ex)
+        with open(cache_file_path, 'r', encoding='utf-8') as f:
+            blame_info = json.load(f)
+
+        # Keep the recently used entries in the cache.
+        os.utime(cache_file_path)
+        return blame_info
+    except (OSError, ValueError):
         return None
 
-    tracking_branch = __get_tracking_branch(repo)
 
-    remote_url = None
+def __store_cached_blame_info(cache_file_path: str, blame_info: Dict):
+    """
+    Write the given blame information to the cache. The repository related
+    fields are not cached, because they are not part of the cache key.
+    """
+    cached_blame_info = {
+        key: value for key, value in blame_info.items()
+        if key not in REPOSITORY_FIELDS}
+
     try:
-        # Handle the use case when a repository doesn't have a remote url.
-        remote_url = next(repo.remote().urls, None)
-    except Exception:
-        pass
+        with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=os.path.dirname(cache_file_path),
+                delete=False) as f:
+            json.dump(cached_blame_info, f)
+        os.replace(f.name, cache_file_path)
+    except OSError as ex:
+        LOG.debug("Failed to cache blame information %s: %s",
+                  cache_file_path, ex)
+
 
+def __get_blame_info(
+    repo: Repo,
+    real_path: str,
+    tracking_branch: Optional[str],
+    remote_url: Optional[str]
+) -> Optional[Dict]:
+    """ Get blame info for the given file. """
     try:
         blame = repo.blame_incremental(repo.head.commit.hexsha, real_path)
 
-        res = {
+        res: Dict[str, Any] = {
             'version': 'v1',
             'tracking_branch': tracking_branch,
             'remote_url': remote_url,
@@ -87,40 +162,176 @@ def __get_blame_info(file_path: str):
                 'to': b.linenos[-1],
                 'commit': commit.hexsha})
 
-        LOG.debug("Collected blame info for %s", file_path)
+        LOG.debug("Collected blame info for %s", real_path)
 
         return res
     except Exception as ex:
-        LOG.debug("Failed to get blame information for %s: %s", file_path, ex)
+        LOG.debug("Failed to get blame information for %s: %s", real_path, ex)
 
     return None
 
 
+def __get_blame_info_for_batch(batch: BlameBatch) -> List[Optional[Dict]]:
+    """
+    Get blame info for the given files of the same repository. The
+    repository is opened only once for the whole batch.
+    """
+    repo_root, cache_dir, files = batch
+    real_paths = [real_path for real_path, _ in files]
+
+    try:
+        repo = Repo(repo_root)
+    except InvalidGitRepositoryError:
+        return [None] * len(files)
+
+    try:
+        try:
+            ignored = set(repo.ignored(*real_paths))
+        except GitCommandError as ex:
+            LOG.debug("Failed to get blame information for %s: %s",
+                      repo_root, ex)
+            return [None] * len(files)
+
+        tracking_branch = __get_tracking_branch(repo)
+
+        remote_url = None
+        try:
+            # Handle the use case when a repository doesn't have a remote url.
+            remote_url = next(repo.remote().urls, None)
+        except Exception:
+            pass
+
+        try:
+            head = repo.head.commit.hexsha
+        except Exception:
+            head = None
+
+        res: List[Optional[Dict]] = []
+        for real_path, content_hash in files:
+            if real_path in ignored:
+                LOG.debug("File %s is an ignored file", real_path)
+                res.append(None)
+                continue
+
+            cache_file_path = None
+            if cache_dir and head and content_hash:
+                cache_file_path = __get_cache_file_path(
+                    cache_dir, head, real_path, content_hash)
+
+                blame_info = __load_cached_blame_info(cache_file_path)
+                if blame_info:
+                    blame_info.update(tracking_branch=tracking_branch,
+                                      remote_url=remote_url)
+                    res.append(blame_info)
+                    continue
+
+            blame_info = __get_blame_info(
+                repo, real_path, tracking_branch, remote_url)
+
+            if blame_info and cache_file_path:
+                __store_cached_blame_info(cache_file_path, blame_info)
+
+            res.append(blame_info)
+
+        return res
+    finally:
+        repo.close()
+
+
 def __collect_blame_info_for_files(
     file_paths: Iterable[str],
+    file_to_hash: Dict[str, str],
+    cache_dir: Optional[str],
     zip_iter=map
 ) -> FileBlameInfo:
-    """ Collect blame information for the given file paths. """
-    file_blame_info = {}
-    for file_path, blame_info in zip(file_paths,
-                                     zip_iter(__get_blame_info, file_paths)):
-        file_blame_info[file_path] = blame_info
+    """
+    Collect blame information for the given file paths. The files are
+    grouped by their repositories and the batches of the files are blamed in
+    parallel by the given map function.
+    """
+    file_blame_info: FileBlameInfo = {}
+
+    repository_roots: Dict[str, Optional[str]] = {}
+    repository_files: Dict[str, List[str]] = {}
+    for file_path in file_paths:
+        real_path = os.path.realpath(file_path)
+        repo_root = __get_repository_root(
+            os.path.dirname(real_path), repository_roots)
+
+        if repo_root:
+            repository_files.setdefault(repo_root, []).append(file_path)
+        else:
+            file_blame_info[file_path] = None
+
+    batch_files: List[List[str]] = []
+    batches: List[BlameBatch] = []
+    for repo_root, files in repository_files.items():
+        for i in range(0, len(files), BLAME_BATCH_SIZE):
+            batch_files.append(files[i:i + BLAME_BATCH_SIZE])
+            batches.append((repo_root, cache_dir, [
+                (os.path.realpath(f), file_to_hash.get(f))
+                for f in batch_files[-1]]))
+
+    LOG.debug("Collecting blame information for %d files of %d "
+              "repositories in %d batches ...",
+              sum(len(files) for files in batch_files),
+              len(repository_files), len(batches))
+
+    for files, blame_infos in zip(
+            batch_files, zip_iter(__get_blame_info_for_batch, batches)):
+        file_blame_info.update(zip(files, blame_infos))
 
     return file_blame_info
 
 
+def __prune_cache(cache_dir: str):
+    """ Remove the least recently used blame information from the cache. """
+    try:
+        entries = [(entry.stat().st_mtime, entry.path)
+                   for entry in os.scandir(cache_dir)
+                   if entry.name.endswith('.json')]
+    except OSError:
+        return
+
+    if len(entries) <= BLAME_CACHE_SIZE:
+        return
+
+    entries.sort()
+    for _, cache_file_path in entries[:-BLAME_CACHE_SIZE]:
+        try:
+            os.remove(cache_file_path)
+        except OSError:
+            pass
+
+
 def assemble_blame_info(
     zip_file: zipfile.ZipFile,
-    file_paths: Iterable[str]
+    file_paths: Iterable[str],
+    file_to_hash: Optional[Dict[str, str]] = None,
+    cache_dir: Optional[str] = None,
+    map_fn=map
 ) -> int:
     """
     Collect and write blame information for the given files to the zip file.
 
+    If a cache directory is given, the blame information is cached by the
+    HEAD commit of the repository and the path and content hash of the files.
+
     Returns the number of collected blame information.
     """
-    with Pool() as executor:
-        file_blame_info = __collect_blame_info_for_files(
-            file_paths, executor.map)
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError as ex:
+            LOG.debug("Failed to create blame cache directory %s: %s",
+                      cache_dir, ex)
+            cache_dir = None
+
+    file_blame_info = __collect_blame_info_for_files(
+        file_paths, file_to_hash or {}, cache_dir, map_fn)
+
+    if cache_dir:
+        __prune_cache(cache_dir)
 
     # Add blame information to the zip for the files which will be sent
     # to the server if exist.
@@ -20,19 +20,27 @@ import os
 import signal
 import sys
 import tempfile
+import time
 import uuid
 import zipfile
 import zlib
 import shutil
 
 from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 from datetime import timedelta
+from multiprocessing import get_context
 from threading import Timer
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, \
+    Set, Tuple, cast
+
+import portalocker
+from thrift.Thrift import TApplicationException
 
 from codechecker_api.codeCheckerDBAccess_v6.ttypes import \
     StoreLimitKind, SubmittedRunOptions
+from codechecker_api_shared.ttypes import RequestFailed
 
 from codechecker_report_converter import twodim
 from codechecker_report_converter.report import Report, report_file, \
@@ -44,7 +52,13 @@ from codechecker_report_converter.report.parser.base import AnalyzerInfo
 try:
     from codechecker_client.blame_info import assemble_blame_info
 except ImportError:
-    def assemble_blame_info(_, __) -> int:
+    def assemble_blame_info(
+        zip_file: zipfile.ZipFile,
+        file_paths: Iterable[str],
+        file_to_hash: Optional[Dict[str, str]] = None,
+        cache_dir: Optional[str] = None,
+        map_fn=map
+    ) -> int:
         """
         Shim for cases where Git blame info is not gatherable due to
         missing libraries.
@@ -56,20 +70,54 @@ from codechecker_client.task_client import await_task_termination
 from codechecker_common import arg, logger, cmd_config
 from codechecker_common.checker_labels import CheckerLabels
 from codechecker_common.compatibility.multiprocessing import Pool, cpu_count
+from codechecker_common.skiplist_handler import SkipListHandler, \
+    SkipListHandlers
 from codechecker_common.source_code_comment_handler import \
-    SourceCodeCommentHandler
+    get_source_code_comment_index
 from codechecker_common.util import format_size, load_json, strtobool
 
 from codechecker_web.shared import webserver_context, host_check
+from codechecker_web.shared.report_fingerprint import KEPT_REPORTS_FILE, \
+    get_fingerprint
 from codechecker_web.shared.env import get_default_workspace
 
 
 LOG = logger.get_logger('system')
 
+# Maximum size of the zip file which is sent in one piece by the synchronous
+# store.
 MAX_UPLOAD_SIZE = 1024 ** 3  # 1024^3 = 1 GiB.
 
+# Size of the chunks in which the zip file is uploaded to the server.
+UPLOAD_CHUNK_SIZE = 8 * 1024 ** 2
+
+# Number of times the upload of a chunk is retried after a failure.
+UPLOAD_CHUNK_RETRIES = 5
+
+# Size of the chunks in which the zip file is base64 encoded. It is divisible
+# by 3, so the encoded chunks don't contain padding.
+B64_CHUNK_SIZE = 3 * 1024 ** 2
+
+# File in the workspace which caches the lines with review comments of the
+# source files by their content hashes.
+REVIEW_COMMENT_CACHE_FILE = 'review_comment_cache.json'
+
+# Maximum number of source files in the review comment cache.
+REVIEW_COMMENT_CACHE_SIZE = 100000
+
+# File in the workspace which caches the content hashes of the source files
+# by their paths, sizes, modification times and inodes.
+CONTENT_HASH_CACHE_FILE = 'content_hash_cache.json'
+
+# Maximum number of source files in the content hash cache.
+CONTENT_HASH_CACHE_SIZE = 100000
+
+# Directory in the workspace which caches the blame information of the
+# source files.
+BLAME_CACHE_DIR = 'blame_cache'
 
-AnalyzerResultFileReports = Dict[str, List[Report]]
+# Size of the chunks in which the source files are read for hashing.
+HASH_CHUNK_SIZE = 1024 ** 2
 
 
 FileReportPositions = Dict[str, Set[int]]
@@ -111,10 +159,25 @@ SourceFilesInReport = namedtuple('SourceFilesInReport',
                                   'changed_since_report_gen'])
 
 
+"""Reports of an analyzer result file which may be stored on the server
+already. They are written to a temporary report file until the content hashes
+of their source files are known.
+
+report_file_path: the temporary report file
+analyzer_name: the name of the analyzer in the report file
+zip_path: the path of the report file in the zip, if it has to be sent
+reports: the report path hashes and the source file paths of the reports
+"""
+UnchangedReportCandidates = namedtuple('UnchangedReportCandidates',
+                                       ['report_file_path', 'analyzer_name',
+                                        'zip_path', 'reports'])
+
+
 class StorageZipStatistics(report_statistics.Statistics):
     def __init__(self):
         super().__init__()
 
+        self.num_of_unchanged_reports = 0
         self.num_of_blame_information = 0
         self.num_of_source_files = 0
         self.num_of_source_files_with_source_code_comment = 0
@@ -126,6 +189,8 @@ class StorageZipStatistics(report_statistics.Statistics):
             ["Number of processed analyzer result files",
              str(self.num_of_analyzer_result_files)],
             ["Number of analyzer reports", str(self.num_of_reports)],
+            ["Number of unchanged analyzer reports (not sent)",
+             str(self.num_of_unchanged_reports)],
             ["Number of source files", str(self.num_of_source_files)],
             ["Number of source files with source code comments",
              str(self.num_of_source_files_with_source_code_comment)],
@@ -141,7 +206,9 @@ def get_file_content_hash(file_path):
     """
     with open(file_path, 'rb') as content:
         hasher = hashlib.sha256()
-        hasher.update(content.read())
+        for chunk in iter(functools.partial(content.read, HASH_CHUNK_SIZE),
+                          b''):
+            hasher.update(chunk)
         return hasher.hexdigest()
 
 
@@ -315,6 +382,34 @@ case of non-gating CI systems.
                              "analysis, and only incrementally update defect "
                              "reports for source files that were analysed.)")
 
+    parser.add_argument('--manifest',
+                        type=str,
+                        metavar='MANIFEST_FILE',
+                        dest="manifest",
+                        default=argparse.SUPPRESS,
+                        required=False,
+                        help="Store multiple runs listed in the given JSON "
+                             "file instead of the 'input' directories. The "
+                             "file contains a list of objects, one for "
+                             "every run, for example: '[{\"input\": "
+                             "[\"./reports/lib\"], \"name\": \"lib\", "
+                             "\"url\": \"localhost:8001/Default\"}]'. "
+                             "The 'input' paths are relative to the manifest "
+                             "file. The optional 'name', 'url', 'tag' and "
+                             "'description' of a run default to the command "
+                             "line arguments, except for the run name, which "
+                             "is generated from the inputs if missing.")
+
+    parser.add_argument('--parallel-runs',
+                        type=int,
+                        dest="parallel_runs",
+                        default=4,
+                        required=False,
+                        help="Number of runs of the manifest file which are "
+                             "stored at the same time. The runs share the "
+                             "'--jobs' parallel jobs which process the input "
+                             "directories.")
+
     server_args = parser.add_argument_group(
         "server arguments", """
 Specifies a 'CodeChecker server' instance which will be used to store the
@@ -367,51 +462,199 @@ def __get_run_name(input_list):
     return False
 
 
-def scan_for_review_comment(job: Tuple[str, Iterable[int]]):
-    """Scan a file for review comments returns
-    all the found review comments.
+def scan_for_review_comment(
+    file_path: str
+) -> Tuple[List[int], Dict[int, str]]:
+    """ Scan a file for review comments. Returns the lines which have review
+    comments and the misspelled review comments by line numbers.
     """
-    file_path, lines = job
-    sc_handler = SourceCodeCommentHandler()
-    comments = []
-    with open(file_path, mode='r', encoding='utf-8', errors='ignore') as f:
-        comments, misspelled_comments = sc_handler.scan_source_line_comments(
-            f, lines)
+    return get_source_code_comment_index(file_path).get_commented_lines()
 
-        if misspelled_comments:
-            LOG.warning("There are misspelled review status comments in %s",
-                        file_path)
-        for mc in misspelled_comments:
-            LOG.warning(mc)
 
-    return comments
+def __load_workspace_cache(cache_file_path: str) -> Dict:
+    """ Load the given cache file or return an empty cache. """
+    cache = load_json(cache_file_path, {}, display_warning=False)
+    return cache if isinstance(cache, dict) else {}
 
 
-def get_source_file_with_comments(jobs, zip_iter=map) -> Set[str]:
+@contextmanager
+def workspace_cache(file_name: str, max_size: int):
+    """
+    Load a JSON object from the given cache file of the workspace and write
+    it back when the context is left. Only the last 'max_size' entries are
+    kept, so the recently used entries should be moved to the end.
+
+    The cache file can be updated by concurrent stores, so the entries are
+    merged with the entries of the cache file under a lock when it is
+    written back.
+    """
+    cache_file_path = os.path.join(get_default_workspace(), file_name)
+
+    cache = __load_workspace_cache(cache_file_path)
+    loaded_keys = list(cache)
+
+    yield cache
+
+    # The entries which were not used are at the beginning of the cache in
+    # their original order. They keep their position in the cache file, the
+    # others are moved after the entries of the concurrent stores.
+    keys = list(cache)
+    loaded_keys_iter = iter(loaded_keys)
+    unused_count = 0
+    for key in keys:
+        if key not in loaded_keys_iter:
+            break
+        unused_count += 1
+
+    try:
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+        with open(f"{cache_file_path}.lock", 'a',
+                  encoding='utf-8') as lock_file:
+            portalocker.lock(lock_file, portalocker.LOCK_EX)
+            try:
+                stored_cache = __load_workspace_cache(cache_file_path)
+
+                merged_cache = {key: cache[key]
+                                for key in keys[:unused_count]
+                                if key not in stored_cache}
+                merged_cache.update(stored_cache)
+                for key in keys[unused_count:]:
+                    merged_cache.pop(key, None)
+                    merged_cache[key] = cache[key]
+
+                for key in list(merged_cache)[:-max_size]:
+                    del merged_cache[key]
+
+                with tempfile.NamedTemporaryFile(
+                        'w', encoding='utf-8',
+                        dir=os.path.dirname(cache_file_path),
+                        delete=False) as f:
+                    json.dump(merged_cache, f)
+                os.replace(f.name, cache_file_path)
+            finally:
+                portalocker.unlock(lock_file)
+    except OSError as err:
+        LOG.debug("Failed to write cache %s: %s", cache_file_path, err)
+
+
+def get_source_file_with_comments(
+    file_report_positions: FileReportPositions,
+    file_to_hash: Dict[str, str],
+    cache: Dict[str, Dict],
+    map_fn=map
+) -> Set[str]:
     """
     Get source files where there is any codechecker review comment at the main
     report positions.
+
+    Only those source files are scanned which content hash is not found in the
+    given cache. The cache is updated with the results of the scan.
     """
+    hash_to_file = {file_to_hash[file_path]: file_path
+                    for file_path in file_report_positions
+                    if file_to_hash[file_path] not in cache}
+
+    LOG.debug("Scanning %d source files for review comments (%d cached) ...",
+              len(hash_to_file), len(file_report_positions) -
+              len(hash_to_file))
+
+    for content_hash, (lines, misspelled_comments) in zip(
+            hash_to_file, map_fn(scan_for_review_comment,
+                                 hash_to_file.values())):
+        cache[content_hash] = {
+            'lines': lines,
+            'misspelled': list(misspelled_comments.items())}
+
     files_with_comment = set()
+    for file_path, report_lines in file_report_positions.items():
+        # Keep the recently used entries at the end of the cache.
+        cached = cache.pop(file_to_hash[file_path])
+        cache[file_to_hash[file_path]] = cached
 
-    for job, comments in zip(jobs, zip_iter(scan_for_review_comment, jobs)):
-        file_path, _ = job
-        if comments:
+        misspelled_comments = [comment for line, comment
+                               in cached['misspelled'] if line in report_lines]
+        if misspelled_comments:
+            LOG.warning("There are misspelled review status comments in %s",
+                        file_path)
+        for mc in misspelled_comments:
+            LOG.warning(mc)
+
+        if any(line in report_lines for line in cached['lines']):
             files_with_comment.add(file_path)
 
     return files_with_comment
 
 
 def filter_source_files_with_comments(
-    file_report_positions: FileReportPositions
+    file_report_positions: FileReportPositions,
+    file_to_hash: Dict[str, str],
+    map_fn=map
 ) -> Set[str]:
     """ Collect the source files where there is any codechecker review
     comment at the main report positions.
+
+    The lines with review comments are cached in the workspace by the content
+    hashes of the source files, so the unchanged source files are not scanned
+    again by the next storage.
+    """
+    with workspace_cache(REVIEW_COMMENT_CACHE_FILE,
+                         REVIEW_COMMENT_CACHE_SIZE) as cache:
+        return get_source_file_with_comments(
+            file_report_positions, file_to_hash, cache, map_fn)
+
+
+def get_file_content_hashes(
+    file_paths: Iterable[str],
+    cache: Dict[str, List],
+    map_fn=map
+) -> Dict[str, str]:
+    """
+    Get the content hashes of the given files.
+
+    Only those files are hashed which are not found in the given cache by
+    their path, size, modification time and inode. The cache is updated with
+    the computed hashes.
     """
-    jobs = file_report_positions.items()
+    file_to_hash: Dict[str, str] = {}
+    file_to_stat: Dict[str, List[int]] = {}
+    for file_path in file_paths:
+        st = os.stat(file_path)
+        file_stat = [st.st_size, st.st_mtime_ns, st.st_ino]
+
+        # Keep the recently used entries at the end of the cache.
+        cached = cache.pop(file_path, None)
+        if cached and cached[0] == file_stat:
+            file_to_hash[file_path] = cached[1]
+            cache[file_path] = cached
+        else:
+            file_to_stat[file_path] = file_stat
+
+    LOG.debug("Hashing %d source files (%d cached) ...",
+              len(file_to_stat), len(file_to_hash))
 
-    with Pool() as executor:
-        return get_source_file_with_comments(jobs, executor.map)
+    for (file_path, file_stat), content_hash in zip(
+            file_to_stat.items(), map_fn(get_file_content_hash,
+                                         list(file_to_stat))):
+        file_to_hash[file_path] = content_hash
+        cache[file_path] = [file_stat, content_hash]
+
+    return file_to_hash
+
+
+def hash_source_files(
+    file_paths: Iterable[str],
+    map_fn=map
+) -> Dict[str, str]:
+    """
+    Get the content hashes of the given source files.
+
+    The hashes are cached in the workspace by the path, size, modification
+    time and inode of the source files, so the unchanged source files are not
+    read again by the next storage.
+    """
+    with workspace_cache(CONTENT_HASH_CACHE_FILE,
+                         CONTENT_HASH_CACHE_SIZE) as cache:
+        return get_file_content_hashes(file_paths, cache, map_fn)
 
 
 def get_reports(
@@ -435,28 +678,39 @@ def get_reports(
     return reports
 
 
-def parse_analyzer_result_files(
-    analyzer_result_files: Iterable[str],
+def iter_analyzer_result_file_reports(
+    analyzer_result_files: List[str],
     checker_labels: CheckerLabels,
-    jobs: int = cpu_count()
-) -> AnalyzerResultFileReports:
-    """ Get reports from the given analyzer result files. """
-    analyzer_result_file_reports: AnalyzerResultFileReports = defaultdict(list)
-
-    ctx = nullcontext() if jobs == 1 else Pool(max_workers=jobs)
+    map_fn=map
+) -> Iterator[Tuple[str, List[Report]]]:
+    """
+    Get reports from the given analyzer result files. The reports of a result
+    file are yielded as soon as the file is parsed, so the reports of every
+    result file don't have to be kept in memory at once.
+    """
+    for idx, (file_path, reports) in enumerate(zip(
+        analyzer_result_files, map_fn(
+            functools.partial(get_reports, checker_labels=checker_labels),
+            analyzer_result_files))):
+        LOG.debug(f"[{idx}/{len(analyzer_result_files)}] "
+                  f"Parsed '{file_path}' ...")
+        yield file_path, reports
 
-    with ctx as executor:
-        map_fn = map if jobs == 1 else executor.map
 
-        for idx, (file_path, reports) in enumerate(zip(
-            analyzer_result_files, map_fn(
-                functools.partial(get_reports, checker_labels=checker_labels),
-                analyzer_result_files))):
-            LOG.debug(f"[{idx}/{len(analyzer_result_files)}] "
-                      f"Parsed '{file_path}' ...")
-            analyzer_result_file_reports[file_path] = reports
+@contextmanager
+def get_map_fn(jobs: int, **pool_kwargs):
+    """
+    Returns a map function which runs the jobs in a process pool of the given
+    size. The pool is used by every parallel step of the storage. Choosing
+    one job doesn't use sub-processes. The keyword arguments are passed to
+    the pool.
+    """
+    if jobs == 1:
+        yield map
+        return
 
-    return analyzer_result_file_reports
+    with Pool(max_workers=jobs, **pool_kwargs) as executor:
+        yield executor.map
 
 
 class ReportLimitExceedError(Exception):
@@ -468,13 +722,149 @@ class ReportLimitExceedError(Exception):
         super().__init__(self, message)
 
 
+class ZlibCompressedWriter:
+    """
+    Write-only file object which compresses the written data to the given
+    file by zlib. The store zip file is written through this object, so the
+    zip file is compressed while it is being built.
+    """
+
+    def __init__(self, fileobj: BinaryIO, level=zlib.Z_BEST_COMPRESSION):
+        self.__fileobj = fileobj
+        self.__compressor = zlib.compressobj(level)
+
+        # Size of the uncompressed data.
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """ Compress the given data and write it to the file. """
+        self.size += len(data)
+        self.__fileobj.write(self.__compressor.compress(data))
+        return len(data)
+
+    def flush(self) -> None:
+        """
+        The compressed stream is flushed only by closing the writer, so the
+        frequent flushes of the zip file don't worsen the compression ratio.
+        """
+
+    def close(self) -> None:
+        """ Write the remaining compressed data to the file. """
+        self.__fileobj.write(self.__compressor.flush())
+
+
+def b64encode_file(file_path: str) -> str:
+    """
+    Base64 encode the content of the given file. The file is encoded chunk by
+    chunk, so beside the result only one chunk of the file is kept in memory.
+    """
+    b64_content = bytearray()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, B64_CHUNK_SIZE), b''):
+            b64_content += base64.b64encode(chunk)
+
+    return b64_content.decode('utf-8')
+
+
+def get_missing_content_hashes(
+    client,
+    file_hashes: List[str]
+) -> Tuple[Set[str], Set[str]]:
+    """
+    Get the hashes of the given source files which are not stored on the
+    server yet, and the hashes of the ones without blame information.
+    Servers which can't tell both at once are asked for them one by one.
+    """
+    if not file_hashes:
+        return set(), set()
+
+    try:
+        missing = client.getMissingContentHashesForStore(file_hashes)
+        return set(missing.contentHashes), set(missing.blameInfoHashes)
+    except TApplicationException:
+        LOG.debug("The server doesn't implement "
+                  "getMissingContentHashesForStore().")
+
+    return set(client.getMissingContentHashes(file_hashes)), \
+        set(client.getMissingContentHashesForBlameInfo(file_hashes))
+
+
+def get_run_report_fingerprints(client, run_name: str) -> Set[str]:
+    """
+    Get the fingerprints of the reports which are stored in the given run.
+    Servers which can't tell them get every report of the run again.
+    """
+    try:
+        return set(client.getRunReportFingerprints(run_name))
+    except TApplicationException:
+        LOG.debug("The server doesn't implement getRunReportFingerprints().")
+
+    return set()
+
+
+def upload_zip(client, zip_file: str) -> str:
+    """
+    Upload the given compressed zip file to the server in chunks and return
+    the token of the upload. A chunk which failed to arrive intact is sent
+    again from the offset where the server's copy ends, so a broken
+    connection doesn't require sending the whole zip file again.
+    """
+    zip_size = os.stat(zip_file).st_size
+    upload_token = client.beginStoreUpload(zip_size)
+
+    offset = 0
+    failures = 0
+    with open(zip_file, 'rb') as f:
+        while offset < zip_size:
+            f.seek(offset)
+            chunk = f.read(UPLOAD_CHUNK_SIZE)
+            try:
+                offset = client.appendStoreUploadChunk(
+                    upload_token,
+                    offset,
+                    base64.b64encode(chunk).decode('utf-8'),
+                    hashlib.sha256(chunk).hexdigest())
+                failures = 0
+            except (OSError, RequestFailed) as ex:
+                failures += 1
+                if failures > UPLOAD_CHUNK_RETRIES:
+                    LOG.error("Failed to upload the zip file: %s", ex)
+                    sys.exit(1)
+
+                LOG.warning("Failed to upload the chunk at offset %d, "
+                            "retrying (%d/%d): %s", offset, failures,
+                            UPLOAD_CHUNK_RETRIES, ex)
+                time.sleep(failures)
+                offset = client.getStoreUploadOffset(upload_token)
+
+            LOG.debug("Uploaded %s of %s.",
+                      format_size(offset), format_size(zip_size))
+
+    return upload_token
+
+
+def get_report_zip_path(report_dir: str, file_name: str) -> str:
+    """ Get the path of a file of the given report directory in the zip. """
+    # Create a unique report directory name.
+    report_dir_name = hashlib.md5(report_dir.encode('utf-8')).hexdigest()
+    return os.path.join('reports', report_dir_name, file_name)
+
+
+def add_file_to_zip(zipf: zipfile.ZipFile, file_path: str, zip_target: str):
+    """ Add the given file to the zip if it is not added yet. """
+    if zip_target not in zipf.NameToInfo:
+        zipf.write(file_path, zip_target)
+
+
 def assemble_zip(inputs,
                  zip_file,
                  client,
                  prod_client,
                  checker_labels: CheckerLabels,
                  tmp_dir: str,
-                 jobs: int):
+                 map_fn=map,
+                 stored_fingerprints: Optional[Set[str]] = None,
+                 trim_path_prefixes: Optional[List[str]] = None):
     """Collect and compress report and source files, together with files
     contanining analysis related information into a zip file which
     will be sent to the server.
@@ -482,49 +872,112 @@ def assemble_zip(inputs,
     For each report directory, we create a uniqued zipped directory. Each
     report directory to store could have been made with different
     configurations, so we can't merge them all into a single zip.
+
+    The unique reports of an analyzer result file are written to the zip as
+    soon as the file is parsed and the zip file is compressed while it is
+    written, so the memory usage doesn't depend on the number of reports.
+
+    Reports whose fingerprint is in `stored_fingerprints` are stored in the
+    run already, so only their fingerprints are written to the zip.
     """
-    files_to_compress: Dict[str, set] = defaultdict(set)
+    temp_dir = tempfile.mkdtemp('-unique-plists', dir=tmp_dir)
+    try:
+        with open(zip_file, 'wb') as f:
+            writer = ZlibCompressedWriter(f)
+            with zipfile.ZipFile(
+                    cast(BinaryIO, writer), 'w', allowZip64=True) as zipf:
+                __assemble_zip(zipf, inputs, client, prod_client,
+                               checker_labels, temp_dir, map_fn,
+                               stored_fingerprints or set(),
+                               trim_path_prefixes)
+            writer.close()
+    finally:
+        # We are responsible for deleting these.
+        shutil.rmtree(temp_dir)
+
+    LOG.info("Building report zip file (%s) done (%s / %s).", zip_file,
+             format_size(writer.size), format_size(os.stat(zip_file).st_size))
+
+
+def __assemble_zip(zipf: zipfile.ZipFile,
+                   inputs,
+                   client,
+                   prod_client,
+                   checker_labels: CheckerLabels,
+                   temp_dir: str,
+                   map_fn,
+                   stored_fingerprints: Set[str],
+                   trim_path_prefixes: Optional[List[str]]):
+    """ Write the content of the store zip file to the given zip file. """
     analyzer_result_file_paths = []
+    skipped_analyzer_result_file_paths = []
     stats = StorageZipStatistics()
 
-    for dir_path, file_paths in report_file.analyzer_result_files(inputs):
-        analyzer_result_file_paths.extend(file_paths)
+    # The skip handlers of the report directories whose reports may be
+    # stored on the server already. The review status of the reports in
+    # directories with a review status config file is evaluated by the server,
+    # so these reports are always sent.
+    unchanged_report_dirs: Dict[str, Optional[SkipListHandlers]] = {}
 
+    LOG.info("Building report zip file...")
+
+    for dir_path, file_paths in report_file.analyzer_result_files(inputs):
         metadata_file_path = os.path.join(dir_path, 'metadata.json')
         if os.path.exists(metadata_file_path):
-            files_to_compress[os.path.dirname(metadata_file_path)] \
-                .add(metadata_file_path)
+            add_file_to_zip(zipf, metadata_file_path,
+                            get_report_zip_path(dir_path, 'metadata.json'))
 
+        skip_handlers = None
         skip_file_path = os.path.join(dir_path, 'skip_file')
         if os.path.exists(skip_file_path):
             with open(skip_file_path, 'r', encoding='utf-8') as f:
+                skip_content = f.read()
                 LOG.info("Found skip file %s with the following content:\n%s",
-                         skip_file_path, f.read())
+                         skip_file_path, skip_content)
+
+            skip_handlers = SkipListHandlers([SkipListHandler(skip_content)])
+            add_file_to_zip(zipf, skip_file_path,
+                            get_report_zip_path(dir_path, 'skip_file'))
 
-            files_to_compress[os.path.dirname(skip_file_path)] \
-                .add(skip_file_path)
+        # The server drops the skipped reports, so report files which contain
+        # only skipped reports don't have to be parsed.
+        metadata = load_json(metadata_file_path) \
+            if skip_handlers and os.path.exists(metadata_file_path) else None
+
+        for file_path in file_paths:
+            if report_file.is_skipped(file_path, skip_handlers, metadata):
+                skipped_analyzer_result_file_paths.append(file_path)
+            else:
+                analyzer_result_file_paths.append(file_path)
 
         review_status_file_path = os.path.join(dir_path, 'review_status.yaml')
         if os.path.exists(review_status_file_path):
-            files_to_compress[os.path.dirname(review_status_file_path)]\
-                .add(review_status_file_path)
+            add_file_to_zip(zipf, review_status_file_path,
+                            get_report_zip_path(
+                                dir_path, 'review_status.yaml'))
+        elif stored_fingerprints:
+            unchanged_report_dirs[dir_path] = skip_handlers
 
     LOG.debug(f"Processing {len(analyzer_result_file_paths)} report files ...")
+    LOG.debug("Skipped %d report files which contain only skipped reports.",
+              len(skipped_analyzer_result_file_paths))
 
-    analyzer_result_file_reports = parse_analyzer_result_files(
-        analyzer_result_file_paths, checker_labels, jobs)
-
-    LOG.info("Processing report files done.")
+    stats.num_of_analyzer_result_files += \
+        len(skipped_analyzer_result_file_paths)
 
     changed_files = set()
     file_paths = set()
     file_report_positions: FileReportPositions = defaultdict(set)
-    unique_reports: Dict[str, Dict[str, List[Report]]] = defaultdict(dict)
 
     unique_report_hashes = set()
-    for file_path, reports in analyzer_result_file_reports.items():
+    unchanged_report_candidates: List[UnchangedReportCandidates] = []
+    for file_path, reports in iter_analyzer_result_file_reports(
+            analyzer_result_file_paths, checker_labels, map_fn):
         stats.num_of_analyzer_result_files += 1
 
+        dir_path = os.path.dirname(file_path)
+        unique_reports: Dict[str, List[Report]] = defaultdict(list)
+        candidate_reports: Dict[str, List[Report]] = defaultdict(list)
         for report in reports:
             if report.changed_files:
                 changed_files.update(report.changed_files)
@@ -535,62 +988,90 @@ def assemble_zip(inputs,
             report_path_hash = get_report_path_hash(report)
             if report_path_hash not in unique_report_hashes:
                 unique_report_hashes.add(report_path_hash)
-                unique_reports[os.path.dirname(file_path)]\
-                    .setdefault(report.analyzer_name, []) \
-                    .append(report)
+                if may_be_stored_unchanged(
+                        report, dir_path, unchanged_report_dirs):
+                    candidate_reports[report.analyzer_name].append(report)
+                else:
+                    unique_reports[report.analyzer_name].append(report)
                 stats.add_report(report)
 
             file_paths.update(report.original_files)
             file_report_positions[report.file.original_path].add(report.line)
 
-    temp_dir = tempfile.mkdtemp('-unique-plists', dir=tmp_dir)
-    for dirname, analyzer_reports in unique_reports.items():
-        for analyzer_name, reports in analyzer_reports.items():
+        # The reports of the result files are not needed after this point, so
+        # the zip is not built if any source file has changed.
+        if changed_files:
+            continue
+
+        for analyzer_name, reports in unique_reports.items():
+            if not analyzer_name:
+                analyzer_name = 'unknown'
+            file_name = f'{uuid.uuid4()}-{analyzer_name}.plist'
+            tmpfile = os.path.join(temp_dir, file_name)
+
+            report_file.create(tmpfile, reports, checker_labels,
+                               AnalyzerInfo(analyzer_name))
+            zipf.write(tmpfile, get_report_zip_path(dir_path, file_name))
+            os.remove(tmpfile)
+            LOG.debug("Stored '%s' unique reports of '%s'.",
+                      analyzer_name, file_path)
+
+        for analyzer_name, reports in candidate_reports.items():
             if not analyzer_name:
                 analyzer_name = 'unknown'
-            tmpfile = os.path.join(
-                temp_dir, f'{uuid.uuid4()}-{analyzer_name}.plist')
+            file_name = f'{uuid.uuid4()}-{analyzer_name}.plist'
+            tmpfile = os.path.join(temp_dir, file_name)
 
             report_file.create(tmpfile, reports, checker_labels,
                                AnalyzerInfo(analyzer_name))
-            LOG.debug(f"Stored '{analyzer_name}' unique reports in {tmpfile}.")
-            files_to_compress[dirname].add(tmpfile)
+            unchanged_report_candidates.append(UnchangedReportCandidates(
+                tmpfile, analyzer_name,
+                get_report_zip_path(dir_path, file_name),
+                [(get_report_path_hash(report), report.original_files)
+                 for report in reports]))
+
+    LOG.info("Processing report files done.")
 
     if changed_files:
         reports_helper.dump_changed_files(changed_files)
-        shutil.rmtree(temp_dir)
         sys.exit(1)
 
+    # Fail store early if too many reports.
+    p = prod_client.getCurrentProduct()
+    if len(unique_report_hashes) > p.reportLimit:
+        LOG.error(f"""Report Limit Exceeded
+
+This report folder cannot be stored because the number of reports in the
+result folder is too high. Usually noisy checkers, generating a lot of
+reports are not useful and it is better to disable them.
+
+Run `CodeChecker parse <report_folder>` to gain a better understanding on
+report counts.
+
+Disable checkers that have generated an excessive number of reports and then
+rerun the analysis to be able to store the results on the server.
+
+Configured report limit for this product: {p.reportLimit}
+        """)
+        raise ReportLimitExceedError("Maximum report limit reached.")
+
     if not file_paths:
         LOG.warning("There is no report to store. After uploading these "
                     "results the previous reports become resolved.")
 
-    hash_to_file: Dict[str, str] = {}
+    LOG.info("Hashing source files...")
 
     # There can be files with same hash, but different path.
-    file_to_hash: Dict[str, str] = {}
-
-    for file_path in file_paths:
-        h = get_file_content_hash(file_path)
-
-        file_to_hash[file_path] = h
-        hash_to_file[h] = file_path
+    file_to_hash = hash_source_files(file_paths, map_fn)
+    file_hashes = list(set(file_to_hash.values()))
 
-    file_hashes = list(hash_to_file.keys())
+    LOG.info("Hashing source files done.")
 
-    LOG.info("Get missing file content hashes from the server...")
-    necessary_hashes = client.getMissingContentHashes(file_hashes) \
-        if file_hashes else []
-    LOG.info("Get missing file content hashes done.")
-
-    LOG.info(
-        "Get file content hashes which do not have blame information from the "
-        "server...")
-    necessary_blame_hashes = \
-        client.getMissingContentHashesForBlameInfo(file_hashes) \
-        if file_hashes else []
-    LOG.info(
-        "Get file content hashes which do not have blame information done.")
+    LOG.info("Get missing file content and blame information hashes from "
+             "the server...")
+    necessary_hashes, necessary_blame_hashes = \
+        get_missing_content_hashes(client, file_hashes)
+    LOG.info("Get missing file content and blame information hashes done.")
 
     LOG.info("Collecting review comments ...")
 
@@ -601,103 +1082,126 @@ def assemble_zip(inputs,
         if file_to_hash[k] not in necessary_hashes}
 
     files_with_comment = filter_source_files_with_comments(
-        unnecessary_file_report_positions)
+        unnecessary_file_report_positions, file_to_hash, map_fn)
 
     for file_path in files_with_comment:
-        necessary_hashes.append(file_to_hash[file_path])
+        necessary_hashes.add(file_to_hash[file_path])
         stats.num_of_source_files_with_source_code_comment += 1
 
     LOG.info("Collecting review comments done.")
 
-    LOG.info("Building report zip file...")
-    with zipfile.ZipFile(zip_file, 'a', allowZip64=True) as zipf:
-        # Add the files to the zip which will be sent to the server.
-
-        for dirname, files in files_to_compress.items():
-            for file_path in files:
-                _, file_name = os.path.split(file_path)
-
-                # Create a unique report directory name.
-                report_dir_name = \
-                    hashlib.md5(dirname.encode('utf-8')).hexdigest()
-                zip_target = \
-                    os.path.join('reports', report_dir_name, file_name)
-                zipf.write(file_path, zip_target)
-
-        collected_file_paths = set()
-        for f, h in file_to_hash.items():
-            if h in necessary_hashes:
-                LOG.debug("File contents for '%s' needed by the server", f)
-
-                file_path = os.path.join('root', f.lstrip('/'))
-                collected_file_paths.add(f)
-                stats.num_of_source_files += 1
-                try:
-                    zipf.getinfo(file_path)
-                except KeyError:
-                    zipf.write(f, file_path)
-
-        if necessary_blame_hashes:
-            file_paths = list(f for f, h in file_to_hash.items()
-                              if h in necessary_blame_hashes)
-
-            LOG.info("Collecting blame information for source files...")
-            try:
-                stats.num_of_blame_information = assemble_blame_info(
-                    zipf, file_paths)
+    # Add the source files to the zip which will be sent to the server.
+    for file_path, h in file_to_hash.items():
+        if h in necessary_hashes:
+            LOG.debug("File contents for '%s' needed by the server", file_path)
 
-                if stats.num_of_blame_information:
-                    LOG.info("Collecting blame information... Done.")
-                else:
-                    LOG.info("No blame information found for source files.")
-            except NotImplementedError:
-                LOG.warning(
-                    "Failed to collect blame information. Make sure Git is "
-                    "installed on your system.")
+            stats.num_of_source_files += 1
+            add_file_to_zip(zipf, file_path,
+                            os.path.join('root', file_path.lstrip('/')))
 
-        zipf.writestr('content_hashes.json', json.dumps(file_to_hash))
+    if necessary_blame_hashes:
+        file_paths = list(f for f, h in file_to_hash.items()
+                          if h in necessary_blame_hashes)
 
-    LOG.info("Building report zip file (%s) done.", zip_file)
+        LOG.info("Collecting blame information for source files...")
+        try:
+            stats.num_of_blame_information = assemble_blame_info(
+                zipf, file_paths, file_to_hash,
+                os.path.join(get_default_workspace(), BLAME_CACHE_DIR),
+                map_fn)
 
-    # Print statistics what will be stored to the server.
-    stats.write()
+            if stats.num_of_blame_information:
+                LOG.info("Collecting blame information... Done.")
+            else:
+                LOG.info("No blame information found for source files.")
+        except NotImplementedError:
+            LOG.warning(
+                "Failed to collect blame information. Make sure Git is "
+                "installed on your system.")
 
-    # Fail store early if too many reports.
-    p = prod_client.getCurrentProduct()
-    if len(unique_report_hashes) > p.reportLimit:
-        LOG.error(f"""Report Limit Exceeded
+    if unchanged_report_candidates:
+        LOG.info("Collecting unchanged reports ...")
+        stats.num_of_unchanged_reports = add_unchanged_report_candidates(
+            zipf, unchanged_report_candidates, stored_fingerprints,
+            file_to_hash, trim_path_prefixes, checker_labels)
+        LOG.info("Collecting unchanged reports done.")
 
-This report folder cannot be stored because the number of reports in the
-result folder is too high. Usually noisy checkers, generating a lot of
-reports are not useful and it is better to disable them.
+    zipf.writestr('content_hashes.json', json.dumps(file_to_hash))
 
-Run `CodeChecker parse <report_folder>` to gain a better understanding on
-report counts.
+    # Print statistics what will be stored to the server.
+    stats.write()
 
-Disable checkers that have generated an excessive number of reports and then
-rerun the analysis to be able to store the results on the server.
 
-Configured report limit for this product: {p.reportLimit}
-        """)
-        shutil.rmtree(temp_dir)
-        raise ReportLimitExceedError("Maximum report limit reached.")
+def may_be_stored_unchanged(
+    report: Report,
+    dir_path: str,
+    unchanged_report_dirs: Dict[str, Optional[SkipListHandlers]]
+) -> bool:
+    """
+    Returns whether the given report of the given report directory may be
+    stored on the server already. Skipped reports are always sent, so the
+    server drops them.
+    """
+    if dir_path not in unchanged_report_dirs:
+        return False
+
+    skip_handlers = unchanged_report_dirs[dir_path]
+    return not skip_handlers or \
+        not skip_handlers.should_skip(report.file.original_path)
 
-    zip_size = os.stat(zip_file).st_size
 
-    LOG.info("Compressing report zip file...")
+def add_unchanged_report_candidates(
+    zipf: zipfile.ZipFile,
+    candidates: List[UnchangedReportCandidates],
+    stored_fingerprints: Set[str],
+    file_to_hash: Dict[str, str],
+    trim_path_prefixes: Optional[List[str]],
+    checker_labels: CheckerLabels
+) -> int:
+    """
+    Write the fingerprints of the candidate reports which are stored on the
+    server already to the report directories of the zip, and the other
+    candidate reports to report files of the zip. Returns the number of the
+    reports which are not sent.
+    """
+    kept_fingerprints: Dict[str, List[str]] = defaultdict(list)
+    for candidate in candidates:
+        fingerprints = [
+            get_fingerprint(report_path_hash, file_paths, file_to_hash,
+                            trim_path_prefixes)
+            for report_path_hash, file_paths in candidate.reports]
+        is_stored = [fingerprint in stored_fingerprints
+                     for fingerprint in fingerprints]
+
+        if not any(is_stored):
+            zipf.write(candidate.report_file_path, candidate.zip_path)
+            continue
+
+        if not all(is_stored):
+            # The reports are read back in the order they were written.
+            reports = report_file.get_reports(
+                candidate.report_file_path, checker_labels)
+            if len(reports) != len(is_stored):
+                zipf.write(candidate.report_file_path, candidate.zip_path)
+                continue
 
-    with open(zip_file, 'rb') as source:
-        compressed = zlib.compress(source.read(), zlib.Z_BEST_COMPRESSION)
-    with open(zip_file, 'wb') as target:
-        target.write(compressed)
+            report_file.create(
+                candidate.report_file_path,
+                [report for report, stored in zip(reports, is_stored)
+                 if not stored],
+                checker_labels, AnalyzerInfo(candidate.analyzer_name))
+            zipf.write(candidate.report_file_path, candidate.zip_path)
 
-    compressed_zip_size = os.stat(zip_file).st_size
+        kept_fingerprints[os.path.dirname(candidate.zip_path)].extend(
+            fingerprint for fingerprint, stored
+            in zip(fingerprints, is_stored) if stored)
 
-    LOG.info("Compressing report zip file done (%s / %s).",
-             format_size(zip_size), format_size(compressed_zip_size))
+    for zip_dir_path, fingerprints in kept_fingerprints.items():
+        zipf.writestr(os.path.join(zip_dir_path, KEPT_REPORTS_FILE),
+                      json.dumps(fingerprints))
 
-    # We are responsible for deleting these.
-    shutil.rmtree(temp_dir)
+    return sum(len(fingerprints)
+               for fingerprints in kept_fingerprints.values())
 
 
 def should_be_zipped(input_file: str, input_files: Iterable[str]) -> bool:
@@ -793,23 +1297,18 @@ def store_analysis_statistics(client, inputs, run_name):
                       "report directory.")
             return None
 
-        # Write statistics files to the ZIP file.
-        with zipfile.ZipFile(zip_file, 'a', allowZip64=True) as zipf:
-            for stat_file in statistics_files:
-                zipf.write(stat_file)
-
-        # Compressing .zip file
-        with open(zip_file, 'rb') as source:
-            compressed = zlib.compress(source.read(),
-                                       zlib.Z_BEST_COMPRESSION)
-
-        with open(zip_file, 'wb') as target:
-            target.write(compressed)
+        # Write statistics files to the compressed ZIP file.
+        with open(zip_file, 'wb') as f:
+            writer = ZlibCompressedWriter(f)
+            with zipfile.ZipFile(
+                    cast(BinaryIO, writer), 'w', allowZip64=True) as zipf:
+                for stat_file in statistics_files:
+                    zipf.write(stat_file)
+            writer.close()
 
         LOG.debug("[ZIP] Analysis statistics zip written at '%s'", zip_file)
 
-        with open(zip_file, 'rb') as zf:
-            b64zip = base64.b64encode(zf.read()).decode('utf-8')
+        b64zip = b64encode_file(zip_file)
 
         # Store analysis statistics on the server
         return client.storeAnalysisStatistics(run_name, b64zip)
@@ -890,6 +1389,132 @@ def _timeout_watchdog(timeout: timedelta, trap: int):
                   timeout.total_seconds(), str(timeout), pid)
 
 
+def load_manifest(manifest_file: str, args) -> List[argparse.Namespace]:
+    """
+    Create the arguments of the runs listed in the given manifest file.
+
+    The manifest is a JSON list of objects. The 'input' of an object is a
+    result directory or a list of result directories relative to the
+    manifest file. The optional 'name', 'url', 'tag' and 'description' of
+    the run default to the command line arguments, except for the run name,
+    which is generated from the inputs if it is missing.
+    """
+    manifest = load_json(manifest_file)
+    if not isinstance(manifest, list) or \
+            not all(isinstance(entry, dict) and 'input' in entry
+                    for entry in manifest):
+        raise ValueError(f"Invalid manifest file '{manifest_file}': it "
+                         "should contain a list of objects with 'input'.")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+
+    runs = []
+    for entry in manifest:
+        run_args = argparse.Namespace(**vars(args))
+        delattr(run_args, 'manifest')
+
+        inputs = entry['input']
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        run_args.input = [os.path.join(base_dir, i) for i in inputs]
+        run_args.product_url = entry.get('url', args.product_url)
+
+        # The run name of the command line can't be used by every run.
+        if 'name' in run_args:
+            delattr(run_args, 'name')
+
+        for key in ['name', 'tag', 'description']:
+            if key in entry:
+                setattr(run_args, key, entry[key])
+
+        runs.append(run_args)
+
+    return runs
+
+
+def __store_manifest_run(run_args, map_fn) -> Tuple[str, float]:
+    """ Store a run of the manifest and return its status and duration. """
+    start_time = time.time()
+    status = "SUCCESSFUL"
+    try:
+        store_run(run_args, map_fn)
+    except SystemExit as exit_ex:
+        if exit_ex.code not in (None, 0):
+            status = "FAILED"
+    except Exception as ex:
+        LOG.error("Storing the reports of %s failed: %s",
+                  run_args.input, str(ex))
+        status = "FAILED"
+
+    return status, time.time() - start_time
+
+
+def store_manifest(args) -> int:
+    """
+    Store the runs listed in the manifest file concurrently. The runs share
+    the process pool which processes the input directories, and reuse the
+    session tokens saved by logging in to each product once.
+
+    Returns the exit code of the command.
+    """
+    try:
+        runs = load_manifest(args.manifest, args)
+    except ValueError as ex:
+        LOG.error(ex)
+        return 2  # argparse returns error code 2 for bad invocations.
+
+    # Log in to every product before the stores start. The client of each
+    # run is still set up separately, because a client can't be used by
+    # several threads, but it finds the saved session token and doesn't ask
+    # for the credentials again.
+    for product_url in sorted(set(run.product_url for run in runs)):
+        libclient.setup_client(product_url)
+
+    # The timeout watchdog of the synchronous store uses signals, which can
+    # be handled only by the main thread.
+    parallel_runs = args.parallel_runs
+    if strtobool(os.environ.get('CC_FORCE_SYNC_STORE', 'no')):
+        parallel_runs = 1
+
+    LOG.info("Storing %d runs from manifest '%s' (%d at once) ...",
+             len(runs), args.manifest, parallel_runs)
+
+    # The workers of the process pool are started when a run first uses it,
+    # while the other runs are being stored in threads. Forking the process
+    # then could copy a lock held by another thread into the workers, so
+    # they are started by a fork server, which also sets up their logging.
+    pool_kwargs = {}
+    if parallel_runs > 1:
+        pool_kwargs = {
+            "mp_context": get_context("forkserver"),
+            "initializer": logger.setup_logger,
+            "initargs": (args.verbose if 'verbose' in args else None,)}
+
+    with get_map_fn(args.jobs, **pool_kwargs) as map_fn:
+        store_fn = functools.partial(__store_manifest_run, map_fn=map_fn)
+        if parallel_runs == 1:
+            results = list(map(store_fn, runs))
+        else:
+            with ThreadPoolExecutor(max_workers=parallel_runs) as executor:
+                results = list(executor.map(store_fn, runs))
+
+    rows = [["Run name", "Product URL", "Status", "Duration"]]
+    for run_args, (status, duration) in zip(runs, results):
+        rows.append([getattr(run_args, 'name', ','.join(run_args.input)),
+                     run_args.product_url, status,
+                     str(timedelta(seconds=round(duration)))])
+
+    print(twodim.to_table(rows))
+
+    num_of_failed = sum(status != "SUCCESSFUL" for status, _ in results)
+    if num_of_failed:
+        LOG.error("Storing %d of %d runs failed.", num_of_failed, len(runs))
+        return 1
+
+    LOG.info("Storing %d runs finished successfully.", len(runs))
+    return 0
+
+
 def main(args):
     """
     Store the defect results in the specified input list as bug reports in the
@@ -906,6 +1531,22 @@ def main(args):
     if not host_check.check_zlib():
         raise ModuleNotFoundError("zlib is not available on the system!")
 
+    if 'manifest' in args:
+        if args.parallel_runs < 1:
+            LOG.error("The number of parallel runs should be a positive "
+                      "integer.")
+            sys.exit(1)
+
+        sys.exit(store_manifest(args))
+
+    store_run(args)
+
+
+def store_run(args, map_fn=None):
+    """
+    Store the defect results of one run. If a map function is given, it is
+    used to process the input directory instead of a new process pool.
+    """
     # To ensure the help message prints the default folder properly,
     # the 'default' for 'args.input' is a string, not a list.
     # But we need lists for the foreach here to work.
@@ -971,15 +1612,27 @@ def main(args):
     try:
         context = webserver_context.get_context()
 
+        trim_path_prefixes = args.trim_path_prefix if \
+            'trim_path_prefix' in args else None
+
+        # The results of the run are removed first by a forced store, so
+        # every report is sent to the server.
+        stored_fingerprints = set() if 'force' in args \
+            else get_run_report_fingerprints(client, args.name)
+
         LOG.debug("Assembling zip file.")
         try:
-            assemble_zip(args.input,
-                         zip_file,
-                         client,
-                         prod_client,
-                         context.checker_labels,
-                         temp_dir_path,
-                         args.jobs)
+            with get_map_fn(args.jobs) if map_fn is None \
+                    else nullcontext(map_fn) as run_map_fn:
+                assemble_zip(args.input,
+                             zip_file,
+                             client,
+                             prod_client,
+                             context.checker_labels,
+                             temp_dir_path,
+                             run_map_fn,
+                             stored_fingerprints,
+                             trim_path_prefixes)
         except ReportLimitExceedError:
             sys.exit(1)
         except Exception as ex:
@@ -989,27 +1642,27 @@ def main(args):
             LOG.error("Failed to assemble zip file.")
             sys.exit(1)
 
-        zip_size = os.stat(zip_file).st_size
-        if zip_size > MAX_UPLOAD_SIZE:
-            LOG.error("The result list to upload is too big (max: %s): %s.",
-                      format_size(MAX_UPLOAD_SIZE), format_size(zip_size))
-            sys.exit(1)
-
-        b64zip = ""
-        with open(zip_file, 'rb') as zf:
-            b64zip = base64.b64encode(zf.read()).decode("utf-8")
-        if len(b64zip) == 0:
+        if os.stat(zip_file).st_size == 0:
             LOG.info("Zip content is empty, nothing to store!")
             sys.exit(1)
 
-        trim_path_prefixes = args.trim_path_prefix if \
-            'trim_path_prefix' in args else None
-
         description = args.description if 'description' in args else None
 
         LOG.info("Storing results to the server ...")
 
         if strtobool(os.environ.get('CC_FORCE_SYNC_STORE', 'no')):
+            zip_size = os.stat(zip_file).st_size
+            if zip_size > MAX_UPLOAD_SIZE:
+                LOG.error("The result list to upload is too big (max: %s): "
+                          "%s.", format_size(MAX_UPLOAD_SIZE),
+                          format_size(zip_size))
+                sys.exit(1)
+
+            # The API expects the whole zip in one string, so this is the
+            # only point where the content of the zip file is kept in
+            # memory.
+            b64zip = b64encode_file(zip_file)
+
             try:
                 with _timeout_watchdog(timedelta(hours=1),
                                        signal.SIGUSR1):
@@ -1065,8 +1718,9 @@ def main(args):
             if client.allowsStoringAnalysisStatistics():
                 store_analysis_statistics(client, args.input, args.name)
         else:
-            task_token: str = client.massStoreRunAsynchronous(
-                b64zip,
+            upload_token = upload_zip(client, zip_file)
+            task_token: str = client.commitStoreUpload(
+                upload_token,
                 SubmittedRunOptions(
                     runName=args.name,
                     tag=args.tag if "tag" in args else None,
@@ -959,7 +959,6 @@ def convert_report_data_to_report(
             report_data, cached_report_file_lookup)
 
         report.changed_files = []
-        report.source_code_comments = []
 
         if source_line_contents:
             source_line = convert.from_b64(
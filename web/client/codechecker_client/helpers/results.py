@@ -209,6 +209,14 @@ class ThriftResultsHelper(BaseClientHelper):
     def getMissingContentHashesForBlameInfo(self, file_hashes):
         pass
 
+    @thrift_client_call
+    def getMissingContentHashesForStore(self, file_hashes):
+        pass
+
+    @thrift_client_call
+    def getRunReportFingerprints(self, run_name):
+        pass
+
     @thrift_client_call
     def massStoreRun(self, name, tag, version, zipdir, force,
                      trim_path_prefixes, description):
@@ -222,6 +230,32 @@ class ThriftResultsHelper(BaseClientHelper):
     ) -> str:
         raise NotImplementedError("Should have called Thrift code!")
 
+    @thrift_client_call
+    def beginStoreUpload(self, zipfile_size: int) -> str:
+        raise NotImplementedError("Should have called Thrift code!")
+
+    @thrift_client_call
+    def getStoreUploadOffset(self, upload_token: str) -> int:
+        raise NotImplementedError("Should have called Thrift code!")
+
+    @thrift_client_call
+    def appendStoreUploadChunk(
+        self,
+        upload_token: str,
+        offset: int,
+        chunk: str,
+        checksum: str
+    ) -> int:
+        raise NotImplementedError("Should have called Thrift code!")
+
+    @thrift_client_call
+    def commitStoreUpload(
+        self,
+        upload_token: str,
+        store_opts: ttypes.SubmittedRunOptions
+    ) -> str:
+        raise NotImplementedError("Should have called Thrift code!")
+
     @thrift_client_call
     def allowsStoringAnalysisStatistics(self):
         pass
@@ -21,6 +21,15 @@ from codechecker_common.logger import get_logger
 
 LOG = get_logger('system')
 
+# Older servers don't implement these calls, so the callers handle the error of
+# the unknown method.
+OPTIONAL_CALLS = {"getMissingContentHashesForStore",
+                  "getRunReportFingerprints"}
+
+# The connection errors of these calls are retried by their callers, so they
+# are not handled here.
+RETRIED_CALLS = {"appendStoreUploadChunk"}
+
 
 def truncate_arg(arg, max_len=100):
     """ Truncate the given argument if the length is too large. """
@@ -58,7 +67,8 @@ def thrift_client_call(function):
             if reqfailure.errorCode == \
                 codechecker_api_shared.ttypes.ErrorCode.GENERAL and \
                     reqfailure.extraInfo and \
-                    reqfailure.extraInfo[0] == "report_limit":
+                    reqfailure.extraInfo[0] in ("report_limit",
+                                                "upload_chunk"):
                 # We handle this error in near the business logic.
                 raise reqfailure
 
@@ -88,6 +98,10 @@ def thrift_client_call(function):
                     LOG.error("%s", '\n'.join(reqfailure.extraInfo))
             sys.exit(1)
         except TApplicationException as ex:
+            if func_name in OPTIONAL_CALLS and \
+                    ex.type == TApplicationException.UNKNOWN_METHOD:
+                raise ex
+
             LOG.error("Internal server error: %s", str(ex.message))
             sys.exit(1)
         except TProtocolException as ex:
@@ -116,6 +130,9 @@ def thrift_client_call(function):
             LOG.exception("Request failed.")
             sys.exit(1)
         except OSError as oserr:
+            if func_name in RETRIED_CALLS:
+                raise oserr
+
             LOG.error("Connection failed.")
             LOG.error("OS Error: %s", str(oserr))
             LOG.error("Check if your CodeChecker server is running.")
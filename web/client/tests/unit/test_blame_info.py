@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Test collecting the blame information of source files.
+"""
+
+
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+from git import Actor, Repo
+
+from codechecker_client import blame_info
+
+
+class BlameInfoTest(unittest.TestCase):
+    """ Test collecting the blame information of source files. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.repo_dir = os.path.join(self.tmp_dir.name, 'repo')
+        repo = Repo.init(self.repo_dir)
+
+        self.source_files = []
+        for idx in range(3):
+            file_path = os.path.join(self.repo_dir, f'{idx}.cpp')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(f"int x = {idx};\n")
+            self.source_files.append(file_path)
+
+        with open(os.path.join(self.repo_dir, '.gitignore'), 'w',
+                  encoding='utf-8') as f:
+            f.write("*.h\n")
+
+        self.ignored_file = os.path.join(self.repo_dir, 'ignored.h')
+        with open(self.ignored_file, 'w', encoding='utf-8') as f:
+            f.write("int y;\n")
+
+        self.untracked_file = os.path.join(self.tmp_dir.name, 'main.cpp')
+        with open(self.untracked_file, 'w', encoding='utf-8') as f:
+            f.write("int z;\n")
+
+        repo.index.add(self.source_files + ['.gitignore'])
+        author = Actor('Author', 'author@example.com')
+        repo.index.commit('Initial commit', author=author, committer=author)
+        repo.close()
+
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+        self.file_paths = \
+            self.source_files + [self.ignored_file, self.untracked_file]
+        self.file_to_hash = {file_path: str(idx) for idx, file_path
+                             in enumerate(self.file_paths)}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assemble_blame_info(self):
+        """ Collect the blame information to a zip file. """
+        zip_file = os.path.join(self.tmp_dir.name, 'blame.zip')
+        with zipfile.ZipFile(zip_file, 'w') as zipf:
+            num = blame_info.assemble_blame_info(
+                zipf, self.file_paths, self.file_to_hash, self.cache_dir)
+
+        with zipfile.ZipFile(zip_file) as zipf:
+            return num, {name: json.loads(zipf.read(name))
+                         for name in zipf.namelist()}
+
+    def test_blame_info(self):
+        """ Blame information is collected for the tracked files. """
+        num, blame = self.assemble_blame_info()
+        self.assertEqual(num, len(self.source_files))
+        self.assertCountEqual(
+            blame,
+            [os.path.join('blame', f.lstrip('/')) for f in self.source_files])
+
+        for info in blame.values():
+            self.assertEqual(len(info['commits']), 1)
+            self.assertEqual(info['blame'][0]['from'], 1)
+            commit = next(iter(info['commits'].values()))
+            self.assertEqual(commit['author']['name'], 'Author')
+
+        self.assertEqual(len(os.listdir(self.cache_dir)),
+                         len(self.source_files))
+
+        # The cached blame information is the same.
+        self.assertEqual(self.assemble_blame_info(), (num, blame))
+
+    def test_batches(self):
+        """ The files of a repository are split into batches. """
+        batch_size = blame_info.BLAME_BATCH_SIZE
+        blame_info.BLAME_BATCH_SIZE = 2
+        try:
+            num, blame = self.assemble_blame_info()
+        finally:
+            blame_info.BLAME_BATCH_SIZE = batch_size
+
+        self.assertEqual(num, len(self.source_files))
+        self.assertEqual(len(blame), len(self.source_files))
+
+    def test_cached_repository_fields(self):
+        """ The remote of the repository is not taken from the cache. """
+        _, blame = self.assemble_blame_info()
+        for info in blame.values():
+            self.assertIsNone(info['remote_url'])
+
+        with Repo(self.repo_dir) as repo:
+            repo.create_remote('origin', 'https://example.com/repo.git')
+
+        _, blame = self.assemble_blame_info()
+        for info in blame.values():
+            self.assertEqual(info['remote_url'],
+                             'https://example.com/repo.git')
+
+        for cache_file in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, cache_file),
+                      encoding='utf-8') as f:
+                self.assertNotIn('remote_url', json.load(f))
@@ -0,0 +1,464 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Test the helper functions of the store command.
+"""
+
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+import zlib
+
+from collections import namedtuple
+from unittest import mock
+
+from thrift.Thrift import TApplicationException
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import MissingContentHashes
+
+from codechecker_report_converter.report import File, Report, report_file
+from codechecker_report_converter.report.parser.base import AnalyzerInfo
+
+from codechecker_client.cli import store
+
+from codechecker_web.shared.report_fingerprint import get_report_fingerprint
+
+
+Product = namedtuple('Product', ['reportLimit'])
+
+
+def recording_map_fn(mapped_items):
+    """ Returns a map function which records the mapped items. """
+    def map_fn(func, items):
+        items = list(items)
+        mapped_items.extend(items)
+        return map(func, items)
+
+    return map_fn
+
+
+class MockClient:
+    """ Client which needs every source file content. """
+    # pylint: disable=invalid-name
+
+    def getMissingContentHashesForStore(self, file_hashes):
+        return MissingContentHashes(contentHashes=list(file_hashes),
+                                    blameInfoHashes=[])
+
+    def getCurrentProduct(self):
+        return Product(reportLimit=100)
+
+
+class OldServerClient:
+    """ Client of a server which can't tell the missing hashes at once. """
+    # pylint: disable=invalid-name
+
+    def getMissingContentHashesForStore(self, _):
+        raise TApplicationException(TApplicationException.UNKNOWN_METHOD)
+
+    def getMissingContentHashes(self, file_hashes):
+        return file_hashes[:1]
+
+    def getMissingContentHashesForBlameInfo(self, file_hashes):
+        return file_hashes[1:]
+
+
+class MissingContentHashesTest(unittest.TestCase):
+    """ Test asking the server for the missing source file contents. """
+
+    def test_missing_hashes(self):
+        self.assertEqual(
+            store.get_missing_content_hashes(MockClient(), ['a', 'b']),
+            ({'a', 'b'}, set()))
+
+    def test_old_server(self):
+        """ Older servers are asked for the two sets separately. """
+        self.assertEqual(
+            store.get_missing_content_hashes(OldServerClient(), ['a', 'b']),
+            ({'a'}, {'b'}))
+
+    def test_no_files(self):
+        self.assertEqual(
+            store.get_missing_content_hashes(OldServerClient(), []),
+            (set(), set()))
+
+
+class ReviewCommentScanTest(unittest.TestCase):
+    """ Test collecting the source files with review comments. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.with_comment = os.path.join(self.tmp_dir.name, 'a.cpp')
+        with open(self.with_comment, 'w', encoding='utf-8') as f:
+            f.write("int x;\n"
+                    "// codechecker_suppress [all] comment\n"
+                    "int y = 1 / 0;\n")
+
+        self.without_comment = os.path.join(self.tmp_dir.name, 'b.cpp')
+        with open(self.without_comment, 'w', encoding='utf-8') as f:
+            f.write("int y = 1 / 0;\n")
+
+        self.file_to_hash = {
+            file_path: store.get_file_content_hash(file_path)
+            for file_path in [self.with_comment, self.without_comment]}
+
+        self.scanned = []
+        self.map_fn = recording_map_fn(self.scanned)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cached_scan(self):
+        """ Source files are scanned only if their content is not cached. """
+        cache = {}
+        file_report_positions = {
+            self.with_comment: {3},
+            self.without_comment: {1}}
+
+        files_with_comment = store.get_source_file_with_comments(
+            file_report_positions, self.file_to_hash, cache, self.map_fn)
+        self.assertEqual(files_with_comment, {self.with_comment})
+        self.assertCountEqual(
+            self.scanned, [self.with_comment, self.without_comment])
+        self.assertEqual(
+            cache[self.file_to_hash[self.with_comment]]['lines'], [3])
+
+        # The result depends on the report positions, but the files are not
+        # scanned again.
+        self.scanned.clear()
+        file_report_positions[self.with_comment] = {1}
+        files_with_comment = store.get_source_file_with_comments(
+            file_report_positions, self.file_to_hash, cache, self.map_fn)
+        self.assertEqual(files_with_comment, set())
+        self.assertEqual(self.scanned, [])
+
+
+class ContentHashCacheTest(unittest.TestCase):
+    """ Test hashing the source files. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.file_paths = []
+        for idx in range(3):
+            file_path = os.path.join(self.tmp_dir.name, f'{idx}.cpp')
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(f"int x = {idx};\n")
+            self.file_paths.append(file_path)
+
+        self.hashed = []
+        self.map_fn = recording_map_fn(self.hashed)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cached_hash(self):
+        """ Source files are hashed only if they have changed. """
+        cache = {}
+        file_to_hash = store.get_file_content_hashes(
+            self.file_paths, cache, self.map_fn)
+        self.assertEqual(file_to_hash, {
+            file_path: store.get_file_content_hash(file_path)
+            for file_path in self.file_paths})
+        self.assertCountEqual(self.hashed, self.file_paths)
+
+        self.hashed.clear()
+        with open(self.file_paths[0], 'a', encoding='utf-8') as f:
+            f.write("int y;\n")
+
+        file_to_hash = store.get_file_content_hashes(
+            self.file_paths, cache, self.map_fn)
+        self.assertEqual(self.hashed, [self.file_paths[0]])
+        self.assertEqual(file_to_hash[self.file_paths[0]],
+                         store.get_file_content_hash(self.file_paths[0]))
+
+
+class WorkspaceCacheTest(unittest.TestCase):
+    """ Test the caches in the workspace. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_concurrent_stores(self):
+        """ Entries of concurrent stores are merged into the cache file. """
+        with mock.patch.object(store, 'get_default_workspace',
+                               return_value=self.tmp_dir.name):
+            with store.workspace_cache('cache.json', 3) as cache:
+                cache['old'] = 0
+
+            with store.workspace_cache('cache.json', 3) as cache1, \
+                    store.workspace_cache('cache.json', 3) as cache2:
+                cache1['a'] = 1
+                cache2['b'] = 2
+
+            with store.workspace_cache('cache.json', 3) as cache:
+                self.assertEqual(cache, {'old': 0, 'a': 1, 'b': 2})
+                cache['c'] = 3
+
+            # The least recently used entries are dropped.
+            with store.workspace_cache('cache.json', 3) as cache:
+                self.assertEqual(cache, {'a': 1, 'b': 2, 'c': 3})
+
+
+class AssembleZipTest(unittest.TestCase):
+    """ Test building the compressed zip file of the store command. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.report_dir = os.path.join(self.tmp_dir.name, 'reports')
+        os.makedirs(self.report_dir)
+
+        self.source_file = os.path.join(self.tmp_dir.name, 'main.cpp')
+        with open(self.source_file, 'w', encoding='utf-8') as f:
+            f.write("int x = 1 / 0;\nint y = 1 / 0;\n")
+
+        def create_report(line):
+            return Report(File(self.source_file), line, 9, "Division by zero",
+                          "core.DivideZero", report_hash=f"hash{line}",
+                          analyzer_name='clangsa')
+
+        # The first report is found by the analysis of both result files.
+        for idx, lines in enumerate([[1], [1, 2]]):
+            report_file.create(
+                os.path.join(self.report_dir, f'main_{idx}.plist'),
+                [create_report(line) for line in lines], None,
+                AnalyzerInfo('clangsa'))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assemble_zip(self, name, stored_fingerprints=None):
+        """
+        Build and extract the zip file of the store command. Returns the
+        directory of the extracted zip and its reports.
+        """
+        zip_file = os.path.join(self.tmp_dir.name, f'{name}.zip')
+
+        with mock.patch.dict(os.environ, {'HOME': self.tmp_dir.name}):
+            store.assemble_zip([self.report_dir], zip_file, MockClient(),
+                               MockClient(), None, self.tmp_dir.name,
+                               stored_fingerprints=stored_fingerprints)
+
+        # The server decodes the uploaded zip file this way.
+        content = zlib.decompress(base64.b64decode(
+            store.b64encode_file(zip_file)))
+
+        unzip_dir = os.path.join(self.tmp_dir.name, f'unzip_{name}')
+        unzip_file = os.path.join(self.tmp_dir.name, f'unzip_{name}.zip')
+        with open(unzip_file, 'wb') as f:
+            f.write(content)
+
+        with zipfile.ZipFile(unzip_file) as zipf:
+            self.assertIsNone(zipf.testzip())
+            zipf.extractall(unzip_dir)
+
+        reports = []
+        for root, _, files in os.walk(os.path.join(unzip_dir, 'reports')):
+            for file_name in files:
+                if report_file.is_supported(file_name):
+                    reports.extend(report_file.get_reports(
+                        os.path.join(root, file_name)))
+
+        return unzip_dir, reports
+
+    def test_assemble_zip(self):
+        """ The zip contains the unique reports and the source files. """
+        unzip_dir, reports = self.assemble_zip('store')
+
+        self.assertTrue(os.path.exists(os.path.join(
+            unzip_dir, 'root', self.source_file.lstrip('/'))))
+        self.assertTrue(os.path.exists(
+            os.path.join(unzip_dir, 'content_hashes.json')))
+
+        self.assertEqual(sorted(r.line for r in reports), [1, 2])
+
+        # The temporary plist files are removed.
+        self.assertEqual(
+            sorted(os.listdir(self.tmp_dir.name)),
+            sorted(['.codechecker', 'main.cpp', 'reports', 'store.zip',
+                    'unzip_store', 'unzip_store.zip']))
+
+    def test_unchanged_reports(self):
+        """ Only the fingerprints of the stored reports are sent. """
+        unzip_dir, reports = self.assemble_zip('first')
+        with open(os.path.join(unzip_dir, 'content_hashes.json'),
+                  encoding='utf-8') as f:
+            file_to_hash = json.load(f)
+
+        # The server computes the fingerprints of the stored reports.
+        fingerprint = next(
+            get_report_fingerprint(r, file_to_hash, None)
+            for r in reports if r.line == 1)
+
+        unzip_dir, reports = self.assemble_zip('second', {fingerprint})
+        self.assertEqual([r.line for r in reports], [2])
+
+        kept_files = [
+            os.path.join(root, store.KEPT_REPORTS_FILE)
+            for root, _, files in os.walk(os.path.join(unzip_dir, 'reports'))
+            if store.KEPT_REPORTS_FILE in files]
+        self.assertEqual(len(kept_files), 1)
+        with open(kept_files[0], encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [fingerprint])
+
+    def test_b64encode_file(self):
+        """ The file is encoded the same way in chunks. """
+        file_path = os.path.join(self.tmp_dir.name, 'data')
+        content = os.urandom(store.B64_CHUNK_SIZE * 2 + 100)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+
+        self.assertEqual(store.b64encode_file(file_path),
+                         base64.b64encode(content).decode('utf-8'))
+
+
+class UploadClient:
+    """
+    Client which receives the uploaded chunks, and loses the connection
+    during the upload of the second chunk after receiving a part of it.
+    """
+    # pylint: disable=invalid-name
+
+    def __init__(self):
+        self.received = b''
+        self.size = None
+        self.failed = False
+
+    def beginStoreUpload(self, zipfile_size):
+        self.size = zipfile_size
+        return 'token'
+
+    def getStoreUploadOffset(self, _):
+        return len(self.received)
+
+    def appendStoreUploadChunk(self, _, offset, chunk, checksum):
+        data = base64.b64decode(chunk)
+        self.received = self.received[:offset] + data
+        if offset and not self.failed:
+            self.failed = True
+            self.received = self.received[:-1]
+            raise OSError("Connection reset by peer")
+
+        assert hashlib.sha256(data).hexdigest() == checksum
+        return len(self.received)
+
+
+class UploadZipTest(unittest.TestCase):
+    """ Test uploading the zip file in chunks. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_resume_upload(self):
+        """ The upload continues from the received part of a chunk. """
+        file_path = os.path.join(self.tmp_dir.name, 'store.zip')
+        content = os.urandom(100)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+
+        client = UploadClient()
+        with mock.patch.object(store, 'UPLOAD_CHUNK_SIZE', 30), \
+                mock.patch.object(store.time, 'sleep'):
+            self.assertEqual(store.upload_zip(client, file_path), 'token')
+
+        self.assertTrue(client.failed)
+        self.assertEqual(client.size, len(content))
+        self.assertEqual(client.received, content)
+
+
+class ManifestTest(unittest.TestCase):
+    """ Test storing multiple runs from a manifest file. """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+        self.manifest_file = os.path.join(self.tmp_dir.name, 'manifest.json')
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {"input": "reports/a", "name": "a"},
+                {"input": ["reports/b", "reports/c"], "name": "b",
+                 "url": "localhost:8002/Other", "tag": "v1"},
+                {"input": "reports/d"}], f)
+
+        parser = argparse.ArgumentParser()
+        store.add_arguments_to_parser(parser)
+        self.args = parser.parse_args([
+            '--manifest', self.manifest_file, '--name', 'ignored',
+            '--tag', 'nightly', '--parallel-runs', '2', '--jobs', '1'])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_manifest(self):
+        """ Run arguments default to the command line arguments. """
+        runs = store.load_manifest(self.manifest_file, self.args)
+
+        self.assertEqual(
+            [run.input for run in runs],
+            [[os.path.join(self.tmp_dir.name, 'reports', d)
+              for d in dirs] for dirs in [['a'], ['b', 'c'], ['d']]])
+        self.assertEqual([run.name for run in runs[:2]], ['a', 'b'])
+        self.assertNotIn('name', runs[2])
+        self.assertEqual([run.product_url for run in runs],
+                         ['localhost:8001/Default', 'localhost:8002/Other',
+                          'localhost:8001/Default'])
+        self.assertEqual([run.tag for run in runs], ['nightly', 'v1',
+                                                     'nightly'])
+        self.assertTrue(all('manifest' not in run for run in runs))
+
+    def test_invalid_manifest(self):
+        """ The manifest has to be a list of runs with inputs. """
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({"input": "reports"}, f)
+
+        with self.assertRaises(ValueError):
+            store.load_manifest(self.manifest_file, self.args)
+
+    def test_store_manifest(self):
+        """ Failed runs don't stop storing the other runs. """
+        stored = []
+
+        def store_run(run_args, _):
+            stored.append(getattr(run_args, 'name', None))
+            if 'name' not in run_args:
+                sys.exit(2)
+
+        with mock.patch.object(store, 'store_run', store_run), \
+                mock.patch.object(store.libclient, 'setup_client') as setup:
+            self.assertEqual(store.store_manifest(self.args), 1)
+
+        self.assertCountEqual(stored, ['a', 'b', None])
+        self.assertCountEqual(
+            [c.args[0] for c in setup.call_args_list],
+            ['localhost:8001/Default', 'localhost:8002/Other'])
+
+    def test_invalid_parallel_runs(self):
+        """ The number of parallel runs has to be positive. """
+        self.args.parallel_runs = 0
+
+        with mock.patch.object(store, 'store_manifest') as store_manifest, \
+                self.assertRaises(SystemExit) as ex:
+            store.main(self.args)
+
+        self.assertEqual(ex.exception.code, 1)
+        store_manifest.assert_not_called()
@@ -0,0 +1,62 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Fingerprint of the stored reports, which is computed the same way by the
+'CodeChecker store' client and by the server.
+"""
+
+
+from hashlib import sha256
+import json
+from typing import Dict, Iterable, List, Optional
+
+from codechecker_report_converter.report import Report
+from codechecker_report_converter.report.hash import get_report_path_hash
+
+
+# File in the report directories of the store zip, which lists the
+# fingerprints of the reports that are found again unchanged, so they are not
+# sent to the server.
+KEPT_REPORTS_FILE = 'kept_report_fingerprints.json'
+
+
+def get_fingerprint(
+    report_path_hash: str,
+    file_paths: Iterable[str],
+    file_to_hash: Dict[str, str],
+    trim_path_prefixes: Optional[List[str]]
+) -> str:
+    """
+    Returns the fingerprint of a report from its report path hash and the
+    original paths of the files it refers to, see get_report_fingerprint().
+    """
+    file_hashes = [file_to_hash.get(file_path)
+                   for file_path in sorted(file_paths)]
+
+    return sha256(json.dumps([report_path_hash,
+                              file_hashes,
+                              sorted(trim_path_prefixes or [])])
+                  .encode('utf-8')).hexdigest()
+
+
+def get_report_fingerprint(
+    report: Report,
+    file_to_hash: Dict[str, str],
+    trim_path_prefixes: Optional[List[str]]
+) -> str:
+    """
+    Returns the fingerprint of the given report, whose paths are not trimmed
+    yet. It is a hash of the report path hash, the content hashes of the
+    referenced files and the path prefixes which are trimmed by the storage.
+    A report which has the same fingerprint as a stored report of the run
+    doesn't have to be stored again.
+    """
+    return get_fingerprint(get_report_path_hash(report),
+                           report.original_files,
+                           file_to_hash,
+                           trim_path_prefixes)
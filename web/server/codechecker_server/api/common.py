@@ -5,6 +5,12 @@
 #  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 #
 # -------------------------------------------------------------------------
+import base64
+import functools
+import zlib
+
+from typing import BinaryIO, Iterable
+
 import sqlalchemy
 
 from codechecker_api_shared.ttypes import RequestFailed, ErrorCode
@@ -14,6 +20,13 @@ from codechecker_common.logger import get_logger
 
 LOG = get_logger("server")
 
+# Size of the chunks in which the uploaded base64 encoded content is decoded.
+# It is divisible by 4, so every chunk can be decoded on its own.
+B64_CHUNK_SIZE = 4 * 1024 ** 2
+
+# Size of the chunks in which uploaded zlib compressed files are read.
+ZLIB_CHUNK_SIZE = 4 * 1024 ** 2
+
 
 def exc_to_thrift_reqfail(function):
     """
@@ -47,3 +60,50 @@ def exc_to_thrift_reqfail(function):
             raise RequestFailed(ErrorCode.GENERAL, msg)
 
     return wrapper
+
+
+def write_zlib_chunks(chunks: Iterable[bytes], output_file: BinaryIO) -> int:
+    """
+    Decompress the given chunks of zlib compressed content to the given file.
+    Returns the size of the decompressed content.
+    """
+    decompressor = zlib.decompressobj()
+
+    size = 0
+    for chunk in chunks:
+        data = decompressor.decompress(chunk)
+        output_file.write(data)
+        size += len(data)
+
+    data = decompressor.flush()
+    output_file.write(data)
+    size += len(data)
+
+    if not decompressor.eof:
+        raise zlib.error("Incomplete compressed content.")
+
+    return size
+
+
+def write_b64_zlib_content(b64_content: str, output_file: BinaryIO) -> int:
+    """
+    Decode the given base64 encoded and zlib compressed content to the given
+    file. The content is decoded and decompressed chunk by chunk, so neither
+    the compressed nor the decompressed content is kept in memory as a whole.
+    Returns the size of the decompressed content.
+    """
+    return write_zlib_chunks(
+        (base64.b64decode(b64_content[i:i + B64_CHUNK_SIZE])
+         for i in range(0, len(b64_content), B64_CHUNK_SIZE)),
+        output_file)
+
+
+def write_zlib_file_content(input_file: BinaryIO,
+                            output_file: BinaryIO) -> int:
+    """
+    Decompress the content of the given zlib compressed file to the given
+    file chunk by chunk. Returns the size of the decompressed content.
+    """
+    return write_zlib_chunks(
+        iter(functools.partial(input_file.read, ZLIB_CHUNK_SIZE), b''),
+        output_file)
@@ -11,19 +11,18 @@ run data to a product's report database.
 
 Called via `report_server`, but factored out here for readability.
 """
-import base64
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import fnmatch
-from hashlib import sha256
 import json
 import os
 from pathlib import Path
 import sqlalchemy
 import tempfile
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, \
-    cast
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, \
+    Tuple, cast
 import zipfile
 import zlib
 
@@ -34,7 +33,8 @@ from codechecker_common import skiplist_handler
 from codechecker_common.logger import get_logger
 from codechecker_common.review_status_handler import ReviewStatusHandler, \
     SourceReviewStatus
-from codechecker_common.util import format_size, load_json, path_for_fake_root
+from codechecker_common.util import chunks, format_size, load_json, \
+    path_for_fake_root
 
 from codechecker_report_converter import twodim
 from codechecker_report_converter.util import trim_path_prefixes
@@ -42,30 +42,46 @@ from codechecker_report_converter.report import \
     FakeChecker, Report, UnknownChecker, report_file
 from codechecker_report_converter.report.hash import get_report_path_hash
 
+from codechecker_web.shared.report_fingerprint import KEPT_REPORTS_FILE, \
+    get_report_fingerprint
+
 from ..database import db_cleanup
+from ..database.bulk_insert import BULK_INSERT_BATCH_SIZE, BulkInserter, \
+    insert_ignoring_conflicts, insert_rows_ignoring_conflicts, \
+    insert_rows_returning_ids
 from ..database.config_db_model import Product
 from ..database.database import DBSession
+from ..database.report_counts import refresh_report_counts
+from ..database.report_path import encode_report_path
 from ..database.run_db_model import \
     AnalysisInfo, AnalysisInfoChecker, AnalyzerStatistic, \
-    BugPathEvent, BugReportPoint, \
     Checker, \
-    ExtendedReportData, \
     File, FileContent, \
-    Report as DBReport, ReportAnnotations, ReviewStatus as ReviewStatusRule, \
+    Report as DBReport, ReportAnalysisInfo, ReportAnnotationColumns, \
+    ReportAnnotations, \
+    ReportPath, ReportPathFile, ReviewStatus as ReviewStatusRule, \
     Run, RunLock as DBRunLock, RunHistory, \
     SourceComponent, SourceComponentFile
 from ..metadata import checker_is_unavailable, MetadataInfoParser
 
+from .common import write_b64_zlib_content, write_zlib_file_content
 from .report_annotations import report_annotation_types
 from ..product import Product as ServerProduct
 from ..session_manager import SessionManager
 from ..task_executors.abstract_task import AbstractTask, TaskCancelHonoured
 from ..task_executors.task_manager import TaskManager
-from .thrift_enum_helper import report_extended_data_type_str
 
 
 LOG = get_logger('server')
 
+# Number of source files which are compressed and inserted into the database
+# in one batch.
+SOURCE_FILE_BATCH_SIZE = 256
+
+# Number of threads compressing the source files. The zlib module releases the
+# GIL while compressing, so the files are compressed in parallel.
+SOURCE_COMPRESSION_JOBS = min(8, os.cpu_count() or 1)
+
 
 class StepLog:
     """
@@ -237,20 +253,47 @@ def unzip(run_name: str, b64zip: str, output_dir: Path) -> int:
     if not b64zip:
         return 0
 
+    return extract_zip(
+        run_name, lambda zip_file: write_b64_zlib_content(b64zip, zip_file),
+        len(b64zip), output_dir)
+
+
+def unzip_file(run_name: str, zlib_zip_path: Path, output_dir: Path) -> int:
+    """
+    This function unzips a ZLib-compressed ZIP file, which was uploaded in
+    chunks. This ZIP is extracted to a temporary directory and the ZIP is then
+    deleted. The function returns the size of the extracted decompressed ZIP
+    file.
+    """
+    with open(zlib_zip_path, 'rb') as zlib_zip_file:
+        return extract_zip(
+            run_name,
+            lambda zip_file: write_zlib_file_content(zlib_zip_file, zip_file),
+            os.stat(zlib_zip_path).st_size, output_dir)
+
+
+def extract_zip(run_name: str,
+                write_zip: Callable[[BinaryIO], int],
+                input_size: int,
+                output_dir: Path) -> int:
+    """
+    Extracts the ZIP file which is decompressed by `write_zip` from the
+    compressed input of `input_size` bytes to the given directory. Returns
+    the size of the decompressed ZIP file.
+    """
     with tempfile.NamedTemporaryFile(
             suffix=".zip", dir=output_dir) as zip_file:
         LOG.debug("Decompressing input massStoreRun() ZIP to '%s' ...",
                   zip_file.name)
         start_time = time.time()
-        zip_file.write(zlib.decompress(base64.b64decode(b64zip)))
+        size = write_zip(zip_file)
         zip_file.flush()
         end_time = time.time()
 
-        size = os.stat(zip_file.name).st_size
         LOG.debug("Decompressed input massStoreRun() ZIP '%s' -> '%s' "
                   "(compression ratio: %.2f%%) in '%s'.",
-                  format_size(len(b64zip)), format_size(size),
-                  (size / len(b64zip)),
+                  format_size(input_size), format_size(size),
+                  (size / input_size),
                   timedelta(seconds=end_time - start_time))
 
         with StepLog(run_name, "Extract massStoreRun() ZIP contents"), \
@@ -273,14 +316,22 @@ def get_file_content(file_path: str) -> bytes:
         return f.read()
 
 
-def assign_file_to_source_components(
+def compress_file_content(file_path: str, level: int) -> bytes:
+    """ Read and compress the content of the given source file. """
+    return zlib.compress(get_file_content(file_path), level)
+
+
+def assign_files_to_source_components(
     session: DBSession,
-    file_id: int,
-    filepath: str
+    file_paths: Dict[int, str]
 ):
     """
-    Checks all Source Components and links the file if it matches.
+    Checks all Source Components and links the given files (file paths by
+    file ids) if they match.
     """
+    if not file_paths:
+        return
+
     components = session.query(SourceComponent).all()
 
     associations = []
@@ -294,102 +345,35 @@ def assign_file_to_source_components(
         if not skip and not include:
             continue
 
-        is_included = False
-        if include:
-            for pattern in include:
-                if fnmatch.fnmatch(filepath, pattern):
-                    is_included = True
-                    break
-        else:
-            # If only skip is defined, it matches everything except skips.
-            is_included = True
-
-        is_skipped = False
-        if skip:
-            for pattern in skip:
-                if fnmatch.fnmatch(filepath, pattern):
-                    is_skipped = True
-                    break
-
-        if is_included and not is_skipped:
-            associations.append({
-                'source_component_name': component.name,
-                'file_id': file_id
-            })
+        for file_id, filepath in file_paths.items():
+            is_included = False
+            if include:
+                for pattern in include:
+                    if fnmatch.fnmatch(filepath, pattern):
+                        is_included = True
+                        break
+            else:
+                # If only skip is defined, it matches everything except
+                # skips.
+                is_included = True
+
+            is_skipped = False
+            if skip:
+                for pattern in skip:
+                    if fnmatch.fnmatch(filepath, pattern):
+                        is_skipped = True
+                        break
+
+            if is_included and not is_skipped:
+                associations.append({
+                    'source_component_name': component.name,
+                    'file_id': file_id
+                })
 
     if associations:
         session.bulk_insert_mappings(SourceComponentFile, associations)
 
 
-def add_file_record(
-    session: DBSession,
-    file_path: str,
-    content_hash: str
-) -> Optional[int]:
-    """
-    Add the necessary file record pointing to an already existing content.
-    Returns the added file record id or None, if the content_hash is not
-    found.
-
-    This function must not be called between add_checker_run() and
-    finish_checker_run() functions when SQLite database is used!
-    add_checker_run() function opens a transaction which is closed by
-    finish_checker_run() and since SQLite doesn't support parallel
-    transactions, this API call will wait until the other transactions
-    finish. In the meantime the run adding transaction times out.
-
-    This function doesn't insert blame info in the File objects because those
-    are added by __add_blame_info(). In previous CodeChecker versions git info
-    was not stored at all, so upgrading to a new CodeChecker results the
-    storage of git blame info even for files that are already stored. For this
-    reason we can't avoid an update on File and FileContent tables, but we can
-    avoid double reading of blame info json files.
-    """
-    file_record = session.query(File) \
-        .filter(File.content_hash == content_hash,
-                File.filepath == file_path) \
-        .one_or_none()
-
-    if file_record:
-        return file_record.id
-
-    try:
-        # Parallel storage of runs containing common file paths results a
-        # "duplicate key violation" error. This is handled by CodeChecker, so
-        # practically it causes no problem. The INSERT command of the second
-        # transaction will be thrown away. However, some DB systems are
-        # supporting "ON CONFLICT DO NOTHING" clause in INSERT statement which
-        # solves the same issue gracefully.
-        # TODO: "ON CONFLICT DO NOTHING" feature is available for SQLite engine
-        # too in SQLAlchemy 1.4.
-        if session.bind.dialect.name == 'postgresql':
-            insert_stmt = sqlalchemy.dialects.postgresql.insert(File).values(
-                filepath=file_path,
-                filename=os.path.basename(file_path),
-                content_hash=content_hash).on_conflict_do_nothing(
-                    index_elements=['filepath', 'content_hash'])
-            file_id = session.execute(insert_stmt).inserted_primary_key[0]
-            assign_file_to_source_components(session, file_id, file_path)
-            session.commit()
-            return file_id
-
-        file_record = File(file_path, content_hash, None, None)
-        session.add(file_record)
-        session.flush()
-        assign_file_to_source_components(session, file_record.id, file_path)
-        session.commit()
-    except sqlalchemy.exc.IntegrityError as ex:
-        LOG.error(ex)
-        # Other transaction might have added the same file in the
-        # meantime.
-        session.rollback()
-        file_record = session.query(File) \
-            .filter(File.content_hash == content_hash,
-                    File.filepath == file_path).one_or_none()
-
-    return file_record.id if file_record else None
-
-
 def get_blame_file_data(
     blame_file: Path
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -446,8 +430,9 @@ class MassStoreRunInputHandler:
                  client_version: str,
                  force_overwrite_of_run: bool,
                  path_prefixes_to_trim: Optional[List[str]],
-                 zipfile_contents_base64: str,
-                 user_name: str):
+                 zipfile_contents_base64: Optional[str],
+                 user_name: str,
+                 zipfile_path: Optional[Path] = None):
         self._input_handling_start_time = time.time()
         self._session_manager = session_manager
         self._config_db = config_db_sessionmaker
@@ -455,6 +440,7 @@ class MassStoreRunInputHandler:
         self._tm = task_manager
         self._package_context = package_context
         self._input_zip_blob = zipfile_contents_base64
+        self._input_zip_path = zipfile_path
         self.client_version = client_version
         self.force_overwrite_of_run = force_overwrite_of_run
         self.path_prefixes_to_trim = path_prefixes_to_trim
@@ -505,9 +491,14 @@ class MassStoreRunInputHandler:
         try:
             with StepLog(self.run_name,
                          "Save massStoreRun() ZIP data to server storage"):
-                zip_size = unzip(self.run_name,
-                                 self._input_zip_blob,
-                                 extract_dir)
+                if self._input_zip_path:
+                    zip_size = unzip_file(self.run_name,
+                                          self._input_zip_path,
+                                          extract_dir)
+                else:
+                    zip_size = unzip(self.run_name,
+                                     self._input_zip_blob,
+                                     extract_dir)
 
                 if not zip_size:
                     raise RequestFailed(ErrorCode.GENERAL,
@@ -531,6 +522,8 @@ class MassStoreRunInputHandler:
                     "run_description": self.run_description,
                     "store_tag": self.store_tag,
                     "user_name": self.user_name,
+                    "source_compression_level":
+                        self._session_manager.get_source_compression_level(),
                     }, cfg_f)
         except Exception:
             LOG.error("Failed to write massStoreRunAsynchronous() "
@@ -662,6 +655,9 @@ class MassStoreRunTask(AbstractTask):
                          self.store_configuration["path_prefixes_to_trim"],
                          self.store_configuration["run_description"],
                          self.store_configuration["user_name"],
+                         self.store_configuration.get(
+                             "source_compression_level",
+                             zlib.Z_BEST_COMPRESSION),
                          )
         m.store(self.input_zip_size, self.time_spent_on_task_preparation)
 
@@ -688,6 +684,7 @@ class MassStoreRun:
                  trim_path_prefix_list: Optional[List[str]],
                  description: Optional[str],
                  user_name: str,
+                 source_compression_level: int = zlib.Z_BEST_COMPRESSION,
                  ):
         self._zip_dir = zip_dir
         self._name = name
@@ -701,6 +698,7 @@ class MassStoreRun:
         self.__package_context = package_context
         self.__product = product
         self.__graceful_cancel_if_requested = graceful_cancel
+        self.__source_compression_level = source_compression_level
 
         self.__mips: Dict[str, MetadataInfoParser] = {}
         self.__analysis_info: Dict[str, AnalysisInfo] = {}
@@ -712,11 +710,18 @@ class MassStoreRun:
         self.__already_added_report_hashes: Set[str] = set()
         self.__new_report_hashes: Dict[str, Tuple] = {}
         self.__all_report_checkers: Set[str] = set()
-        self.__added_reports: List[Tuple[DBReport, Report]] = []
+        self.__added_report_count: int = 0
+        self.__kept_report_ids: Set[int] = set()
+        self.__kept_report_analysis_info: Dict[int, Optional[int]] = {}
         self.__reports_with_fake_checkers: Dict[
-            # Either a DBReport *without* an ID, or the ID of a committed
-            # DBReport.
-            str, Tuple[Report, Union[DBReport, int]]] = {}
+            str, Tuple[Report, int]] = {}
+
+        # Reports which are not inserted into the database yet: the row of
+        # the report, the parsed report, the id of its analysis information
+        # and its path hash if it has a fake checker.
+        self.__pending_reports: List[
+            Tuple[Dict[str, Any], Report, Optional[int], Optional[str]]] = []
+        self.__inserter: Optional[BulkInserter] = None
 
         with DBSession(config_db) as session:
             product = session.get(Product, self.__product.id)
@@ -727,42 +732,57 @@ class MassStoreRun:
         source_root: Path,
         filename_to_hash: Dict[str, str]
     ) -> Dict[str, int]:
-        """ Storing file contents from plist. """
-        file_path_to_id = {}
+        """
+        Store the source files of the run and return the database ids of the
+        files by their trimmed paths.
+
+        The file contents which are not in the database yet are compressed in
+        parallel and inserted in batches, then the missing file records are
+        added. Both steps commit their own transactions, so they must not be
+        called between add_checker_run() and finish_checker_run() when SQLite
+        database is used.
+        """
+        from .report_server import SQLITE_MAX_VARIABLE_NUMBER
 
+        # Source files in the ZIP file by their content hashes. The files
+        # are not in the ZIP file if the server already has their contents.
+        source_files: Dict[str, str] = {}
+        file_hashes: Dict[str, str] = {}
         for file_name, file_hash in filename_to_hash.items():
-            self.__graceful_cancel_if_requested()
             source_file_path = path_for_fake_root(file_name, str(source_root))
-            LOG.debug("Storing source file: %s", source_file_path)
+            if os.path.isfile(source_file_path):
+                source_files.setdefault(file_hash, source_file_path)
+
             trimmed_file_path = trim_path_prefixes(
                 file_name, self._trim_path_prefixes)
+            file_hashes[trimmed_file_path] = file_hash
 
-            if not os.path.isfile(source_file_path):
-                # The file was not in the ZIP file, because we already
-                # have the content. Let's check if we already have a file
-                # record in the database or we need to add one.
-
-                LOG.debug('%s not found or already stored.', trimmed_file_path)
-                with DBSession(self.__product.session_factory) as session:
-                    fid = add_file_record(
-                        session, trimmed_file_path, file_hash)
-
-                if fid:
-                    file_path_to_id[trimmed_file_path] = fid
-                    LOG.debug("%d fileid found", fid)
-                else:
-                    LOG.error("File ID for %s is not found in the DB with "
-                              "content hash %s. Missing from ZIP?",
-                              source_file_path, file_hash)
-                continue
-
-            with DBSession(self.__product.session_factory) as session:
-                self.__add_file_content(session, source_file_path, file_hash)
-
-                file_path_to_id[trimmed_file_path] = add_file_record(
-                    session, trimmed_file_path, file_hash)
-
-        return file_path_to_id
+        stored_hashes: Set[str] = set()
+        with DBSession(self.__product.session_factory) as session:
+            for content_hashes in chunks(set(file_hashes.values()),
+                                         SQLITE_MAX_VARIABLE_NUMBER):
+                stored_hashes.update(
+                    content_hash for content_hash, in
+                    session.query(FileContent.content_hash)
+                    .filter(FileContent.content_hash.in_(
+                        list(content_hashes))))
+
+        self.__add_file_contents([
+            (content_hash, source_file_path)
+            for content_hash, source_file_path in source_files.items()
+            if content_hash not in stored_hashes])
+        stored_hashes.update(source_files.keys())
+
+        for file_path, file_hash in file_hashes.items():
+            if file_hash not in stored_hashes:
+                LOG.error("File ID for %s is not found in the DB with "
+                          "content hash %s. Missing from ZIP?",
+                          file_path, file_hash)
+
+        return self.__add_file_records({
+            file_path: file_hash
+            for file_path, file_hash in file_hashes.items()
+            if file_hash in stored_hashes})
 
     def __add_blame_info(
         self,
@@ -810,23 +830,14 @@ class MassStoreRun:
 
             session.commit()
 
-    def __add_file_content(
-        self,
-        session: DBSession,
-        source_file_name: str,
-        content_hash: Optional[str]
-    ):
+    def __add_file_contents(self, contents: List[Tuple[str, str]]):
         """
-        Add the necessary file contents. If content_hash in None then this
-        function calculates the content hash. Or if it's available at the
-        caller and it's provided then it will not be calculated again.
+        Add the given file contents (content hashes and source file paths)
+        to the database.
 
-        This function must not be called between add_checker_run() and
-        finish_checker_run() functions when SQLite database is used!
-        add_checker_run() function opens a transaction which is closed by
-        finish_checker_run() and since SQLite doesn't support parallel
-        transactions, this API call will wait until the other transactions
-        finish. In the meantime the run adding transaction times out.
+        The files are read and compressed by a thread pool while the
+        previous batch of contents is inserted. The contents which were
+        added by a concurrent storage in the meantime are skipped.
 
         This function doesn't insert blame info in the FileContent objects
         because those are added by __add_blame_info(). In previous CodeChecker
@@ -836,40 +847,97 @@ class MassStoreRun:
         and FileContent tables, but we can avoid double reading of blame info
         json files.
         """
-        source_file_content = None
-        if not content_hash:
-            source_file_content = get_file_content(source_file_name)
-
-            hasher = sha256()
-            hasher.update(source_file_content)
-            content_hash = hasher.hexdigest()
-
-        file_content = session.get(FileContent, content_hash)
-        if not file_content:
-            if not source_file_content:
-                source_file_content = get_file_content(source_file_name)
-            try:
-                compressed_content = zlib.compress(
-                    source_file_content, zlib.Z_BEST_COMPRESSION)
-
-                if session.bind.dialect.name == 'postgresql':
-                    insert_stmt = sqlalchemy.dialects.postgresql \
-                        .insert(FileContent).values(
-                            content_hash=content_hash,
-                            content=compressed_content,
-                            blame_info=None).on_conflict_do_nothing(
-                                index_elements=['content_hash'])
-
-                    session.execute(insert_stmt)
-                else:
-                    fc = FileContent(content_hash, compressed_content, None)
-                    session.add(fc)
+        if not contents:
+            return
+
+        LOG.info("[%s] Compressing and storing %d new file content(s) with "
+                 "compression level %d.", self._name, len(contents),
+                 self.__source_compression_level)
+
+        batches = [list(batch) for batch
+                   in chunks(contents, SOURCE_FILE_BATCH_SIZE)]
+
+        with ThreadPoolExecutor(SOURCE_COMPRESSION_JOBS) as executor:
+            def submit(batch):
+                return [executor.submit(compress_file_content,
+                                        source_file_path,
+                                        self.__source_compression_level)
+                        for _, source_file_path in batch]
+
+            pending = submit(batches[0])
+            for idx, batch in enumerate(batches):
+                self.__graceful_cancel_if_requested()
+
+                futures = pending
+                if idx + 1 < len(batches):
+                    pending = submit(batches[idx + 1])
+
+                rows = [{'content_hash': content_hash,
+                         'content': future.result(),
+                         'blame_info': None}
+                        for (content_hash, _), future in zip(batch, futures)]
+
+                with DBSession(self.__product.session_factory) as session:
+                    session.execute(insert_ignoring_conflicts(
+                        session, FileContent.__table__, ['content_hash']),
+                        rows)
+                    session.commit()
+
+    def __add_file_records(
+        self,
+        file_hashes: Dict[str, str]
+    ) -> Dict[str, int]:
+        """
+        Add the file records pointing to already existing contents (content
+        hashes by file paths) and return the file ids by the file paths.
+
+        This function doesn't insert blame info in the File objects because
+        those are added by __add_blame_info().
+        """
+        from .report_server import SQLITE_MAX_VARIABLE_NUMBER
+
+        file_path_to_id: Dict[str, int] = {}
+
+        def query_file_ids(session, file_paths):
+            for paths in chunks(file_paths, SQLITE_MAX_VARIABLE_NUMBER):
+                for file_id, file_path, content_hash in \
+                        session.query(File.id, File.filepath,
+                                      File.content_hash) \
+                        .filter(File.filepath.in_(list(paths))):
+                    if file_hashes[file_path] == content_hash:
+                        file_path_to_id[file_path] = file_id
 
-                session.commit()
-            except sqlalchemy.exc.IntegrityError:
-                # Other transaction moght have added the same content in
-                # the meantime.
-                session.rollback()
+        with DBSession(self.__product.session_factory) as session:
+            query_file_ids(session, file_hashes.keys())
+
+            missing_file_paths = [file_path for file_path in file_hashes
+                                  if file_path not in file_path_to_id]
+            if not missing_file_paths:
+                return file_path_to_id
+
+            LOG.debug("[%s] Adding %d new file record(s).", self._name,
+                      len(missing_file_paths))
+
+            # Parallel storage of runs containing common file paths would
+            # result a "duplicate key violation" error, the records which
+            # were added by an other transaction in the meantime are skipped.
+            new_files: Dict[int, str] = {}
+            for file_paths in chunks(missing_file_paths,
+                                     SOURCE_FILE_BATCH_SIZE):
+                new_files.update(insert_rows_ignoring_conflicts(
+                    session, File.__table__, ['filepath', 'content_hash'],
+                    [{'filepath': file_path,
+                      'filename': os.path.basename(file_path),
+                      'content_hash': file_hashes[file_path]}
+                     for file_path in file_paths],
+                    'filepath'))
+
+            assign_files_to_source_components(session, new_files)
+            session.commit()
+
+            query_file_ids(session, missing_file_paths)
+
+        return file_path_to_id
 
     def __store_checker_identifiers(self, checkers: Set[Tuple[str, str]]):
         """
@@ -1169,9 +1237,13 @@ class MassStoreRun:
         detection_time: datetime,
         run_history_time: datetime,
         analysis_info: Optional[AnalysisInfo],
+        fingerprint: str,
         fixed_at: Optional[datetime] = None
-    ) -> int:
-        """ Add report to the database. """
+    ):
+        """
+        Add report to the database. The reports are inserted in batches by
+        __insert_pending_reports().
+        """
         checker = self.__checker_for_report(session, report)
         if not checker:
             # It would be too easy to create a 'Checker' instance with the
@@ -1192,23 +1264,147 @@ class MassStoreRun:
                           FakeChecker[0], FakeChecker[1])
                 raise KeyError(FakeChecker[1])
 
-        db_report = DBReport(
-            file_path_to_id[report.file.path], run_id, report.report_hash,
-            checker, report.line, report.column,
-            len(report.bug_path_events), report.message, detection_status,
-            review_status.status, review_status.author,
-            review_status.message, run_history_time,
-            review_status.in_source, detection_time, fixed_at)
-        if analysis_info:
-            db_report.analysis_info.append(analysis_info)
+        row = {
+            'file_id': file_path_to_id[report.file.path],
+            'run_id': run_id,
+            'bug_id': report.report_hash,
+            'checker_id': checker.id,
+            'line': report.line,
+            'column': report.column,
+            'path_length': len(report.bug_path_events),
+            'checker_message': report.message,
+            'detection_status': detection_status,
+            'review_status': review_status.status,
+            'review_status_author': review_status.author,
+            'review_status_message': review_status.message,
+            'review_status_date': run_history_time,
+            'review_status_is_in_source': review_status.in_source,
+            'detected_at': detection_time,
+            'fixed_at': fixed_at,
+            'fingerprint': fingerprint}
+
+        self.__pending_reports.append((
+            row, report, analysis_info.id if analysis_info else None,
+            report_path_hash if checker.checker_name == FakeChecker[1]
+            else None))
+        self.__added_report_count += 1
+
+        if len(self.__pending_reports) >= BULK_INSERT_BATCH_SIZE:
+            self.__insert_pending_reports(session, file_path_to_id)
+
+    def __insert_pending_reports(
+        self,
+        session: DBSession,
+        file_path_to_id: Dict[str, int]
+    ):
+        """
+        Insert the pending reports into the database and queue the rows of
+        their bug paths, extended data and analysis information for the
+        bulk inserter.
+        """
+        if not self.__pending_reports:
+            return
+
+        report_ids = insert_rows_returning_ids(
+            session, DBReport.__table__,
+            [row for row, _, _, _ in self.__pending_reports])
+
+        inserter = cast(BulkInserter, self.__inserter)
+        for report_id, (_, report, analysis_info_id, report_path_hash) in \
+                zip(report_ids, self.__pending_reports):
+            if analysis_info_id is not None:
+                inserter.add(ReportAnalysisInfo, {
+                    'report_id': report_id,
+                    'analysis_info_id': analysis_info_id})
+
+            if report_path_hash is not None:
+                self.__reports_with_fake_checkers[report_path_hash] = \
+                    (report, report_id)
 
-        session.add(db_report)
-        self.__added_reports.append((db_report, report))
-        if db_report.checker.checker_name == FakeChecker[1]:
-            self.__reports_with_fake_checkers[report_path_hash] = \
-                (report, db_report)
+            self.__add_report_context(report_id, report, file_path_to_id)
 
-        return db_report.id
+        self.__pending_reports = []
+
+    def __keep_report(
+        self,
+        db_report: DBReport,
+        review_status: SourceReviewStatus,
+        detection_status: str,
+        run_history_time: datetime,
+        analysis_info: Optional[AnalysisInfo],
+        fixed_at: Optional[datetime] = None
+    ):
+        """
+        Update a report of the run in place which is found again with the
+        same fingerprint, instead of removing and adding it again.
+        """
+        db_report.detection_status = detection_status
+        db_report.review_status = review_status.status
+        db_report.review_status_author = review_status.author
+        db_report.review_status_message = review_status.message
+        db_report.review_status_date = run_history_time
+        db_report.review_status_is_in_source = review_status.in_source
+        db_report.fixed_at = fixed_at
+
+        self.__kept_report_ids.add(db_report.id)
+        self.__kept_report_analysis_info[db_report.id] = \
+            analysis_info.id if analysis_info else None
+
+    def __keep_unchanged_reports(
+        self,
+        fingerprints: List[str],
+        fingerprint_to_report: Dict[str, DBReport],
+        analysis_info: Optional[AnalysisInfo]
+    ):
+        """
+        Keep the reports of the run which the client found again unchanged
+        and therefore didn't send. Only their detection status and analysis
+        information are updated, like the status of a report which is found
+        again.
+        """
+        for fingerprint in fingerprints:
+            db_report = fingerprint_to_report.get(fingerprint)
+            if db_report is None or db_report.id in self.__kept_report_ids:
+                raise RequestFailed(
+                    ErrorCode.GENERAL,
+                    "The reports of the run have changed since the client "
+                    "queried them. Please store the results again!")
+
+            self.__check_report_count()
+
+            db_report.detection_status = 'reopened' \
+                if db_report.detection_status == 'resolved' else 'unresolved'
+            if db_report.review_status not in \
+                    ['false_positive', 'intentional']:
+                db_report.fixed_at = None
+
+            self.__kept_report_ids.add(db_report.id)
+            self.__kept_report_analysis_info[db_report.id] = \
+                analysis_info.id if analysis_info else None
+
+            self.__all_report_checkers.add(db_report.checker.checker_name)
+            self.__new_report_hashes[db_report.bug_id] = \
+                db_report.review_status
+
+    def __set_kept_reports_analysis_info(self, session: DBSession):
+        """
+        Replace the analysis information of the kept reports with the
+        analysis information of the current storage, like the analysis
+        information of the added reports.
+        """
+        from .report_server import SQLITE_MAX_VARIABLE_NUMBER
+
+        for report_ids in chunks(self.__kept_report_ids,
+                                 SQLITE_MAX_VARIABLE_NUMBER):
+            session.execute(ReportAnalysisInfo.delete().where(
+                ReportAnalysisInfo.c.report_id.in_(list(report_ids))))
+
+        rows = [{'report_id': report_id, 'analysis_info_id': info_id}
+                for report_id, info_id
+                in self.__kept_report_analysis_info.items()
+                if info_id is not None]
+        if rows:
+            session.execute(ReportAnalysisInfo.insert(), rows)
 
     def __get_faked_checkers(self) \
             -> Set[Tuple[str, str]]:
@@ -1222,22 +1418,6 @@ class MassStoreRun:
                    for report, _
                    in self.__reports_with_fake_checkers.values())
 
-    def __load_report_ids_for_reports_with_fake_checkers(self, session):
-        """
-        Transforms the __reports_with_fake_checkers data structure by loading
-        the report.id column in place for the DBReport ORM objects to allow
-        __realise_fake_checkers() to execute appropriately.
-
-        This must only be run **once** between the __add_report() sequence and
-        the __realise_fake_checkers() operation. The reports **MUST** have
-        been committed prior.
-        """
-        for rph, (report, db_report) in \
-                self.__reports_with_fake_checkers.items():
-            # Only load the "id" field from the database, not the entire row.
-            session.refresh(db_report, ["id"])
-            self.__reports_with_fake_checkers[rph] = (report, db_report.id)
-
     def __realise_fake_checkers(self, session):
         """
         __add_report() might leave some reports that have checker names in
@@ -1258,7 +1438,7 @@ class MassStoreRun:
         for _, (report, db_id) in \
                 self.__reports_with_fake_checkers.items():
             checker: Tuple[str, str] = checker_name_for_report(report)
-            grouped_by_checker[checker].append(cast(int, db_id))
+            grouped_by_checker[checker].append(db_id)
 
         for checker, report_ids in grouped_by_checker.items():
             analyzer_name, checker_name = checker
@@ -1270,50 +1450,29 @@ class MassStoreRun:
                 .update({"checker_id": chk_obj.id},
                         synchronize_session=False)
 
-    def __add_report_context(self, session, file_path_to_id):
-        for db_report, report in self.__added_reports:
-            LOG.debug("Storing bug path positions.")
-            for idx, path_pos in enumerate(report.bug_path_positions):
-                session.add(BugReportPoint(
-                    path_pos.range.start_line, path_pos.range.start_col,
-                    path_pos.range.end_line, path_pos.range.end_col,
-                    idx, file_path_to_id[path_pos.file.path], db_report.id))
-
-            LOG.debug("Storing bug path events.")
-            for idx, event in enumerate(report.bug_path_events):
-                session.add(BugPathEvent(
-                    event.range.start_line, event.range.start_col,
-                    event.range.end_line, event.range.end_col,
-                    idx, event.message, file_path_to_id[event.file.path],
-                    db_report.id))
-
-            LOG.debug("Storing notes.")
-            for note in report.notes:
-                data_type = report_extended_data_type_str(
-                    ttypes.ExtendedReportDataType.NOTE)
-
-                session.add(ExtendedReportData(
-                    note.range.start_line, note.range.start_col,
-                    note.range.end_line, note.range.end_col,
-                    note.message, file_path_to_id[note.file.path],
-                    db_report.id, data_type))
-
-            LOG.debug("Storing macro expansions.")
-            for macro in report.macro_expansions:
-                data_type = report_extended_data_type_str(
-                    ttypes.ExtendedReportDataType.MACRO)
-
-                session.add(ExtendedReportData(
-                    macro.range.start_line, macro.range.start_col,
-                    macro.range.end_line, macro.range.end_col,
-                    macro.message, file_path_to_id[macro.file.path],
-                    db_report.id, data_type))
-
-            if report.annotations:
-                self.__validate_and_add_report_annotations(
-                    session, db_report.id, report.annotations)
+    def __add_report_context(
+        self,
+        report_id: int,
+        report: Report,
+        file_path_to_id: Dict[str, int]
+    ):
+        """
+        Queue the compressed bug path and the annotations of the given report
+        for the bulk inserter.
+        """
+        inserter = cast(BulkInserter, self.__inserter)
 
-        session.flush()
+        data, file_ids = encode_report_path(report, file_path_to_id)
+        inserter.add(ReportPath.__table__,
+                     {'report_id': report_id, 'data': data})
+
+        for file_id in file_ids:
+            inserter.add(ReportPathFile.__table__,
+                         {'report_id': report_id, 'file_id': file_id})
+
+        if report.annotations:
+            self.__validate_and_add_report_annotations(
+                report_id, report.annotations)
 
     def __process_report_file(
         self,
@@ -1321,6 +1480,7 @@ class MassStoreRun:
         session: DBSession,
         run_id: int,
         file_path_to_id: Dict[str, int],
+        filename_to_hash: Dict[str, str],
         run_history_time: datetime,
         skip_handler: skiplist_handler.SkipListHandler,
         review_status_handler: ReviewStatusHandler,
@@ -1350,6 +1510,8 @@ class MassStoreRun:
 
         for report in reports:
             self.__report_count += 1
+            fingerprint = get_report_fingerprint(
+                report, filename_to_hash, self._trim_path_prefixes)
             report.trim_path_prefixes(self._trim_path_prefixes)
 
             missing_ids_for_files = get_missing_file_ids(report)
@@ -1409,10 +1571,28 @@ class MassStoreRun:
                     fixed_at = run_history_time
 
             self.__check_report_count()
-            self.__add_report(session, run_id, report, report_path_hash,
-                              file_path_to_id, review_status, detection_status,
-                              detected_at, run_history_time, analysis_info,
-                              fixed_at)
+
+            # Reports which are stored again without any change are updated
+            # in place instead of removing and adding them again. Reports of
+            # unknown checkers are always added again, so their checker is
+            # fixed up later like for any new report.
+            checker = self.__checker_for_report(session, report)
+            kept_report = next((
+                r for r in hash_map_reports.get(report.report_hash, [])
+                if checker and r.checker_id == checker.id and
+                r.fingerprint == fingerprint and
+                r.id not in self.__kept_report_ids), None)
+
+            if kept_report:
+                self.__keep_report(kept_report, review_status,
+                                   detection_status, run_history_time,
+                                   analysis_info, fixed_at)
+            else:
+                self.__add_report(session, run_id, report, report_path_hash,
+                                  file_path_to_id, review_status,
+                                  detection_status, detected_at,
+                                  run_history_time, analysis_info,
+                                  fingerprint, fixed_at)
 
             self.__new_report_hashes[report.report_hash] = \
                 review_status.status
@@ -1426,7 +1606,6 @@ class MassStoreRun:
 
     def __validate_and_add_report_annotations(
         self,
-        session: DBSession,
         report_id: int,
         report_annotation: Dict
     ):
@@ -1436,13 +1615,27 @@ class MassStoreRun:
         doesn't match then an exception is thrown. In case of proper format the
         annotation is added to the database.
         """
+        inserter = cast(BulkInserter, self.__inserter)
+
+        # The rows of a table must have the same keys in the bulk inserter.
+        columns: Dict[str, Any] = dict.fromkeys(report_annotation_types)
+        columns['report_id'] = report_id
+
         for key, value in report_annotation.items():
             try:
                 # String conversion is for normalizing the format. For example,
                 # "2000-01-01T10:20" timestamp will be stored as
                 # "2000-01-01 10:20".
-                value = str(report_annotation_types[key]["func"](value))
-                session.add(ReportAnnotations(report_id, key, value))
+                annotation_type = report_annotation_types[key]
+                typed_value = annotation_type["func"](value)
+                value = str(typed_value)
+                inserter.add(
+                    ReportAnnotations.__table__,
+                    {'report_id': report_id, 'key': key, 'value': value})
+
+                columns[key] = value \
+                    if annotation_type["db"] is sqlalchemy.types.String \
+                    else typed_value
             except KeyError:
                 # pylint: disable=raise-missing-from
                 raise RequestFailed(
@@ -1456,13 +1649,16 @@ class MassStoreRun:
                     f"'{value}' has wrong format. '{key}' annotations must be "
                     f"'{report_annotation_types[key]['display']}'.")
 
+        inserter.add(ReportAnnotationColumns.__table__, columns)
+
     def __check_report_count(self):
         """
         This method comparest the already added report count to the report
         limit, Raises exception if the number of reports is more than the
         that is configured for the product.
         """
-        if len(self.__added_reports) >= self.__report_limit:
+        if self.__added_report_count + len(self.__kept_report_ids) >= \
+                self.__report_limit:
             LOG.error("The number of reports in the given report folder is " +
                       "larger than the allowed." +
                       f"The limit: {self.__report_limit}!")
@@ -1485,6 +1681,7 @@ class MassStoreRun:
         source_root: Path,
         run_id: int,
         file_path_to_id: Dict[str, int],
+        filename_to_hash: Dict[str, str],
         run_history_time: datetime
     ):
         """ Parse up and store the plist report files. """
@@ -1513,14 +1710,21 @@ class MassStoreRun:
         self.__already_added_report_hashes = set()
         self.__new_report_hashes = {}
         self.__all_report_checkers = set()
+        self.__kept_report_ids = set()
+        self.__kept_report_analysis_info = {}
+        self.__pending_reports = []
+        self.__inserter = BulkInserter(session)
 
         all_reports = session.query(DBReport) \
             .filter(DBReport.run_id == run_id) \
             .all()
 
         report_to_report_id = defaultdict(list)
+        fingerprint_to_report = {}
         for db_report in all_reports:
             report_to_report_id[db_report.bug_id].append(db_report)
+            if db_report.fingerprint:
+                fingerprint_to_report[db_report.fingerprint] = db_report
 
         enabled_checkers: Set[str] = set()
         disabled_checkers: Set[str] = set()
@@ -1544,6 +1748,13 @@ class MassStoreRun:
             enabled_checkers.update(mip.enabled_checkers)
             disabled_checkers.update(mip.disabled_checkers)
 
+            kept_reports_file = os.path.join(root_dir_path, KEPT_REPORTS_FILE)
+            if os.path.isfile(kept_reports_file):
+                self.__keep_unchanged_reports(
+                    load_json(kept_reports_file, []),
+                    fingerprint_to_report,
+                    self.__analysis_info.get(root_dir_path))
+
             for f in report_file_paths:
                 if not report_file.is_supported(f):
                     continue
@@ -1554,13 +1765,20 @@ class MassStoreRun:
                 self.__graceful_cancel_if_requested()
                 self.__process_report_file(
                     report_file_path, session, run_id,
-                    file_path_to_id, run_history_time,
+                    file_path_to_id, filename_to_hash, run_history_time,
                     skip_handler, review_status_handler, report_to_report_id)
                 processed_result_file_count += 1
 
+            review_status_handler.log_rule_match_statistics()
+
         session.flush()
 
-        self.__add_report_context(session, file_path_to_id)
+        self.__insert_pending_reports(session, file_path_to_id)
+        self.__inserter.flush()
+        LOG.debug("[%s] Inserted %d rows of report data.", self._name,
+                  self.__inserter.row_count)
+
+        self.__set_kept_reports_analysis_info(session)
         # Get all relevant review_statuses for the newly stored reports
         # CHHECK: Call self.getReviewStatusRules instead of the below query
         # but before first check the performance
@@ -1598,6 +1816,9 @@ class MassStoreRun:
 
         LOG.info("[%s] Processed %d analyzer result file(s).", self._name,
                  processed_result_file_count)
+        LOG.info("[%s] Added %d and kept %d unchanged report(s).",
+                 self._name, self.__added_report_count,
+                 len(self.__kept_report_ids))
 
         # If a checker was found in a plist file it can not be disabled so we
         # will add this to the enabled checkers list and remove this checker
@@ -1611,7 +1832,9 @@ class MassStoreRun:
         reports_to_delete = set()
         for bug_hash, reports in report_to_report_id.items():
             if bug_hash in self.__new_report_hashes:
-                reports_to_delete.update([x.id for x in reports])
+                reports_to_delete.update([x.id for x in reports
+                                          if x.id not in
+                                          self.__kept_report_ids])
             else:
                 for report in reports:
                     checker_name: str = report.checker.checker_name
@@ -1708,12 +1931,14 @@ class MassStoreRun:
                     with StepLog(self._name, "Store 'reports'"):
                         self.__store_reports(
                             session, report_dir, source_root, run_id,
-                            file_path_to_id, run_history_time)
+                            file_path_to_id, filename_to_hash,
+                            run_history_time)
+
+                    with StepLog(self._name, "Refresh 'report_counts'"):
+                        refresh_report_counts(session, run_id)
 
                     self.__graceful_cancel_if_requested()
                     session.commit()
-                    self.__load_report_ids_for_reports_with_fake_checkers(
-                        session)
 
                 # The task should not be cancelled after this point, as the
                 # "main" bulk of the modifications to the database had already
@@ -1740,6 +1965,7 @@ class MassStoreRun:
                         with StepLog(self._name,
                                      "Fix-up report-to-checker associations"):
                             self.__realise_fake_checkers(session)
+                            refresh_report_counts(session, run_id)
 
                     self.finish_checker_run(session, run_id)
                     session.commit()
@@ -1787,6 +2013,10 @@ class MassStoreRun:
             with DBSession(self.__product.session_factory) as session:
                 RunLock(session, self._name).drop_run_lock_from_db()
 
+            # Some transactions may have been committed even if the storage
+            # failed.
+            self.__product.invalidate_result_cache(self.__config_db)
+
             if self.__wrong_src_code_comments:
                 wrong_files_as_table = twodim.to_str(
                     "table",
@@ -10,6 +10,8 @@ Handle Thrift requests.
 """
 
 import base64
+import binascii
+import functools
 import html
 import json
 import os
@@ -22,13 +24,14 @@ import zlib
 from copy import deepcopy
 from collections import OrderedDict, defaultdict, namedtuple
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Collection, Dict, List, Optional, Set, Tuple
 
 import sqlalchemy
+from sqlalchemy import Column, MetaData, String, Table
 from sqlalchemy.sql.expression import or_, and_, not_, func, \
-    asc, desc, union_all, select, bindparam, literal_column, cast, true
+    asc, desc, exists, select, literal_column, cast, false, true
 from sqlalchemy.orm import contains_eager
-from sqlalchemy.types import ARRAY, String
 
 import codechecker_api_shared
 from codechecker_api.codeCheckerDBAccess_v6 import constants, ttypes
@@ -39,6 +42,7 @@ from codechecker_api.codeCheckerDBAccess_v6.ttypes import \
     CommentData, \
     DetectionStatus, DiffType, \
     Encoding, ExportData, \
+    MissingContentHashes, \
     Order, \
     ReportData, ReportDetails, ReportStatus, ReviewData, ReviewStatusRule, \
     ReviewStatusRuleFilter, ReviewStatusRuleSortMode, \
@@ -61,8 +65,11 @@ from codechecker_server.profiler import timeit
 
 from .. import permissions
 from ..database import db_cleanup
+from ..database.bulk_insert import temporary_table
 from ..database.config_db_model import Product
 from ..database.database import conv, DBSession, escape_like
+from ..database.report_counts import ReportCountUpdate
+from ..database.report_path import decode_report_path
 from ..database.run_db_model import \
     AnalysisInfo, AnalysisInfoChecker as DB_AnalysisInfoChecker, \
     AnalyzerStatistic, \
@@ -70,15 +77,18 @@ from ..database.run_db_model import \
     CleanupPlan, CleanupPlanReportHash, Checker, Comment, \
     ExtendedReportData, \
     File, FileContent, \
-    Report, ReportAnnotations, ReportAnalysisInfo, ReviewStatus, \
+    Report, ReportAnalysisInfo, ReportAnnotationColumns, ReportAnnotations, \
+    ReportCount, ReportPath, ReportPathFile, ReviewStatus, \
     Run, RunHistory, RunHistoryAnalysisInfo, RunLock, \
     SourceComponent, SourceComponentFile, FilterPreset
+from ..result_cache import make_cache_key, ResultCache
 
-from .common import exc_to_thrift_reqfail
+from .common import exc_to_thrift_reqfail, write_b64_zlib_content
 from .thrift_enum_helper import detection_status_enum, \
     detection_status_str, report_status_enum, \
     review_status_enum, review_status_str, report_extended_data_type_enum
 from .report_annotations import report_annotation_types
+from .store_upload import CHUNK_ERROR_INFO, StoreUpload
 
 # These names are inherited from Thrift stubs.
 # pylint: disable=invalid-name
@@ -88,7 +98,12 @@ LOG = get_logger('server')
 GEN_OTHER_COMPONENT_NAME = "Other (auto-generated)"
 
 SQLITE_MAX_VARIABLE_NUMBER = 999
-SQLITE_MAX_COMPOUND_SELECT = 500
+
+# Temporary table of the report hashes of the client in a diff.
+REPORT_HASHES_TABLE = Table(
+    'tmp_report_hashes', MetaData(),
+    Column('bug_id', String, primary_key=True),
+    prefixes=['TEMPORARY'])
 
 
 class CommentKindValue:
@@ -224,12 +239,27 @@ def update_source_component_files(
                       'file_id': fid[0]} for fid in file_ids])
 
 
+# Fields of the report filter which can be applied on the summary of the report
+# counts.
+REPORT_COUNT_FILTER_FIELDS = {'filepath', 'checkerName', 'severity',
+                              'reviewStatus', 'detectionStatus', 'runName',
+                              'analyzerNames', 'reportStatus'}
+
+OUTSTANDING_DETECTION_STATUSES = list(map(
+    detection_status_str,
+    (DetectionStatus.NEW, DetectionStatus.UNRESOLVED,
+     DetectionStatus.REOPENED)))
+
+OUTSTANDING_REVIEW_STATUSES = list(map(
+    review_status_str,
+    (API_ReviewStatus.UNREVIEWED, API_ReviewStatus.CONFIRMED)))
+
+
 def process_report_filter(
     session,
     run_ids,
     report_filter,
-    cmp_data=None,
-    keep_all_annotations=False
+    cmp_data=None
 ):
     """
     Process the new report filter.
@@ -431,25 +461,140 @@ def process_report_filter(
 
         OR = []
         for key, values in annotations.items():
-            if keep_all_annotations:
-                OR.append(or_(
-                    ReportAnnotations.key != key,
-                    *[ReportAnnotations.value.ilike(conv(v))
-                      for v in values]))
+            column = getattr(ReportAnnotationColumns, key, None)
+            if column is None:
+                OR.append(false())
+            elif values:
+                OR.extend(cast(column, String).ilike(conv(v))
+                          for v in values)
             else:
-                OR.append(and_(
-                    ReportAnnotations.key == key,
-                    or_(*[ReportAnnotations.value.ilike(conv(v))
-                          for v in values])) if values else and_(
-                              ReportAnnotations.key == key))
+                OR.append(column.isnot(None))
 
         if OR:
             AND.append(or_(*OR))
+            join_tables.append(ReportAnnotationColumns)
 
     filter_expr = and_(*AND) if AND else true()
     return filter_expr, join_tables
 
 
+def is_report_count_filter(report_filter, cmp_data) -> bool:
+    """
+    True if the reports matching the given filter can be counted by the
+    summary of the report counts (see database/report_counts.py).
+    """
+    if not is_cmp_data_empty(cmp_data):
+        return False
+
+    if report_filter is None:
+        return True
+
+    # Empty list of report hashes matches no reports and an empty list of
+    # annotations requires the join of the annotations.
+    if report_filter.reportHash is not None or \
+            report_filter.annotations is not None:
+        return False
+
+    if report_filter.filepath and report_filter.fileMatchesAnyPoint:
+        return False
+
+    return all(value is None or value is False or value == []
+               for field, value in vars(report_filter).items()
+               if field not in REPORT_COUNT_FILTER_FIELDS)
+
+
+def process_report_count_filter(run_ids, report_filter):
+    """
+    Process the report filter on the summary of the report counts. The
+    filter must be checked by is_report_count_filter() before.
+    """
+    AND = []
+    join_tables = []
+
+    if run_ids:
+        AND.append(ReportCount.run_id.in_(run_ids))
+
+    if report_filter is None:
+        return and_(*AND) if AND else true(), join_tables
+
+    if report_filter.filepath:
+        AND.append(or_(*[File.filepath.ilike(conv(fp))
+                         for fp in report_filter.filepath]))
+        join_tables.append(File)
+
+    if report_filter.analyzerNames or report_filter.checkerName \
+            or report_filter.severity:
+        if report_filter.analyzerNames:
+            AND.append(or_(*[Checker.analyzer_name.ilike(conv(an))
+                             for an in report_filter.analyzerNames]))
+
+        if report_filter.checkerName:
+            AND.append(or_(*[Checker.checker_name.ilike(conv(cn))
+                             for cn in report_filter.checkerName]))
+
+        if report_filter.severity:
+            AND.append(Checker.severity.in_(report_filter.severity))
+
+        join_tables.append(Checker)
+
+    if report_filter.runName:
+        AND.append(or_(*[Run.name.ilike(conv(rn))
+                         for rn in report_filter.runName]))
+        join_tables.append(Run)
+
+    if report_filter.reportStatus:
+        OR = []
+        filter_query = and_(
+            ReportCount.review_status.in_(OUTSTANDING_REVIEW_STATUSES),
+            ReportCount.detection_status.in_(OUTSTANDING_DETECTION_STATUSES))
+
+        if ReportStatus.OUTSTANDING in report_filter.reportStatus:
+            OR.append(filter_query)
+
+        if ReportStatus.CLOSED in report_filter.reportStatus:
+            OR.append(not_(filter_query))
+
+        if OR:
+            AND.append(or_(*OR))
+
+    if report_filter.detectionStatus:
+        AND.append(ReportCount.detection_status.in_(list(map(
+            detection_status_str, report_filter.detectionStatus))))
+
+    if report_filter.reviewStatus:
+        AND.append(ReportCount.review_status.in_(list(map(
+            review_status_str, report_filter.reviewStatus))))
+
+    filter_expr = and_(*AND) if AND else true()
+    return filter_expr, join_tables
+
+
+def get_report_count_query(session, run_ids, report_filter, cmp_data,
+                           columns):
+    """
+    Returns the query of the number of the filtered reports grouped by the
+    given columns from the summary of the report counts, or None if the
+    reports have to be counted by the reports table.
+    """
+    if not is_report_count_filter(report_filter, cmp_data):
+        return None
+
+    filter_expression, join_tables = process_report_count_filter(
+        run_ids, report_filter)
+
+    join_tables += [column.class_ for column in columns]
+
+    q = session.query(*columns, func.sum(ReportCount.report_count))
+    if Checker in join_tables:
+        q = q.join(Checker, ReportCount.checker_id == Checker.id)
+    if File in join_tables:
+        q = q.join(File, ReportCount.file_id == File.id)
+    if Run in join_tables:
+        q = q.join(Run, ReportCount.run_id == Run.id)
+
+    return q.filter(filter_expression).group_by(*columns)
+
+
 def process_source_component_filter(session, component_names):
     """ Process source component filter.
 
@@ -578,6 +723,10 @@ def get_reports_by_bugpath_filter_for_single_origin(
         .join(File, File.id == ExtendedReportData.file_id) \
         .filter(file_filter_q)
 
+    q_reportpathfile = session.query(ReportPathFile.report_id) \
+        .join(File, File.id == ReportPathFile.file_id) \
+        .filter(file_filter_q)
+
     neg_q_report = session.query(Report.id) \
         .join(File, File.id != Report.file_id) \
         .filter(file_filter_q)
@@ -594,14 +743,20 @@ def get_reports_by_bugpath_filter_for_single_origin(
         .join(File, File.id != ExtendedReportData.file_id) \
         .filter(file_filter_q)
 
+    neg_q_reportpathfile = session.query(ReportPathFile.report_id) \
+        .join(File, File.id != ReportPathFile.file_id) \
+        .filter(file_filter_q)
+
     return q_report.union(
         q_bugpathevent,
         q_bugreportpoint,
-        q_extendedreportdata).except_(
+        q_extendedreportdata,
+        q_reportpathfile).except_(
         neg_q_report,
         neg_q_bugpathevent,
         neg_q_bugreportpoint,
-        neg_q_extendedreportdata)
+        neg_q_extendedreportdata,
+        neg_q_reportpathfile)
 
 
 def get_reports_by_bugpath_filter(session, file_filter_q) -> Set[int]:
@@ -627,10 +782,15 @@ def get_reports_by_bugpath_filter(session, file_filter_q) -> Set[int]:
         .join(File, File.id == ExtendedReportData.file_id) \
         .filter(file_filter_q)
 
+    q_reportpathfile = session.query(ReportPathFile.report_id) \
+        .join(File, File.id == ReportPathFile.file_id) \
+        .filter(file_filter_q)
+
     return q_report.union(
         q_bugpathevent,
         q_extendedreportdata,
-        q_bugreportpoint)
+        q_bugreportpoint,
+        q_reportpathfile)
 
 
 def get_reports_by_components(session,
@@ -896,14 +1056,70 @@ def get_report_details(session, report_ids):
     """
     details = {}
 
+    bug_events_list = defaultdict(list)
+    bug_point_list = defaultdict(list)
+    extended_data_list = defaultdict(list)
+
+    # Get the compressed bug paths.
+    report_paths = {
+        report_id: decode_report_path(data) for report_id, data in
+        session.query(ReportPath.report_id, ReportPath.data)
+        .filter(ReportPath.report_id.in_(report_ids))}
+
+    file_ids = {element.file_id
+                for path in report_paths.values()
+                for elements in path
+                for element in elements}
+    file_paths = dict(session.query(File.id, File.filepath)
+                      .filter(File.id.in_(file_ids))) if file_ids else {}
+
+    for report_id, path in report_paths.items():
+        for element in path.events:
+            bug_events_list[report_id].append(ttypes.BugPathEvent(
+                startLine=element.line_begin,
+                startCol=element.col_begin,
+                endLine=element.line_end,
+                endCol=element.col_end,
+                msg=element.message,
+                fileId=element.file_id,
+                filePath=file_paths.get(element.file_id)))
+
+        for element in path.points:
+            bug_point_list[report_id].append(BugPathPos(
+                startLine=element.line_begin,
+                startCol=element.col_begin,
+                endLine=element.line_end,
+                endCol=element.col_end,
+                fileId=element.file_id,
+                filePath=file_paths.get(element.file_id)))
+
+        for data_type, elements in [
+                (ttypes.ExtendedReportDataType.NOTE, path.notes),
+                (ttypes.ExtendedReportDataType.MACRO, path.macros)]:
+            for element in elements:
+                extended_data_list[report_id].append(
+                    ttypes.ExtendedReportData(
+                        type=data_type,
+                        startLine=element.line_begin,
+                        startCol=element.col_begin,
+                        endLine=element.line_end,
+                        endCol=element.col_end,
+                        message=element.message,
+                        fileId=element.file_id,
+                        filePath=file_paths.get(element.file_id)))
+
+    # Reports which were stored before the compressed bug paths were
+    # introduced have their bug path in separate tables.
+    legacy_report_ids = [report_id for report_id in report_ids
+                         if report_id not in report_paths]
+
     # Get bug path events.
     bug_path_events = session.query(BugPathEvent, File.filepath) \
-        .filter(BugPathEvent.report_id.in_(report_ids)) \
+        .filter(BugPathEvent.report_id.in_(legacy_report_ids)) \
         .outerjoin(File,
                    File.id == BugPathEvent.file_id) \
         .order_by(BugPathEvent.report_id, BugPathEvent.order)
 
-    bug_events_list = defaultdict(list)
     for event, file_path in bug_path_events:
         report_id = event.report_id
         event = bugpathevent_db_to_api(event)
@@ -912,12 +1128,11 @@ def get_report_details(session, report_ids):
 
     # Get bug report points.
     bug_report_points = session.query(BugReportPoint, File.filepath) \
-        .filter(BugReportPoint.report_id.in_(report_ids)) \
+        .filter(BugReportPoint.report_id.in_(legacy_report_ids)) \
         .outerjoin(File,
                    File.id == BugReportPoint.file_id) \
         .order_by(BugReportPoint.report_id, BugReportPoint.order)
 
-    bug_point_list = defaultdict(list)
     for bug_point, file_path in bug_report_points:
         report_id = bug_point.report_id
         bug_point = bugreportpoint_db_to_api(bug_point)
@@ -925,9 +1140,8 @@ def get_report_details(session, report_ids):
         bug_point_list[report_id].append(bug_point)
 
     # Get extended report data.
-    extended_data_list = defaultdict(list)
     q = session.query(ExtendedReportData, File.filepath) \
-        .filter(ExtendedReportData.report_id.in_(report_ids)) \
+        .filter(ExtendedReportData.report_id.in_(legacy_report_ids)) \
         .outerjoin(File,
                    File.id == ExtendedReportData.file_id)
 
@@ -1053,10 +1267,11 @@ def apply_report_filter(q, filter_expression,
                         join_tables: List[Any],
                         already_joined_tables: Optional[List[Any]] = None):
     """
-    Applies the given filter expression and joins the Checker, File, Run, and
-    RunHistory tables if necessary based on join_tables parameter. If a table
-    is already joined by the main query and this is indicated, that will not
-    be joined by this function to prevent a "duplicate alias" error.
+    Applies the given filter expression and joins the Checker, File, Run,
+    RunHistory and ReportAnnotationColumns tables if necessary based on
+    join_tables parameter. If a table is already joined by the main query and
+    this is indicated, that will not be joined by this function to prevent a
+    "duplicate alias" error.
     """
     def needs_join(tbl):
         return tbl in join_tables and (already_joined_tables is None or
@@ -1070,6 +1285,9 @@ def apply_report_filter(q, filter_expression,
         q = q.outerjoin(Run, Run.id == Report.run_id)
     if needs_join(RunHistory):
         q = q.outerjoin(RunHistory, RunHistory.run_id == Report.run_id)
+    if needs_join(ReportAnnotationColumns):
+        q = q.outerjoin(ReportAnnotationColumns,
+                        ReportAnnotationColumns.report_id == Report.id)
 
     return q.filter(filter_expression)
 
@@ -1084,10 +1302,13 @@ def get_sort_map(sort_types, is_unique=False):
         SortType.SEVERITY: [(Checker.severity, 'severity')],
         SortType.REVIEW_STATUS: [(Report.review_status, 'rw_status')],
         SortType.DETECTION_STATUS: [(Report.detection_status, 'dt_status')],
-        SortType.TIMESTAMP: [('annotation_timestamp', 'annotation_timestamp')],
-        SortType.TESTCASE: [('annotation_testcase', 'annotation_testcase')],
-        SortType.CHRONOLOGICAL_ORDER: [('annotation_chronological_order',
-                                        'annotation_chronological_order')]}
+        SortType.TIMESTAMP: [(ReportAnnotationColumns.timestamp,
+                              'annotation_timestamp')],
+        SortType.TESTCASE: [(ReportAnnotationColumns.testcase,
+                             'annotation_testcase')],
+        SortType.CHRONOLOGICAL_ORDER: [
+            (ReportAnnotationColumns.chronological_order,
+             'annotation_chronological_order')]}
 
     if is_unique:
         sort_type_map[SortType.FILENAME] = [(File.filename, 'filename')]
@@ -1102,6 +1323,65 @@ def get_sort_map(sort_types, is_unique=False):
     return sort_types, sort_type_map, order_type_map
 
 
+def get_keyset_columns(sort_types, sort_type_map):
+    """
+    Returns the columns of the order of the reports and whether they are
+    sorted in ascending order, completed by the report id so the order is
+    total.
+    """
+    columns = []
+    for sort in sort_types:
+        for column, _ in sort_type_map.get(sort.type):
+            columns.append((column, sort.ord == Order.ASC))
+
+    columns.append((Report.id, True))
+    return columns
+
+
+def get_keyset_key(report, filepath, annotations, keyset_columns):
+    """
+    Returns the sort key of the given report in the order of the given
+    columns (see get_keyset_columns()). The annotations of the report are
+    given by their keys.
+    """
+    def get_value(column):
+        if column is File.filepath:
+            return filepath
+        if column.class_ is ReportAnnotationColumns:
+            return annotations.get(column.key)
+        if column.class_ is Checker:
+            return getattr(report.checker, column.key)
+        return getattr(report, column.key)
+
+    return tuple(get_value(column) for column, _ in keyset_columns)
+
+
+def get_keyset_filter(keyset_columns, last_key, nulls_are_largest):
+    """
+    Returns the filter of the rows which follow the row of the given sort key
+    in the order of the given columns (see get_keyset_columns()). The rows
+    are ordered without NULLS FIRST/LAST, so NULL values are larger than any
+    other value in PostgreSQL and smaller in SQLite.
+    """
+    OR = []
+    equal = []
+    for (column, ascending), value in zip(keyset_columns, last_key):
+        nulls_last = ascending == nulls_are_largest
+        if value is None:
+            after = column.isnot(None) if not nulls_last else false()
+            same = column.is_(None)
+        else:
+            after = column > value if ascending else column < value
+            if nulls_last:
+                after = or_(after, column.is_(None))
+            same = column == value
+
+        OR.append(and_(*equal, after))
+        equal.append(same)
+
+    return or_(*OR)
+
+
 def sort_results_query(query, sort_types, sort_type_map, order_type_map,
                        order_by_label=False):
     """
@@ -1391,9 +1671,10 @@ def remove_reports(session: DBSession,
     Removes `Report`s in chunks.
     """
     for r_ids in util.chunks(iter(report_ids), chunk_size):
-        session.query(Report) \
-            .filter(Report.id.in_(r_ids)) \
-            .delete(synchronize_session=False)
+        with ReportCountUpdate(session, Report.id.in_(r_ids)):
+            session.query(Report) \
+                .filter(Report.id.in_(r_ids)) \
+                .delete(synchronize_session=False)
 
 
 def transform_rf_db_to_thrift(rf_db):
@@ -1460,6 +1741,18 @@ def transform_rf_db_to_thrift(rf_db):
     return report_filter
 
 
+def cached_result(method):
+    """
+    Decorator of the read-only API methods whose results are cached by the
+    result cache of the server if it is enabled.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        return self._get_cached_result(method, args)
+
+    return wrapper
+
+
 class ThriftRequestHandler:
     """
     Connect to database and handle thrift client requests.
@@ -1474,7 +1767,9 @@ class ThriftRequestHandler:
                  config_database,
                  package_version,
                  client_version,
-                 context):
+                 context,
+                 result_cache: Optional[ResultCache] = None,
+                 page_cursors: Optional[ResultCache] = None):
 
         if not product:
             raise ValueError("Cannot initialize request handler without "
@@ -1489,6 +1784,9 @@ class ThriftRequestHandler:
         self.__client_version = client_version
         self._Session = Session
         self._context = context
+        self._result_cache = result_cache
+        self._page_cursors = page_cursors
+        self.__cache_generation = None
         self.__permission_args = {
             'productID': product.id
         }
@@ -1499,6 +1797,68 @@ class ThriftRequestHandler:
         """
         return self._auth_session.user if self._auth_session else "Anonymous"
 
+    def _get_cached_result(self, method, args):
+        """
+        Returns the result of the given API method from the result cache, or
+        calls the method and caches its result. The permission of the user is
+        checked before the cache is looked up.
+        """
+        if not self._result_cache:
+            return method(self, *args)
+
+        self.__require_view()
+
+        generation = self.__get_cache_generation()
+        key = make_cache_key(method.__name__, args)
+
+        found, result = self._result_cache.get(
+            self._product.id, generation, key)
+        if found:
+            return result
+
+        result = method(self, *args)
+        self._result_cache.put(self._product.id, generation, key, result)
+        return result
+
+    def __get_cache_generation(self):
+        """
+        Returns the generation of the product's results when the request
+        started to be handled.
+        """
+        if self.__cache_generation is None:
+            self.__cache_generation = self._product.get_cache_generation(
+                self._config_database)
+
+        return self.__cache_generation
+
+    def __get_page_cursor(self, request_args, offset):
+        """
+        Returns the sort key of the last report before the given offset in
+        the results of the given request, if the previous page was queried
+        in the current generation of the product's results.
+        """
+        if not self._page_cursors:
+            return None
+
+        _, cursor = self._page_cursors.get(
+            self._product.id, self.__get_cache_generation(),
+            make_cache_key('getRunResults.cursor', (*request_args, offset)))
+        return cursor
+
+    def __set_page_cursor(self, request_args, offset, cursor):
+        """
+        Store the sort key of the last report before the given offset in the
+        results of the given request, so the next page can be queried by
+        keyset pagination instead of skipping the previous reports.
+        """
+        if not self._page_cursors:
+            return
+
+        self._page_cursors.put(
+            self._product.id, self.__get_cache_generation(),
+            make_cache_key('getRunResults.cursor', (*request_args, offset)),
+            cursor)
+
     def __require_permission(self, required):
         """
         Helper method to raise an UNAUTHORIZED exception if the user does not
@@ -2091,14 +2451,20 @@ class ThriftRequestHandler:
         skip_statuses_str = [detection_status_str(status)
                              for status in skip_detection_statuses]
 
-        with DBSession(self._Session) as session:
-            if diff_type == DiffType.NEW:
-                # In postgresql we can select multiple rows filled with
-                # constants by using `unnest` function. In sqlite we have to
-                # use multiple UNION ALL.
+        if diff_type not in [DiffType.NEW, DiffType.RESOLVED,
+                             DiffType.UNRESOLVED]:
+            return []
 
-                if not report_hashes:
-                    return []
+        if diff_type == DiffType.NEW and not report_hashes:
+            return []
+
+        # The report hashes of the client are joined from a temporary table,
+        # because the list of the hashes can be very long.
+        with DBSession(self._Session) as session, \
+                temporary_table(session, REPORT_HASHES_TABLE,
+                                [{'bug_id': report_hash} for report_hash
+                                 in set(report_hashes)]) as client_hashes:
+            if diff_type == DiffType.NEW:
 
                 base_hashes = session.query(Report.bug_id.label('bug_id')) \
                     .outerjoin(File, Report.file_id == File.id)
@@ -2115,50 +2481,31 @@ class ThriftRequestHandler:
                     base_hashes = filter_open_reports_in_tags_old(
                         base_hashes, run_ids, tag_ids)
 
-                if self._product.driver_name == 'postgresql':
-                    new_hashes = select(
-                        func.unnest(cast(report_hashes, ARRAY(String)))
-                            .label('bug_id')) \
-                        .except_(base_hashes).alias('new_bugs')
-                    return [res[0] for res in session.query(new_hashes)]
-                else:
-                    # The maximum number of compound select in sqlite is 500
-                    # by default. We increased SQLITE_MAX_COMPOUND_SELECT
-                    # limit but when the number of compound select was larger
-                    # than 8435 sqlite threw a `Segmentation fault` error.
-                    # For this reason we create queries with chunks.
-                    new_hashes = []
-                    for chunk in util.chunks(
-                            iter(report_hashes), SQLITE_MAX_COMPOUND_SELECT):
-                        new_hashes_query = union_all(*[
-                            select(bindparam('bug_id' + str(i), h)
-                                   .label('bug_id'))
-                            for i, h in enumerate(chunk)])
-                        q = select(new_hashes_query.subquery()) \
-                            .except_(base_hashes)
-                        new_hashes.extend([
-                            res[0] for res in session.query(q.subquery())])
-
-                    return new_hashes
+                new_hashes = select(client_hashes.c.bug_id) \
+                    .except_(base_hashes)
+                return list(session.execute(new_hashes).scalars())
             elif diff_type == DiffType.RESOLVED:
                 results = session.query(Report.bug_id)
 
+                not_in_client = ~exists().where(
+                    client_hashes.c.bug_id == Report.bug_id)
+
                 if client_version >= (6, 50):
                     results = results.filter(or_(
-                        Report.bug_id.notin_(report_hashes),
+                        not_in_client,
                         Report.fixed_at.isnot(None)))
                     results = filter_open_reports_in_tags(
                         results, run_ids, tag_ids)
                 else:
-                    results = results.filter(
-                        Report.bug_id.notin_(report_hashes))
+                    results = results.filter(not_in_client)
                     results = filter_open_reports_in_tags_old(
                         results, run_ids, tag_ids)
 
                 return [res[0] for res in results]
-            elif diff_type == DiffType.UNRESOLVED:
+            else:
                 results = session.query(Report.bug_id) \
-                    .filter(Report.bug_id.in_(report_hashes))
+                    .join(client_hashes,
+                          client_hashes.c.bug_id == Report.bug_id)
 
                 if client_version >= (6, 50):
                     results = results \
@@ -2174,11 +2521,10 @@ class ThriftRequestHandler:
                         results, run_ids, tag_ids)
 
                 return [res[0] for res in results]
-            else:
-                return []
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getRunResults(self, run_ids, limit, offset, sort_types,
                       report_filter, cmp_data, get_details):
         self.__require_view()
@@ -2188,86 +2534,19 @@ class ThriftRequestHandler:
         with DBSession(self._Session) as session:
             results = []
 
-            # Extending "reports" table with report annotation columns.
-            #
-            # Suppose that we have these tables in the database:
-            #
-            # reports
-            # =================
-            # id, checker_id, ...
-            # -------------------
-            # 1,  123456,     ...
-            # 2,  999999,     ...
-            #
-            # report_annotations
-            # =======================
-            # report_id, key,  value
-            # -----------------------
-            # 1,         key1, value1
-            # 1,         key2, value2
-            # 2,         key1, value3
-            #
-            # The resulting table should look like this:
-            #
-            # reports extended
-            # ===================================================
-            # id, checker_id, ..., annotation_key1, annotation_key2
-            # ---------------------------------------------------
-            # 1,  123456,     ..., value1,          value2
-            # 2,  999999,     ..., value3,          NULL
-            #
-            # The SQL query which results this table is similar to this:
-            #
-            # SELECT
-            #   <every column in "reports" table>,
-            #   MAX(CASE WHEN report_annotations.key == <col1> THEN
-            #       report_annotations.value END) AS annotation_<col1>
-            #   MAX(CASE WHEN report_annotations.key == <col2> THEN
-            #       report_annotations.value END) AS annotation_<col2>
-            # FROM
-            #   reports
-            #   LEFT OUTER JOIN report_annotations ON
-            #     report_annotations.report_id = reports.id
-            # GROUP BY
-            #   reports.id;
-            #
-            # <col1>, <col2>... are the distinct keys in table
-            # "report_annotations". These are collected in a previous query.
-            #
-            # Since the "join" operation makes a Cartesian product of the two
-            # tables, the resulting table contains as many rows for a report as
-            # many annotations belong to it. These have to be joined by report
-            # ID and this is the reason of the aggregating MAX() functions.
-            #
-            # TODO: The creation of this extended table should be produced by
-            # a helper function and it could be used as a sub-query in every
-            # other query which originally works on "reports" table.
-
-            annotation_keys = list(map(
-                lambda x: x[0],
-                session.query(ReportAnnotations.key).distinct().all()))
-
-            annotation_cols = OrderedDict()
-            for col in annotation_keys:
-                annotation_cols[col] = func.max(sqlalchemy.case((
-                    ReportAnnotations.key == col,
-                    cast(ReportAnnotations.value,
-                         report_annotation_types[col]["db"])))) \
-                            .label(f"annotation_{col}")
+            # The annotations of the reports are joined from a table which
+            # has a column for every allowed annotation key, so the reports
+            # can be filtered and sorted by their annotations without
+            # grouping.
+            annotation_cols = OrderedDict(
+                (key, getattr(ReportAnnotationColumns, key)
+                 .label(f"annotation_{key}"))
+                for key in report_annotation_types)
 
-            if report_filter.isUnique:
-                # A report annotation filter cannot be set in WHERE clause if
-                # we use annotation parameters in aggregate functions to
-                # create a pivot table. Instead of filtering report
-                # annotations in WHERE clause, we should use HAVING clause
-                # only for filtering aggregate functions.
-                # TODO: Fixing report annotation filter in every report server
-                # endpoint function.
-                annotations_backup = report_filter.annotations
-                report_filter.annotations = None
-                filter_expression, join_tables = process_report_filter(
-                    session, run_ids, report_filter, cmp_data)
+            filter_expression, join_tables = process_report_filter(
+                session, run_ids, report_filter, cmp_data)
 
+            if report_filter.isUnique:
                 sort_types, sort_type_map, order_type_map = \
                     get_sort_map(sort_types, True)
 
@@ -2288,27 +2567,16 @@ class ThriftRequestHandler:
                                    .options(contains_eager(Report.checker)) \
                                    .outerjoin(File,
                                               Report.file_id == File.id) \
-                                   .outerjoin(ReportAnnotations,
+                                   .outerjoin(ReportAnnotationColumns,
                                               Report.id ==
-                                              ReportAnnotations.report_id)
+                                              ReportAnnotationColumns
+                                              .report_id)
 
                 sub_query = apply_report_filter(sub_query,
                                                 filter_expression,
                                                 join_tables,
-                                                [File, Checker])
-
-                sub_query = sub_query.group_by(Report.id, File.id, Checker.id)
-
-                if annotations_backup:
-                    annotations = defaultdict(list)
-                    for annotation in annotations_backup:
-                        annotations[annotation.first].append(annotation.second)
-
-                    OR = []
-                    for key, values in annotations.items():
-                        OR.extend([annotation_cols[key].ilike(conv(v))
-                                   for v in values])
-                    sub_query = sub_query.having(or_(*OR))
+                                                [File, Checker,
+                                                 ReportAnnotationColumns])
 
                 sub_query = sort_results_query(sub_query,
                                                sort_types,
@@ -2339,11 +2607,9 @@ class ThriftRequestHandler:
 
                 for row in query_result:
                     annotations = {
-                        k: v for k, v in zip(
-                            annotation_keys,
-                            [getattr(row, 'annotation_testcase', None),
-                             getattr(row, 'annotation_timestamp', None)]
-                            ) if v is not None}
+                        k: str(getattr(row, f'annotation_{k}'))
+                        for k in annotation_cols
+                        if getattr(row, f'annotation_{k}') is not None}
 
                     review_data = create_review_data(
                         row.review_status,
@@ -2379,10 +2645,6 @@ class ThriftRequestHandler:
                                    blameInfo=blame_info,
                                    annotations=annotations))
             else:  # not is_unique
-                filter_expression, join_tables = process_report_filter(
-                    session, run_ids, report_filter, cmp_data,
-                    keep_all_annotations=True)
-
                 sort_types, sort_type_map, order_type_map = \
                     get_sort_map(sort_types)
 
@@ -2395,17 +2657,8 @@ class ThriftRequestHandler:
                     .outerjoin(File,
                                Report.file_id == File.id) \
                     .outerjoin(
-                        ReportAnnotations,
-                        Report.id == ReportAnnotations.report_id)
-
-                # Grouping by "reports.id" is described at the beginning of
-                # this function. Grouping by "files.id" is necessary, because
-                # "files" table is joined for gathering file names belonging to
-                # the given report. According to SQL syntax if there is a group
-                # by report IDs then files should also be either grouped or an
-                # aggregate function must be applied on them. The same applies
-                # to the "checkers" table.
-                q = q.group_by(Report.id, File.id, Checker.id)
+                        ReportAnnotationColumns,
+                        Report.id == ReportAnnotationColumns.report_id)
 
                 # The "Checker" entity is eagerly loaded for each "Report" as
                 # there is a guaranteed FOREIGN KEY ... NOT NULL relationship
@@ -2413,7 +2666,8 @@ class ThriftRequestHandler:
                 # add "Checker" here is actually ill-formed, as it would
                 # result in queries that ambiguously refer to the same table.
                 q = apply_report_filter(q, filter_expression, join_tables,
-                                        [File, Checker])
+                                        [File, Checker,
+                                         ReportAnnotationColumns])
                 q = sort_results_query(q,
                                        sort_types,
                                        sort_type_map,
@@ -2426,21 +2680,33 @@ class ThriftRequestHandler:
                 # prevents it.
                 q = q.order_by(Report.id)
 
-                if report_filter.annotations:
-                    annotations = defaultdict(list)
-                    for annotation in report_filter.annotations:
-                        annotations[annotation.first].append(annotation.second)
-
-                    OR = []
-                    for key, values in annotations.items():
-                        OR.extend([annotation_cols[key].ilike(conv(v))
-                                   for v in values])
-                    q = q.having(or_(*OR))
-
-                q = q.limit(limit).offset(offset)
+                # The position of the pages which follow a page queried
+                # before is given by the sort key of the last report of that
+                # page, so the reports before it don't have to be skipped.
+                keyset_columns = get_keyset_columns(sort_types, sort_type_map)
+                request_args = (run_ids, sort_types, report_filter, cmp_data)
+
+                cursor = self.__get_page_cursor(request_args, offset) \
+                    if keyset_columns and offset else None
+                if cursor is not None:
+                    q = q.filter(get_keyset_filter(
+                        keyset_columns, cursor,
+                        session.get_bind().dialect.name == 'postgresql'))
+                    q = q.limit(limit)
+                else:
+                    q = q.limit(limit).offset(offset)
 
                 query_result = q.all()
 
+                if keyset_columns and limit and len(query_result) == limit:
+                    report, filepath, *annotation_values = query_result[-1]
+                    self.__set_page_cursor(
+                        request_args, (offset or 0) + limit,
+                        get_keyset_key(
+                            report, filepath,
+                            dict(zip(annotation_cols, annotation_values)),
+                            keyset_columns))
+
                 # Get report details if it is required.
                 report_details = {}
                 blame_infos = {}
@@ -2457,7 +2723,7 @@ class ThriftRequestHandler:
                 for row in query_result:
                     report, filepath = row[0], row[1]
                     annotations = {
-                        k: str(v) for k, v in zip(annotation_keys, row[2:])
+                        k: str(v) for k, v in zip(annotation_cols, row[2:])
                         if v is not None}
 
                     review_data = create_review_data(
@@ -2566,6 +2832,7 @@ class ThriftRequestHandler:
         return list(map(lambda x: x[0], result))
 
     @timeit
+    @cached_result
     def getRunReportCounts(self, run_ids, report_filter, limit, offset):
         """
           Count the results separately for multiple runs.
@@ -2579,6 +2846,18 @@ class ThriftRequestHandler:
         results = []
 
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, None, [Run.id, Run.name])
+            if count_q is not None:
+                count_q = count_q.order_by(Run.name)
+                if limit:
+                    count_q = count_q.limit(limit).offset(offset)
+
+                return [RunReportCount(runId=run_id,
+                                       name=run_name,
+                                       reportCount=count)
+                        for run_id, run_name, count in count_q]
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter)
 
@@ -2586,12 +2865,6 @@ class ThriftRequestHandler:
             reports_subq = apply_report_filter(
                 reports_subq, filter_expression, join_tables)
 
-            if report_filter.annotations is not None:
-                reports_subq = reports_subq.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                reports_subq = reports_subq.group_by(Report.id)
-
             reports_subq = reports_subq.subquery()
 
             if report_filter is not None and report_filter.isUnique:
@@ -2618,10 +2891,16 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getRunResultCount(self, run_ids, report_filter, cmp_data):
         self.__require_view()
 
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data, [])
+            if count_q is not None:
+                return count_q.scalar() or 0
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -2630,11 +2909,6 @@ class ThriftRequestHandler:
             else:
                 q = session.query(Report.bug_id)
 
-            if report_filter.annotations is not None:
-                q = q.outerjoin(ReportAnnotations,
-                                ReportAnnotations.report_id == Report.id)
-                q = q.group_by(Report.id)
-
             q = apply_report_filter(q, filter_expression, join_tables)
 
             report_count = q.count()
@@ -2745,15 +3019,16 @@ class ThriftRequestHandler:
                 .filter(Report.review_status_is_in_source.is_(False)) \
                 .update({"fixed_at": None}, synchronize_session=False)
 
-        session \
-            .query(Report) \
-            .filter(Report.review_status_is_in_source.is_(False)) \
-            .filter(Report.bug_id == report_hash) \
-            .update({
-                'review_status': review_status.status,
-                'review_status_author': review_status.author,
-                'review_status_message': review_status.message,
-                'review_status_date': review_status.date})
+        with ReportCountUpdate(session, Report.bug_id == report_hash):
+            session \
+                .query(Report) \
+                .filter(Report.review_status_is_in_source.is_(False)) \
+                .filter(Report.bug_id == report_hash) \
+                .update({
+                    'review_status': review_status.status,
+                    'review_status_author': review_status.author,
+                    'review_status_message': review_status.message,
+                    'review_status_date': review_status.date})
 
         session.flush()
 
@@ -2803,17 +3078,21 @@ class ThriftRequestHandler:
                     session.query(Report).filter(
                         Report.id == report_id).update({"fixed_at": None})
 
-                session.query(Report).filter(Report.id == report_id).update({
-                        'review_status': review_status_str(status),
-                        'review_status_author': self._get_username(),
-                        'review_status_message': bytes(message, 'utf-8'),
-                        'review_status_date': datetime.now()
-                        })
+                with ReportCountUpdate(session, Report.id == report_id):
+                    session.query(Report) \
+                        .filter(Report.id == report_id) \
+                        .update({
+                            'review_status': review_status_str(status),
+                            'review_status_author': self._get_username(),
+                            'review_status_message': bytes(message, 'utf-8'),
+                            'review_status_date': datetime.now()
+                            })
             else:
                 raise codechecker_api_shared.ttypes.RequestFailed(
                     codechecker_api_shared.ttypes.ErrorCode.DATABASE,
                     "No report found in the database.")
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             LOG.info("Review status of report '%s' was changed to '%s' by %s.",
                      report_id, review_status_str(status),
@@ -2891,18 +3170,21 @@ class ThriftRequestHandler:
                 # Reports become unreviewed when the corresponding review
                 # status rule is removed and the report doesn't have a review
                 # status as source code comment.
-                session \
-                    .query(Report) \
-                    .filter(Report.bug_id == review_status.bug_hash) \
-                    .filter(Report.review_status_is_in_source.is_(False)) \
-                    .update({
-                        'review_status': 'unreviewed',
-                        'review_status_author': None,
-                        'review_status_message': None,
-                        'review_status_date': None,
-                        'fixed_at': None})
+                with ReportCountUpdate(
+                        session, Report.bug_id == review_status.bug_hash):
+                    session \
+                        .query(Report) \
+                        .filter(Report.bug_id == review_status.bug_hash) \
+                        .filter(Report.review_status_is_in_source.is_(False)) \
+                        .update({
+                            'review_status': 'unreviewed',
+                            'review_status_author': None,
+                            'review_status_message': None,
+                            'review_status_date': None,
+                            'fixed_at': None})
 
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             LOG.info("Review status rules were removed based on filter '%s' by"
                      "'%s'.", rule_filter, self._get_username())
@@ -2924,6 +3206,7 @@ class ThriftRequestHandler:
             self._setReviewStatus(
                 session, report_hash, review_status, message)
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
             return True
 
     @exc_to_thrift_reqfail
@@ -2994,6 +3277,7 @@ class ThriftRequestHandler:
                                              comment_data.message)
                 session.add(comment)
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
 
                 return True
             else:
@@ -3045,6 +3329,7 @@ class ThriftRequestHandler:
                 session.add(comment)
 
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
                 return True
             else:
                 msg = f'Comment id {comment_id} was not found in the database.'
@@ -3074,6 +3359,7 @@ class ThriftRequestHandler:
                         'Unathorized comment modification!')
                 session.delete(comment)
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
 
                 LOG.info("Comment '%s...' was removed from bug hash '%s' by "
                          "'%s'.", comment.message[:10], comment.bug_hash,
@@ -3285,6 +3571,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getCheckerCounts(self, run_ids, report_filter, cmp_data, limit,
                          offset):
         """
@@ -3298,6 +3585,17 @@ class ThriftRequestHandler:
 
         results = []
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data,
+                [Checker.checker_name, Checker.severity])
+            if count_q is not None:
+                count_q = count_q.order_by(Checker.checker_name)
+                if limit:
+                    count_q = count_q.limit(limit).offset(offset)
+
+                return [CheckerCount(name=name, severity=severity, count=count)
+                        for name, severity, count in count_q]
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3308,12 +3606,6 @@ class ThriftRequestHandler:
                 .join(Checker,
                       Report.checker_id == Checker.id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables, [Checker])
 
@@ -3491,6 +3783,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getAnalyzerNameCounts(self, run_ids, report_filter, cmp_data, limit,
                               offset):
         """
@@ -3504,6 +3797,16 @@ class ThriftRequestHandler:
 
         results = {}
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data,
+                [Checker.analyzer_name])
+            if count_q is not None:
+                count_q = count_q.order_by(Checker.analyzer_name)
+                if limit:
+                    count_q = count_q.limit(limit).offset(offset)
+
+                return dict(count_q.all())
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3513,12 +3816,6 @@ class ThriftRequestHandler:
                 .join(Checker,
                       Report.checker_id == Checker.id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables, [Checker])
 
@@ -3554,6 +3851,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getSeverityCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3563,6 +3861,11 @@ class ThriftRequestHandler:
         self.__require_view()
         results = {}
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data, [Checker.severity])
+            if count_q is not None:
+                return dict(count_q.all())
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3572,12 +3875,6 @@ class ThriftRequestHandler:
                 .join(Checker,
                       Report.checker_id == Checker.id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables, [Checker])
 
@@ -3606,6 +3903,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getCheckerMsgCounts(self, run_ids, report_filter, cmp_data, limit,
                             offset):
         """
@@ -3626,12 +3924,6 @@ class ThriftRequestHandler:
                 Report.checker_message,
                 Report.bug_id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables)
 
@@ -3667,6 +3959,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getReportStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3675,6 +3968,21 @@ class ThriftRequestHandler:
         """
         self.__require_view()
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data,
+                [ReportCount.review_status, ReportCount.detection_status])
+            if count_q is not None:
+                results = defaultdict(int)
+                for review_status, detection_status, count in count_q:
+                    is_outstanding = \
+                        review_status in OUTSTANDING_REVIEW_STATUSES and \
+                        detection_status in OUTSTANDING_DETECTION_STATUSES
+                    results[report_status_enum(
+                        "outstanding" if is_outstanding else "closed")] += \
+                        count
+
+                return dict(results)
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3698,13 +4006,6 @@ class ThriftRequestHandler:
                 .label("isOutstanding")
             )
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id
-                )
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables)
 
@@ -3732,6 +4033,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getReviewStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -3740,6 +4042,13 @@ class ThriftRequestHandler:
         """
         self.__require_view()
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data,
+                [ReportCount.review_status])
+            if count_q is not None:
+                return {review_status_enum(rev_status): count
+                        for rev_status, count in count_q}
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -3747,12 +4056,6 @@ class ThriftRequestHandler:
                 Report.review_status,
                 Report.bug_id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables)
 
@@ -3776,6 +4079,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getFileCounts(self, run_ids, report_filter, cmp_data, limit, offset):
         """
           If the run id list is empty the metrics will be counted
@@ -3788,19 +4092,20 @@ class ThriftRequestHandler:
 
         results = {}
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data, [File.filepath])
+            if count_q is not None:
+                if limit:
+                    count_q = count_q.limit(limit).offset(offset)
+
+                return dict(count_q.all())
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
             distinct_file_path = session.query(File.filepath.distinct()) \
                 .join(Report, Report.file_id == File.id)
 
-            if report_filter.annotations is not None:
-                distinct_file_path = distinct_file_path.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                distinct_file_path = distinct_file_path.group_by(
-                    Report.id)
-
             distinct_file_path = apply_report_filter(
                 distinct_file_path, filter_expression, join_tables, [File])
 
@@ -3848,13 +4153,6 @@ class ThriftRequestHandler:
             distinct_file_path = session.query(File.filepath.distinct()) \
                 .join(Report, Report.file_id == File.id)
 
-            if report_filter.annotations is not None:
-                distinct_file_path = distinct_file_path.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                distinct_file_path = distinct_file_path.group_by(
-                    Report.id)
-
             distinct_file_path = apply_report_filter(
                 distinct_file_path, filter_expression, join_tables, [File])
 
@@ -3914,6 +4212,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getRunHistoryTagCounts(self, run_ids, report_filter, cmp_data, limit,
                                offset):
         """
@@ -3941,12 +4240,6 @@ class ThriftRequestHandler:
                                          Report.detected_at,
                                          Report.fixed_at)
 
-            if report_filter.annotations is not None:
-                report_cnt_q = report_cnt_q.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                report_cnt_q = report_cnt_q.group_by(Report.id)
-
             report_cnt_q = apply_report_filter(
                 report_cnt_q, filter_expression, join_tables)
             report_cnt_q = report_cnt_q.filter(
@@ -4004,6 +4297,7 @@ class ThriftRequestHandler:
 
     @exc_to_thrift_reqfail
     @timeit
+    @cached_result
     def getDetectionStatusCounts(self, run_ids, report_filter, cmp_data):
         """
           If the run id list is empty the metrics will be counted
@@ -4013,6 +4307,12 @@ class ThriftRequestHandler:
         self.__require_view()
         results = {}
         with DBSession(self._Session) as session:
+            count_q = get_report_count_query(
+                session, run_ids, report_filter, cmp_data,
+                [ReportCount.detection_status])
+            if count_q is not None:
+                return {detection_status_enum(k): v for k, v in count_q}
+
             filter_expression, join_tables = process_report_filter(
                 session, run_ids, report_filter, cmp_data)
 
@@ -4020,12 +4320,6 @@ class ThriftRequestHandler:
                 Report.detection_status,
                 Report.bug_id)
 
-            if report_filter.annotations is not None:
-                extended_table = extended_table.outerjoin(
-                    ReportAnnotations,
-                    ReportAnnotations.report_id == Report.id)
-                extended_table = extended_table.group_by(Report.id)
-
             extended_table = apply_report_filter(
                 extended_table, filter_expression, join_tables)
 
@@ -4142,11 +4436,6 @@ class ThriftRequestHandler:
 
                 q = session.query(Report.id)
 
-                if report_filter.annotations is not None:
-                    q = q.outerjoin(ReportAnnotations,
-                                    ReportAnnotations.report_id == Report.id)
-                    q = q.group_by(Report.id)
-
                 q = apply_report_filter(q, filter_expression, join_tables)
 
                 reports_to_delete = [r[0] for r in q]
@@ -4154,6 +4443,7 @@ class ThriftRequestHandler:
                     remove_reports(session, reports_to_delete)
 
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
                 session.close()
 
                 LOG.info("The following reports were removed by '%s': %s",
@@ -4226,6 +4516,7 @@ class ThriftRequestHandler:
         self._product.set_cached_run_data(
             self._config_database,
             number_of_runs_change=-1 * deleted_run_cnt)
+        self._product.invalidate_result_cache(self._config_database)
 
         # Remove unused comments and unused analysis info from the database.
         # Originally db_cleanup.remove_unused_data() was used here which
@@ -4267,6 +4558,7 @@ class ThriftRequestHandler:
                 run_data.name = new_run_name
                 session.add(run_data)
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
 
                 LOG.info("Run name '%s' (%d) was changed to %s by '%s'.",
                          old_run_name, run_id, new_run_name,
@@ -4315,6 +4607,7 @@ class ThriftRequestHandler:
             update_source_component_files(session, component)
 
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             return True
 
@@ -4367,6 +4660,7 @@ class ThriftRequestHandler:
             if component:
                 session.delete(component)
                 session.commit()
+                self._product.invalidate_result_cache(self._config_database)
                 LOG.info("Source component '%s' has been removed by '%s'",
                          name, self._get_username())
                 return True
@@ -4410,8 +4704,48 @@ class ThriftRequestHandler:
             return list(set(file_hashes) -
                         set(fc.content_hash for fc in q))
 
-    def __massStoreRun_common(self, is_async: bool, zipfile_blob: str,
-                              store_opts: SubmittedRunOptions) -> str:
+    @exc_to_thrift_reqfail
+    @timeit
+    def getMissingContentHashesForStore(self, file_hashes):
+        self.__require_store()
+
+        if not file_hashes:
+            return MissingContentHashes(contentHashes=[], blameInfoHashes=[])
+
+        with DBSession(self._Session) as session:
+
+            q = session.query(FileContent.content_hash,
+                              FileContent.blame_info.isnot(None)) \
+                .filter(FileContent.content_hash.in_(file_hashes))
+
+            stored_hashes = set()
+            stored_blame_hashes = set()
+            for content_hash, has_blame_info in q:
+                stored_hashes.add(content_hash)
+                if has_blame_info:
+                    stored_blame_hashes.add(content_hash)
+
+            return MissingContentHashes(
+                contentHashes=list(set(file_hashes) - stored_hashes),
+                blameInfoHashes=list(set(file_hashes) - stored_blame_hashes))
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def getRunReportFingerprints(self, run_name):
+        self.__require_store()
+
+        with DBSession(self._Session) as session:
+            q = session.query(Report.fingerprint) \
+                .join(Run, Run.id == Report.run_id) \
+                .filter(Run.name == run_name) \
+                .filter(Report.fingerprint.isnot(None))
+
+            return [fingerprint for fingerprint, in q]
+
+    def __massStoreRun_common(self, is_async: bool,
+                              zipfile_blob: Optional[str],
+                              store_opts: SubmittedRunOptions,
+                              zipfile_path: Optional[Path] = None) -> str:
         self.__require_store()
         if not store_opts.runName:
             raise ValueError("A run name is needed to know where to store!")
@@ -4434,7 +4768,8 @@ class ThriftRequestHandler:
                                       store_opts.force,
                                       store_opts.trimPathPrefixes,
                                       zipfile_blob,
-                                      self._get_username())
+                                      self._get_username(),
+                                      zipfile_path)
         ih.check_store_input_validity_at_face_value()
         m: MassStoreRunTask = ih.create_mass_store_task(is_async)
         self._task_manager.push_task(m)
@@ -4501,6 +4836,71 @@ class ThriftRequestHandler:
         token = self.__massStoreRun_common(True, zipfile_blob, store_opts)
         return token
 
+    def __get_store_upload(self, upload_token: str) -> StoreUpload:
+        return StoreUpload.get(self._task_manager.upload_data_root,
+                               upload_token,
+                               self._product.id,
+                               self._get_username())
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def beginStoreUpload(self, zipfile_size: int) -> str:
+        self.__require_store()
+
+        upload = StoreUpload.begin(self._task_manager.upload_data_root,
+                                   self._product.id,
+                                   self._get_username(),
+                                   zipfile_size)
+        LOG.debug("Upload '%s' of %d bytes has begun.",
+                  upload.token, zipfile_size)
+        return upload.token
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def getStoreUploadOffset(self, upload_token: str) -> int:
+        self.__require_store()
+
+        return self.__get_store_upload(upload_token).offset
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def appendStoreUploadChunk(self, upload_token: str, offset: int,
+                               chunk: str, checksum: str) -> int:
+        self.__require_store()
+
+        upload = self.__get_store_upload(upload_token)
+        try:
+            data = base64.b64decode(chunk, validate=True)
+        except binascii.Error as err:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"The chunk at offset {offset} is not Base64 encoded: "
+                f"{err}", CHUNK_ERROR_INFO) from err
+
+        return upload.write_chunk(offset, data, checksum)
+
+    @exc_to_thrift_reqfail
+    @timeit
+    def commitStoreUpload(self, upload_token: str,
+                          store_opts: SubmittedRunOptions) -> str:
+        self.__require_store()
+
+        upload = self.__get_store_upload(upload_token)
+        if upload.offset != upload.size:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"Only {upload.offset} of the {upload.size} bytes of the "
+                f"upload '{upload_token}' were received!")
+
+        token = self.__massStoreRun_common(True, None, store_opts,
+                                           upload.zip_path)
+
+        # The ZIP is extracted to the data of the task by now. If the store
+        # failed before that, the upload is kept, so it can be committed
+        # again.
+        upload.remove()
+        return token
+
     @exc_to_thrift_reqfail
     @timeit
     def allowsStoringAnalysisStatistics(self):
@@ -4547,8 +4947,7 @@ class ThriftRequestHandler:
                 run_name = slugify(run_name)
                 run_zip_file = os.path.join(product_dir, run_name + '.zip')
                 with open(run_zip_file, 'wb') as run_zip:
-                    run_zip.write(zlib.decompress(
-                        base64.b64decode(b64zip.encode('utf-8'))))
+                    write_b64_zlib_content(b64zip, run_zip)
 
                 # Change permission, so only current user and group have access
                 # to this file.
@@ -4693,6 +5092,7 @@ class ThriftRequestHandler:
                                       date)
 
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
             return True
 
     @exc_to_thrift_reqfail
@@ -4737,6 +5137,7 @@ class ThriftRequestHandler:
 
             session.add(cleanup_plan)
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             LOG.info("Cleanup plan '%d' has been updated by '%s'",
                      cleanup_plan_id, self._get_username())
@@ -4792,6 +5193,7 @@ class ThriftRequestHandler:
 
             session.delete(cleanup_plan)
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             LOG.info("Cleanup plan '%s' has been removed by '%s'",
                      name, self._get_username())
@@ -4809,6 +5211,7 @@ class ThriftRequestHandler:
             cleanup_plan.closed_at = datetime.now()
             session.add(cleanup_plan)
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             LOG.info("Cleanup plan '%s' has been closed by '%s'",
                      cleanup_plan.name, self._get_username())
@@ -4826,6 +5229,7 @@ class ThriftRequestHandler:
             cleanup_plan.closed_at = None
             session.add(cleanup_plan)
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
             LOG.info("Cleanup plan '%s' has been reopened by '%s'",
                      cleanup_plan.name, self._get_username())
             return True
@@ -4850,6 +5254,7 @@ class ThriftRequestHandler:
                     cleanup_plan_id=cleanup_plan.id, bug_hash=report_hash))
 
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
 
             return True
 
@@ -4869,6 +5274,7 @@ class ThriftRequestHandler:
                 .delete(synchronize_session=False)
 
             session.commit()
+            self._product.invalidate_result_cache(self._config_database)
             session.close()
 
             return True
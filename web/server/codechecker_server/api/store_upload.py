@@ -0,0 +1,185 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Handling of the store ZIP files which are uploaded in chunks.
+"""
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import time
+from typing import Optional
+
+from codechecker_api_shared.ttypes import ErrorCode, RequestFailed
+
+from codechecker_common.logger import get_logger
+from codechecker_common.util import generate_random_token
+
+
+LOG = get_logger('server')
+
+# Number of hexadecimal characters in the token of an upload.
+UPLOAD_TOKEN_LENGTH = 32
+
+UPLOAD_TOKEN_PATTERN = re.compile(f"[0-9a-f]{{{UPLOAD_TOKEN_LENGTH}}}")
+
+# File of the received chunks in the directory of an upload.
+UPLOAD_ZIP_FILE = "store_zip.zlib"
+
+# The `extraInfo` of the errors of a chunk which the client can resend.
+CHUNK_ERROR_INFO = ["upload_chunk"]
+
+# Uploads which didn't receive a chunk for this many seconds are removed when
+# a new upload begins.
+STALE_UPLOAD_TIMEOUT = 24 * 60 * 60
+
+
+class StoreUpload:
+    """
+    A compressed store ZIP file which is uploaded in chunks.
+
+    The received chunks are written to a file in the directory of the upload,
+    so the ZIP file is not kept in memory, and every API handler process can
+    continue the upload.
+    """
+
+    def __init__(self, upload_dir: Path):
+        self.upload_dir = upload_dir
+
+        with open(upload_dir / "upload.json", 'r',
+                  encoding="utf-8") as upload_f:
+            upload_info = json.load(upload_f)
+
+        self.product_id: int = upload_info["product_id"]
+        self.user_name: Optional[str] = upload_info["user_name"]
+        self.size: int = upload_info["size"]
+
+    @property
+    def token(self) -> str:
+        """ Returns the token which identifies the upload. """
+        return self.upload_dir.name
+
+    @property
+    def zip_path(self) -> Path:
+        """ Returns the path of the file of the received chunks. """
+        return self.upload_dir / UPLOAD_ZIP_FILE
+
+    @property
+    def offset(self) -> int:
+        """ Returns the number of received bytes. """
+        return self.zip_path.stat().st_size
+
+    @staticmethod
+    def begin(upload_root: Path,
+              product_id: int,
+              user_name: Optional[str],
+              size: int) -> "StoreUpload":
+        """
+        Creates the directory of a new upload of a file of the given size.
+        """
+        if size <= 0:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                "The uploaded ZIP file is empty!")
+
+        remove_stale_uploads(upload_root)
+
+        upload_dir = upload_root / generate_random_token(UPLOAD_TOKEN_LENGTH)
+        os.makedirs(upload_dir)
+
+        with open(upload_dir / "upload.json", 'w',
+                  encoding="utf-8") as upload_f:
+            json.dump({"product_id": product_id,
+                       "user_name": user_name,
+                       "size": size}, upload_f)
+
+        upload = StoreUpload(upload_dir)
+        upload.zip_path.touch()
+
+        return upload
+
+    @staticmethod
+    def get(upload_root: Path,
+            token: str,
+            product_id: int,
+            user_name: Optional[str]) -> "StoreUpload":
+        """
+        Returns the upload of the given token, if it was started by the given
+        user to the given product.
+        """
+        upload_dir = upload_root / token
+        if not UPLOAD_TOKEN_PATTERN.fullmatch(token) or \
+                not (upload_dir / "upload.json").is_file():
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"No upload with token '{token}' exists!")
+
+        upload = StoreUpload(upload_dir)
+        if upload.product_id != product_id or upload.user_name != user_name:
+            raise RequestFailed(ErrorCode.GENERAL,
+                                f"No upload with token '{token}' exists!")
+
+        return upload
+
+    def write_chunk(self, offset: int, chunk: bytes, checksum: str) -> int:
+        """
+        Writes the given chunk at the given offset and truncates the file
+        after it. Returns the number of received bytes.
+        """
+        if sha256(chunk).hexdigest() != checksum.lower():
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"The checksum of the chunk at offset {offset} doesn't "
+                "match its content!", CHUNK_ERROR_INFO)
+
+        received = self.offset
+        if offset < 0 or offset > received:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"The chunk at offset {offset} doesn't continue the "
+                f"{received} received bytes!", CHUNK_ERROR_INFO)
+
+        if offset + len(chunk) > self.size:
+            raise RequestFailed(
+                ErrorCode.GENERAL,
+                f"The chunk at offset {offset} exceeds the size of the "
+                f"uploaded ZIP file ({self.size} bytes)!")
+
+        with open(self.zip_path, 'r+b') as zip_f:
+            zip_f.seek(offset)
+            zip_f.write(chunk)
+            zip_f.truncate()
+
+        return offset + len(chunk)
+
+    def remove(self):
+        """ Removes the directory of the upload. """
+        shutil.rmtree(self.upload_dir, ignore_errors=True)
+
+
+def remove_stale_uploads(upload_root: Path):
+    """
+    Removes the uploads which didn't receive a chunk for
+    `STALE_UPLOAD_TIMEOUT` seconds.
+    """
+    if not upload_root.is_dir():
+        return
+
+    now = time.time()
+    for upload_dir in upload_root.iterdir():
+        zip_path = upload_dir / UPLOAD_ZIP_FILE
+        try:
+            last_modified = (zip_path if zip_path.exists() else upload_dir) \
+                .stat().st_mtime
+        except OSError:
+            # The upload was removed by another process.
+            continue
+
+        if now - last_modified > STALE_UPLOAD_TIMEOUT:
+            LOG.info("Removing stale upload '%s'.", upload_dir.name)
+            shutil.rmtree(upload_dir, ignore_errors=True)
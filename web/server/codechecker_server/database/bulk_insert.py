@@ -0,0 +1,263 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Helpers to insert a large number of rows into the database without creating
+ORM objects for them.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+import io
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import Table, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from codechecker_common.logger import get_logger
+
+from .database import DBSession
+
+LOG = get_logger('server')
+
+# Number of rows of a table which are buffered before they are inserted into
+# the database.
+BULK_INSERT_BATCH_SIZE = 10000
+
+
+def insert_rows_returning_ids(
+    session: DBSession,
+    table: Table,
+    rows: List[Dict[str, Any]]
+) -> List[int]:
+    """
+    Insert the given rows into the table and return the generated ids of
+    the rows in the order of the given rows. If the database doesn't support
+    RETURNING, the ids are looked up after inserting the rows.
+    """
+    if not rows:
+        return []
+
+    if supports_returning(session):
+        result = session.execute(
+            table.insert().returning(table.c.id,
+                                     sort_by_parameter_order=True),
+            rows)
+
+        return list(result.scalars())
+
+    # The first row is inserted alone, so the transaction holds the write
+    # lock of the SQLite database, and the other rows get the ids following
+    # the id of the first row in their order.
+    first_id = session.execute(table.insert(), rows[0]).lastrowid
+    if len(rows) > 1:
+        session.execute(table.insert(), rows[1:])
+
+    ids = [first_id] + list(session.execute(
+        select(table.c.id)
+        .where(table.c.id > first_id)
+        .order_by(table.c.id)).scalars())
+
+    if len(ids) != len(rows):
+        raise RuntimeError(f"Failed to look up the ids of the {len(rows)} "
+                           f"rows inserted into '{table.name}'!")
+
+    return ids
+
+
+def insert_rows_ignoring_conflicts(
+    session: DBSession,
+    table: Table,
+    index_elements: List[str],
+    rows: List[Dict[str, Any]],
+    column: str
+) -> Dict[int, Any]:
+    """
+    Insert the given rows into the table, skipping the ones which violate the
+    unique constraint of the given columns, and return the value of the given
+    column of the inserted rows by their generated ids.
+    """
+    stmt = insert_ignoring_conflicts(session, table, index_elements)
+
+    if supports_returning(session):
+        return dict(session.execute(
+            stmt.returning(table.c.id, table.c[column]), rows)
+            .tuples().all())
+
+    # The rows are inserted one by one to get the ids of the inserted ones.
+    inserted = {}
+    for row in rows:
+        result = session.execute(stmt, row)
+        if result.rowcount:
+            inserted[result.lastrowid] = row[column]
+
+    return inserted
+
+
+def supports_returning(session: DBSession) -> bool:
+    """
+    Returns whether the database supports the RETURNING clause of the INSERT
+    statements. SQLite supports it since version 3.35.
+    """
+    return session.get_bind().dialect.insert_returning
+
+
+def dialect_insert(session: DBSession, table: Table):
+    """
+    Returns the dialect specific INSERT statement for the given table which
+    supports the ON CONFLICT clause.
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        return postgresql.insert(table)
+
+    return sqlite.insert(table)
+
+
+def insert_ignoring_conflicts(
+    session: DBSession,
+    table: Table,
+    index_elements: List[str]
+):
+    """
+    Returns an INSERT statement for the given table which skips the rows
+    violating the unique constraint of the given columns, for example when
+    a concurrent transaction has already inserted them.
+    """
+    return dialect_insert(session, table) \
+        .on_conflict_do_nothing(index_elements=index_elements)
+
+
+def _csv_value(value: Any) -> str:
+    """
+    Format the given value for PostgreSQL's COPY command in CSV format where
+    an unquoted empty value means NULL.
+    """
+    if value is None:
+        return ''
+
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+
+    if isinstance(value, bytes):
+        # Hex format of the bytea type.
+        return '"\\x' + value.hex() + '"'
+
+    return str(value)
+
+
+class BulkInserter:
+    """
+    Buffers the rows of database tables and inserts them in batches.
+
+    The rows are inserted by a single executemany() call of a Core INSERT
+    statement for every batch, or by a COPY FROM STDIN command if the
+    database is PostgreSQL and the psycopg2 driver is used. The rows of a
+    table must have the same keys.
+    """
+
+    def __init__(
+        self,
+        session: DBSession,
+        batch_size: int = BULK_INSERT_BATCH_SIZE
+    ):
+        self.__session = session
+        self.__batch_size = batch_size
+        self.__rows: Dict[Table, List[Dict[str, Any]]] = defaultdict(list)
+
+        dialect = session.get_bind().dialect
+        self.__use_copy = dialect.name == 'postgresql' and \
+            dialect.driver == 'psycopg2'
+        self.__quote = dialect.identifier_preparer.quote
+
+        # Number of rows which are already inserted into the database.
+        self.row_count = 0
+
+    def add(self, table: Table, row: Dict[str, Any]):
+        """
+        Add a row to the given table. The row is inserted into the database
+        when the batch of the table is full or on flush().
+        """
+        rows = self.__rows[table]
+        rows.append(row)
+
+        if len(rows) >= self.__batch_size:
+            self.__insert(table)
+
+    def flush(self):
+        """ Insert the buffered rows of every table into the database. """
+        for table in list(self.__rows):
+            self.__insert(table)
+
+    def __insert(self, table: Table):
+        rows = self.__rows.pop(table, None)
+        if not rows:
+            return
+
+        if self.__use_copy:
+            self.__copy(table, rows)
+        else:
+            self.__session.execute(table.insert(), rows)
+
+        self.row_count += len(rows)
+        LOG.debug("Inserted %d rows into '%s'.", len(rows), table.name)
+
+    def __copy(self, table: Table, rows: List[Dict[str, Any]]):
+        """ Insert the given rows by PostgreSQL's COPY FROM STDIN command. """
+        columns = list(rows[0].keys())
+
+        data = io.StringIO()
+        for row in rows:
+            data.write(','.join(_csv_value(row[c]) for c in columns))
+            data.write('\n')
+        data.seek(0)
+
+        # The raw DBAPI connection is used in the transaction of the session.
+        cursor = self.__session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {self.__quote(table.name)} "
+                f"({', '.join(self.__quote(c) for c in columns)}) "
+                "FROM STDIN WITH (FORMAT csv)", data)
+        finally:
+            cursor.close()
+
+
+@contextmanager
+def temporary_table(
+    session: DBSession,
+    table: Table,
+    rows: Iterable[Dict[str, Any]]
+):
+    """
+    Create the given temporary table in the database connection of the
+    session and insert the given rows into it, so large lists of values can
+    be joined instead of being passed as bound parameters. The table is
+    dropped on exit, because the connection may be reused by other sessions
+    if it is pooled. On error the creation of the table is rolled back with
+    the transaction.
+    """
+    connection = session.connection()
+    table.drop(connection, checkfirst=True)
+    table.create(connection)
+
+    inserter = BulkInserter(session)
+    for row in rows:
+        inserter.add(table, row)
+    inserter.flush()
+
+    # Temporary tables are not analyzed automatically by PostgreSQL, but the
+    # query planner needs their statistics to choose the proper join.
+    dialect = connection.dialect
+    if dialect.name == 'postgresql':
+        session.execute(text(
+            f"ANALYZE {dialect.identifier_preparer.quote(table.name)}"))
+
+    yield table
+
+    table.drop(connection)
@@ -44,6 +44,10 @@ class Product(Base):
     num_of_runs = Column(Integer, server_default="0")
     latest_storage_date = Column(DateTime, nullable=True)
 
+    # Incremented when the analysis results of the product change, so the
+    # cached results of the earlier generations are not used anymore.
+    cache_generation = Column(Integer, nullable=False, server_default="0")
+
     # Disable review status change on UI.
     is_review_status_change_disabled = Column(Boolean,
                                               server_default=false())
@@ -11,6 +11,7 @@ Database connection handling to a database backend.
 from abc import ABCMeta, abstractmethod
 import os
 import subprocess
+from typing import Any, Dict, Optional
 
 from alembic import command, config
 from alembic import script
@@ -21,7 +22,7 @@ import sqlalchemy
 from sqlalchemy import event
 from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 
 from codechecker_api_shared.ttypes import DBStatus
 
@@ -32,6 +33,15 @@ from codechecker_web.shared import host_check, pgpass
 
 LOG = get_logger('system')
 
+# Keys of the connection pool options and the corresponding keyword arguments
+# of sqlalchemy.create_engine().
+POOL_OPTION_ARGS = {
+    'size': 'pool_size',
+    'max_overflow': 'max_overflow',
+    'timeout': 'pool_timeout',
+    'pre_ping': 'pool_pre_ping',
+    'recycle': 'pool_recycle'}
+
 
 def call_command(cmd, env=None, cwd=None):
     """ Call an external cmd and return with (output, return_code)."""
@@ -386,9 +396,15 @@ class SQLServer(metaclass=ABCMeta):
         by create_engine.
         """
 
-    def create_engine(self):
+    def create_engine(self, pool_options: Optional[Dict[str, Any]] = None):
         """
         Creates a new SQLAlchemy engine.
+
+        By default every session opens a new database connection. If pool
+        options (see POOL_OPTION_ARGS) are given, the connections to a
+        PostgreSQL database are kept in a connection pool. An engine with a
+        connection pool must not be used by forked processes, these should
+        call reset_pool_after_fork() first.
         """
 
         if make_url(self.get_connection_string()).drivername == \
@@ -400,6 +416,18 @@ class SQLServer(metaclass=ABCMeta):
                 self.get_connection_string(),
                 connect_args={'timeout': 600, 'check_same_thread': False},
                 poolclass=NullPool)
+        elif pool_options is not None:
+            pool_args = {arg: pool_options[key]
+                         for key, arg in POOL_OPTION_ARGS.items()
+                         if pool_options.get(key) is not None}
+            LOG.debug("Using connection pool for '%s' database: %s",
+                      self.name_in_log, pool_args)
+
+            engine = sqlalchemy.create_engine(
+                self.get_connection_string(),
+                client_encoding='utf8',
+                poolclass=QueuePool,
+                **pool_args)
         else:
             engine = sqlalchemy.create_engine(
                 self.get_connection_string(),
@@ -662,6 +690,31 @@ class SQLiteDatabase(SQLServer):
         return self.dbpath
 
 
+def reset_pool_after_fork(engine):
+    """
+    Drop the pooled connections which were inherited from the parent process
+    without closing them, so the parent can keep using them. The pool of the
+    engine opens new connections in the current process.
+    """
+    engine.dispose(close=False)
+
+
+def get_pool_status(engine) -> Optional[Dict[str, int]]:
+    """
+    Returns the utilization of the connection pool of the given engine in the
+    current process, or None if the engine doesn't pool its connections.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+
+    return {
+        'size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': max(pool.overflow(), 0)}
+
+
 def conv(filter_value):
     """
     Convert * to % got from clients for the database queries.
@@ -25,7 +25,8 @@ from .run_db_model import \
     BugPathEvent, BugReportPoint, \
     Comment, Checker, \
     File, FileContent, \
-    Report, ReportAnalysisInfo, RunHistoryAnalysisInfo, RunLock
+    Report, ReportAnalysisInfo, ReportPathFile, RunHistoryAnalysisInfo, \
+    RunLock
 
 LOG = get_logger('server')
 RUN_LOCK_TIMEOUT_IN_DATABASE = 30 * 60  # 30 minutes.
@@ -80,9 +81,10 @@ def remove_unused_files(product):
     # File deletion is a relatively slow operation due to database cascades.
     # Removing files in big chunks prevents reaching a potential database
     # statement timeout. This hard-coded value is a safe choice according to
-    # some measurements. Maybe this could be a command-line parameter. But in
-    # the long terms we are planning to reduce cascade deletes by redesigning
-    # bug_path_events and bug_report_points tables.
+    # some measurements. Maybe this could be a command-line parameter. The
+    # bug paths of newly stored reports are kept in the report_paths table
+    # which has a row per report instead of a row per bug path element, so
+    # the cascades get cheaper as the old reports are removed.
     chunk_size = 500_000
     with DBSession(product.session_factory) as session:
         LOG.debug("[%s] Garbage collection of dangling files started...",
@@ -92,9 +94,13 @@ def remove_unused_files(product):
                 .group_by(BugPathEvent.file_id)
             brp_files = session.query(BugReportPoint.file_id) \
                 .group_by(BugReportPoint.file_id)
+            rpf_files = session.query(ReportPathFile.file_id) \
+                .group_by(ReportPathFile.file_id)
 
             files_to_delete = session.query(File.id) \
-                .filter(File.id.notin_(bpe_files), File.id.notin_(brp_files))
+                .filter(File.id.notin_(bpe_files),
+                        File.id.notin_(brp_files),
+                        File.id.notin_(rpf_files))
             files_to_delete = map(lambda x: x[0], files_to_delete)
 
             total_count = 0
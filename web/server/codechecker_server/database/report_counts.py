@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Summary of the number of reports of the runs.
+
+The 'report_counts' table contains the number of reports of every run by
+their checkers, files, review statuses and detection statuses. The report
+count API calls of the dashboard are answered from this table if their report
+filter refers only to these properties, instead of aggregating the reports.
+
+The summary of a run is recomputed when the run is stored. When the review
+status of reports changes or reports are removed, the summary is updated by
+the difference of the counts of the modified reports.
+"""
+from sqlalchemy import delete, func, insert, select
+
+from .bulk_insert import dialect_insert
+from .database import DBSession
+from .run_db_model import Report, ReportCount
+
+# Columns of the reports by which the reports are counted.
+REPORT_COUNT_KEYS = ['run_id', 'checker_id', 'file_id', 'review_status',
+                     'detection_status']
+
+
+def _group_reports(where_clause):
+    """
+    Returns the query of the number of reports matching the given condition
+    grouped by REPORT_COUNT_KEYS.
+    """
+    columns = [getattr(Report, key) for key in REPORT_COUNT_KEYS]
+    return select(*columns, func.count(Report.id)) \
+        .where(where_clause) \
+        .group_by(*columns)
+
+
+def refresh_report_counts(session: DBSession, run_id: int):
+    """ Recompute the report counts of the given run. """
+    session.execute(delete(ReportCount).where(ReportCount.run_id == run_id))
+    session.execute(insert(ReportCount).from_select(
+        REPORT_COUNT_KEYS + ['report_count'],
+        _group_reports(Report.run_id == run_id)))
+
+
+class ReportCountUpdate:
+    """
+    Context manager which updates the report counts by the modification of
+    the reports matching the given condition. The reports are subtracted from
+    the counts when entering the context and the matching reports are added
+    again on exit, so the reports can be modified or removed in the context.
+    The condition must not depend on the modified columns.
+    """
+
+    def __init__(self, session: DBSession, where_clause):
+        self.__session = session
+        self.__where_clause = where_clause
+        self.__run_ids = set()
+
+    def __enter__(self):
+        self.__apply(-1)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # The transaction is rolled back on error.
+        if exc_type is None:
+            self.__apply(1)
+
+    def __apply(self, sign: int):
+        rows = []
+        for *keys, count in self.__session.execute(
+                _group_reports(self.__where_clause)):
+            row = dict(zip(REPORT_COUNT_KEYS, keys))
+            row['report_count'] = sign * count
+            rows.append(row)
+            self.__run_ids.add(row['run_id'])
+
+        if rows:
+            # The stored reports always have a file and a detection status,
+            # otherwise the NULL keys would not conflict and the deltas would
+            # be kept as separate rows, which are still summed correctly.
+            stmt = dialect_insert(self.__session, ReportCount.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=REPORT_COUNT_KEYS,
+                set_={'report_count': ReportCount.__table__.c.report_count +
+                      stmt.excluded.report_count})
+            self.__session.execute(stmt, rows)
+
+        if sign > 0 and self.__run_ids:
+            self.__session.execute(
+                delete(ReportCount)
+                .where(ReportCount.run_id.in_(self.__run_ids),
+                       ReportCount.report_count == 0))
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Compact storage format of the bug path of a report.
+
+The bug path events, bug path positions, notes and macro expansions of a
+report are stored as one zlib compressed JSON document in the 'report_paths'
+table instead of one row per element in the 'bug_path_events',
+'bug_report_points' and 'extended_report_data' tables. The elements refer to
+the files by an index into the list of the file ids of the report. These file
+ids are also stored in the 'report_path_files' table so the reports can be
+filtered by the files of their bug path.
+"""
+import json
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import zlib
+
+from codechecker_report_converter.report import Range, Report
+
+REPORT_PATH_VERSION = 1
+
+
+class PathElement(NamedTuple):
+    """ An element of the bug path of a report. """
+    line_begin: int
+    col_begin: int
+    line_end: int
+    col_end: int
+    file_id: int
+    message: Optional[str]
+
+
+class ReportPathData(NamedTuple):
+    """ The decoded bug path of a report. """
+    events: List[PathElement]
+    points: List[PathElement]
+    notes: List[PathElement]
+    macros: List[PathElement]
+
+
+def encode_report_path(
+    report: Report,
+    file_path_to_id: Dict[str, int]
+) -> Tuple[bytes, List[int]]:
+    """
+    Encode the bug path of the given report. Returns the compressed data and
+    the ids of the files which are referenced by the report or its bug path.
+    """
+    # The file of the report is referenced even if the bug path is empty, so
+    # the garbage collection of the unused files keeps it.
+    file_ids: List[int] = [file_path_to_id[report.file.path]]
+    file_indexes: Dict[int, int] = {file_ids[0]: 0}
+
+    def encode(elements, with_message=True):
+        encoded = []
+        for element in elements:
+            file_id = file_path_to_id[element.file.path]
+            if file_id not in file_indexes:
+                file_indexes[file_id] = len(file_ids)
+                file_ids.append(file_id)
+
+            # Bug path events may have only a line and a column.
+            file_range = element.range or Range(
+                element.line, element.column, element.line, element.column)
+
+            value = [file_range.start_line, file_range.start_col,
+                     file_range.end_line, file_range.end_col,
+                     file_indexes[file_id]]
+            if with_message:
+                value.append(element.message)
+
+            encoded.append(value)
+
+        return encoded
+
+    data = {
+        'version': REPORT_PATH_VERSION,
+        'events': encode(report.bug_path_events),
+        'points': encode(report.bug_path_positions, False),
+        'notes': encode(report.notes),
+        'macros': encode(report.macro_expansions),
+        'files': file_ids}
+
+    return zlib.compress(json.dumps(data, separators=(',', ':'))
+                         .encode('utf-8')), file_ids
+
+
+def decode_report_path(data: bytes) -> ReportPathData:
+    """ Decode the bug path which was encoded by encode_report_path(). """
+    decoded = json.loads(zlib.decompress(data))
+    file_ids = decoded['files']
+
+    def decode(elements):
+        return [PathElement(
+            line_begin, col_begin, line_end, col_end, file_ids[file_idx],
+            message[0] if message else None)
+            for line_begin, col_begin, line_end, col_end, file_idx, *message
+            in elements]
+
+    return ReportPathData(
+        events=decode(decoded['events']),
+        points=decode(decoded['points']),
+        notes=decode(decoded['notes']),
+        macros=decode(decoded['macros']))
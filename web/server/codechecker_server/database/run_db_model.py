@@ -13,11 +13,12 @@ from math import ceil
 import os
 from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, \
-    LargeBinary, MetaData, String, UniqueConstraint, Table, Text, JSON
+from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Index, \
+    Integer, LargeBinary, MetaData, String, UniqueConstraint, Table, Text, \
+    JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql.expression import true, false
+from sqlalchemy.sql.expression import true, false, text
 
 CC_META = MetaData(naming_convention={
     "ix": 'ix_%(column_0_label)s',
@@ -365,6 +366,45 @@ class ExtendedReportData(Base):
         self.type = data_type
 
 
+class ReportPath(Base):
+    """
+    Compressed bug path events, bug path positions, notes and macro
+    expansions of a report, see database/report_path.py. Reports which were
+    stored before this table existed have their bug path in the
+    bug_path_events, bug_report_points and extended_report_data tables.
+    """
+    __tablename__ = 'report_paths'
+
+    report_id = Column(Integer, ForeignKey('reports.id', deferrable=True,
+                                           initially="DEFERRED",
+                                           ondelete='CASCADE'),
+                       primary_key=True)
+    data = Column(LargeBinary, nullable=False)
+
+    def __init__(self, report_id: int, data: bytes):
+        self.report_id = report_id
+        self.data = data
+
+
+class ReportPathFile(Base):
+    """ Files which are referenced by the compressed bug path of a report. """
+    __tablename__ = 'report_path_files'
+
+    report_id = Column(Integer, ForeignKey('reports.id', deferrable=True,
+                                           initially="DEFERRED",
+                                           ondelete='CASCADE'),
+                       primary_key=True)
+    file_id = Column(Integer, ForeignKey('files.id', deferrable=True,
+                                         initially="DEFERRED",
+                                         ondelete='CASCADE'),
+                     primary_key=True,
+                     index=True)
+
+    def __init__(self, report_id: int, file_id: int):
+        self.report_id = report_id
+        self.file_id = file_id
+
+
 ReportAnalysisInfo = Table(
     'report_analysis_info',
     Base.metadata,
@@ -388,9 +428,34 @@ ReviewStatusType = Enum(
     name='review_status')
 
 
+DetectionStatusType = Enum(
+    'new',
+    'unresolved',
+    'resolved',
+    'reopened',
+    'off',
+    'unavailable',
+    name='detection_status')
+
+
 class Report(Base):
     __tablename__ = 'reports'
 
+    # Indexes of the most common filters of the report listing and statistics
+    # in the given runs. The plans of the queries using them are checked by
+    # server/tests/unit/test_query_plans.py.
+    __table_args__ = (
+        Index('ix_reports_run_id_review_status_detection_status',
+              'run_id', 'review_status', 'detection_status'),
+        Index('ix_reports_run_id_checker_id', 'run_id', 'checker_id'),
+        Index('ix_reports_run_id_bug_id', 'run_id', 'bug_id'),
+        Index('ix_reports_run_id_detected_at', 'run_id', 'detected_at'),
+        # Open reports, e.g. the unresolved reports of a diff.
+        Index('ix_reports_open_run_id_bug_id', 'run_id', 'bug_id',
+              sqlite_where=text('fixed_at IS NULL'),
+              postgresql_where=text('fixed_at IS NULL')),
+    )
+
     id = Column(Integer, autoincrement=True, primary_key=True)
     file_id = Column(Integer, ForeignKey('files.id', deferrable=True,
                                          initially="DEFERRED",
@@ -416,13 +481,7 @@ class Report(Base):
 
     # TODO: multiple messages to multiple source locations?
     checker_message = Column(String)
-    detection_status = Column(Enum('new',
-                                   'unresolved',
-                                   'resolved',
-                                   'reopened',
-                                   'off',
-                                   'unavailable',
-                                   name='detection_status'))
+    detection_status = Column(DetectionStatusType)
     review_status = Column(ReviewStatusType,
                            nullable=False,
                            server_default='unreviewed')
@@ -442,6 +501,12 @@ class Report(Base):
     # to false positive or intentional.
     fixed_at = Column(DateTime)
 
+    # Hash of the stored data of the report, see
+    # codechecker_web.shared.report_fingerprint. Reports with the same
+    # fingerprint are kept and updated in place by the next storage of the
+    # run.
+    fingerprint = Column(String, nullable=True)
+
     analysis_info = relationship(
         "AnalysisInfo",
         secondary=ReportAnalysisInfo)
@@ -488,6 +553,35 @@ class Report(Base):
         self.fixed_at = fixed_date
 
 
+class ReportCount(Base):
+    """
+    Number of the reports of a run by their checkers, files, review statuses
+    and detection statuses, see database/report_counts.py.
+    """
+    __tablename__ = 'report_counts'
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    run_id = Column(Integer, ForeignKey('runs.id', deferrable=True,
+                                        initially="DEFERRED",
+                                        ondelete='CASCADE'),
+                    nullable=False)
+    checker_id = Column(Integer, ForeignKey('checkers.id', deferrable=True,
+                                            initially="DEFERRED",
+                                            ondelete='CASCADE'),
+                        nullable=False)
+    file_id = Column(Integer, ForeignKey('files.id', deferrable=True,
+                                         initially="DEFERRED",
+                                         ondelete='CASCADE'))
+    review_status = Column(ReviewStatusType, nullable=False)
+    detection_status = Column(DetectionStatusType)
+    report_count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('run_id', 'checker_id', 'file_id', 'review_status',
+                         'detection_status'),
+    )
+
+
 class ReportAnnotations(Base):
     __tablename__ = "report_annotations"
 
@@ -505,6 +599,24 @@ class ReportAnnotations(Base):
     value = Column(String, nullable=False)
 
 
+class ReportAnnotationColumns(Base):
+    """
+    The annotations of a report in a single row with a column for every
+    allowed annotation key (see api/report_annotations.py), so the reports
+    can be filtered and sorted by their annotations without grouping the
+    rows of the "report_annotations" table.
+    """
+    __tablename__ = "report_annotation_columns"
+
+    report_id = Column(
+        Integer,
+        ForeignKey("reports.id", ondelete="CASCADE"),
+        primary_key=True)
+    timestamp = Column(String, index=True)
+    testcase = Column(String, index=True)
+    chronological_order = Column(Integer, index=True)
+
+
 class Comment(Base):
     __tablename__ = 'comments'
 
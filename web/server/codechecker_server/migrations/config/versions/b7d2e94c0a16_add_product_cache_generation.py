@@ -0,0 +1,27 @@
+"""
+Add the generation of the cached results of the products
+
+Revision ID: b7d2e94c0a16
+Revises:     5e1501dfd333
+Create Date: 2026-10-18 18:20:43.604118
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = 'b7d2e94c0a16'
+down_revision = '5e1501dfd333'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('products',
+                  sa.Column('cache_generation', sa.Integer(),
+                            server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('products', 'cache_generation')
@@ -0,0 +1,81 @@
+"""
+add report counts
+
+Revision ID: 3d8b6f0a2c41
+Revises:     9a7e3c5d1f20
+Create Date: 2026-10-18 16:42:09.518230
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# Revision identifiers, used by Alembic.
+revision = '3d8b6f0a2c41'
+down_revision = '9a7e3c5d1f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_context().dialect.name
+
+    if dialect == 'postgresql':
+        # The enum types were already created for the 'reports' table.
+        review_status_type = postgresql.ENUM(
+            'unreviewed', 'confirmed', 'false_positive', 'intentional',
+            name='review_status', create_type=False)
+        detection_status_type = postgresql.ENUM(
+            'new', 'unresolved', 'resolved', 'reopened', 'off', 'unavailable',
+            name='detection_status', create_type=False)
+    else:
+        review_status_type = sa.Enum(
+            'unreviewed', 'confirmed', 'false_positive', 'intentional',
+            name='review_status')
+        detection_status_type = sa.Enum(
+            'new', 'unresolved', 'resolved', 'reopened', 'off', 'unavailable',
+            name='detection_status')
+
+    op.create_table(
+        'report_counts',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('checker_id', sa.Integer(), nullable=False),
+        sa.Column('file_id', sa.Integer(), nullable=True),
+        sa.Column('review_status', review_status_type, nullable=False),
+        sa.Column('detection_status', detection_status_type, nullable=True),
+        sa.Column('report_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['run_id'],
+            ['runs.id'],
+            name=op.f('fk_report_counts_run_id_runs'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.ForeignKeyConstraint(
+            ['checker_id'],
+            ['checkers.id'],
+            name=op.f('fk_report_counts_checker_id_checkers'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.ForeignKeyConstraint(
+            ['file_id'],
+            ['files.id'],
+            name=op.f('fk_report_counts_file_id_files'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_report_counts')),
+        sa.UniqueConstraint(
+            'run_id', 'checker_id', 'file_id', 'review_status',
+            'detection_status', name=op.f('uq_report_counts_run_id'))
+    )
+
+    op.execute("""
+        INSERT INTO report_counts (run_id, checker_id, file_id,
+                                   review_status, detection_status,
+                                   report_count)
+        SELECT run_id, checker_id, file_id, review_status, detection_status,
+               COUNT(id)
+        FROM reports
+        GROUP BY run_id, checker_id, file_id, review_status, detection_status
+    """)
+
+
+def downgrade():
+    op.drop_table('report_counts')
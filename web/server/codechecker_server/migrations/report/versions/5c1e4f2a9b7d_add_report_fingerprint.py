@@ -0,0 +1,26 @@
+"""
+add report fingerprint
+
+Revision ID: 5c1e4f2a9b7d
+Revises:     24c9660f82b1
+Create Date: 2026-10-18 10:12:41.573920
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = '5c1e4f2a9b7d'
+down_revision = '24c9660f82b1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('reports', sa.Column('fingerprint', sa.String(),
+                                       nullable=True))
+
+
+def downgrade():
+    op.drop_column('reports', 'fingerprint')
@@ -0,0 +1,127 @@
+"""
+add compact report paths
+
+Revision ID: 9a7e3c5d1f20
+Revises:     5c1e4f2a9b7d
+Create Date: 2026-10-18 14:05:27.316582
+"""
+import json
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = '9a7e3c5d1f20'
+down_revision = '5c1e4f2a9b7d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The bug paths of the already stored reports are kept in the
+    # bug_path_events, bug_report_points and extended_report_data tables,
+    # the server reads both layouts.
+    op.create_table(
+        'report_paths',
+        sa.Column('report_id', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['report_id'],
+            ['reports.id'],
+            name=op.f('fk_report_paths_report_id_reports'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.PrimaryKeyConstraint('report_id', name=op.f('pk_report_paths'))
+    )
+
+    op.create_table(
+        'report_path_files',
+        sa.Column('report_id', sa.Integer(), nullable=False),
+        sa.Column('file_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['report_id'],
+            ['reports.id'],
+            name=op.f('fk_report_path_files_report_id_reports'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.ForeignKeyConstraint(
+            ['file_id'],
+            ['files.id'],
+            name=op.f('fk_report_path_files_file_id_files'),
+            ondelete='CASCADE', initially='DEFERRED', deferrable=True),
+        sa.PrimaryKeyConstraint('report_id', 'file_id',
+                                name=op.f('pk_report_path_files'))
+    )
+    op.create_index(op.f('ix_report_path_files_file_id'),
+                    'report_path_files', ['file_id'], unique=False)
+
+
+def downgrade():
+    conn = op.get_bind()
+
+    bug_path_events = sa.table(
+        'bug_path_events',
+        sa.column('line_begin'), sa.column('col_begin'),
+        sa.column('line_end'), sa.column('col_end'),
+        sa.column('order'), sa.column('msg'),
+        sa.column('file_id'), sa.column('report_id'))
+
+    bug_report_points = sa.table(
+        'bug_report_points',
+        sa.column('line_begin'), sa.column('col_begin'),
+        sa.column('line_end'), sa.column('col_end'),
+        sa.column('order'), sa.column('file_id'), sa.column('report_id'))
+
+    extended_report_data = sa.table(
+        'extended_report_data',
+        sa.column('line_begin'), sa.column('col_begin'),
+        sa.column('line_end'), sa.column('col_end'),
+        sa.column('message'), sa.column('file_id'),
+        sa.column('report_id'), sa.column('type'))
+
+    def position(value, file_ids):
+        return {'line_begin': value[0], 'col_begin': value[1],
+                'line_end': value[2], 'col_end': value[3],
+                'file_id': file_ids[value[4]]}
+
+    # Move the compressed bug paths back to the per-row tables.
+    report_paths = conn.execute(sa.text("""
+        SELECT report_id, data
+        FROM report_paths
+    """))
+
+    while True:
+        rows = report_paths.fetchmany(1000)
+        if not rows:
+            break
+
+        events, points, extended_data = [], [], []
+        for report_id, data in rows:
+            path = json.loads(zlib.decompress(data))
+            file_ids = path['files']
+
+            for idx, value in enumerate(path['events']):
+                events.append(dict(position(value, file_ids), order=idx,
+                                   msg=value[5], report_id=report_id))
+
+            for idx, value in enumerate(path['points']):
+                points.append(dict(position(value, file_ids), order=idx,
+                                   report_id=report_id))
+
+            for data_type in ['notes', 'macros']:
+                for value in path[data_type]:
+                    extended_data.append(dict(
+                        position(value, file_ids), message=value[5],
+                        report_id=report_id,
+                        type='note' if data_type == 'notes' else 'macro'))
+
+        for table, values in [(bug_path_events, events),
+                              (bug_report_points, points),
+                              (extended_report_data, extended_data)]:
+            if values:
+                conn.execute(table.insert(), values)
+
+    op.drop_index(op.f('ix_report_path_files_file_id'),
+                  table_name='report_path_files')
+    op.drop_table('report_path_files')
+    op.drop_table('report_paths')
@@ -0,0 +1,62 @@
+"""
+add report annotation columns
+
+Revision ID: c4a81e25f7d9
+Revises:     3d8b6f0a2c41
+Create Date: 2026-10-18 23:31:47.208613
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = 'c4a81e25f7d9'
+down_revision = '3d8b6f0a2c41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'report_annotation_columns',
+        sa.Column('report_id', sa.Integer(), nullable=False),
+        sa.Column('timestamp', sa.String(), nullable=True),
+        sa.Column('testcase', sa.String(), nullable=True),
+        sa.Column('chronological_order', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['report_id'], ['reports.id'],
+            name=op.f('fk_report_annotation_columns_report_id_reports'),
+            ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('report_id',
+                                name=op.f('pk_report_annotation_columns'))
+    )
+
+    op.execute("""
+        INSERT INTO report_annotation_columns (report_id, timestamp, testcase,
+                                               chronological_order)
+        SELECT report_id,
+               MAX(CASE WHEN key = 'timestamp' THEN value END),
+               MAX(CASE WHEN key = 'testcase' THEN value END),
+               CAST(MAX(CASE WHEN key = 'chronological_order'
+                             THEN value END) AS INTEGER)
+        FROM report_annotations
+        GROUP BY report_id
+    """)
+
+    op.create_index(op.f('ix_report_annotation_columns_timestamp'),
+                    'report_annotation_columns', ['timestamp'], unique=False)
+    op.create_index(op.f('ix_report_annotation_columns_testcase'),
+                    'report_annotation_columns', ['testcase'], unique=False)
+    op.create_index(op.f('ix_report_annotation_columns_chronological_order'),
+                    'report_annotation_columns', ['chronological_order'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_report_annotation_columns_chronological_order'),
+                  table_name='report_annotation_columns')
+    op.drop_index(op.f('ix_report_annotation_columns_testcase'),
+                  table_name='report_annotation_columns')
+    op.drop_index(op.f('ix_report_annotation_columns_timestamp'),
+                  table_name='report_annotation_columns')
+    op.drop_table('report_annotation_columns')
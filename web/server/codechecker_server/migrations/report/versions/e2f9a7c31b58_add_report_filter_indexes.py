@@ -0,0 +1,42 @@
+"""
+add report filter indexes
+
+Revision ID: e2f9a7c31b58
+Revises:     c4a81e25f7d9
+Create Date: 2026-10-19 00:12:35.716049
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# Revision identifiers, used by Alembic.
+revision = 'e2f9a7c31b58'
+down_revision = 'c4a81e25f7d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_reports_run_id_review_status_detection_status',
+                    'reports',
+                    ['run_id', 'review_status', 'detection_status'],
+                    unique=False)
+    op.create_index('ix_reports_run_id_checker_id', 'reports',
+                    ['run_id', 'checker_id'], unique=False)
+    op.create_index('ix_reports_run_id_bug_id', 'reports',
+                    ['run_id', 'bug_id'], unique=False)
+    op.create_index('ix_reports_run_id_detected_at', 'reports',
+                    ['run_id', 'detected_at'], unique=False)
+    op.create_index('ix_reports_open_run_id_bug_id', 'reports',
+                    ['run_id', 'bug_id'], unique=False,
+                    sqlite_where=sa.text('fixed_at IS NULL'),
+                    postgresql_where=sa.text('fixed_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_reports_open_run_id_bug_id', table_name='reports')
+    op.drop_index('ix_reports_run_id_detected_at', table_name='reports')
+    op.drop_index('ix_reports_run_id_bug_id', table_name='reports')
+    op.drop_index('ix_reports_run_id_checker_id', table_name='reports')
+    op.drop_index('ix_reports_run_id_review_status_detection_status',
+                  table_name='reports')
@@ -12,7 +12,7 @@ analysis results and associated information, which a CodeChecker server can
 connect to.
 """
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
@@ -43,9 +43,13 @@ class Product:
     CONNECT_RETRY_TIMEOUT = 300
 
     def __init__(self, id_: int, endpoint: str, display_name: str,
-                 connection_string: str, context, check_env):
+                 connection_string: str, context, check_env,
+                 pool_options: Optional[Dict[str, Any]] = None):
         """
         Set up a new managed product object for the configuration given.
+
+        If pool options are given, the connections to the product's database
+        are pooled (see SQLServer.create_engine()).
         """
         self.__id = id_
         self.__endpoint = endpoint
@@ -54,6 +58,7 @@ class Product:
         self.__driver_name = None
         self.__context = context
         self.__check_env = check_env
+        self.__pool_options = pool_options
         self.__engine = None
         self.__session = None
         self.__db_status = DBStatus.MISSING
@@ -136,7 +141,7 @@ class Product:
             LOG.debug("Trying to connect to the database")
 
             # Create the SQLAlchemy engine.
-            self.__engine = sql_server.create_engine()
+            self.__engine = sql_server.create_engine(self.__pool_options)
             LOG.debug(self.__engine)
 
             self.__session = sessionmaker(bind=self.__engine)
@@ -183,6 +188,25 @@ class Product:
 
         return num_of_runs, runs_in_progress, latest_store_to_product
 
+    @property
+    def pool_status(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the utilization of the connection pool of the product's
+        database in the current process, or None if it is not pooled.
+        """
+        if not self.__engine:
+            return None
+
+        return database.get_pool_status(self.__engine)
+
+    def reset_pool_after_fork(self):
+        """
+        Drops the pooled database connections which were inherited from the
+        parent process.
+        """
+        if self.__engine:
+            database.reset_pool_after_fork(self.__engine)
+
     def teardown(self):
         """
         Disposes the database connection to the product's backend.
@@ -236,3 +260,26 @@ class Product:
                     .filter(DBProduct.id == self.__id) \
                     .update(updates)
                 session.commit()
+
+    def get_cache_generation(self, config_db_session_factory) -> int:
+        """
+        Returns the generation of the product's results which are cached by
+        the API worker processes.
+        """
+        with DBSession(config_db_session_factory) as session:
+            return session.query(DBProduct.cache_generation) \
+                .filter(DBProduct.id == self.__id) \
+                .scalar() or 0
+
+    def invalidate_result_cache(self, config_db_session_factory):
+        """
+        Increment the generation of the product's results, so the results
+        cached before are not used anymore. This must be called after the
+        modification of the results is committed.
+        """
+        with DBSession(config_db_session_factory) as session:
+            session.query(DBProduct) \
+                .filter(DBProduct.id == self.__id) \
+                .update({"cache_generation":
+                         DBProduct.cache_generation + 1})
+            session.commit()
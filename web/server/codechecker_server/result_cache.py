@@ -0,0 +1,212 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+"""
+Cache of the results of the read-only requests of the report server API.
+
+The results are cached in the memory of the API worker processes and, if a
+file is configured, in an SQLite database which is shared by the processes.
+The entries are keyed by the product, the generation of the product's results
+and the request. The generation is stored in the configuration database and
+it is incremented when the results of the product change (see
+Product.invalidate_result_cache()), so the entries of the earlier generations
+are not used anymore and they are evicted eventually.
+"""
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import ReportFilter
+
+from codechecker_common.logger import get_logger
+
+LOG = get_logger('server')
+
+# Number of cached results kept by default in the memory of a process.
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def _normalize(value, is_unordered=False):
+    """
+    Returns a representation of an argument of an API request which is the
+    same for equivalent arguments. The order of the values of the report
+    filter fields doesn't matter and the unset fields are omitted.
+    """
+    if isinstance(value, list):
+        values = [_normalize(v) for v in value]
+        return sorted(values, key=repr) if is_unordered else values
+
+    if hasattr(value, 'thrift_spec'):
+        return (type(value).__name__,
+                sorted((field, _normalize(
+                    v, isinstance(value, ReportFilter)))
+                    for field, v in vars(value).items() if v is not None))
+
+    return value
+
+
+def make_cache_key(method_name: str, args: Tuple) -> str:
+    """ Returns the cache key of the given API request. """
+    return hashlib.sha256(
+        repr((method_name, _normalize(list(args)))).encode('utf-8')) \
+        .hexdigest()
+
+
+class ResultCache:
+    """
+    Least recently used cache of the results of the API requests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        path: Optional[str] = None
+    ):
+        self.__max_entries = max_entries
+        self.__path = path
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+        # The connection to the shared cache file is opened separately by
+        # every API worker process.
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__connection_pid: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """ Returns the number of hits, misses and entries in memory. """
+        with self.__lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self.__entries)}
+
+    def get(self, product_id: int, generation: int, key: str) \
+            -> Tuple[bool, Any]:
+        """
+        Returns whether the result of the given request is cached and the
+        cached result.
+        """
+        entry_key = (product_id, generation, key)
+        with self.__lock:
+            if entry_key in self.__entries:
+                self.__entries.move_to_end(entry_key)
+                self.hits += 1
+                return True, self.__entries[entry_key]
+
+            value = self.__get_from_file(product_id, generation, key)
+            if value is None:
+                self.misses += 1
+                return False, None
+
+            result = pickle.loads(value)
+            self.__add(entry_key, result)
+            self.hits += 1
+            return True, result
+
+    def put(self, product_id: int, generation: int, key: str, result: Any):
+        """ Cache the result of the given request. """
+        with self.__lock:
+            self.__add((product_id, generation, key), result)
+            self.__put_to_file(product_id, generation, key,
+                               pickle.dumps(result))
+
+    def clear(self):
+        """
+        Remove every cached result. The results of the products may have been
+        changed while the server was not running, so the shared cache file is
+        cleared when the server starts.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+            try:
+                connection = self.__get_connection()
+                if connection:
+                    with connection:
+                        connection.execute("DELETE FROM result_cache")
+            except sqlite3.Error as ex:
+                LOG.warning("Failed to clear the result cache file '%s': %s",
+                            self.__path, ex)
+
+    def __add(self, entry_key, result):
+        self.__entries[entry_key] = result
+        self.__entries.move_to_end(entry_key)
+
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def __get_connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Returns the connection to the shared cache file of the current
+        process, or None if there is no such file.
+        """
+        if not self.__path:
+            return None
+
+        if self.__connection_pid != os.getpid():
+            self.__connection = sqlite3.connect(self.__path, timeout=5)
+            self.__connection_pid = os.getpid()
+            with self.__connection:
+                self.__connection.execute("PRAGMA journal_mode=WAL")
+                self.__connection.execute("""
+                    CREATE TABLE IF NOT EXISTS result_cache (
+                        product_id INTEGER NOT NULL,
+                        generation INTEGER NOT NULL,
+                        key TEXT NOT NULL,
+                        value BLOB NOT NULL,
+                        PRIMARY KEY (product_id, generation, key))
+                """)
+
+        return self.__connection
+
+    def __get_from_file(self, product_id, generation, key) \
+            -> Optional[bytes]:
+        try:
+            connection = self.__get_connection()
+            if not connection:
+                return None
+
+            row = connection.execute("""
+                SELECT value FROM result_cache
+                WHERE product_id = ? AND generation = ? AND key = ?
+            """, (product_id, generation, key)).fetchone()
+
+            return row[0] if row else None
+        except sqlite3.Error as ex:
+            LOG.warning("Failed to read the result cache file '%s': %s",
+                        self.__path, ex)
+            return None
+
+    def __put_to_file(self, product_id, generation, key, value: bytes):
+        try:
+            connection = self.__get_connection()
+            if not connection:
+                return
+
+            with connection:
+                connection.execute("""
+                    DELETE FROM result_cache
+                    WHERE product_id = ? AND generation < ?
+                """, (product_id, generation))
+                connection.execute("""
+                    INSERT OR REPLACE INTO result_cache
+                        (product_id, generation, key, value)
+                    VALUES (?, ?, ?, ?)
+                """, (product_id, generation, key, value))
+                connection.execute("""
+                    DELETE FROM result_cache
+                    WHERE rowid <= (SELECT MAX(rowid) FROM result_cache) - ?
+                """, (self.__max_entries,))
+        except sqlite3.Error as ex:
+            LOG.warning("Failed to write the result cache file '%s': %s",
+                        self.__path, ex)
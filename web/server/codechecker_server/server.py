@@ -65,9 +65,11 @@ from .api.server_info_handler import \
 from .api.tasks import ThriftTaskHandler as TaskHandler_v6
 from .database.config_db_model import Product as ORMProduct, \
     Configuration as ORMConfiguration
-from .database.database import DBSession
+from .database.database import DBSession, get_pool_status, \
+    reset_pool_after_fork
 from .database.run_db_model import Run
 from .product import Product
+from .result_cache import DEFAULT_MAX_ENTRIES, ResultCache
 from .task_executors.main import executor as background_task_executor
 from .task_executors.task_manager import \
     TaskManager as BackgroundTaskManager
@@ -75,6 +77,9 @@ from .task_executors.task_manager import \
 
 LOG = get_logger('server')
 
+# File of the page cursors of the report listing in the workspace directory.
+PAGE_CURSOR_FILE = 'page_cursors.sqlite'
+
 
 class ProductNotFoundError(ValueError):
     pass
@@ -181,6 +186,55 @@ class RequestHandler(SimpleHTTPRequestHandler):
         except BrokenPipeError:
             pass
 
+    def __handle_metrics(self):
+        """
+        Publish the utilization of the database connection pools and the
+        statistics of the result cache of the API worker process which
+        handles the request in Prometheus text format.
+        """
+        lines = []
+        pool_status = self.server.get_database_pool_status() \
+            if self.server.manager.is_database_pool_metrics_enabled() else {}
+        for metric, description in [
+                ('size', "Number of connections kept in the pool."),
+                ('checked_in', "Number of idle connections in the pool."),
+                ('checked_out', "Number of connections in use."),
+                ('overflow', "Number of connections over the pool size.")]:
+            name = f"codechecker_database_pool_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} gauge")
+
+            for endpoint, status in pool_status.items():
+                labels = f'process="{os.getpid()}",' + \
+                    (f'database="product",product="{endpoint}"'
+                     if endpoint else 'database="config"')
+                lines.append(f"{name}{{{labels}}} {status[metric]}")
+
+        if self.server.manager.is_result_cache_metrics_enabled() and \
+                self.server.result_cache:
+            statistics = self.server.result_cache.statistics
+            for metric, metric_type, description in [
+                    ('hits_total', 'counter',
+                     "Number of requests answered from the cache."),
+                    ('misses_total', 'counter',
+                     "Number of requests not found in the cache."),
+                    ('entries', 'gauge',
+                     "Number of results cached in memory.")]:
+                name = f"codechecker_result_cache_{metric}"
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.append(
+                    f'{name}{{process="{os.getpid()}"}} '
+                    f'{statistics[metric.replace("_total", "")]}')
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.end_headers()
+            self.wfile.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        except BrokenPipeError:
+            pass
+
     def __handle_liveness(self):
         """ Handle liveness probe. """
         try:
@@ -303,6 +357,12 @@ class RequestHandler(SimpleHTTPRequestHandler):
             self.__handle_readiness()
             return
 
+        if self.path == '/metrics' and \
+                (self.server.manager.is_database_pool_metrics_enabled() or
+                 self.server.manager.is_result_cache_metrics_enabled()):
+            self.__handle_metrics()
+            return
+
         product_endpoint, _ = routing.split_client_GET_request(self.path)
 
         # Check that path contains a product endpoint.
@@ -496,7 +556,9 @@ class RequestHandler(SimpleHTTPRequestHandler):
                             self.server.config_session,
                             version,
                             api_ver,
-                            self.server.context)
+                            self.server.context,
+                            self.server.result_cache,
+                            self.server.page_cursors)
                         processor = ReportAPI_v6.Processor(acc_handler)
                     else:
                         LOG.debug("This API endpoint does not exist.")
@@ -668,10 +730,31 @@ class CCSimpleHttpServer(HTTPServer):
 
         # Create a database engine for the configuration database.
         LOG.debug("Creating database engine for CONFIG DATABASE...")
-        self.__engine = product_db_sql_server.create_engine()
+        self.__engine = product_db_sql_server.create_engine(
+            self.manager.get_database_pool_options())
         self.config_session = sessionmaker(bind=self.__engine)
         self.manager.set_database_connection(self.config_session)
 
+        # The results of the read-only API requests are cached by every API
+        # worker process, see result_cache.py.
+        self.result_cache = None
+        result_cache_options = self.manager.get_result_cache_options()
+        if result_cache_options is not None:
+            cache_path = result_cache_options.get('path')
+            self.result_cache = ResultCache(
+                result_cache_options.get('max_entries', DEFAULT_MAX_ENTRIES),
+                os.path.join(workspace_directory, cache_path)
+                if cache_path else None)
+            self.result_cache.clear()
+
+        # The sort keys of the last reports of the queried pages are shared
+        # by the API worker processes, so the next page can be queried from
+        # its position by any of them, see getRunResults().
+        self.page_cursors = ResultCache(
+            DEFAULT_MAX_ENTRIES,
+            os.path.join(workspace_directory, PAGE_CURSOR_FILE))
+        self.page_cursors.clear()
+
         self.__task_queue = task_queue
         self.task_manager = BackgroundTaskManager(
             task_queue, task_pipes, self.config_session, self.check_env,
@@ -816,8 +899,40 @@ class CCSimpleHttpServer(HTTPServer):
             self.terminate()
 
         signal.signal(signal.SIGINT, _handler)
+        self.reset_database_pools_after_fork()
         return self.serve_forever()
 
+    def reset_database_pools_after_fork(self):
+        """
+        The server is initialised by the main process and the API worker
+        processes are forked from it. The database connections which were
+        pooled by the main process must not be shared, so every worker process
+        opens its own connections.
+        """
+        reset_pool_after_fork(self.__engine)
+        for product in self.__products.values():
+            product.reset_pool_after_fork()
+
+    def get_database_pool_status(self) \
+            -> Dict[Optional[str], Dict[str, int]]:
+        """
+        Returns the utilization of the connection pools of the configuration
+        database (with the key None) and the product databases (with the
+        product endpoints as keys) in the current process.
+        """
+        status: Dict[Optional[str], Dict[str, int]] = {}
+
+        config_status = get_pool_status(self.__engine)
+        if config_status:
+            status[None] = config_status
+
+        for endpoint, product in self.__products.items():
+            product_status = product.pool_status
+            if product_status:
+                status[endpoint] = product_status
+
+        return status
+
     def add_product(self, orm_product, init_db=False):
         """
         Adds a product to the list of product databases connected to
@@ -835,7 +950,9 @@ class CCSimpleHttpServer(HTTPServer):
                        orm_product.display_name,
                        orm_product.connection,
                        self.context,
-                       self.check_env)
+                       self.check_env,
+                       self.manager.get_database_pool_options(
+                           orm_product.endpoint))
 
         # Update the product database status.
         prod.connect()
@@ -13,6 +13,7 @@ import json
 import os
 import re
 import uuid
+import zlib
 
 from datetime import datetime
 import hashlib
@@ -206,6 +207,8 @@ class SessionManager:
         self.__max_run_count = self.scfg_dict.get('max_run_count', None)
         self.__store_config = self.scfg_dict.get('store', {})
         self.__keepalive_config = self.scfg_dict.get('keepalive', {})
+        self.__database_pool_config = self.scfg_dict.get('database_pool')
+        self.__result_cache_config = self.scfg_dict.get('result_cache')
         self.__auth_config = self.scfg_dict['authentication']
 
         if force_auth:
@@ -1032,6 +1035,14 @@ class SessionManager:
         limit = self.__store_config.get('limit', {})
         return limit.get('compilation_database_size')
 
+    def get_source_compression_level(self) -> int:
+        """
+        zlib compression level of the source file contents which are stored
+        in the database.
+        """
+        return self.__store_config.get('source_compression_level',
+                                       zlib.Z_BEST_COMPRESSION)
+
     def is_keepalive_enabled(self):
         """
         True if the keepalive functionality is explicitly enabled, otherwise it
@@ -1051,6 +1062,63 @@ class SessionManager:
         """ Get keepalive max probe count. """
         return self.__keepalive_config.get('max_probe')
 
+    def get_database_pool_options(
+        self,
+        product_endpoint: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Get the connection pool options of the given product's database or of
+        the configuration database if no product is given. If the value is
+        None it means the connections are not pooled.
+        """
+        if self.__database_pool_config is None:
+            return None
+
+        overrides = self.__database_pool_config.get('products', {}) \
+            .get(product_endpoint, {}) if product_endpoint \
+            else self.__database_pool_config.get('config_database', {})
+
+        options = {key: value for key, value
+                   in self.__database_pool_config.items()
+                   if key not in ['config_database', 'products', 'enabled',
+                                  'metrics']}
+        options.update(overrides)
+
+        if not options.pop('enabled', self.__database_pool_config.get(
+                'enabled', True)):
+            return None
+
+        return options
+
+    def is_database_pool_metrics_enabled(self) -> bool:
+        """
+        True if the utilization of the connection pools is published on the
+        /metrics endpoint of the server.
+        """
+        return bool(self.__database_pool_config and
+                    self.__database_pool_config.get('metrics'))
+
+    def get_result_cache_options(self) -> Optional[dict]:
+        """
+        Get the options of the cache of the API request results. If the value
+        is None it means the results are not cached.
+        """
+        if self.__result_cache_config is None or \
+                not self.__result_cache_config.get('enabled', True):
+            return None
+
+        return {key: value for key, value
+                in self.__result_cache_config.items()
+                if key in ['max_entries', 'path']}
+
+    def is_result_cache_metrics_enabled(self) -> bool:
+        """
+        True if the statistics of the result cache are published on the
+        /metrics endpoint of the server.
+        """
+        return bool(self.get_result_cache_options() is not None and
+                    self.__result_cache_config.get('metrics'))
+
     def __get_local_session_from_db(self, token):
         """
         Creates a local session if a valid session token can be found in the
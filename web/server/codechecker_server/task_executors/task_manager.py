@@ -65,9 +65,10 @@ class TaskManager:
         self._temp_dir_root = (temp_dir or Path(tempfile.gettempdir())) \
             / "codechecker_tasks" \
             / CHARS_INVALID_IN_PATH.sub('_', machine_id)
+        self._upload_dir_root = self._temp_dir_root / "uploads"
         self.__task_pipes = task_pipes
 
-        os.makedirs(self._temp_dir_root, exist_ok=True)
+        os.makedirs(self._upload_dir_root, exist_ok=True)
 
     @property
     def configuration_database_session_factory(self):
@@ -87,6 +88,19 @@ class TaskManager:
         """Returns the ``machine_id`` the instance was constructed with."""
         return self._machine_id
 
+    @property
+    def upload_data_root(self) -> Path:
+        """
+        Returns the directory of the files which are uploaded in chunks to be
+        the input of a task. The directory is shared by the API handler
+        processes of the server, so the chunks of an upload can be received
+        by any of them.
+
+        Like the data of the tasks, the uploads are removed by
+        `destroy_all_temporary_data`.
+        """
+        return self._upload_dir_root
+
     def allocate_task_record(self, kind: str, summary: str,
                              user_name: Optional[str],
                              product: Optional[Product] = None) -> str:
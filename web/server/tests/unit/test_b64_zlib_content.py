@@ -0,0 +1,58 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test decoding the uploaded zip files. """
+
+
+import base64
+import io
+import os
+import unittest
+import zlib
+
+from codechecker_server.api import common
+from codechecker_server.api.common import write_b64_zlib_content, \
+    write_zlib_file_content
+
+
+class B64ZlibContentTestCase(unittest.TestCase):
+    """
+    Test cases to decode base64 encoded and zlib compressed content.
+    """
+
+    def test_multiple_chunks(self):
+        content = os.urandom(common.B64_CHUNK_SIZE) * 3
+        b64_content = base64.b64encode(zlib.compress(content)).decode()
+
+        output = io.BytesIO()
+        self.assertEqual(write_b64_zlib_content(b64_content, output),
+                         len(content))
+        self.assertEqual(output.getvalue(), content)
+
+    def test_empty(self):
+        b64_content = base64.b64encode(zlib.compress(b'')).decode()
+
+        output = io.BytesIO()
+        self.assertEqual(write_b64_zlib_content(b64_content, output), 0)
+        self.assertEqual(output.getvalue(), b'')
+
+    def test_truncated(self):
+        compressed = zlib.compress(b'content' * 100)
+        b64_content = base64.b64encode(compressed[:-4]).decode()
+
+        with self.assertRaises(zlib.error):
+            write_b64_zlib_content(b64_content, io.BytesIO())
+
+    def test_file_content(self):
+        content = os.urandom(common.ZLIB_CHUNK_SIZE) * 3
+        input_file = io.BytesIO(zlib.compress(content))
+
+        output = io.BytesIO()
+        self.assertEqual(write_zlib_file_content(input_file, output),
+                         len(content))
+        self.assertEqual(output.getvalue(), content)
@@ -0,0 +1,168 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test inserting rows into the database in batches. """
+
+
+from datetime import datetime
+import unittest
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy import Column, MetaData, String, Table
+from sqlalchemy.orm import sessionmaker
+
+from codechecker_server.database import bulk_insert
+from codechecker_server.database.bulk_insert import BulkInserter, \
+    insert_ignoring_conflicts, insert_rows_ignoring_conflicts, \
+    insert_rows_returning_ids, temporary_table
+from codechecker_server.database.run_db_model import Base, BugPathEvent, \
+    File, FileContent, Report
+
+
+class BulkInsertTestCase(unittest.TestCase):
+    """
+    Test cases to insert rows without ORM objects.
+    """
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def test_returning_ids(self):
+        """ The ids are returned in the order of the rows. """
+        rows = [{'run_id': 1, 'bug_id': f'hash{i}', 'checker_id': 1,
+                 'line': i, 'detected_at': datetime.now()}
+                for i in range(100)]
+
+        ids = insert_rows_returning_ids(self.session, Report.__table__, rows)
+        self.assertEqual(len(set(ids)), len(rows))
+
+        lines = dict(self.session.query(Report.id, Report.line))
+        self.assertEqual([lines[i] for i in ids], list(range(100)))
+
+    def test_returning_ids_without_returning(self):
+        """ The ids are looked up if RETURNING is not supported. """
+        self.session.execute(Report.__table__.insert(), [
+            {'run_id': 1, 'bug_id': 'old', 'checker_id': 1, 'line': -1,
+             'detected_at': datetime.now()}])
+
+        rows = [{'run_id': 1, 'bug_id': f'hash{i}', 'checker_id': 1,
+                 'line': i, 'detected_at': datetime.now()}
+                for i in range(100)]
+
+        with mock.patch.object(self.engine.dialect, 'insert_returning',
+                               False):
+            ids = insert_rows_returning_ids(
+                self.session, Report.__table__, rows)
+
+        lines = dict(self.session.query(Report.id, Report.line))
+        self.assertEqual([lines[i] for i in ids], list(range(100)))
+
+    def test_rows_ignoring_conflicts(self):
+        """ Only the inserted rows are returned with or without RETURNING. """
+        self.session.execute(
+            FileContent.__table__.insert(),
+            [{'content_hash': 'hash0', 'content': b'', 'blame_info': None}])
+
+        def insert_files(file_paths):
+            return insert_rows_ignoring_conflicts(
+                self.session, File.__table__, ['filepath', 'content_hash'],
+                [{'filepath': file_path, 'filename': file_path,
+                  'content_hash': 'hash0'} for file_path in file_paths],
+                'filepath')
+
+        first = insert_files(['a.cpp', 'b.cpp'])
+        with mock.patch.object(self.engine.dialect, 'insert_returning',
+                               False):
+            second = insert_files(['b.cpp', 'c.cpp'])
+
+        file_ids = dict(self.session.query(File.filepath, File.id))
+        self.assertEqual(first, {file_ids['a.cpp']: 'a.cpp',
+                                 file_ids['b.cpp']: 'b.cpp'})
+        self.assertEqual(second, {file_ids['c.cpp']: 'c.cpp'})
+
+    def test_ignoring_conflicts(self):
+        """ Already existing rows are skipped and not returned. """
+        self.session.execute(
+            insert_ignoring_conflicts(
+                self.session, FileContent.__table__, ['content_hash']),
+            [{'content_hash': f'hash{i}', 'content': b'', 'blame_info': None}
+             for i in range(3)])
+
+        stmt = insert_ignoring_conflicts(
+            self.session, File.__table__, ['filepath', 'content_hash']) \
+            .returning(File.__table__.c.id, File.__table__.c.filepath)
+
+        def insert_files(file_paths):
+            return dict(self.session.execute(stmt, [
+                {'filepath': file_path, 'filename': file_path,
+                 'content_hash': 'hash0'}
+                for file_path in file_paths]).tuples().all())
+
+        first = insert_files(['a.cpp', 'b.cpp'])
+        second = insert_files(['b.cpp', 'c.cpp'])
+
+        self.assertCountEqual(first.values(), ['a.cpp', 'b.cpp'])
+        self.assertEqual(list(second.values()), ['c.cpp'])
+        self.assertEqual(self.session.query(File).count(), 3)
+
+    def test_batches(self):
+        """ Buffered rows are inserted when a batch is full and on flush. """
+        inserter = BulkInserter(self.session, batch_size=3)
+        for i in range(10):
+            inserter.add(BugPathEvent.__table__, {
+                'order': i, 'msg': f'event {i}', 'report_id': 1})
+
+        self.assertEqual(inserter.row_count, 9)
+        self.assertEqual(self.session.query(BugPathEvent).count(), 9)
+
+        inserter.flush()
+        self.assertEqual(inserter.row_count, 10)
+        self.assertEqual(
+            [e.msg for e in self.session.query(BugPathEvent)
+             .order_by(BugPathEvent.order)],
+            [f'event {i}' for i in range(10)])
+
+    def test_temporary_table(self):
+        """ The rows of a temporary table can be joined until exit. """
+        self.session.execute(Report.__table__.insert(), [
+            {'run_id': 1, 'bug_id': f'hash{i}', 'checker_id': 1, 'line': i,
+             'detected_at': datetime.now()} for i in range(5)])
+
+        table = Table('tmp_hashes', MetaData(),
+                      Column('bug_id', String, primary_key=True),
+                      prefixes=['TEMPORARY'])
+
+        for _ in range(2):
+            with temporary_table(self.session, table, [
+                    {'bug_id': f'hash{i}'} for i in range(3, 8)]) as hashes:
+                self.assertEqual(
+                    sorted(line for line, in self.session.query(Report.line)
+                           .join(hashes, hashes.c.bug_id == Report.bug_id)
+                           .all()),
+                    [3, 4])
+
+        self.assertFalse(sqlalchemy.inspect(self.session.connection())
+                         .get_temp_table_names())
+
+    def test_copy_csv_value(self):
+        """ NULL and empty strings are distinguished in the COPY data. """
+        # pylint: disable=protected-access
+        self.assertEqual(bulk_insert._csv_value(None), '')
+        self.assertEqual(bulk_insert._csv_value(''), '""')
+        self.assertEqual(bulk_insert._csv_value('a "b",\nc'),
+                         '"a ""b"",\nc"')
+        self.assertEqual(bulk_insert._csv_value(42), '42')
+        self.assertEqual(bulk_insert._csv_value(True), 'true')
+        self.assertEqual(bulk_insert._csv_value(b'\x00\xff'), '"\\x00ff"')
@@ -0,0 +1,114 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the configuration and the status of database connection pools. """
+
+
+import json
+import os
+import tempfile
+import unittest
+
+import sqlalchemy
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from codechecker_server.database.database import get_pool_status, \
+    reset_pool_after_fork
+from codechecker_server.session_manager import SessionManager
+
+
+class DatabasePoolTestCase(unittest.TestCase):
+    """
+    Test cases of the connection pool handling.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.engine = sqlalchemy.create_engine(
+            'sqlite:///' + os.path.join(self.tmp_dir.name, 'test.sqlite'),
+            poolclass=QueuePool, pool_size=2, max_overflow=1)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def create_session_manager(self, pool_config):
+        """ Create a session manager with the given pool configuration. """
+        config_file = os.path.join(self.tmp_dir.name, 'server_config.json')
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump({'authentication': {'enabled': False},
+                       'database_pool': pool_config}, f)
+
+        return SessionManager(config_file, os.path.join(
+            self.tmp_dir.name, 'server_secrets.json'))
+
+    def test_pool_status(self):
+        """ The checked out and overflowing connections are counted. """
+        connections = [self.engine.connect() for _ in range(3)]
+        for connection in connections:
+            connection.execute(text('SELECT 1'))
+
+        self.assertEqual(get_pool_status(self.engine), {
+            'size': 2, 'checked_in': 0, 'checked_out': 3, 'overflow': 1})
+
+        for connection in connections:
+            connection.close()
+
+        self.assertEqual(get_pool_status(self.engine), {
+            'size': 2, 'checked_in': 2, 'checked_out': 0, 'overflow': 0})
+
+    def test_reset_pool_after_fork(self):
+        """ The inherited connections are dropped without closing them. """
+        with self.engine.connect() as connection:
+            dbapi_connection = connection.connection.dbapi_connection
+
+        reset_pool_after_fork(self.engine)
+        self.assertEqual(get_pool_status(self.engine)['checked_in'], 0)
+
+        # The connection is still usable by the "parent process".
+        dbapi_connection.execute('SELECT 1')
+        dbapi_connection.close()
+
+        with self.engine.connect() as connection:
+            self.assertIsNot(connection.connection.dbapi_connection,
+                             dbapi_connection)
+
+    def test_no_pool(self):
+        """ Engines without a connection pool have no status. """
+        engine = sqlalchemy.create_engine(
+            'sqlite://', poolclass=sqlalchemy.pool.NullPool)
+        self.assertIsNone(get_pool_status(engine))
+
+    def test_pool_options(self):
+        """ The options of the databases override the common options. """
+        manager = self.create_session_manager({
+            'size': 2, 'pre_ping': True,
+            'config_database': {'size': 1},
+            'products': {'Default': {'size': 4, 'recycle': 60},
+                         'Legacy': {'enabled': False}}})
+
+        self.assertEqual(manager.get_database_pool_options(),
+                         {'size': 1, 'pre_ping': True})
+        self.assertEqual(manager.get_database_pool_options('Default'),
+                         {'size': 4, 'pre_ping': True, 'recycle': 60})
+        self.assertEqual(manager.get_database_pool_options('Other'),
+                         {'size': 2, 'pre_ping': True})
+        self.assertIsNone(manager.get_database_pool_options('Legacy'))
+        self.assertFalse(manager.is_database_pool_metrics_enabled())
+
+    def test_disabled_pool(self):
+        """ Pooling can be disabled for every database. """
+        manager = self.create_session_manager({
+            'enabled': False, 'metrics': True,
+            'products': {'Default': {'enabled': True}}})
+
+        self.assertIsNone(manager.get_database_pool_options())
+        self.assertIsNone(manager.get_database_pool_options('Other'))
+        self.assertEqual(manager.get_database_pool_options('Default'), {})
+        self.assertTrue(manager.is_database_pool_metrics_enabled())
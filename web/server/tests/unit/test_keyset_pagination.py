@@ -0,0 +1,125 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the keyset pagination of the reports. """
+
+
+from datetime import datetime
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import contains_eager, sessionmaker
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import Order, Pair, \
+    ReportFilter, SortMode, SortType
+
+from codechecker_server.api.report_server import apply_report_filter, \
+    get_keyset_columns, get_keyset_filter, get_keyset_key, get_sort_map, \
+    process_report_filter, sort_results_query
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    Report, ReportAnnotationColumns
+
+
+class KeysetPaginationTestCase(unittest.TestCase):
+    """
+    Test cases of paging the reports by their sort keys.
+    """
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        self.session.execute(Checker.__table__.insert(), [
+            {'id': i, 'analyzer_name': f'analyzer{i % 2}',
+             'checker_name': f'checker{i % 3}', 'severity': i % 2}
+            for i in range(1, 5)])
+        self.session.execute(File.__table__.insert(), [
+            {'id': i, 'filepath': f'/src/{i % 2}.cpp', 'filename': 'a.cpp'}
+            for i in range(1, 4)])
+        self.session.execute(Report.__table__.insert(), [
+            {'run_id': 1, 'bug_id': f'hash{i}', 'checker_id': 1 + i % 4,
+             'file_id': 1 + i % 3, 'line': i % 5,
+             'path_length': None if i % 4 == 0 else i % 3,
+             'detected_at': datetime.now(),
+             'review_status': ['unreviewed', 'confirmed'][i % 2]}
+            for i in range(50)])
+        self.session.execute(ReportAnnotationColumns.__table__.insert(), [
+            {'report_id': i, 'timestamp': f'2000-01-{i % 7 + 1:02d} 10:00:00',
+             'testcase': f'test{i % 4}', 'chronological_order': i % 6}
+            for i in range(1, 50, 2)])
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def query(self, sort_types):
+        """ Returns the query of the reports in the given order. """
+        sort_types, sort_type_map, order_type_map = get_sort_map(sort_types)
+        q = self.session.query(Report, File.filepath,
+                               ReportAnnotationColumns.timestamp,
+                               ReportAnnotationColumns.chronological_order) \
+            .join(Checker, Report.checker_id == Checker.id) \
+            .options(contains_eager(Report.checker)) \
+            .outerjoin(File, Report.file_id == File.id) \
+            .outerjoin(ReportAnnotationColumns,
+                       ReportAnnotationColumns.report_id == Report.id)
+        q = sort_results_query(q, sort_types, sort_type_map, order_type_map)
+        return q.order_by(Report.id), \
+            get_keyset_columns(sort_types, sort_type_map)
+
+    def test_pages(self):
+        """ The pages are the same as the pages queried by offset. """
+        for sort_types in [
+                None,
+                [SortMode(SortType.FILENAME, Order.ASC)],
+                [SortMode(SortType.BUG_PATH_LENGTH, Order.ASC),
+                 SortMode(SortType.CHECKER_NAME, Order.DESC)],
+                [SortMode(SortType.BUG_PATH_LENGTH, Order.DESC),
+                 SortMode(SortType.REVIEW_STATUS, Order.ASC)],
+                [SortMode(SortType.TIMESTAMP, Order.ASC)],
+                [SortMode(SortType.CHRONOLOGICAL_ORDER, Order.DESC),
+                 SortMode(SortType.FILENAME, Order.ASC)]]:
+            q, keyset_columns = self.query(sort_types)
+
+            expected = [row[0].id for row in q]
+            pages = []
+            last_key = None
+            while True:
+                page_q = q if last_key is None else q.filter(
+                    get_keyset_filter(keyset_columns, last_key, False))
+                page = page_q.limit(7).all()
+                if not page:
+                    break
+
+                pages.extend(row[0].id for row in page)
+                report, filepath, timestamp, order = page[-1]
+                last_key = get_keyset_key(
+                    report, filepath,
+                    {'timestamp': timestamp, 'chronological_order': order},
+                    keyset_columns)
+
+            self.assertEqual(pages, expected, sort_types)
+
+    def test_annotation_filter(self):
+        """ Reports are filtered by the columns of their annotations. """
+        def report_ids(annotations):
+            filter_expression, join_tables = process_report_filter(
+                self.session, None, ReportFilter(annotations=annotations))
+            q = apply_report_filter(self.session.query(Report.id),
+                                    filter_expression, join_tables)
+            return sorted(report_id for report_id, in q)
+
+        self.assertEqual(
+            report_ids([Pair('testcase', 'test1'),
+                        Pair('timestamp', '2000-01-01*')]),
+            [1, 5, 7, 9, 13, 17, 21, 25, 29, 33, 35, 37, 41, 45, 49])
+        self.assertEqual(report_ids([Pair('chronological_order', '5')]),
+                         [5, 11, 17, 23, 29, 35, 41, 47])
+        self.assertEqual(report_ids([Pair('testcase', 'test0')]), [])
+        self.assertEqual(report_ids([Pair('unknown', 'value')]), [])
@@ -0,0 +1,356 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+"""
+Test the query plans and the latency of the report server endpoints on a
+synthetic product database.
+
+The tests use an SQLite database by default. If the TEST_USE_POSTGRESQL
+environment variable is 'true', a PostgreSQL database is created on the
+local server given by the TEST_DBPORT, TEST_DBUSERNAME and
+CODECHECKER_DB_DRIVER variables, like in the functional tests. The latency
+of the endpoints is checked only if the TEST_LATENCY_BUDGET environment
+variable gives the maximal duration of a request in seconds.
+"""
+
+
+from datetime import datetime, timedelta
+import os
+import random
+import re
+import tempfile
+import time
+import types
+import unittest
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import DateInterval, \
+    DiffType, ReportDate, ReportFilter, ReportStatus, ReviewStatus
+
+from codechecker_server.api.report_server import ThriftRequestHandler
+from codechecker_server.database import config_db_model
+from codechecker_server.database.bulk_insert import BulkInserter
+from codechecker_server.database.report_counts import refresh_report_counts
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    Report, Run, RunHistory
+from codechecker_server.result_cache import ResultCache
+
+
+RUN_COUNT = 10
+REPORT_COUNT = 30000
+REPORT_HASH_COUNT = 10000
+
+# Maximal duration of an API request in seconds, if it is given by the
+# TEST_LATENCY_BUDGET environment variable. The duration depends on the load
+# of the test machine, so it is checked only on demand, e.g. by the
+# test_query_plans_server_psql make target.
+LATENCY_BUDGET = float(os.environ['TEST_LATENCY_BUDGET']) \
+    if os.environ.get('TEST_LATENCY_BUDGET') else None
+
+NOW = datetime(2024, 1, 1)
+
+# The report filters which are used the most by the web interface.
+REPORT_FILTERS = {
+    'all': ReportFilter(),
+    'outstanding': ReportFilter(reportStatus=[ReportStatus.OUTSTANDING]),
+    'review status': ReportFilter(reviewStatus=[ReviewStatus.CONFIRMED]),
+    'checker': ReportFilter(checkerName=['checker1*']),
+    'detection date': ReportFilter(date=ReportDate(detected=DateInterval(
+        after=int((NOW - timedelta(days=7)).timestamp())))),
+    'unique': ReportFilter(isUnique=True,
+                           reportStatus=[ReportStatus.OUTSTANDING])}
+
+
+def create_engine(database_name):
+    """
+    Returns the engine of an empty database which is used by a single
+    connection, so temporary tables are visible to the query plans.
+    """
+    if os.environ.get('TEST_USE_POSTGRESQL', '') != 'true':
+        return sqlalchemy.create_engine(
+            'sqlite://', poolclass=StaticPool,
+            connect_args={'check_same_thread': False})
+
+    url = sqlalchemy.URL.create(
+        f"postgresql+{os.environ['CODECHECKER_DB_DRIVER']}",
+        username=os.environ.get('TEST_DBUSERNAME'), host='localhost',
+        port=int(os.environ.get('TEST_DBPORT', 5432)))
+
+    admin_engine = sqlalchemy.create_engine(
+        url.set(database='postgres'), isolation_level='AUTOCOMMIT')
+    with admin_engine.connect() as connection:
+        connection.exec_driver_sql(
+            f"DROP DATABASE IF EXISTS {database_name}")
+        connection.exec_driver_sql(f"CREATE DATABASE {database_name}")
+    admin_engine.dispose()
+
+    return sqlalchemy.create_engine(url.set(database=database_name),
+                                    poolclass=StaticPool)
+
+
+def drop_database(engine):
+    """ Drop the PostgreSQL database of the given engine. """
+    engine.dispose()
+    if engine.dialect.name != 'postgresql':
+        return
+
+    admin_engine = sqlalchemy.create_engine(
+        engine.url.set(database='postgres'), isolation_level='AUTOCOMMIT')
+    with admin_engine.connect() as connection:
+        connection.exec_driver_sql(
+            f"DROP DATABASE IF EXISTS {engine.url.database}")
+    admin_engine.dispose()
+
+
+def seed(session):
+    """ Store runs with random reports into the database. """
+    rnd = random.Random(0)
+
+    session.execute(Run.__table__.insert(), [
+        {'id': i, 'name': f'run{i}', 'date': NOW, 'duration': 0}
+        for i in range(1, RUN_COUNT + 1)])
+    session.execute(RunHistory.__table__.insert(), [
+        {'id': i, 'run_id': i, 'version_tag': 'v1', 'user': 'user',
+         'time': NOW} for i in range(1, RUN_COUNT + 1)])
+    session.execute(Checker.__table__.insert(), [
+        {'id': i, 'analyzer_name': 'clangsa', 'checker_name': f'checker{i}',
+         'severity': i % 6} for i in range(1, 101)])
+    session.execute(File.__table__.insert(), [
+        {'id': i, 'filepath': f'/src/file{i}.cpp',
+         'filename': f'file{i}.cpp', 'content_hash': None}
+        for i in range(1, 1001)])
+
+    inserter = BulkInserter(session)
+    for i in range(REPORT_COUNT):
+        detection_status = rnd.choice(
+            ['new', 'unresolved', 'resolved', 'reopened', 'off',
+             'unavailable'])
+        inserter.add(Report.__table__, {
+            'run_id': 1 + i % RUN_COUNT,
+            'bug_id': f'hash{i % REPORT_HASH_COUNT}',
+            'checker_id': rnd.randint(1, 100),
+            'file_id': rnd.randint(1, 1000),
+            'line': i, 'column': 1, 'path_length': rnd.randint(1, 20),
+            'checker_message': 'Division by zero',
+            'detection_status': detection_status,
+            'review_status': rnd.choice(
+                ['unreviewed', 'confirmed', 'false_positive',
+                 'intentional']),
+            'review_status_is_in_source': False,
+            'detected_at': NOW - timedelta(days=rnd.randint(0, 365)),
+            'fixed_at': NOW if detection_status == 'resolved' else None})
+    inserter.flush()
+
+    refresh_report_counts(session, None)
+
+
+class QueryPlanTestCase(unittest.TestCase):
+    """
+    Test cases of the query plans of the report server endpoints. Every
+    query of an endpoint is explained on the same connection before it is
+    executed and its plan must not scan the whole "reports" table.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = create_engine('codechecker_query_plans')
+        Base.metadata.create_all(cls.engine)
+        cls.session_factory = sessionmaker(bind=cls.engine)
+
+        with cls.session_factory() as session:
+            seed(session)
+            session.commit()
+
+        with cls.engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+            connection.commit()
+
+        cls.config_engine = sqlalchemy.create_engine(
+            'sqlite://', poolclass=StaticPool,
+            connect_args={'check_same_thread': False})
+        config_db_model.Base.metadata.create_all(cls.config_engine)
+        cls.config_session_factory = sessionmaker(bind=cls.config_engine)
+        with cls.config_session_factory() as session:
+            session.add(config_db_model.Product(
+                'Default', str(cls.engine.url), 'Default'))
+            session.commit()
+
+        cls.handler = cls.make_handler()
+
+        cls.plans = []
+        event.listen(cls.engine, 'before_cursor_execute', cls.explain)
+
+    @classmethod
+    def make_handler(cls, page_cursors=None):
+        """
+        Returns a request handler of the product, like the one created for
+        every API request.
+        """
+        return ThriftRequestHandler(
+            types.SimpleNamespace(is_enabled=False), None,
+            cls.session_factory,
+            types.SimpleNamespace(id=1, endpoint='Default',
+                                  driver_name=cls.engine.dialect.name,
+                                  get_cache_generation=lambda _: 0),
+            None, cls.config_session_factory, None, '6.60', None,
+            page_cursors=page_cursors)
+
+    @classmethod
+    def tearDownClass(cls):
+        event.remove(cls.engine, 'before_cursor_execute', cls.explain)
+        cls.config_engine.dispose()
+        drop_database(cls.engine)
+
+    @classmethod
+    def explain(cls, conn, cursor, statement, parameters, _context,
+                executemany):
+        """ Collect the plan of the given query before it is executed. """
+        if executemany or \
+                not re.match(r'\s*(SELECT|WITH)\b', statement, re.IGNORECASE):
+            return
+
+        explain_cursor = cursor.connection.cursor()
+        try:
+            if conn.dialect.name == 'postgresql':
+                # Sequential scans are reported only if there is no index to
+                # use, because they are cheaper on small tables.
+                explain_cursor.execute("SET enable_seqscan = off")
+                explain_cursor.execute("EXPLAIN " + statement, parameters)
+                plan = [row[0] for row in explain_cursor.fetchall()]
+                explain_cursor.execute("RESET enable_seqscan")
+            else:
+                explain_cursor.execute(
+                    "EXPLAIN QUERY PLAN " + statement, parameters)
+                plan = [row[-1] for row in explain_cursor.fetchall()]
+        finally:
+            explain_cursor.close()
+
+        cls.plans.append((statement, plan))
+
+    def call(self, endpoint, *args):
+        """
+        Call the given endpoint and check the plans of its queries and, if
+        a latency budget is given, its latency. Returns the plans of the
+        queries.
+        """
+        self.plans.clear()
+
+        before = time.time()
+        getattr(self.handler, endpoint)(*args)
+        duration = time.time() - before
+
+        if LATENCY_BUDGET is not None:
+            self.assertLess(duration, LATENCY_BUDGET, endpoint)
+
+        for statement, plan in self.plans:
+            full_scans = [line for line in plan if re.search(
+                r'^SCAN reports\b|Seq Scan on reports\b', line.strip())]
+            self.assertFalse(full_scans, f"{endpoint}: {statement}")
+
+        return [line for _, plan in self.plans for line in plan]
+
+    def check_report_filters(self, endpoint, *args):
+        """
+        Call the given endpoint with the report filters of the web interface
+        in a run. The report filter follows the run ids in the arguments.
+        """
+        for name, report_filter in REPORT_FILTERS.items():
+            with self.subTest(filter=name):
+                self.call(endpoint, [3], report_filter, *args)
+
+    def test_get_run_results(self):
+        for name, report_filter in REPORT_FILTERS.items():
+            with self.subTest(filter=name):
+                self.call('getRunResults', [3], 25, 0, None, report_filter,
+                          None, False)
+
+    def test_keyset_pages(self):
+        """
+        The page which follows a full page is queried from the sort key of
+        the last report of that page, also by another API worker process.
+        """
+        def query_pages(handlers):
+            pages = []
+            for page, handler in enumerate(handlers):
+                self.plans.clear()
+                pages.extend(report.reportId for report in
+                             handler.getRunResults([3], 25, page * 25, None,
+                                                   ReportFilter(), None,
+                                                   False))
+            return pages, [statement for statement, _ in self.plans]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cursor_file = os.path.join(tmp_dir, 'page_cursors.sqlite')
+            pages, statements = query_pages(
+                [self.make_handler(ResultCache(path=cursor_file))
+                 for _ in range(3)])
+
+        expected, offset_statements = query_pages([self.handler] * 3)
+        self.assertEqual(pages, expected)
+        self.assertFalse(any('reports.id >' in s for s in offset_statements))
+        self.assertTrue(any('reports.id >' in s for s in statements))
+
+    def test_get_run_result_count(self):
+        self.check_report_filters('getRunResultCount', None)
+
+    def test_get_run_report_counts(self):
+        self.check_report_filters('getRunReportCounts', None, 0)
+
+    def test_get_checker_counts(self):
+        self.check_report_filters('getCheckerCounts', None, None, 0)
+
+    def test_get_checker_msg_counts(self):
+        self.check_report_filters('getCheckerMsgCounts', None, None, 0)
+
+    def test_get_severity_counts(self):
+        self.check_report_filters('getSeverityCounts', None)
+
+    def test_get_review_status_counts(self):
+        self.check_report_filters('getReviewStatusCounts', None)
+
+    def test_get_detection_status_counts(self):
+        self.check_report_filters('getDetectionStatusCounts', None)
+
+    def test_get_report_status_counts(self):
+        self.check_report_filters('getReportStatusCounts', None)
+
+    def test_get_file_counts(self):
+        self.check_report_filters('getFileCounts', None, None, 0)
+
+    def test_get_diff_results_hash(self):
+        report_hashes = [f'hash{i}' for i in range(0, REPORT_HASH_COUNT, 3)]
+        for diff_type in [DiffType.NEW, DiffType.RESOLVED,
+                          DiffType.UNRESOLVED]:
+            with self.subTest(diff_type=diff_type):
+                self.call('getDiffResultsHash', [3], report_hashes,
+                          diff_type, None, None)
+
+    @unittest.skipIf(os.environ.get('TEST_USE_POSTGRESQL', '') == 'true',
+                     "The indexes are chosen by the costs of SQLite.")
+    def test_composite_indexes(self):
+        """ The filters of the web interface use the composite indexes. """
+        plan = self.call('getRunResultCount', [3], ReportFilter(
+            date=REPORT_FILTERS['detection date'].date), None)
+        self.assertIn('ix_reports_run_id_detected_at', '\n'.join(plan))
+
+        plan = self.call('getRunResultCount', [3],
+                         REPORT_FILTERS['unique'], None)
+        self.assertIn('ix_reports_run_id_bug_id', '\n'.join(plan))
+
+        plan = self.call('getReviewStatusCounts', [3],
+                         REPORT_FILTERS['unique'], None)
+        self.assertIn('ix_reports_run_id_review_status_detection_status',
+                      '\n'.join(plan))
+
+        plan = self.call('getDiffResultsHash', [3], ['hash1'],
+                         DiffType.UNRESOLVED, None, None)
+        self.assertIn('ix_reports_open_run_id_bug_id', '\n'.join(plan))
@@ -0,0 +1,157 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the summary of the number of reports of the runs. """
+
+
+from datetime import datetime
+import unittest
+
+import sqlalchemy
+from sqlalchemy.orm import sessionmaker
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import DetectionStatus, \
+    ReportFilter, ReviewStatus
+
+from codechecker_server.api.report_server import get_report_count_query, \
+    is_report_count_filter
+from codechecker_server.database.report_counts import ReportCountUpdate, \
+    refresh_report_counts
+from codechecker_server.database.run_db_model import Base, Checker, File, \
+    Report, ReportCount, Run
+
+
+class ReportCountsTestCase(unittest.TestCase):
+    """
+    Test cases of maintaining and querying the report counts.
+    """
+
+    def setUp(self):
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+
+        self.session.execute(Run.__table__.insert(), [
+            {'id': 1, 'name': 'run1', 'date': datetime.now()},
+            {'id': 2, 'name': 'run2', 'date': datetime.now()}])
+        self.session.execute(Checker.__table__.insert(), [
+            {'id': 1, 'analyzer_name': 'clangsa',
+             'checker_name': 'core.DivideZero', 'severity': 3},
+            {'id': 2, 'analyzer_name': 'clang-tidy',
+             'checker_name': 'misc-redundant-expression', 'severity': 2}])
+        self.session.execute(File.__table__.insert(), [
+            {'id': 1, 'filepath': '/src/a.cpp', 'filename': 'a.cpp'},
+            {'id': 2, 'filepath': '/src/b.cpp', 'filename': 'b.cpp'}])
+
+        rows = []
+        for i in range(12):
+            rows.append({
+                'run_id': 1 + i % 2, 'bug_id': f'hash{i % 6}',
+                'checker_id': 1 + i % 3 // 2, 'file_id': 1 + i % 4 // 3,
+                'line': i, 'detected_at': datetime.now(),
+                'review_status': 'unreviewed',
+                'detection_status': 'resolved' if i == 11 else 'new'})
+        self.session.execute(Report.__table__.insert(), rows)
+
+        refresh_report_counts(self.session, 1)
+        refresh_report_counts(self.session, 2)
+
+    def tearDown(self):
+        self.session.close()
+        self.engine.dispose()
+
+    def count(self, report_filter, columns):
+        """ Returns the number of the reports grouped by the columns. """
+        q = get_report_count_query(
+            self.session, None, report_filter, None, columns)
+        return {tuple(row[:-1]): row[-1] for row in q}
+
+    def live_count(self, where_clause, columns):
+        """ Returns the number of the matching reports in the reports. """
+        q = self.session.query(*columns, sqlalchemy.func.count(Report.id)) \
+            .join(Checker, Report.checker_id == Checker.id) \
+            .join(File, Report.file_id == File.id) \
+            .filter(where_clause) \
+            .group_by(*columns)
+        return {tuple(row[:-1]): row[-1] for row in q}
+
+    def test_refresh(self):
+        """ The counts of the runs are computed from the reports. """
+        self.assertEqual(
+            self.session.query(sqlalchemy.func.sum(ReportCount.report_count))
+            .scalar(), 12)
+
+        self.assertEqual(self.count(None, [Checker.checker_name]),
+                         self.live_count(True, [Checker.checker_name]))
+
+        # Recomputing the counts of a run doesn't duplicate the rows.
+        row_count = self.session.query(ReportCount).count()
+        refresh_report_counts(self.session, 1)
+        self.assertEqual(self.session.query(ReportCount).count(), row_count)
+
+    def test_filter(self):
+        """ The counts are filtered by the report filter. """
+        report_filter = ReportFilter(
+            checkerName=['core.*'],
+            detectionStatus=[DetectionStatus.NEW],
+            runName=['run1'])
+
+        self.assertEqual(
+            self.count(report_filter, [File.filepath]),
+            self.live_count(sqlalchemy.and_(
+                Checker.checker_name.like('core.%'),
+                Report.detection_status == 'new',
+                Report.run_id == 1), [File.filepath]))
+
+        report_filter = ReportFilter(severity=[2], filepath=['*b.cpp'])
+        self.assertEqual(self.count(report_filter, []), {(): 1})
+
+    def test_review_status_change(self):
+        """ The counts follow the change of the review status. """
+        with ReportCountUpdate(self.session, Report.bug_id == 'hash0'):
+            self.session.query(Report) \
+                .filter(Report.bug_id == 'hash0') \
+                .update({'review_status': 'false_positive'})
+
+        report_filter = ReportFilter(
+            reviewStatus=[ReviewStatus.FALSE_POSITIVE])
+        self.assertEqual(self.count(report_filter, [ReportCount.run_id]),
+                         {(1,): 2})
+        self.assertEqual(self.count(None, [ReportCount.review_status]),
+                         {('unreviewed',): 10, ('false_positive',): 2})
+
+        # The rows of the reports which don't exist anymore are removed.
+        self.assertEqual(self.session.query(ReportCount)
+                         .filter(ReportCount.report_count == 0).count(), 0)
+
+    def test_remove_reports(self):
+        """ The counts of the removed reports are subtracted. """
+        with ReportCountUpdate(self.session, Report.run_id == 2):
+            self.session.query(Report).filter(Report.run_id == 2).delete()
+
+        self.assertEqual(self.count(None, [ReportCount.run_id]), {(1,): 6})
+        self.assertEqual(self.session.query(ReportCount)
+                         .filter(ReportCount.run_id == 2).count(), 0)
+
+    def test_unsupported_filter(self):
+        """ Filters on other properties of the reports are not counted. """
+        self.assertTrue(is_report_count_filter(None, None))
+        self.assertTrue(is_report_count_filter(
+            ReportFilter(severity=[3], isUnique=False, checkerMsg=[]), None))
+
+        self.assertFalse(is_report_count_filter(
+            ReportFilter(isUnique=True), None))
+        self.assertFalse(is_report_count_filter(
+            ReportFilter(checkerMsg=['Division by zero']), None))
+        self.assertFalse(is_report_count_filter(
+            ReportFilter(reportHash=[]), None))
+        self.assertFalse(is_report_count_filter(
+            ReportFilter(filepath=['*.cpp'], fileMatchesAnyPoint=True), None))
+        self.assertIsNone(get_report_count_query(
+            self.session, None, ReportFilter(componentNames=['lib']), None,
+            [Checker.severity]))
@@ -0,0 +1,70 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the fingerprint of the stored reports. """
+
+
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, File, Report
+
+from codechecker_web.shared.report_fingerprint import \
+    get_report_fingerprint
+
+
+class ReportFingerprintTestCase(unittest.TestCase):
+    """
+    Test cases to decide whether a report has to be stored again.
+    """
+
+    def setUp(self):
+        self.file_to_hash = {'/src/main.cpp': 'a', '/src/lib.h': 'b'}
+
+    def create_report(self, header_line=3, result_file='a.plist'):
+        main = File('/src/main.cpp')
+        header = File('/src/lib.h')
+        return Report(
+            main, 10, 5, "Division by zero", "core.DivideZero",
+            report_hash="hash", analyzer_name="clangsa",
+            analyzer_result_file_path=result_file,
+            bug_path_events=[
+                BugPathEvent("Assuming zero", header, header_line, 1),
+                BugPathEvent("Division by zero", main, 10, 5)])
+
+    def test_same_report(self):
+        """ The analyzer result file doesn't change the fingerprint. """
+        self.assertEqual(
+            get_report_fingerprint(self.create_report(),
+                                   self.file_to_hash, None),
+            get_report_fingerprint(self.create_report(
+                result_file='b.plist'), self.file_to_hash, None))
+
+    def test_changed_bug_path(self):
+        """ Reports with the same hash may have a different bug path. """
+        self.assertNotEqual(
+            get_report_fingerprint(self.create_report(),
+                                   self.file_to_hash, None),
+            get_report_fingerprint(self.create_report(header_line=4),
+                                   self.file_to_hash, None))
+
+    def test_changed_file_content(self):
+        """ The stored report refers to the contents of the files. """
+        report = self.create_report()
+        fingerprint = get_report_fingerprint(report, self.file_to_hash, None)
+
+        self.file_to_hash['/src/lib.h'] = 'c'
+        self.assertNotEqual(
+            get_report_fingerprint(report, self.file_to_hash, None),
+            fingerprint)
+
+    def test_trimmed_paths(self):
+        """ The stored report refers to the trimmed file paths. """
+        report = self.create_report()
+        self.assertNotEqual(
+            get_report_fingerprint(report, self.file_to_hash, ['/src']),
+            get_report_fingerprint(report, self.file_to_hash, None))
@@ -0,0 +1,67 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the compact storage format of bug paths. """
+
+
+import unittest
+
+from codechecker_report_converter.report import BugPathEvent, \
+    BugPathPosition, File, MacroExpansion, Range, Report
+
+from codechecker_server.database.report_path import PathElement, \
+    decode_report_path, encode_report_path
+
+
+class ReportPathTestCase(unittest.TestCase):
+    """
+    Test cases to encode and decode the bug path of a report.
+    """
+
+    def test_encode_decode(self):
+        """ The decoded bug path refers to the database ids of the files. """
+        main = File('/src/main.cpp')
+        header = File('/src/lib.h')
+        report = Report(
+            main, 10, 5, "Division by zero", "core.DivideZero",
+            bug_path_events=[
+                BugPathEvent("Assuming zero", header, 3, 1,
+                             Range(3, 1, 3, 8)),
+                BugPathEvent("Division by zero", main, 10, 5)],
+            bug_path_positions=[
+                BugPathPosition(header, Range(3, 1, 3, 8)),
+                BugPathPosition(main, Range(10, 5, 10, 9))],
+            notes=[BugPathEvent("Note \"quoted\"", header, 1, 1)],
+            macro_expansions=[
+                MacroExpansion("1 / 0", "DIV", main, 10, 5)])
+
+        data, file_ids = encode_report_path(
+            report, {'/src/main.cpp': 7, '/src/lib.h': 3})
+        self.assertEqual(file_ids, [7, 3])
+
+        path = decode_report_path(data)
+        self.assertEqual(path.events, [
+            PathElement(3, 1, 3, 8, 3, "Assuming zero"),
+            PathElement(10, 5, 10, 5, 7, "Division by zero")])
+        self.assertEqual(path.points, [
+            PathElement(3, 1, 3, 8, 3, None),
+            PathElement(10, 5, 10, 9, 7, None)])
+        self.assertEqual(path.notes, [
+            PathElement(1, 1, 1, 1, 3, "Note \"quoted\"")])
+        self.assertEqual(path.macros, [
+            PathElement(10, 5, 10, 5, 7, "1 / 0")])
+
+    def test_report_file(self):
+        """ The file of the report is referenced without a bug path in it. """
+        header = File('/src/lib.h')
+        report = Report(File('/src/main.cpp'), 1, 1, "Message", "checker",
+                        bug_path_events=[BugPathEvent("Event", header, 2, 1)])
+
+        _, file_ids = encode_report_path(
+            report, {'/src/main.cpp': 1, '/src/lib.h': 2})
+        self.assertEqual(file_ids, [1, 2])
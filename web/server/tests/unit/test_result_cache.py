@@ -0,0 +1,125 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the cache of the results of the API requests. """
+
+
+import json
+import os
+import tempfile
+import unittest
+
+from codechecker_api.codeCheckerDBAccess_v6.ttypes import CheckerCount, \
+    ReportFilter, Severity, SortMode, SortType, Order
+
+from codechecker_server.result_cache import make_cache_key, ResultCache
+from codechecker_server.session_manager import SessionManager
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    """
+    Test cases of the result cache.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp_dir.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cache_key(self):
+        """ Equivalent report filters have the same key. """
+        key = make_cache_key('getCheckerCounts', (
+            [1, 2], ReportFilter(checkerName=['a', 'b'], severity=[1]),
+            None, 10, 0))
+
+        self.assertEqual(key, make_cache_key('getCheckerCounts', (
+            [1, 2], ReportFilter(severity=[1], checkerName=['b', 'a']),
+            None, 10, 0)))
+
+        self.assertNotEqual(key, make_cache_key('getFileCounts', (
+            [1, 2], ReportFilter(checkerName=['a', 'b'], severity=[1]),
+            None, 10, 0)))
+        self.assertNotEqual(key, make_cache_key('getCheckerCounts', (
+            [1, 2], ReportFilter(checkerName=['a', 'b'], severity=[1]),
+            None, 10, 10)))
+        self.assertNotEqual(key, make_cache_key('getCheckerCounts', (
+            [1, 2], ReportFilter(checkerName=['a', 'b'], severity=[1],
+                                 reportHash=[]),
+            None, 10, 0)))
+
+        # The order of the sort modes matters.
+        file_sort = SortMode(SortType.FILENAME, Order.ASC)
+        severity_sort = SortMode(SortType.SEVERITY, Order.DESC)
+        self.assertNotEqual(
+            make_cache_key('getRunResults', ([file_sort, severity_sort],)),
+            make_cache_key('getRunResults', ([severity_sort, file_sort],)))
+
+    def test_generations(self):
+        """ The results of the other generations are not returned. """
+        cache = ResultCache()
+        cache.put(1, 0, 'key', 42)
+
+        self.assertEqual(cache.get(1, 0, 'key'), (True, 42))
+        self.assertEqual(cache.get(1, 1, 'key'), (False, None))
+        self.assertEqual(cache.get(2, 0, 'key'), (False, None))
+        self.assertEqual(cache.statistics,
+                         {'hits': 1, 'misses': 2, 'entries': 1})
+
+    def test_least_recently_used(self):
+        """ The least recently used results are dropped. """
+        cache = ResultCache(max_entries=2)
+        cache.put(1, 0, 'a', 1)
+        cache.put(1, 0, 'b', 2)
+        cache.get(1, 0, 'a')
+        cache.put(1, 0, 'c', 3)
+
+        self.assertTrue(cache.get(1, 0, 'a')[0])
+        self.assertFalse(cache.get(1, 0, 'b')[0])
+        self.assertTrue(cache.get(1, 0, 'c')[0])
+
+    def test_shared_file(self):
+        """ The results are shared by the caches of the same file. """
+        result = [CheckerCount(name='core.DivideZero',
+                               severity=Severity.HIGH, count=3)]
+        ResultCache(path=self.cache_file).put(1, 0, 'key', result)
+
+        cache = ResultCache(path=self.cache_file)
+        self.assertEqual(cache.get(1, 0, 'key'), (True, result))
+
+        # The results of the earlier generations are removed.
+        cache.put(1, 1, 'other', [])
+        self.assertFalse(ResultCache(path=self.cache_file)
+                         .get(1, 0, 'key')[0])
+
+        cache.clear()
+        self.assertFalse(ResultCache(path=self.cache_file)
+                         .get(1, 1, 'other')[0])
+
+    def test_options(self):
+        """ The cache options are read from the server configuration. """
+        config_file = os.path.join(self.tmp_dir.name, 'server_config.json')
+
+        def create_session_manager(result_cache_config):
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump({'authentication': {'enabled': False},
+                           'result_cache': result_cache_config}, f)
+
+            return SessionManager(config_file, os.path.join(
+                self.tmp_dir.name, 'server_secrets.json'))
+
+        manager = create_session_manager(
+            {'max_entries': 10, 'path': 'cache.sqlite', 'metrics': True})
+        self.assertEqual(manager.get_result_cache_options(),
+                         {'max_entries': 10, 'path': 'cache.sqlite'})
+        self.assertTrue(manager.is_result_cache_metrics_enabled())
+
+        manager = create_session_manager({'enabled': False, 'metrics': True})
+        self.assertIsNone(manager.get_result_cache_options())
+        self.assertFalse(manager.is_result_cache_metrics_enabled())
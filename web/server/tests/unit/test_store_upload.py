@@ -0,0 +1,103 @@
+# -------------------------------------------------------------------------
+#
+#  Part of the CodeChecker project, under the Apache License v2.0 with
+#  LLVM Exceptions. See LICENSE for license information.
+#  SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+#
+# -------------------------------------------------------------------------
+
+""" Test the store ZIP files which are uploaded in chunks. """
+
+
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+
+from codechecker_api_shared.ttypes import RequestFailed
+
+from codechecker_server.api import store_upload
+from codechecker_server.api.store_upload import StoreUpload
+
+
+def checksum(chunk: bytes) -> str:
+    return sha256(chunk).hexdigest()
+
+
+class StoreUploadTestCase(unittest.TestCase):
+    """
+    Test cases of receiving the chunks of an upload.
+    """
+
+    def setUp(self):
+        self.__temp_dir = tempfile.TemporaryDirectory()
+        self.upload_root = Path(self.__temp_dir.name)
+
+    def tearDown(self):
+        self.__temp_dir.cleanup()
+
+    def test_chunks(self):
+        upload = StoreUpload.begin(self.upload_root, 1, "user", 6)
+        self.assertEqual(upload.offset, 0)
+
+        self.assertEqual(upload.write_chunk(0, b"abc", checksum(b"abc")), 3)
+        self.assertEqual(upload.write_chunk(3, b"def", checksum(b"def")), 6)
+
+        upload = StoreUpload.get(self.upload_root, upload.token, 1, "user")
+        self.assertEqual(upload.offset, 6)
+        self.assertEqual(upload.zip_path.read_bytes(), b"abcdef")
+
+    def test_resend_chunk(self):
+        """ A chunk can be sent again from an already received offset. """
+        upload = StoreUpload.begin(self.upload_root, 1, "user", 6)
+        upload.write_chunk(0, b"abc", checksum(b"abc"))
+        upload.write_chunk(3, b"xyz", checksum(b"xyz"))
+
+        self.assertEqual(upload.write_chunk(3, b"de", checksum(b"de")), 5)
+        self.assertEqual(upload.zip_path.read_bytes(), b"abcde")
+
+    def test_invalid_chunks(self):
+        upload = StoreUpload.begin(self.upload_root, 1, "user", 6)
+        upload.write_chunk(0, b"abc", checksum(b"abc"))
+
+        with self.assertRaises(RequestFailed) as ctx:
+            upload.write_chunk(3, b"def", checksum(b"xyz"))
+        self.assertEqual(ctx.exception.extraInfo, ["upload_chunk"])
+
+        with self.assertRaises(RequestFailed):
+            upload.write_chunk(4, b"ef", checksum(b"ef"))
+
+        with self.assertRaises(RequestFailed):
+            upload.write_chunk(3, b"defg", checksum(b"defg"))
+
+        self.assertEqual(upload.offset, 3)
+
+    def test_get(self):
+        upload = StoreUpload.begin(self.upload_root, 1, "user", 6)
+
+        for token, product_id, user_name in [
+                (upload.token, 2, "user"),
+                (upload.token, 1, "other"),
+                ("0" * store_upload.UPLOAD_TOKEN_LENGTH, 1, "user"),
+                ("../" + upload.token, 1, "user")]:
+            with self.assertRaises(RequestFailed):
+                StoreUpload.get(self.upload_root, token, product_id,
+                                user_name)
+
+    def test_empty(self):
+        with self.assertRaises(RequestFailed):
+            StoreUpload.begin(self.upload_root, 1, "user", 0)
+
+    def test_remove_stale_uploads(self):
+        stale = StoreUpload.begin(self.upload_root, 1, "user", 6)
+        fresh = StoreUpload.begin(self.upload_root, 1, "user", 6)
+
+        last_modified = time.time() - store_upload.STALE_UPLOAD_TIMEOUT - 1
+        os.utime(stale.zip_path, (last_modified, last_modified))
+
+        store_upload.remove_stale_uploads(self.upload_root)
+
+        self.assertFalse(stale.upload_dir.exists())
+        self.assertTrue(fresh.upload_dir.exists())